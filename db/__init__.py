@@ -4,6 +4,7 @@ from .base import *
 from .hawky_task import *
 from .sent_letter import *
 from .alias import *
+from .letter_count import *
 
 # Wargame models
 from .territory import *
@@ -21,11 +22,16 @@ from .building_type import *
 from .building import *
 from .player_resources import *
 from .territory_adjacency import *
+from .territory_graph import *
 from .wargame_config import *
 from .order import *
 from .turn_log import *
+from .turn_report import *
 from .naval_unit_position import *
 from .spirit_nexus import *
+from .resource_ledger import *
+from .resource_balance import *
+from .guild_snapshot import *
 
 # Herbalism models
 from .ingredient import *
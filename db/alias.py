@@ -25,6 +25,16 @@ class Alias:
         row = await conn.fetchrow(query, self.character_id, self.alias, self.guild_id)
         self.id = row['id']
 
+    @classmethod
+    async def insert_many(cls, conn: asyncpg.Connection, aliases: List["Alias"]):
+        """
+        Insert many new Alias entries with a single executemany.
+        """
+        await conn.executemany("""
+            INSERT INTO Alias (character_id, alias, guild_id)
+            VALUES ($1, $2, $3);
+        """, [(a.character_id, a.alias, a.guild_id) for a in aliases])
+
     @classmethod
     async def fetch_by_alias(cls, conn: asyncpg.Connection, alias: str, guild_id: int) -> Optional["Alias"]:
         """
@@ -56,24 +56,35 @@ class Alliance:
         if result:
             self.id = result['id']
 
+    _UPSERT_QUERY = """
+    INSERT INTO Alliance (
+        faction_a_id, faction_b_id, status, initiated_by_faction_id,
+        created_at, activated_at, activated_turn, guild_id
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    ON CONFLICT (faction_a_id, faction_b_id, guild_id) DO UPDATE
+    SET status = EXCLUDED.status,
+        activated_at = EXCLUDED.activated_at,
+        activated_turn = EXCLUDED.activated_turn
+    RETURNING id;
+    """
+
     async def upsert(self, conn: asyncpg.Connection):
         """
         Insert or update this Alliance entry.
         """
-        query = """
-        INSERT INTO Alliance (
-            faction_a_id, faction_b_id, status, initiated_by_faction_id,
-            created_at, activated_at, activated_turn, guild_id
+        result = await conn.fetchrow(
+            self._UPSERT_QUERY,
+            *self._upsert_args()
         )
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-        ON CONFLICT (faction_a_id, faction_b_id, guild_id) DO UPDATE
-        SET status = EXCLUDED.status,
-            activated_at = EXCLUDED.activated_at,
-            activated_turn = EXCLUDED.activated_turn
-        RETURNING id;
+        if result:
+            self.id = result['id']
+
+    def _upsert_args(self) -> tuple:
         """
-        result = await conn.fetchrow(
-            query,
+        Positional arguments for _UPSERT_QUERY, in column order.
+        """
+        return (
             self.faction_a_id,
             self.faction_b_id,
             self.status,
@@ -83,8 +94,15 @@ class Alliance:
             self.activated_turn,
             self.guild_id
         )
-        if result:
-            self.id = result['id']
+
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, entries: List["Alliance"]):
+        """
+        Insert or update many Alliance entries with a single executemany.
+        """
+        if not entries:
+            return
+        await conn.executemany(cls._UPSERT_QUERY, [e._upsert_args() for e in entries])
 
     @classmethod
     async def fetch_by_factions(
@@ -24,34 +24,43 @@ class Building:
     keywords: Optional[List[str]] = None
     guild_id: Optional[int] = None
 
+    _UPSERT_QUERY = """
+    INSERT INTO Building (
+        building_id, name, building_type, territory_id, durability, status,
+        upkeep_ore, upkeep_lumber, upkeep_coal, upkeep_rations, upkeep_cloth, upkeep_platinum,
+        keywords, guild_id
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
+    ON CONFLICT (building_id, guild_id) DO UPDATE
+    SET name = EXCLUDED.name,
+        building_type = EXCLUDED.building_type,
+        territory_id = EXCLUDED.territory_id,
+        durability = EXCLUDED.durability,
+        status = EXCLUDED.status,
+        upkeep_ore = EXCLUDED.upkeep_ore,
+        upkeep_lumber = EXCLUDED.upkeep_lumber,
+        upkeep_coal = EXCLUDED.upkeep_coal,
+        upkeep_rations = EXCLUDED.upkeep_rations,
+        upkeep_cloth = EXCLUDED.upkeep_cloth,
+        upkeep_platinum = EXCLUDED.upkeep_platinum,
+        keywords = EXCLUDED.keywords;
+    """
+
     async def upsert(self, conn: asyncpg.Connection):
         """
         Insert or update this Building entry.
         The tuple (building_id, guild_id) must be unique.
         """
-        query = """
-        INSERT INTO Building (
-            building_id, name, building_type, territory_id, durability, status,
-            upkeep_ore, upkeep_lumber, upkeep_coal, upkeep_rations, upkeep_cloth, upkeep_platinum,
-            keywords, guild_id
+        await conn.execute(
+            self._UPSERT_QUERY,
+            *self._upsert_args()
         )
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
-        ON CONFLICT (building_id, guild_id) DO UPDATE
-        SET name = EXCLUDED.name,
-            building_type = EXCLUDED.building_type,
-            territory_id = EXCLUDED.territory_id,
-            durability = EXCLUDED.durability,
-            status = EXCLUDED.status,
-            upkeep_ore = EXCLUDED.upkeep_ore,
-            upkeep_lumber = EXCLUDED.upkeep_lumber,
-            upkeep_coal = EXCLUDED.upkeep_coal,
-            upkeep_rations = EXCLUDED.upkeep_rations,
-            upkeep_cloth = EXCLUDED.upkeep_cloth,
-            upkeep_platinum = EXCLUDED.upkeep_platinum,
-            keywords = EXCLUDED.keywords;
+
+    def _upsert_args(self) -> tuple:
         """
-        await conn.execute(
-            query,
+        Positional arguments for _UPSERT_QUERY, in column order.
+        """
+        return (
             self.building_id, self.name, self.building_type, self.territory_id,
             self.durability, self.status,
             self.upkeep_ore, self.upkeep_lumber, self.upkeep_coal,
@@ -59,6 +68,15 @@ class Building:
             self.keywords, self.guild_id
         )
 
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, entries: List["Building"]):
+        """
+        Insert or update many Building entries with a single executemany.
+        """
+        if not entries:
+            return
+        await conn.executemany(cls._UPSERT_QUERY, [e._upsert_args() for e in entries])
+
     @classmethod
     async def fetch_by_id(cls, conn: asyncpg.Connection, building_internal_id: int) -> Optional["Building"]:
         """
@@ -156,6 +174,47 @@ class Building:
             result.append(cls(**data))
         return result
 
+    @classmethod
+    async def fetch_active_by_territories(
+        cls,
+        conn: asyncpg.Connection,
+        territory_ids: List[str],
+        guild_id: int
+    ) -> List["Building"]:
+        """
+        Fetch all ACTIVE Buildings in any of the given territories, in one query.
+        """
+        if not territory_ids:
+            return []
+        rows = await conn.fetch("""
+            SELECT id, building_id, name, building_type, territory_id, durability, status,
+                   upkeep_ore, upkeep_lumber, upkeep_coal, upkeep_rations, upkeep_cloth, upkeep_platinum,
+                   keywords, guild_id
+            FROM Building
+            WHERE territory_id = ANY($1::TEXT[]) AND guild_id = $2 AND status = 'ACTIVE'
+            ORDER BY territory_id, building_id;
+        """, territory_ids, guild_id)
+        result = []
+        for row in rows:
+            data = dict(row)
+            data['keywords'] = list(data['keywords']) if data['keywords'] else []
+            result.append(cls(**data))
+        return result
+
+    @classmethod
+    async def update_durability_many(cls, conn: asyncpg.Connection, buildings: List["Building"]):
+        """
+        Write the durability of many buildings in one statement.
+        """
+        if not buildings:
+            return
+        await conn.execute("""
+            UPDATE Building
+            SET durability = v.durability
+            FROM unnest($1::INTEGER[], $2::INTEGER[]) AS v(id, durability)
+            WHERE Building.id = v.id;
+        """, [b.id for b in buildings], [b.durability for b in buildings])
+
     @classmethod
     async def delete(cls, conn: asyncpg.Connection, building_id: str, guild_id: int) -> bool:
         """
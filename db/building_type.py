@@ -27,44 +27,62 @@ class BuildingType:
     keywords: Optional[List[str]] = None
     guild_id: Optional[int] = None
 
+    _UPSERT_QUERY = """
+    INSERT INTO BuildingType (
+        type_id, name, description,
+        cost_ore, cost_lumber, cost_coal, cost_rations, cost_cloth, cost_platinum,
+        upkeep_ore, upkeep_lumber, upkeep_coal, upkeep_rations, upkeep_cloth, upkeep_platinum,
+        keywords, guild_id
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)
+    ON CONFLICT (type_id, guild_id) DO UPDATE
+    SET name = EXCLUDED.name,
+        description = EXCLUDED.description,
+        cost_ore = EXCLUDED.cost_ore,
+        cost_lumber = EXCLUDED.cost_lumber,
+        cost_coal = EXCLUDED.cost_coal,
+        cost_rations = EXCLUDED.cost_rations,
+        cost_cloth = EXCLUDED.cost_cloth,
+        cost_platinum = EXCLUDED.cost_platinum,
+        upkeep_ore = EXCLUDED.upkeep_ore,
+        upkeep_lumber = EXCLUDED.upkeep_lumber,
+        upkeep_coal = EXCLUDED.upkeep_coal,
+        upkeep_rations = EXCLUDED.upkeep_rations,
+        upkeep_cloth = EXCLUDED.upkeep_cloth,
+        upkeep_platinum = EXCLUDED.upkeep_platinum,
+        keywords = EXCLUDED.keywords;
+    """
+
     async def upsert(self, conn: asyncpg.Connection):
         """
         Insert or update this BuildingType entry.
         The tuple (type_id, guild_id) must be unique.
         """
-        query = """
-        INSERT INTO BuildingType (
-            type_id, name, description,
-            cost_ore, cost_lumber, cost_coal, cost_rations, cost_cloth, cost_platinum,
-            upkeep_ore, upkeep_lumber, upkeep_coal, upkeep_rations, upkeep_cloth, upkeep_platinum,
-            keywords, guild_id
+        await conn.execute(
+            self._UPSERT_QUERY,
+            *self._upsert_args()
         )
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)
-        ON CONFLICT (type_id, guild_id) DO UPDATE
-        SET name = EXCLUDED.name,
-            description = EXCLUDED.description,
-            cost_ore = EXCLUDED.cost_ore,
-            cost_lumber = EXCLUDED.cost_lumber,
-            cost_coal = EXCLUDED.cost_coal,
-            cost_rations = EXCLUDED.cost_rations,
-            cost_cloth = EXCLUDED.cost_cloth,
-            cost_platinum = EXCLUDED.cost_platinum,
-            upkeep_ore = EXCLUDED.upkeep_ore,
-            upkeep_lumber = EXCLUDED.upkeep_lumber,
-            upkeep_coal = EXCLUDED.upkeep_coal,
-            upkeep_rations = EXCLUDED.upkeep_rations,
-            upkeep_cloth = EXCLUDED.upkeep_cloth,
-            upkeep_platinum = EXCLUDED.upkeep_platinum,
-            keywords = EXCLUDED.keywords;
+
+    def _upsert_args(self) -> tuple:
         """
-        await conn.execute(
-            query,
+        Positional arguments for _UPSERT_QUERY, in column order.
+        """
+        return (
             self.type_id, self.name, self.description,
             self.cost_ore, self.cost_lumber, self.cost_coal, self.cost_rations, self.cost_cloth, self.cost_platinum,
             self.upkeep_ore, self.upkeep_lumber, self.upkeep_coal, self.upkeep_rations,
             self.upkeep_cloth, self.upkeep_platinum, self.keywords, self.guild_id
         )
 
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, entries: List["BuildingType"]):
+        """
+        Insert or update many BuildingType entries with a single executemany.
+        """
+        if not entries:
+            return
+        await conn.executemany(cls._UPSERT_QUERY, [e._upsert_args() for e in entries])
+
     @classmethod
     async def fetch_by_id(cls, conn: asyncpg.Connection, building_type_internal_id: int) -> Optional["BuildingType"]:
         """
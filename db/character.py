@@ -14,7 +14,7 @@ class Character:
     user_id: Optional[int] = None
     channel_id: Optional[int] = None
     letter_limit: Optional[int] = None
-    letter_count: int = 0
+    letter_count: int = 0  # Populated from LetterCount for the current period when needed
     guild_id: Optional[int] = None
     # Resource production per turn
     ore_production: int = 0
@@ -29,38 +29,47 @@ class Character:
     represented_faction_id: Optional[int] = None
     representation_changed_turn: Optional[int] = None
 
+    _UPSERT_QUERY = """
+    INSERT INTO Character (
+        identifier, name, user_id, channel_id,
+        letter_limit, letter_count, guild_id,
+        ore_production, lumber_production, coal_production,
+        rations_production, cloth_production, platinum_production,
+        victory_points, represented_faction_id, representation_changed_turn
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
+    ON CONFLICT (identifier, guild_id) DO UPDATE
+    SET name = EXCLUDED.name,
+        user_id = EXCLUDED.user_id,
+        channel_id = EXCLUDED.channel_id,
+        letter_limit = EXCLUDED.letter_limit,
+        letter_count = EXCLUDED.letter_count,
+        ore_production = EXCLUDED.ore_production,
+        lumber_production = EXCLUDED.lumber_production,
+        coal_production = EXCLUDED.coal_production,
+        rations_production = EXCLUDED.rations_production,
+        cloth_production = EXCLUDED.cloth_production,
+        platinum_production = EXCLUDED.platinum_production,
+        victory_points = EXCLUDED.victory_points,
+        represented_faction_id = EXCLUDED.represented_faction_id,
+        representation_changed_turn = EXCLUDED.representation_changed_turn;
+    """
+
     async def upsert(self, conn: asyncpg.Connection):
         """
         Insert or update this Character entry.
         The pair (identifier, guild_id) must be unique.
         """
-        query = """
-        INSERT INTO Character (
-            identifier, name, user_id, channel_id,
-            letter_limit, letter_count, guild_id,
-            ore_production, lumber_production, coal_production,
-            rations_production, cloth_production, platinum_production,
-            victory_points, represented_faction_id, representation_changed_turn
+        await conn.execute(
+            self._UPSERT_QUERY,
+            *self._upsert_args()
         )
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
-        ON CONFLICT (identifier, guild_id) DO UPDATE
-        SET name = EXCLUDED.name,
-            user_id = EXCLUDED.user_id,
-            channel_id = EXCLUDED.channel_id,
-            letter_limit = EXCLUDED.letter_limit,
-            letter_count = EXCLUDED.letter_count,
-            ore_production = EXCLUDED.ore_production,
-            lumber_production = EXCLUDED.lumber_production,
-            coal_production = EXCLUDED.coal_production,
-            rations_production = EXCLUDED.rations_production,
-            cloth_production = EXCLUDED.cloth_production,
-            platinum_production = EXCLUDED.platinum_production,
-            victory_points = EXCLUDED.victory_points,
-            represented_faction_id = EXCLUDED.represented_faction_id,
-            representation_changed_turn = EXCLUDED.representation_changed_turn;
+
+    def _upsert_args(self) -> tuple:
         """
-        await conn.execute(
-            query,
+        Positional arguments for _UPSERT_QUERY, in column order.
+        """
+        return (
             self.identifier,
             self.name,
             self.user_id,
@@ -79,6 +88,42 @@ class Character:
             self.representation_changed_turn
         )
 
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, entries: List["Character"]):
+        """
+        Insert or update many Character entries with a single executemany.
+        """
+        if not entries:
+            return
+        await conn.executemany(cls._UPSERT_QUERY, [e._upsert_args() for e in entries])
+
+    @classmethod
+    async def insert_many(cls, conn: asyncpg.Connection, characters: List["Character"]) -> List["Character"]:
+        """
+        Insert many new Characters in one statement and set their database-assigned IDs.
+        Only the letter-related fields are written; production and VP columns take their defaults.
+        """
+        if not characters:
+            return characters
+
+        rows = await conn.fetch("""
+            INSERT INTO Character (identifier, name, user_id, channel_id, letter_limit, guild_id)
+            SELECT * FROM unnest($1::TEXT[], $2::TEXT[], $3::BIGINT[], $4::BIGINT[], $5::SMALLINT[], $6::BIGINT[])
+            RETURNING id, identifier;
+        """,
+            [c.identifier for c in characters],
+            [c.name for c in characters],
+            [c.user_id for c in characters],
+            [c.channel_id for c in characters],
+            [c.letter_limit for c in characters],
+            [c.guild_id for c in characters]
+        )
+
+        ids = {row['identifier']: row['id'] for row in rows}
+        for character in characters:
+            character.id = ids[character.identifier]
+        return characters
+
     @classmethod
     async def fetch_by_id(cls, conn: asyncpg.Connection, char_id: int) -> Optional["Character"]:
         """
@@ -109,6 +154,21 @@ class Character:
         """, identifier, guild_id)
         return cls(**row) if row else None
 
+    @classmethod
+    async def fetch_by_identifiers(cls, conn: asyncpg.Connection, identifiers: List[str], guild_id: int) -> List["Character"]:
+        """
+        Fetch every Character in a guild whose identifier is in the given list.
+        """
+        rows = await conn.fetch("""
+            SELECT id, identifier, name, user_id, channel_id, letter_limit, letter_count, guild_id,
+                   ore_production, lumber_production, coal_production,
+                   rations_production, cloth_production, platinum_production, victory_points,
+                   represented_faction_id, representation_changed_turn
+            FROM Character
+            WHERE identifier = ANY($1::TEXT[]) AND guild_id = $2;
+        """, list(identifiers), guild_id)
+        return [cls(**row) for row in rows]
+
     @classmethod
     async def fetch_by_user(cls, conn: asyncpg.Connection, user_id: int, guild_id: int) -> Optional["Character"]:
         """
@@ -158,23 +218,6 @@ class Character:
         return [cls(**row) for row in rows]
 
     
-    @classmethod
-    async def reset_letter_counts(cls, conn: asyncpg.Connection, guild_id: int) -> int:
-        """
-        Reset letter_count to 0 for all Characters in the given guild.
-        Returns the number of rows affected.
-        """
-        result = await conn.execute("""
-            UPDATE Character
-            SET letter_count = 0
-            WHERE guild_id = $1;
-        """, guild_id)
-
-        # Result looks like "UPDATE X" — extract number of affected rows
-        updated_count = int(result.split()[-1]) if result.startswith("UPDATE") else 0
-        logger.info(f"🔄 Reset letter_count for {updated_count} characters in guild {guild_id}.")
-        return updated_count
-    
     @classmethod
     async def print_all(cls, conn: asyncpg.Connection):
         """
@@ -1,12 +1,92 @@
 import asyncpg
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Iterable, FrozenSet, Tuple
 from datetime import datetime
+from functools import lru_cache
 import logging
 import fnmatch
 
 logger = logging.getLogger(__name__)
 
+# Each character of an item number is packed into this many bits (enough for any code point)
+_CHAR_BITS = 21
+_CHAR_MASK = (1 << _CHAR_BITS) - 1
+WILDCARD_CHAR = '*'
+
+
+def encode_item_number(item_number: str) -> Tuple[int, int]:
+    """
+    Encode an item number as (length, packed integer) for compiled pattern matching.
+    """
+    value = 0
+    for ch in item_number:
+        value = (value << _CHAR_BITS) | ord(ch)
+    return len(item_number), value
+
+
+def encode_item_numbers(item_numbers: Iterable[str]) -> FrozenSet[Tuple[int, int]]:
+    """
+    Encode a blend's ingredient numbers once so many recipes can be checked against it.
+    """
+    return frozenset(encode_item_number(n) for n in item_numbers)
+
+
+class CompiledIngredientMatcher:
+    """
+    A recipe's ingredient patterns compiled to (length, mask, value) integers.
+
+    Fully fixed patterns are checked first with a set lookup, which rejects most
+    recipes before any wildcard pattern is tried. A wildcard pattern matches an
+    ingredient when the lengths are equal and (ingredient & mask) == value.
+    """
+    __slots__ = ("exact", "wildcards")
+
+    def __init__(self, patterns: Iterable[str]):
+        exact = set()
+        wildcards = []
+        for pattern in patterns:
+            mask = 0
+            value = 0
+            for ch in pattern:
+                mask <<= _CHAR_BITS
+                value <<= _CHAR_BITS
+                if ch != WILDCARD_CHAR:
+                    mask |= _CHAR_MASK
+                    value |= ord(ch)
+            if WILDCARD_CHAR in pattern:
+                wildcards.append((len(pattern), mask, value))
+            else:
+                exact.add((len(pattern), value))
+        self.exact = frozenset(exact)
+        self.wildcards = tuple(wildcards)
+
+    def matches_encoded(self, encoded: FrozenSet[Tuple[int, int]]) -> bool:
+        """
+        Check pre-encoded ingredient numbers (see encode_item_numbers).
+        Every pattern must be matched by at least one ingredient.
+        """
+        if not self.exact <= encoded:
+            return False
+        for length, mask, value in self.wildcards:
+            if not any(n_len == length and (n_val & mask) == value for n_len, n_val in encoded):
+                return False
+        return True
+
+    def matches(self, ingredient_numbers: Iterable[str]) -> bool:
+        """
+        Check raw ingredient numbers.
+        """
+        return self.matches_encoded(encode_item_numbers(ingredient_numbers))
+
+
+@lru_cache(maxsize=None)
+def compile_ingredient_matcher(patterns: Tuple[str, ...]) -> CompiledIngredientMatcher:
+    """
+    Compile (and cache) the matcher for a tuple of ingredient patterns.
+    Recipes sharing the same patterns share one compiled matcher.
+    """
+    return CompiledIngredientMatcher(patterns)
+
 
 @dataclass
 class ConstraintRecipe:
@@ -52,6 +132,31 @@ class ConstraintRecipe:
             self.id = row['id']
             self.created_at = row['created_at']
 
+    @classmethod
+    async def bulk_insert(cls, conn: asyncpg.Connection, recipes: List["ConstraintRecipe"]):
+        """
+        Insert many ConstraintRecipes with a single COPY.
+        Rows are copied in list order, so the serial id preserves FIFO order
+        even when every row shares the same created_at.
+        """
+        records = [
+            (
+                recipe.product_item_number, recipe.product_type, recipe.quantity_produced,
+                recipe.ingredients, recipe.primary_chakra, recipe.primary_is_boon,
+                recipe.secondary_chakra, recipe.secondary_is_boon, recipe.tier
+            )
+            for recipe in recipes
+        ]
+        await conn.copy_records_to_table(
+            'constraintrecipe',
+            records=records,
+            columns=[
+                'product_item_number', 'product_type', 'quantity_produced', 'ingredients',
+                'primary_chakra', 'primary_is_boon', 'secondary_chakra', 'secondary_is_boon',
+                'tier'
+            ]
+        )
+
     @classmethod
     async def fetch_matching(
         cls,
@@ -78,6 +183,7 @@ class ConstraintRecipe:
             ORDER BY created_at ASC, id ASC;
         """, product_type)
 
+        encoded_ingredients = encode_item_numbers(ingredient_numbers)
         matching = []
         for row in rows:
             recipe = cls(
@@ -95,7 +201,8 @@ class ConstraintRecipe:
             )
 
             if recipe.matches(ingredient_numbers, primary_chakra, primary_is_boon,
-                              secondary_chakra, secondary_is_boon, tier):
+                              secondary_chakra, secondary_is_boon, tier,
+                              encoded_ingredients=encoded_ingredients):
                 matching.append(recipe)
 
         return matching
@@ -107,11 +214,13 @@ class ConstraintRecipe:
         primary_is_boon: Optional[str],
         secondary_chakra: Optional[str],
         secondary_is_boon: Optional[str],
-        tier: int
+        tier: int,
+        encoded_ingredients: Optional[FrozenSet[Tuple[int, int]]] = None
     ) -> bool:
         """
         Check if the given parameters match this recipe's constraints.
         All non-null constraints must match.
+        Pass encoded_ingredients to reuse one encoding across many recipes.
         """
         # Check tier constraint
         if self.tier is not None and self.tier != tier:
@@ -139,11 +248,20 @@ class ConstraintRecipe:
 
         # Check ingredient constraints (with wildcard support)
         if self.ingredients is not None and len(self.ingredients) > 0:
-            if not self._ingredients_match(ingredient_numbers):
+            if encoded_ingredients is None:
+                encoded_ingredients = encode_item_numbers(ingredient_numbers)
+            if not self.ingredient_matcher.matches_encoded(encoded_ingredients):
                 return False
 
         return True
 
+    @property
+    def ingredient_matcher(self) -> CompiledIngredientMatcher:
+        """
+        The compiled matcher for this recipe's ingredient patterns.
+        """
+        return compile_ingredient_matcher(tuple(self.ingredients or ()))
+
     def _ingredients_match(self, ingredient_numbers: List[str]) -> bool:
         """
         Check if the provided ingredient_numbers match all required recipe ingredients.
@@ -152,17 +270,7 @@ class ConstraintRecipe:
         if self.ingredients is None or len(self.ingredients) == 0:
             return True
 
-        for required in self.ingredients:
-            # Check if any input ingredient matches the pattern
-            matched = False
-            for actual in ingredient_numbers:
-                if self._pattern_matches(required, actual):
-                    matched = True
-                    break
-            if not matched:
-                return False
-
-        return True
+        return self.ingredient_matcher.matches(ingredient_numbers)
 
     @staticmethod
     def _pattern_matches(pattern: str, value: str) -> bool:
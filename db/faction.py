@@ -1,6 +1,6 @@
 import asyncpg
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,34 +25,43 @@ class Faction:
     platinum_spending: int = 0
     starting_territory_count: int = 0
 
+    _UPSERT_QUERY = """
+    INSERT INTO Faction (
+        faction_id, name, leader_character_id, created_turn, has_declared_war, guild_id,
+        nation, ore_spending, lumber_spending, coal_spending, rations_spending, cloth_spending, platinum_spending,
+        starting_territory_count
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
+    ON CONFLICT (faction_id, guild_id) DO UPDATE
+    SET name = EXCLUDED.name,
+        leader_character_id = EXCLUDED.leader_character_id,
+        created_turn = EXCLUDED.created_turn,
+        has_declared_war = EXCLUDED.has_declared_war,
+        nation = EXCLUDED.nation,
+        ore_spending = EXCLUDED.ore_spending,
+        lumber_spending = EXCLUDED.lumber_spending,
+        coal_spending = EXCLUDED.coal_spending,
+        rations_spending = EXCLUDED.rations_spending,
+        cloth_spending = EXCLUDED.cloth_spending,
+        platinum_spending = EXCLUDED.platinum_spending,
+        starting_territory_count = EXCLUDED.starting_territory_count;
+    """
+
     async def upsert(self, conn: asyncpg.Connection):
         """
         Insert or update this Faction entry.
         The pair (faction_id, guild_id) must be unique.
         """
-        query = """
-        INSERT INTO Faction (
-            faction_id, name, leader_character_id, created_turn, has_declared_war, guild_id,
-            nation, ore_spending, lumber_spending, coal_spending, rations_spending, cloth_spending, platinum_spending,
-            starting_territory_count
+        await conn.execute(
+            self._UPSERT_QUERY,
+            *self._upsert_args()
         )
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
-        ON CONFLICT (faction_id, guild_id) DO UPDATE
-        SET name = EXCLUDED.name,
-            leader_character_id = EXCLUDED.leader_character_id,
-            created_turn = EXCLUDED.created_turn,
-            has_declared_war = EXCLUDED.has_declared_war,
-            nation = EXCLUDED.nation,
-            ore_spending = EXCLUDED.ore_spending,
-            lumber_spending = EXCLUDED.lumber_spending,
-            coal_spending = EXCLUDED.coal_spending,
-            rations_spending = EXCLUDED.rations_spending,
-            cloth_spending = EXCLUDED.cloth_spending,
-            platinum_spending = EXCLUDED.platinum_spending,
-            starting_territory_count = EXCLUDED.starting_territory_count;
+
+    def _upsert_args(self) -> tuple:
         """
-        await conn.execute(
-            query,
+        Positional arguments for _UPSERT_QUERY, in column order.
+        """
+        return (
             self.faction_id,
             self.name,
             self.leader_character_id,
@@ -69,6 +78,15 @@ class Faction:
             self.starting_territory_count
         )
 
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, entries: List["Faction"]):
+        """
+        Insert or update many Faction entries with a single executemany.
+        """
+        if not entries:
+            return
+        await conn.executemany(cls._UPSERT_QUERY, [e._upsert_args() for e in entries])
+
     @classmethod
     async def fetch_by_id(cls, conn: asyncpg.Connection, faction_internal_id: int) -> Optional["Faction"]:
         """
@@ -97,6 +115,20 @@ class Faction:
         """, faction_id, guild_id)
         return cls(**row) if row else None
 
+    @classmethod
+    async def fetch_by_faction_ids(cls, conn: asyncpg.Connection, faction_ids: List[str], guild_id: int) -> List["Faction"]:
+        """
+        Fetch every Faction in a guild whose faction_id is in the given list.
+        """
+        rows = await conn.fetch("""
+            SELECT id, faction_id, name, leader_character_id, created_turn, has_declared_war, guild_id,
+                   nation, ore_spending, lumber_spending, coal_spending, rations_spending, cloth_spending, platinum_spending,
+                   starting_territory_count
+            FROM Faction
+            WHERE faction_id = ANY($1::TEXT[]) AND guild_id = $2;
+        """, list(faction_ids), guild_id)
+        return [cls(**row) for row in rows]
+
     @classmethod
     async def fetch_all(cls, conn: asyncpg.Connection, guild_id: int) -> List["Faction"]:
         """
@@ -112,6 +144,40 @@ class Faction:
         """, guild_id)
         return [cls(**row) for row in rows]
 
+    @classmethod
+    async def fetch_page_with_member_counts(
+        cls,
+        conn: asyncpg.Connection,
+        guild_id: int,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Tuple[List[Tuple["Faction", int]], int]:
+        """
+        Fetch a page of Factions in a guild with their member counts in one query.
+        Returns ([(faction, member_count)], total number of factions).
+        """
+        rows = await conn.fetch("""
+            SELECT f.id, f.faction_id, f.name, f.leader_character_id, f.created_turn, f.has_declared_war, f.guild_id,
+                   f.nation, f.ore_spending, f.lumber_spending, f.coal_spending, f.rations_spending, f.cloth_spending,
+                   f.platinum_spending, f.starting_territory_count,
+                   COUNT(fm.id) AS member_count,
+                   COUNT(*) OVER () AS total_count
+            FROM Faction f
+            LEFT JOIN FactionMember fm ON fm.faction_id = f.id
+            WHERE f.guild_id = $1
+            GROUP BY f.id
+            ORDER BY f.faction_id
+            LIMIT $2 OFFSET $3;
+        """, guild_id, limit, offset)
+        total = rows[0]['total_count'] if rows else 0
+        result = []
+        for row in rows:
+            data = dict(row)
+            member_count = data.pop('member_count')
+            data.pop('total_count')
+            result.append((cls(**data), member_count))
+        return result, total
+
     @classmethod
     async def delete(cls, conn: asyncpg.Connection, faction_id: str, guild_id: int) -> bool:
         """
@@ -1,6 +1,6 @@
 import asyncpg
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Dict
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,27 +32,45 @@ class FactionMember:
             self.guild_id
         )
 
+    _UPSERT_QUERY = """
+    INSERT INTO FactionMember (
+        faction_id, character_id, joined_turn, guild_id
+    )
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT (faction_id, character_id, guild_id) DO UPDATE
+    SET joined_turn = EXCLUDED.joined_turn;
+    """
+
     async def upsert(self, conn: asyncpg.Connection):
         """
         Insert or update this FactionMember entry.
         A character can now be a member of multiple factions.
         """
-        query = """
-        INSERT INTO FactionMember (
-            faction_id, character_id, joined_turn, guild_id
+        await conn.execute(
+            self._UPSERT_QUERY,
+            *self._upsert_args()
         )
-        VALUES ($1, $2, $3, $4)
-        ON CONFLICT (faction_id, character_id, guild_id) DO UPDATE
-        SET joined_turn = EXCLUDED.joined_turn;
+
+    def _upsert_args(self) -> tuple:
         """
-        await conn.execute(
-            query,
+        Positional arguments for _UPSERT_QUERY, in column order.
+        """
+        return (
             self.faction_id,
             self.character_id,
             self.joined_turn,
             self.guild_id
         )
 
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, entries: List["FactionMember"]):
+        """
+        Insert or update many FactionMember entries with a single executemany.
+        """
+        if not entries:
+            return
+        await conn.executemany(cls._UPSERT_QUERY, [e._upsert_args() for e in entries])
+
     @classmethod
     async def fetch_by_character(cls, conn: asyncpg.Connection, character_id: int, guild_id: int) -> Optional["FactionMember"]:
         """
@@ -84,6 +102,23 @@ class FactionMember:
         """, character_id, guild_id)
         return cls(**row) if row else None
 
+    @classmethod
+    async def fetch_represented_factions(cls, conn: asyncpg.Connection, guild_id: int) -> Dict[int, int]:
+        """
+        Map every character with a membership to the faction fetch_by_character would return:
+        the represented faction if set, otherwise the most recent membership.
+        """
+        rows = await conn.fetch("""
+            SELECT DISTINCT ON (fm.character_id) fm.character_id, fm.faction_id
+            FROM FactionMember fm
+            JOIN Character c ON c.id = fm.character_id AND c.guild_id = fm.guild_id
+            WHERE fm.guild_id = $1
+            ORDER BY fm.character_id,
+                     (fm.faction_id = c.represented_faction_id) IS TRUE DESC,
+                     fm.joined_turn DESC;
+        """, guild_id)
+        return {row['character_id']: row['faction_id'] for row in rows}
+
     @classmethod
     async def fetch_all_by_character(cls, conn: asyncpg.Connection, character_id: int, guild_id: int) -> List["FactionMember"]:
         """
@@ -124,6 +159,19 @@ class FactionMember:
         """, faction_id, guild_id)
         return [cls(**row) for row in rows]
 
+    @classmethod
+    async def fetch_all(cls, conn: asyncpg.Connection, guild_id: int) -> List["FactionMember"]:
+        """
+        Fetch all memberships in a guild, grouped by faction and ordered by joined_turn.
+        """
+        rows = await conn.fetch("""
+            SELECT id, faction_id, character_id, joined_turn, guild_id
+            FROM FactionMember
+            WHERE guild_id = $1
+            ORDER BY faction_id, joined_turn, id;
+        """, guild_id)
+        return [cls(**row) for row in rows]
+
     @classmethod
     async def delete(cls, conn: asyncpg.Connection, character_id: int, guild_id: int, faction_id: Optional[int] = None) -> bool:
         """
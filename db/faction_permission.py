@@ -37,6 +37,30 @@ class FactionPermission:
             self.guild_id
         )
 
+    @classmethod
+    async def insert_many(cls, conn: asyncpg.Connection, permissions: List["FactionPermission"], guild_id: int) -> int:
+        """
+        Insert many FactionPermission entries with a single COPY.
+        Duplicates and permissions that already exist are skipped.
+        Returns the number of permissions inserted.
+        """
+        existing = {
+            (p.faction_id, p.character_id, p.permission_type) for p in await cls.fetch_all(conn, guild_id)
+        }
+        records = []
+        for perm in permissions:
+            key = (perm.faction_id, perm.character_id, perm.permission_type)
+            if key not in existing:
+                existing.add(key)
+                records.append(key + (guild_id,))
+        if records:
+            await conn.copy_records_to_table(
+                'factionpermission',
+                records=records,
+                columns=['faction_id', 'character_id', 'permission_type', 'guild_id']
+            )
+        return len(records)
+
     async def delete(self, conn: asyncpg.Connection) -> bool:
         """
         Delete this specific permission.
@@ -111,6 +135,23 @@ class FactionPermission:
         """, faction_id, guild_id)
         return [cls(**row) for row in rows]
 
+    @classmethod
+    async def fetch_all(
+        cls,
+        conn: asyncpg.Connection,
+        guild_id: int
+    ) -> List["FactionPermission"]:
+        """
+        Fetch all permissions in a guild.
+        """
+        rows = await conn.fetch("""
+            SELECT id, faction_id, character_id, permission_type, guild_id
+            FROM FactionPermission
+            WHERE guild_id = $1
+            ORDER BY faction_id, character_id, permission_type;
+        """, guild_id)
+        return [cls(**row) for row in rows]
+
     @classmethod
     async def fetch_by_character(
         cls,
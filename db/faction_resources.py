@@ -72,6 +72,39 @@ class FactionResources:
         """, guild_id)
         return [cls(**row) for row in rows]
 
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, resources: List["FactionResources"]):
+        """
+        Insert or update many FactionResources entries in one statement.
+        """
+        if not resources:
+            return
+        await conn.execute("""
+            INSERT INTO FactionResources (
+                faction_id, ore, lumber, coal, rations, cloth, platinum, guild_id
+            )
+            SELECT * FROM unnest(
+                $1::INTEGER[], $2::INTEGER[], $3::INTEGER[], $4::INTEGER[],
+                $5::INTEGER[], $6::INTEGER[], $7::INTEGER[], $8::BIGINT[]
+            )
+            ON CONFLICT (faction_id, guild_id) DO UPDATE
+            SET ore = EXCLUDED.ore,
+                lumber = EXCLUDED.lumber,
+                coal = EXCLUDED.coal,
+                rations = EXCLUDED.rations,
+                cloth = EXCLUDED.cloth,
+                platinum = EXCLUDED.platinum;
+        """,
+            [r.faction_id for r in resources],
+            [r.ore for r in resources],
+            [r.lumber for r in resources],
+            [r.coal for r in resources],
+            [r.rations for r in resources],
+            [r.cloth for r in resources],
+            [r.platinum for r in resources],
+            [r.guild_id for r in resources]
+        )
+
     @classmethod
     async def delete(cls, conn: asyncpg.Connection, faction_id: int, guild_id: int) -> bool:
         """
@@ -30,6 +30,19 @@ class FailedBlend:
         """
         await conn.execute(query, self.product_item_number, self.product_type)
 
+    @classmethod
+    async def bulk_insert(cls, conn: asyncpg.Connection, failed_blends: List["FailedBlend"]):
+        """
+        Insert many FailedBlends with a single COPY.
+        Assumes the table has been cleared; product_type conflicts will raise.
+        """
+        records = [(fb.product_item_number, fb.product_type) for fb in failed_blends]
+        await conn.copy_records_to_table(
+            'failedblend',
+            records=records,
+            columns=['product_item_number', 'product_type']
+        )
+
     @classmethod
     async def fetch_by_type(cls, conn: asyncpg.Connection, product_type: str) -> Optional["FailedBlend"]:
         """
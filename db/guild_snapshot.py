@@ -0,0 +1,289 @@
+"""
+Binary snapshots of a guild's wargame state.
+
+A snapshot holds every wargame table for one guild as a PostgreSQL binary
+COPY stream per table, plus the wargame columns of the guild's characters.
+The streams are concatenated behind a small JSON manifest and compressed
+with zlib. Restoring clears the guild's rows and COPYs the streams back,
+keeping the original internal IDs so cross-table references stay valid.
+"""
+import asyncpg
+import io
+import json
+import struct
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bump when the set of tables or the container layout changes
+SNAPSHOT_SCHEMA_VERSION = 2
+
+SNAPSHOT_MAGIC = b'IROHSNAP'
+
+# Restore order; rows are cleared in reverse so references are removed first
+SNAPSHOT_TABLES = [
+    'WargameConfig',
+    'Faction',
+    'FactionMember',
+    'FactionResources',
+    'FactionPermission',
+    'FactionJoinRequest',
+    'UnitType',
+    'BuildingType',
+    'Territory',
+    'TerritoryAdjacency',
+    'Unit',
+    'Building',
+    'NavalUnitPosition',
+    'PlayerResources',
+    'WargameOrder',
+    'Alliance',
+    'War',
+    'WarParticipant',
+    'SpiritNexus',
+    'TurnLog',
+    'TurnReport',
+    'ResourceLedger',
+    'ResourceBalance',
+]
+
+# Character rows belong to hawky; only their wargame columns are captured and restored
+CHARACTER_COLUMNS = [
+    'id', 'ore_production', 'lumber_production', 'coal_production',
+    'rations_production', 'cloth_production', 'platinum_production',
+    'victory_points', 'represented_faction_id', 'representation_changed_turn',
+]
+
+
+@dataclass
+class GuildSnapshot:
+    """
+    A stored snapshot. data is None when fetched without its payload.
+    """
+    id: Optional[int] = None
+    turn_number: int = 0
+    schema_version: int = SNAPSHOT_SCHEMA_VERSION
+    automatic: bool = False
+    size_bytes: int = 0
+    data: Optional[bytes] = None
+    created_at: Optional[datetime] = None
+    guild_id: Optional[int] = None
+
+    @classmethod
+    async def capture(
+        cls,
+        conn: asyncpg.Connection,
+        guild_id: int,
+        turn_number: int,
+        automatic: bool = False
+    ) -> "GuildSnapshot":
+        """
+        Capture the guild's current wargame state. The snapshot is not stored; call insert().
+        """
+        column_rows = await conn.fetch("""
+            SELECT table_name, column_name
+            FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = ANY($1::TEXT[])
+            ORDER BY table_name, ordinal_position;
+        """, [t.lower() for t in SNAPSHOT_TABLES])
+        columns: Dict[str, List[str]] = {}
+        for row in column_rows:
+            columns.setdefault(row['table_name'], []).append(row['column_name'])
+
+        sections = [(t, columns[t.lower()]) for t in SNAPSHOT_TABLES] + [('Character', CHARACTER_COLUMNS)]
+        manifest: Dict[str, Any] = {'turn_number': turn_number, 'tables': []}
+        blobs = []
+        for table, table_columns in sections:
+            buffer = io.BytesIO()
+            select_list = ', '.join(f'"{c}"' for c in table_columns)
+            result = await conn.copy_from_query(
+                f"SELECT {select_list} FROM {table} WHERE guild_id = $1",
+                guild_id,
+                output=buffer,
+                format='binary'
+            )
+            blob = buffer.getvalue()
+            manifest['tables'].append({
+                'table': table,
+                'columns': table_columns,
+                'rows': int(result.split()[-1]),
+                'size': len(blob),
+            })
+            blobs.append(blob)
+
+        header = json.dumps(manifest).encode()
+        payload = struct.pack('>I', len(header)) + header + b''.join(blobs)
+        data = SNAPSHOT_MAGIC + struct.pack('>H', SNAPSHOT_SCHEMA_VERSION) + zlib.compress(payload)
+
+        logger.info(f"Captured snapshot of guild {guild_id} at turn {turn_number}: "
+                    f"{sum(t['rows'] for t in manifest['tables'])} rows, {len(data)} bytes compressed")
+        return cls(
+            turn_number=turn_number,
+            schema_version=SNAPSHOT_SCHEMA_VERSION,
+            automatic=automatic,
+            size_bytes=len(data),
+            data=data,
+            guild_id=guild_id
+        )
+
+    @staticmethod
+    def decode(data: bytes) -> tuple[Dict[str, Any], List[bytes]]:
+        """
+        Split a snapshot payload into its manifest and per-table COPY streams.
+
+        Raises:
+            ValueError: If the payload is not a snapshot or has a different schema version
+        """
+        if not data.startswith(SNAPSHOT_MAGIC):
+            raise ValueError("Not a guild snapshot.")
+        offset = len(SNAPSHOT_MAGIC)
+        (version,) = struct.unpack_from('>H', data, offset)
+        if version != SNAPSHOT_SCHEMA_VERSION:
+            raise ValueError(f"Snapshot schema version {version} cannot be restored by version {SNAPSHOT_SCHEMA_VERSION}.")
+
+        payload = zlib.decompress(data[offset + 2:])
+        (header_size,) = struct.unpack_from('>I', payload, 0)
+        manifest = json.loads(payload[4:4 + header_size])
+        blobs = []
+        position = 4 + header_size
+        for table in manifest['tables']:
+            blobs.append(payload[position:position + table['size']])
+            position += table['size']
+        return manifest, blobs
+
+    async def restore(self, conn: asyncpg.Connection) -> int:
+        """
+        Replace the guild's wargame state with this snapshot.
+
+        Must run inside a transaction; a failure part way leaves the guild as it was.
+
+        Returns:
+            Number of rows restored
+
+        Raises:
+            ValueError: If the payload cannot be decoded
+        """
+        manifest, blobs = self.decode(self.data)
+
+        for table in reversed(SNAPSHOT_TABLES):
+            await conn.execute(f"DELETE FROM {table} WHERE guild_id = $1;", self.guild_id)
+
+        restored = 0
+        for section, blob in zip(manifest['tables'], blobs):
+            if section['rows'] == 0:
+                continue
+            if section['table'] == 'Character':
+                await self._restore_characters(conn, section['columns'], blob)
+            else:
+                await conn.copy_to_table(
+                    section['table'].lower(),
+                    source=io.BytesIO(blob),
+                    columns=section['columns'],
+                    format='binary'
+                )
+            restored += section['rows']
+
+        logger.warning(f"Restored snapshot {self.id} (turn {self.turn_number}) for guild {self.guild_id}: {restored} rows")
+        return restored
+
+    async def _restore_characters(self, conn: asyncpg.Connection, columns: List[str], blob: bytes):
+        """
+        Write captured wargame columns back onto the guild's existing characters.
+        """
+        await conn.execute(f"""
+            CREATE TEMP TABLE snapshot_character ON COMMIT DROP AS
+            SELECT {', '.join(columns)} FROM Character WITH NO DATA;
+        """)
+        await conn.copy_to_table(
+            'snapshot_character',
+            source=io.BytesIO(blob),
+            columns=columns,
+            format='binary'
+        )
+        assignments = ', '.join(f"{c} = s.{c}" for c in columns if c != 'id')
+        await conn.execute(f"""
+            UPDATE Character c SET {assignments}
+            FROM snapshot_character s
+            WHERE c.id = s.id AND c.guild_id = $1;
+        """, self.guild_id)
+        await conn.execute("DROP TABLE snapshot_character;")
+
+    async def insert(self, conn: asyncpg.Connection):
+        """
+        Store this snapshot.
+        """
+        row = await conn.fetchrow("""
+            INSERT INTO GuildSnapshot (turn_number, schema_version, automatic, size_bytes, data, guild_id)
+            VALUES ($1, $2, $3, $4, $5, $6)
+            RETURNING id, created_at;
+        """, self.turn_number, self.schema_version, self.automatic, self.size_bytes, self.data, self.guild_id)
+        self.id = row['id']
+        self.created_at = row['created_at']
+
+    @classmethod
+    async def fetch_by_id(cls, conn: asyncpg.Connection, snapshot_id: int, guild_id: int) -> Optional["GuildSnapshot"]:
+        """
+        Fetch a snapshot with its payload.
+        """
+        row = await conn.fetchrow("""
+            SELECT id, turn_number, schema_version, automatic, size_bytes, data, created_at, guild_id
+            FROM GuildSnapshot
+            WHERE id = $1 AND guild_id = $2;
+        """, snapshot_id, guild_id)
+        return cls(**row) if row else None
+
+    @classmethod
+    async def fetch_latest(cls, conn: asyncpg.Connection, guild_id: int) -> Optional["GuildSnapshot"]:
+        """
+        Fetch the most recent snapshot of a guild with its payload.
+        """
+        row = await conn.fetchrow("""
+            SELECT id, turn_number, schema_version, automatic, size_bytes, data, created_at, guild_id
+            FROM GuildSnapshot
+            WHERE guild_id = $1
+            ORDER BY created_at DESC, id DESC
+            LIMIT 1;
+        """, guild_id)
+        return cls(**row) if row else None
+
+    @classmethod
+    async def fetch_all(cls, conn: asyncpg.Connection, guild_id: int) -> List["GuildSnapshot"]:
+        """
+        Fetch every snapshot of a guild without payloads, newest first.
+        """
+        rows = await conn.fetch("""
+            SELECT id, turn_number, schema_version, automatic, size_bytes, created_at, guild_id
+            FROM GuildSnapshot
+            WHERE guild_id = $1
+            ORDER BY created_at DESC, id DESC;
+        """, guild_id)
+        return [cls(**row) for row in rows]
+
+    @classmethod
+    async def prune_automatic(cls, conn: asyncpg.Connection, guild_id: int, keep: int) -> int:
+        """
+        Delete all but the newest `keep` automatic snapshots of a guild.
+        Returns the number deleted.
+        """
+        result = await conn.execute("""
+            DELETE FROM GuildSnapshot
+            WHERE guild_id = $1 AND automatic AND id NOT IN (
+                SELECT id FROM GuildSnapshot
+                WHERE guild_id = $1 AND automatic
+                ORDER BY created_at DESC, id DESC
+                LIMIT $2
+            );
+        """, guild_id, keep)
+        return int(result.split()[-1])
+
+    @classmethod
+    async def delete_all(cls, conn: asyncpg.Connection, guild_id: int):
+        """
+        Delete all snapshots of a guild.
+        """
+        result = await conn.execute("DELETE FROM GuildSnapshot WHERE guild_id = $1;", guild_id)
+        logger.warning(f"All GuildSnapshot entries deleted for guild {guild_id}. Result: {result}")
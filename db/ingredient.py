@@ -59,6 +59,31 @@ class Ingredient:
             self.properties, self.flavor_text, self.rules_text, self.skip_export
         )
 
+    @classmethod
+    async def bulk_insert(cls, conn: asyncpg.Connection, ingredients: List["Ingredient"]):
+        """
+        Insert many Ingredients with a single COPY.
+        Assumes the table has been cleared; item_number conflicts will raise.
+        """
+        records = [
+            (
+                ing.item_number, ing.name, ing.macro, ing.rarity,
+                ing.primary_chakra, ing.primary_chakra_strength,
+                ing.secondary_chakra, ing.secondary_chakra_strength,
+                ing.properties, ing.flavor_text, ing.rules_text, ing.skip_export
+            )
+            for ing in ingredients
+        ]
+        await conn.copy_records_to_table(
+            'ingredient',
+            records=records,
+            columns=[
+                'item_number', 'name', 'macro', 'rarity', 'primary_chakra',
+                'primary_chakra_strength', 'secondary_chakra', 'secondary_chakra_strength',
+                'properties', 'flavor_text', 'rules_text', 'skip_export'
+            ]
+        )
+
     @classmethod
     async def fetch_by_item_number(cls, conn: asyncpg.Connection, item_number: str) -> Optional["Ingredient"]:
         """
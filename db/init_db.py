@@ -103,6 +103,23 @@ async def ensure_tables():
     await conn.execute("ALTER TABLE Alias ADD COLUMN IF NOT EXISTS alias TEXT;")
     await conn.execute("ALTER TABLE Alias ADD COLUMN IF NOT EXISTS guild_id BIGINT;")
 
+    # --- LetterCount table ---
+    # One counter per (character, quota period); a new period is an implicit reset
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS LetterCount (
+        character_id INTEGER NOT NULL REFERENCES Character(id) ON DELETE CASCADE,
+        period_start TIMESTAMP NOT NULL,
+        count SMALLINT NOT NULL DEFAULT 0,
+        guild_id BIGINT NOT NULL,
+        PRIMARY KEY (character_id, period_start)
+    );
+    """)
+
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_letter_count_guild
+    ON LetterCount(guild_id);
+    """)
+
     # Foreign key constraint linking guild_id -> ServerConfig.guild_id
     await conn.execute("""
     DO $$
@@ -812,6 +829,27 @@ async def ensure_tables():
         ON TurnLog(entity_type, entity_id, guild_id);
     """)
 
+    # --- TurnReport table (report lines rendered once when a turn resolves) ---
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS TurnReport (
+        id SERIAL PRIMARY KEY,
+        turn_number INTEGER NOT NULL,
+        character_id INTEGER REFERENCES Character(id) ON DELETE CASCADE,
+        phase VARCHAR(50) NOT NULL,
+        event_count INTEGER NOT NULL DEFAULT 0,
+        lines TEXT[] NOT NULL DEFAULT '{}',
+        event_types TEXT[] NOT NULL DEFAULT '{}',
+        guild_id BIGINT NOT NULL REFERENCES ServerConfig(guild_id) ON DELETE CASCADE
+    );
+    """)
+
+    await conn.execute("ALTER TABLE TurnReport ADD COLUMN IF NOT EXISTS event_types TEXT[] NOT NULL DEFAULT '{}';")
+
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_turn_report_turn
+        ON TurnReport(guild_id, turn_number, character_id);
+    """)
+
     # --- Alliance table ---
     await conn.execute("""
     CREATE TABLE IF NOT EXISTS Alliance (
@@ -973,6 +1011,72 @@ async def ensure_tables():
         ON SpiritNexus(territory_id, guild_id);
     """)
 
+    # --- ResourceLedger table (append-only journal of balance changes) ---
+    # owner_id is Character.id or Faction.id depending on owner_type; amounts are signed deltas
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS ResourceLedger (
+        id BIGSERIAL PRIMARY KEY,
+        turn_number INTEGER NOT NULL,
+        phase VARCHAR(50) NOT NULL,
+        reason VARCHAR(50) NOT NULL,
+        owner_type VARCHAR(20) NOT NULL,
+        owner_id INTEGER NOT NULL,
+        ore INTEGER NOT NULL DEFAULT 0,
+        lumber INTEGER NOT NULL DEFAULT 0,
+        coal INTEGER NOT NULL DEFAULT 0,
+        rations INTEGER NOT NULL DEFAULT 0,
+        cloth INTEGER NOT NULL DEFAULT 0,
+        platinum INTEGER NOT NULL DEFAULT 0,
+        order_id INTEGER,
+        guild_id BIGINT NOT NULL REFERENCES ServerConfig(guild_id) ON DELETE CASCADE
+    );
+    """)
+
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_resource_ledger_owner
+        ON ResourceLedger(guild_id, owner_type, owner_id, turn_number);
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_resource_ledger_turn
+        ON ResourceLedger(guild_id, turn_number);
+    """)
+
+    # --- ResourceBalance table (balances materialized at the end of each turn) ---
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS ResourceBalance (
+        turn_number INTEGER NOT NULL,
+        owner_type VARCHAR(20) NOT NULL,
+        owner_id INTEGER NOT NULL,
+        ore INTEGER NOT NULL DEFAULT 0,
+        lumber INTEGER NOT NULL DEFAULT 0,
+        coal INTEGER NOT NULL DEFAULT 0,
+        rations INTEGER NOT NULL DEFAULT 0,
+        cloth INTEGER NOT NULL DEFAULT 0,
+        platinum INTEGER NOT NULL DEFAULT 0,
+        guild_id BIGINT NOT NULL REFERENCES ServerConfig(guild_id) ON DELETE CASCADE,
+        PRIMARY KEY (guild_id, turn_number, owner_type, owner_id)
+    );
+    """)
+
+    # --- GuildSnapshot table (compressed binary COPY of a guild's wargame tables) ---
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS GuildSnapshot (
+        id SERIAL PRIMARY KEY,
+        turn_number INTEGER NOT NULL,
+        schema_version INTEGER NOT NULL,
+        automatic BOOLEAN NOT NULL DEFAULT FALSE,
+        size_bytes INTEGER NOT NULL DEFAULT 0,
+        data BYTEA NOT NULL,
+        created_at TIMESTAMP DEFAULT NOW(),
+        guild_id BIGINT NOT NULL REFERENCES ServerConfig(guild_id) ON DELETE CASCADE
+    );
+    """)
+
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_guild_snapshot_guild
+        ON GuildSnapshot(guild_id, created_at);
+    """)
+
     # --- Add foreign key constraints for faction ownership ---
     # FK for Territory.controller_faction_id -> Faction.id (ON DELETE SET NULL)
     await conn.execute("""
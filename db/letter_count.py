@@ -0,0 +1,109 @@
+import asyncpg
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime, time, timedelta
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def letter_period_start(reset_time: Optional[time], now: Optional[datetime] = None) -> datetime:
+    """
+    Return the start of the letter quota period containing `now`.
+    A period runs from one daily reset_time (UTC, default midnight) to the next,
+    so a new period starting is what resets everyone's count.
+    """
+    if reset_time is None:
+        reset_time = time(0, 0)
+    if now is None:
+        now = datetime.now()
+
+    start = datetime.combine(now.date(), reset_time)
+    if start > now:
+        start -= timedelta(days=1)
+    return start
+
+
+@dataclass
+class LetterCount:
+    """
+    Letters sent by a character during one quota period.
+    A character's rows from older periods are deleted when their count rolls over.
+    """
+    character_id: int = 0
+    period_start: Optional[datetime] = None
+    count: int = 0
+    guild_id: int = 0
+
+    @classmethod
+    async def fetch_count(cls, conn: asyncpg.Connection, character_id: int, period_start: datetime) -> int:
+        """
+        Fetch the number of letters sent by a character in the given period.
+        """
+        count = await conn.fetchval("""
+            SELECT count
+            FROM LetterCount
+            WHERE character_id = $1 AND period_start = $2;
+        """, character_id, period_start)
+        return count or 0
+
+    @classmethod
+    async def try_increment(
+        cls,
+        conn: asyncpg.Connection,
+        character_id: int,
+        guild_id: int,
+        period_start: datetime,
+        letter_limit: Optional[int]
+    ) -> Optional[int]:
+        """
+        Atomically count one more letter if the character is under letter_limit.
+        The character's counters from earlier periods are pruned in the same statement.
+        Returns the new count, or None if the limit has been reached.
+        A letter_limit of None means unlimited.
+        """
+        if letter_limit is not None and letter_limit <= 0:
+            return None
+
+        return await conn.fetchval("""
+            WITH pruned AS (
+                DELETE FROM LetterCount
+                WHERE character_id = $1 AND period_start < $2
+            )
+            INSERT INTO LetterCount (character_id, period_start, count, guild_id)
+            VALUES ($1, $2, 1, $3)
+            ON CONFLICT (character_id, period_start) DO UPDATE
+            SET count = LetterCount.count + 1
+            WHERE $4::INTEGER IS NULL OR LetterCount.count < $4::INTEGER
+            RETURNING count;
+        """, character_id, period_start, guild_id, letter_limit)
+
+    @classmethod
+    async def set_count(
+        cls,
+        conn: asyncpg.Connection,
+        character_id: int,
+        guild_id: int,
+        period_start: datetime,
+        count: int
+    ):
+        """
+        Overwrite a character's count for the given period (admin edits).
+        """
+        await conn.execute("""
+            INSERT INTO LetterCount (character_id, period_start, count, guild_id)
+            VALUES ($1, $2, $3, $4)
+            ON CONFLICT (character_id, period_start) DO UPDATE
+            SET count = EXCLUDED.count;
+        """, character_id, period_start, count, guild_id)
+
+    @classmethod
+    async def reset_guild(cls, conn: asyncpg.Connection, guild_id: int) -> int:
+        """
+        Manually reset a guild by deleting its counters, including stale ones from past periods.
+        Returns the number of rows deleted.
+        """
+        result = await conn.execute("DELETE FROM LetterCount WHERE guild_id = $1;", guild_id)
+        deleted_count = int(result.split()[-1]) if result.startswith("DELETE") else 0
+        logger.info(f"🔄 Reset {deleted_count} letter counters in guild {guild_id}.")
+        return deleted_count
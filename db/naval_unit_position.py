@@ -7,7 +7,7 @@ territories each naval unit occupies.
 """
 import asyncpg
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -109,6 +109,59 @@ class NavalUnitPosition:
         """, unit_id, guild_id)
         return [row['territory_id'] for row in rows]
 
+    @classmethod
+    async def fetch_territories_by_units(
+        cls,
+        conn: asyncpg.Connection,
+        unit_ids: List[int],
+        guild_id: int
+    ) -> Dict[int, List[str]]:
+        """
+        Fetch the territory IDs of several naval units in one query.
+
+        Args:
+            conn: Database connection
+            unit_ids: The units' internal IDs
+            guild_id: Guild ID
+
+        Returns:
+            {unit internal ID: territory_id strings ordered by position_index}; units without positions are absent
+        """
+        rows = await conn.fetch("""
+            SELECT unit_id, territory_id
+            FROM NavalUnitPosition
+            WHERE unit_id = ANY($1::INTEGER[]) AND guild_id = $2
+            ORDER BY unit_id, position_index;
+        """, unit_ids, guild_id)
+        result: Dict[int, List[str]] = {}
+        for row in rows:
+            result.setdefault(row['unit_id'], []).append(row['territory_id'])
+        return result
+
+    @classmethod
+    async def fetch_all(
+        cls,
+        conn: asyncpg.Connection,
+        guild_id: int
+    ) -> List["NavalUnitPosition"]:
+        """
+        Fetch every position entry in a guild, ordered by unit then position_index.
+
+        Args:
+            conn: Database connection
+            guild_id: Guild ID
+
+        Returns:
+            List of NavalUnitPosition objects
+        """
+        rows = await conn.fetch("""
+            SELECT id, unit_id, territory_id, position_index, guild_id
+            FROM NavalUnitPosition
+            WHERE guild_id = $1
+            ORDER BY unit_id, position_index;
+        """, guild_id)
+        return [cls(**dict(row)) for row in rows]
+
     @classmethod
     async def fetch_units_in_territory(
         cls,
@@ -200,6 +253,73 @@ class NavalUnitPosition:
         logger.info(f"Set {len(positions)} positions for unit_id={unit_id}: {territory_ids}")
         return positions
 
+    @classmethod
+    async def set_windows(
+        cls,
+        conn: asyncpg.Connection,
+        windows: Dict[int, List[str]],
+        guild_id: int
+    ) -> int:
+        """
+        Set the positions of many naval units at once.
+
+        Units whose stored window already matches are left untouched. The rest
+        are cleared with one DELETE and rewritten with one COPY. As with
+        set_positions, a territory listed twice keeps its last position_index.
+
+        Args:
+            conn: Database connection
+            windows: Unit internal ID -> territory IDs in order
+            guild_id: Guild ID
+
+        Returns:
+            Number of units whose window changed
+        """
+        if not windows:
+            return 0
+
+        def rows_for(territory_ids: List[str]) -> List[Tuple[str, int]]:
+            last_index = {territory_id: index for index, territory_id in enumerate(territory_ids)}
+            return sorted(last_index.items(), key=lambda item: item[1])
+
+        rows = await conn.fetch("""
+            SELECT unit_id, territory_id, position_index
+            FROM NavalUnitPosition
+            WHERE unit_id = ANY($1::INTEGER[]) AND guild_id = $2
+            ORDER BY unit_id, position_index;
+        """, list(windows.keys()), guild_id)
+        current: Dict[int, List[Tuple[str, int]]] = {}
+        for row in rows:
+            current.setdefault(row['unit_id'], []).append((row['territory_id'], row['position_index']))
+
+        changed = {
+            unit_id: rows_for(territory_ids)
+            for unit_id, territory_ids in windows.items()
+            if current.get(unit_id, []) != rows_for(territory_ids)
+        }
+        if not changed:
+            return 0
+
+        await conn.execute("""
+            DELETE FROM NavalUnitPosition
+            WHERE unit_id = ANY($1::INTEGER[]) AND guild_id = $2;
+        """, list(changed.keys()), guild_id)
+
+        records = [
+            (unit_id, territory_id, position_index, guild_id)
+            for unit_id, unit_rows in changed.items()
+            for territory_id, position_index in unit_rows
+        ]
+        if records:
+            await conn.copy_records_to_table(
+                'navalunitposition',
+                records=records,
+                columns=['unit_id', 'territory_id', 'position_index', 'guild_id']
+            )
+
+        logger.info(f"Set windows for {len(changed)} of {len(windows)} naval units in guild {guild_id}")
+        return len(changed)
+
     @classmethod
     async def delete_all(cls, conn: asyncpg.Connection, guild_id: int):
         """
@@ -69,6 +69,40 @@ class Order:
             self.guild_id
         )
 
+    @classmethod
+    async def insert_many(cls, conn: asyncpg.Connection, orders: List["Order"]):
+        """
+        Insert many new Order entries in one batch.
+        """
+        if not orders:
+            return
+        await conn.executemany("""
+            INSERT INTO WargameOrder (
+                order_id, order_type, unit_ids, character_id, turn_number,
+                phase, priority, status, order_data, result_data,
+                submitted_at, updated_at, updated_turn, guild_id
+            )
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14);
+        """, [
+            (
+                order.order_id,
+                order.order_type,
+                order.unit_ids,
+                order.character_id,
+                order.turn_number,
+                order.phase,
+                order.priority,
+                order.status,
+                json.dumps(order.order_data) if order.order_data else '{}',
+                json.dumps(order.result_data) if order.result_data else None,
+                order.submitted_at,
+                order.updated_at,
+                order.updated_turn,
+                order.guild_id
+            )
+            for order in orders
+        ])
+
     @classmethod
     async def fetch_by_order_id(cls, conn: asyncpg.Connection, order_id: str, guild_id: int) -> Optional["Order"]:
         """
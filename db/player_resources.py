@@ -1,6 +1,6 @@
 import asyncpg
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -60,6 +60,51 @@ class PlayerResources:
         """, character_id, guild_id)
         return cls(**row) if row else None
 
+    @classmethod
+    async def fetch_all(cls, conn: asyncpg.Connection, guild_id: int) -> List["PlayerResources"]:
+        """
+        Fetch all PlayerResources entries for a guild.
+        """
+        rows = await conn.fetch("""
+            SELECT id, character_id, ore, lumber, coal, rations, cloth, platinum, guild_id
+            FROM PlayerResources
+            WHERE guild_id = $1;
+        """, guild_id)
+        return [cls(**row) for row in rows]
+
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, resources: List["PlayerResources"]):
+        """
+        Insert or update many PlayerResources entries in one statement.
+        """
+        if not resources:
+            return
+        await conn.execute("""
+            INSERT INTO PlayerResources (
+                character_id, ore, lumber, coal, rations, cloth, platinum, guild_id
+            )
+            SELECT * FROM unnest(
+                $1::INTEGER[], $2::INTEGER[], $3::INTEGER[], $4::INTEGER[],
+                $5::INTEGER[], $6::INTEGER[], $7::INTEGER[], $8::BIGINT[]
+            )
+            ON CONFLICT (character_id, guild_id) DO UPDATE
+            SET ore = EXCLUDED.ore,
+                lumber = EXCLUDED.lumber,
+                coal = EXCLUDED.coal,
+                rations = EXCLUDED.rations,
+                cloth = EXCLUDED.cloth,
+                platinum = EXCLUDED.platinum;
+        """,
+            [r.character_id for r in resources],
+            [r.ore for r in resources],
+            [r.lumber for r in resources],
+            [r.coal for r in resources],
+            [r.rations for r in resources],
+            [r.cloth for r in resources],
+            [r.platinum for r in resources],
+            [r.guild_id for r in resources]
+        )
+
     @classmethod
     async def delete(cls, conn: asyncpg.Connection, character_id: int, guild_id: int) -> bool:
         """
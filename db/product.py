@@ -46,6 +46,28 @@ class Product:
             self.flavor_text, self.rules_text, self.skip_export, self.skip_prod
         )
 
+    @classmethod
+    async def bulk_insert(cls, conn: asyncpg.Connection, products: List["Product"]):
+        """
+        Insert many Products with a single COPY.
+        Assumes the table has been cleared; (item_number, product_type) conflicts will raise.
+        """
+        records = [
+            (
+                prod.item_number, prod.name, prod.macro, prod.product_type,
+                prod.flavor_text, prod.rules_text, prod.skip_export, prod.skip_prod
+            )
+            for prod in products
+        ]
+        await conn.copy_records_to_table(
+            'product',
+            records=records,
+            columns=[
+                'item_number', 'name', 'macro', 'product_type',
+                'flavor_text', 'rules_text', 'skip_export', 'skip_prod'
+            ]
+        )
+
     @classmethod
     async def fetch_by_item_number(cls, conn: asyncpg.Connection, item_number: str) -> Optional["Product"]:
         """
@@ -0,0 +1,71 @@
+import asyncpg
+from dataclasses import dataclass
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResourceBalance:
+    """
+    A character's or faction's resources as they stood at the end of a turn.
+    """
+    turn_number: int = 0
+    owner_type: str = ""
+    owner_id: int = 0
+    ore: int = 0
+    lumber: int = 0
+    coal: int = 0
+    rations: int = 0
+    cloth: int = 0
+    platinum: int = 0
+    guild_id: Optional[int] = None
+
+    @classmethod
+    async def snapshot_turn(cls, conn: asyncpg.Connection, turn_number: int, guild_id: int):
+        """
+        Materialize every current PlayerResources and FactionResources row as the
+        balances at the end of turn_number, in one statement.
+        """
+        result = await conn.execute("""
+            INSERT INTO ResourceBalance (
+                turn_number, owner_type, owner_id, ore, lumber, coal, rations, cloth, platinum, guild_id
+            )
+            SELECT $1, 'character', character_id,
+                   COALESCE(ore, 0), COALESCE(lumber, 0), COALESCE(coal, 0), COALESCE(rations, 0), COALESCE(cloth, 0), COALESCE(platinum, 0), guild_id
+            FROM PlayerResources
+            WHERE guild_id = $2
+            UNION ALL
+            SELECT $1, 'faction', faction_id,
+                   COALESCE(ore, 0), COALESCE(lumber, 0), COALESCE(coal, 0), COALESCE(rations, 0), COALESCE(cloth, 0), COALESCE(platinum, 0), guild_id
+            FROM FactionResources
+            WHERE guild_id = $2
+            ON CONFLICT (guild_id, turn_number, owner_type, owner_id) DO UPDATE
+            SET ore = EXCLUDED.ore,
+                lumber = EXCLUDED.lumber,
+                coal = EXCLUDED.coal,
+                rations = EXCLUDED.rations,
+                cloth = EXCLUDED.cloth,
+                platinum = EXCLUDED.platinum;
+        """, turn_number, guild_id)
+        logger.info(f"Snapshot resource balances for guild {guild_id}, turn {turn_number}. Result: {result}")
+
+    @classmethod
+    async def fetch(
+        cls,
+        conn: asyncpg.Connection,
+        owner_type: str,
+        owner_id: int,
+        turn_number: int,
+        guild_id: int
+    ) -> Optional["ResourceBalance"]:
+        """
+        Fetch an owner's balance at the end of a turn.
+        """
+        row = await conn.fetchrow("""
+            SELECT turn_number, owner_type, owner_id, ore, lumber, coal, rations, cloth, platinum, guild_id
+            FROM ResourceBalance
+            WHERE owner_type = $1 AND owner_id = $2 AND turn_number = $3 AND guild_id = $4;
+        """, owner_type, owner_id, turn_number, guild_id)
+        return cls(**row) if row else None
@@ -0,0 +1,123 @@
+import asyncpg
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+LEDGER_RESOURCE_TYPES = ('ore', 'lumber', 'coal', 'rations', 'cloth', 'platinum')
+
+
+@dataclass
+class ResourceLedgerEntry:
+    """
+    One signed change to a character's or faction's resources.
+    Rows are only ever appended; a turn's history is the sum of its entries.
+    owner_id is Character.id when owner_type is 'character' and Faction.id when 'faction'.
+    """
+    id: Optional[int] = None
+    turn_number: int = 0
+    phase: str = ""
+    reason: str = ""
+    owner_type: str = ""
+    owner_id: int = 0
+    ore: int = 0
+    lumber: int = 0
+    coal: int = 0
+    rations: int = 0
+    cloth: int = 0
+    platinum: int = 0
+    order_id: Optional[int] = None
+    guild_id: Optional[int] = None
+
+    @classmethod
+    async def insert_many(cls, conn: asyncpg.Connection, entries: List["ResourceLedgerEntry"]):
+        """
+        Append many entries using a single COPY.
+        """
+        if not entries:
+            return
+        records = [
+            (
+                e.turn_number, e.phase, e.reason, e.owner_type, e.owner_id,
+                e.ore, e.lumber, e.coal, e.rations, e.cloth, e.platinum,
+                e.order_id, e.guild_id
+            )
+            for e in entries
+        ]
+        await conn.copy_records_to_table(
+            'resourceledger',
+            records=records,
+            columns=[
+                'turn_number', 'phase', 'reason', 'owner_type', 'owner_id',
+                'ore', 'lumber', 'coal', 'rations', 'cloth', 'platinum',
+                'order_id', 'guild_id'
+            ]
+        )
+
+    @classmethod
+    async def fetch_by_turn(cls, conn: asyncpg.Connection, turn_number: int, guild_id: int) -> List["ResourceLedgerEntry"]:
+        """
+        Fetch every entry recorded for a turn, in the order they were written.
+        """
+        rows = await conn.fetch("""
+            SELECT id, turn_number, phase, reason, owner_type, owner_id,
+                   ore, lumber, coal, rations, cloth, platinum, order_id, guild_id
+            FROM ResourceLedger
+            WHERE turn_number = $1 AND guild_id = $2
+            ORDER BY id;
+        """, turn_number, guild_id)
+        return [cls(**row) for row in rows]
+
+    @classmethod
+    async def fetch_turn_summary(
+        cls,
+        conn: asyncpg.Connection,
+        owner_type: str,
+        owner_id: int,
+        turn_number: int,
+        guild_id: int
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Sum an owner's entries for a turn, grouped by reason.
+        Returns {reason: {resource: signed amount}}.
+        """
+        rows = await conn.fetch("""
+            SELECT reason,
+                   SUM(ore) AS ore, SUM(lumber) AS lumber, SUM(coal) AS coal,
+                   SUM(rations) AS rations, SUM(cloth) AS cloth, SUM(platinum) AS platinum
+            FROM ResourceLedger
+            WHERE owner_type = $1 AND owner_id = $2 AND turn_number = $3 AND guild_id = $4
+            GROUP BY reason
+            ORDER BY reason;
+        """, owner_type, owner_id, turn_number, guild_id)
+        return {
+            row['reason']: {rt: int(row[rt]) for rt in LEDGER_RESOURCE_TYPES}
+            for row in rows
+        }
+
+    @classmethod
+    async def fetch_turn_summaries(
+        cls,
+        conn: asyncpg.Connection,
+        turn_number: int,
+        guild_id: int
+    ) -> Dict[Tuple[str, int], Dict[str, Dict[str, int]]]:
+        """
+        Sum every owner's entries for a turn, grouped by reason, in one query.
+        Returns {(owner_type, owner_id): {reason: {resource: signed amount}}}.
+        """
+        rows = await conn.fetch("""
+            SELECT owner_type, owner_id, reason,
+                   SUM(ore) AS ore, SUM(lumber) AS lumber, SUM(coal) AS coal,
+                   SUM(rations) AS rations, SUM(cloth) AS cloth, SUM(platinum) AS platinum
+            FROM ResourceLedger
+            WHERE turn_number = $1 AND guild_id = $2
+            GROUP BY owner_type, owner_id, reason
+            ORDER BY owner_type, owner_id, reason;
+        """, turn_number, guild_id)
+        result: Dict[Tuple[str, int], Dict[str, Dict[str, int]]] = {}
+        for row in rows:
+            owner = (row['owner_type'], row['owner_id'])
+            result.setdefault(owner, {})[row['reason']] = {rt: int(row[rt]) for rt in LEDGER_RESOURCE_TYPES}
+        return result
@@ -18,28 +18,46 @@ class SpiritNexus:
     territory_id: str = ""      # Reference to Territory
     guild_id: Optional[int] = None
 
+    _UPSERT_QUERY = """
+    INSERT INTO SpiritNexus (
+        identifier, health, territory_id, guild_id
+    )
+    VALUES ($1, $2, $3, $4)
+    ON CONFLICT (identifier, guild_id) DO UPDATE
+    SET health = EXCLUDED.health,
+        territory_id = EXCLUDED.territory_id
+    RETURNING id;
+    """
+
     async def upsert(self, conn: asyncpg.Connection):
         """
         Insert or update this SpiritNexus entry.
         The tuple (identifier, guild_id) must be unique.
         """
-        query = """
-        INSERT INTO SpiritNexus (
-            identifier, health, territory_id, guild_id
-        )
-        VALUES ($1, $2, $3, $4)
-        ON CONFLICT (identifier, guild_id) DO UPDATE
-        SET health = EXCLUDED.health,
-            territory_id = EXCLUDED.territory_id
-        RETURNING id;
-        """
         result = await conn.fetchrow(
-            query,
-            self.identifier, self.health, self.territory_id, self.guild_id
+            self._UPSERT_QUERY,
+            *self._upsert_args()
         )
         if result:
             self.id = result['id']
 
+    def _upsert_args(self) -> tuple:
+        """
+        Positional arguments for _UPSERT_QUERY, in column order.
+        """
+        return (
+            self.identifier, self.health, self.territory_id, self.guild_id
+        )
+
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, entries: List["SpiritNexus"]):
+        """
+        Insert or update many SpiritNexus entries with a single executemany.
+        """
+        if not entries:
+            return
+        await conn.executemany(cls._UPSERT_QUERY, [e._upsert_args() for e in entries])
+
     @classmethod
     async def fetch_by_id(cls, conn: asyncpg.Connection, nexus_id: int) -> Optional["SpiritNexus"]:
         """
@@ -40,6 +40,25 @@ class SubsetRecipe:
             self.quantity_produced, sorted_ingredients
         )
 
+    @classmethod
+    async def bulk_insert(cls, conn: asyncpg.Connection, recipes: List["SubsetRecipe"]):
+        """
+        Insert many SubsetRecipes with a single COPY.
+        Ingredients are sorted descending, matching upsert().
+        """
+        records = [
+            (
+                recipe.product_item_number, recipe.product_type,
+                recipe.quantity_produced, sorted(recipe.ingredients, reverse=True)
+            )
+            for recipe in recipes
+        ]
+        await conn.copy_records_to_table(
+            'subsetrecipe',
+            records=records,
+            columns=['product_item_number', 'product_type', 'quantity_produced', 'ingredients']
+        )
+
     @classmethod
     async def fetch_matching_subsets(
         cls,
@@ -1,6 +1,7 @@
 import asyncpg
 from dataclasses import dataclass
-from typing import Optional, List, Union, TYPE_CHECKING
+from typing import Optional, List, Tuple, Union, TYPE_CHECKING
+from db.territory_graph import territory_graphs
 import logging
 
 if TYPE_CHECKING:
@@ -30,36 +31,46 @@ class Territory:
     keywords: Optional[List[str]] = None
     guild_id: Optional[int] = None
 
+    _UPSERT_QUERY = """
+    INSERT INTO Territory (
+        territory_id, name, terrain_type, ore_production, lumber_production,
+        coal_production, rations_production, cloth_production, platinum_production,
+        victory_points, siege_defense, controller_character_id, controller_faction_id, original_nation, keywords, guild_id
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
+    ON CONFLICT (territory_id, guild_id) DO UPDATE
+    SET name = EXCLUDED.name,
+        terrain_type = EXCLUDED.terrain_type,
+        ore_production = EXCLUDED.ore_production,
+        lumber_production = EXCLUDED.lumber_production,
+        coal_production = EXCLUDED.coal_production,
+        rations_production = EXCLUDED.rations_production,
+        cloth_production = EXCLUDED.cloth_production,
+        platinum_production = EXCLUDED.platinum_production,
+        victory_points = EXCLUDED.victory_points,
+        siege_defense = EXCLUDED.siege_defense,
+        controller_character_id = EXCLUDED.controller_character_id,
+        controller_faction_id = EXCLUDED.controller_faction_id,
+        original_nation = EXCLUDED.original_nation,
+        keywords = EXCLUDED.keywords;
+    """
+
     async def upsert(self, conn: asyncpg.Connection):
         """
         Insert or update this Territory entry.
         The pair (territory_id, guild_id) must be unique.
         """
-        query = """
-        INSERT INTO Territory (
-            territory_id, name, terrain_type, ore_production, lumber_production,
-            coal_production, rations_production, cloth_production, platinum_production,
-            victory_points, siege_defense, controller_character_id, controller_faction_id, original_nation, keywords, guild_id
+        await conn.execute(
+            self._UPSERT_QUERY,
+            *self._upsert_args()
         )
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
-        ON CONFLICT (territory_id, guild_id) DO UPDATE
-        SET name = EXCLUDED.name,
-            terrain_type = EXCLUDED.terrain_type,
-            ore_production = EXCLUDED.ore_production,
-            lumber_production = EXCLUDED.lumber_production,
-            coal_production = EXCLUDED.coal_production,
-            rations_production = EXCLUDED.rations_production,
-            cloth_production = EXCLUDED.cloth_production,
-            platinum_production = EXCLUDED.platinum_production,
-            victory_points = EXCLUDED.victory_points,
-            siege_defense = EXCLUDED.siege_defense,
-            controller_character_id = EXCLUDED.controller_character_id,
-            controller_faction_id = EXCLUDED.controller_faction_id,
-            original_nation = EXCLUDED.original_nation,
-            keywords = EXCLUDED.keywords;
+        territory_graphs.territory_written(self.guild_id, self.territory_id, self.terrain_type)
+
+    def _upsert_args(self) -> tuple:
         """
-        await conn.execute(
-            query,
+        Positional arguments for _UPSERT_QUERY, in column order.
+        """
+        return (
             self.territory_id,
             self.name,
             self.terrain_type,
@@ -78,6 +89,17 @@ class Territory:
             self.guild_id
         )
 
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, entries: List["Territory"]):
+        """
+        Insert or update many Territory entries with a single executemany.
+        """
+        if not entries:
+            return
+        await conn.executemany(cls._UPSERT_QUERY, [e._upsert_args() for e in entries])
+        for e in entries:
+            territory_graphs.territory_written(e.guild_id, e.territory_id, e.terrain_type)
+
     @classmethod
     async def fetch_by_id(cls, conn: asyncpg.Connection, territory_internal_id: int) -> Optional["Territory"]:
         """
@@ -134,6 +156,41 @@ class Territory:
             result.append(cls(**data))
         return result
 
+    @classmethod
+    async def fetch_page_with_controller_names(
+        cls,
+        conn: asyncpg.Connection,
+        guild_id: int,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Tuple[List[Tuple["Territory", Optional[str]]], int]:
+        """
+        Fetch a page of Territories in a guild with their controlling character's name in one query.
+        Returns ([(territory, controller_name or None)], total number of territories).
+        """
+        rows = await conn.fetch("""
+            SELECT t.id, t.territory_id, t.name, t.terrain_type, t.ore_production, t.lumber_production,
+                   t.coal_production, t.rations_production, t.cloth_production, t.platinum_production,
+                   t.victory_points, t.siege_defense, t.controller_character_id, t.controller_faction_id,
+                   t.original_nation, t.keywords, t.guild_id,
+                   c.name AS controller_name,
+                   COUNT(*) OVER () AS total_count
+            FROM Territory t
+            LEFT JOIN Character c ON c.id = t.controller_character_id
+            WHERE t.guild_id = $1
+            ORDER BY t.territory_id
+            LIMIT $2 OFFSET $3;
+        """, guild_id, limit, offset)
+        total = rows[0]['total_count'] if rows else 0
+        result = []
+        for row in rows:
+            data = dict(row)
+            controller_name = data.pop('controller_name')
+            data.pop('total_count')
+            data['keywords'] = list(data['keywords']) if data['keywords'] else []
+            result.append((cls(**data), controller_name))
+        return result, total
+
     @classmethod
     async def fetch_by_controller(cls, conn: asyncpg.Connection, character_id: int, guild_id: int) -> List["Territory"]:
         """
@@ -183,6 +240,7 @@ class Territory:
             "DELETE FROM Territory WHERE territory_id = $1 AND guild_id = $2;",
             territory_id, guild_id
         )
+        territory_graphs.invalidate_guild(guild_id)
         deleted = result.startswith("DELETE 1")
         logger.info(f"Deleted Territory territory_id={territory_id} guild_id={guild_id}. Result: {result}")
         return deleted
@@ -193,6 +251,7 @@ class Territory:
         Delete all Territory entries for a guild.
         """
         result = await conn.execute("DELETE FROM Territory WHERE guild_id = $1;", guild_id)
+        territory_graphs.invalidate_guild(guild_id)
         logger.warning(f"All Territory entries deleted for guild {guild_id}. Result: {result}")
 
     def verify(self) -> tuple[bool, str]:
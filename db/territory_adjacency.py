@@ -1,6 +1,7 @@
 import asyncpg
 from dataclasses import dataclass
 from typing import Optional, List
+from db.territory_graph import territory_graphs
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,7 @@ class TerritoryAdjacency:
         result = await conn.fetchrow(query, a, b, self.guild_id)
         if result:
             self.id = result['id']
+        territory_graphs.adjacency_written(self.guild_id, a, b)
 
     async def insert(self, conn: asyncpg.Connection):
         """
@@ -41,6 +43,31 @@ class TerritoryAdjacency:
         """
         await self.upsert(conn)
 
+    @classmethod
+    async def insert_many(cls, conn: asyncpg.Connection, adjacencies: List["TerritoryAdjacency"], guild_id: int) -> int:
+        """
+        Insert many TerritoryAdjacency entries with a single COPY.
+        Pairs are put in canonical order; duplicates and pairs that already exist are skipped.
+        Returns the number of pairs inserted.
+        """
+        existing = {
+            (a.territory_a_id, a.territory_b_id) for a in await cls.fetch_all(conn, guild_id)
+        }
+        pairs = []
+        for adjacency in adjacencies:
+            pair = tuple(sorted([adjacency.territory_a_id, adjacency.territory_b_id]))
+            if pair not in existing:
+                existing.add(pair)
+                pairs.append(pair)
+        if pairs:
+            await conn.copy_records_to_table(
+                'territoryadjacency',
+                records=[(a, b, guild_id) for a, b in pairs],
+                columns=['territory_a_id', 'territory_b_id', 'guild_id']
+            )
+            territory_graphs.invalidate_guild(guild_id)
+        return len(pairs)
+
     @classmethod
     async def fetch_adjacent(cls, conn: asyncpg.Connection, territory_id: str, guild_id: int) -> List[str]:
         """
@@ -58,6 +85,18 @@ class TerritoryAdjacency:
         """, territory_id, guild_id)
         return [row['adjacent_id'] for row in rows]
 
+    @classmethod
+    async def fetch_all(cls, conn: asyncpg.Connection, guild_id: int) -> List["TerritoryAdjacency"]:
+        """
+        Fetch all adjacency pairs in a guild.
+        """
+        rows = await conn.fetch("""
+            SELECT id, territory_a_id, territory_b_id, guild_id
+            FROM TerritoryAdjacency
+            WHERE guild_id = $1;
+        """, guild_id)
+        return [cls(**row) for row in rows]
+
     @classmethod
     async def are_adjacent(cls, conn: asyncpg.Connection, territory_1: str, territory_2: str, guild_id: int) -> bool:
         """
@@ -80,6 +119,7 @@ class TerritoryAdjacency:
             "DELETE FROM TerritoryAdjacency WHERE territory_a_id = $1 AND territory_b_id = $2 AND guild_id = $3;",
             a, b, guild_id
         )
+        territory_graphs.invalidate_guild(guild_id)
         deleted = result.startswith("DELETE 1")
         logger.info(f"Deleted adjacency {a}<->{b} guild_id={guild_id}. Result: {result}")
         return deleted
@@ -90,6 +130,7 @@ class TerritoryAdjacency:
         Delete all TerritoryAdjacency entries for a guild.
         """
         result = await conn.execute("DELETE FROM TerritoryAdjacency WHERE guild_id = $1;", guild_id)
+        territory_graphs.invalidate_guild(guild_id)
         logger.warning(f"All TerritoryAdjacency entries deleted for guild {guild_id}. Result: {result}")
 
     def verify(self) -> tuple[bool, str]:
@@ -0,0 +1,118 @@
+import asyncpg
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TerritoryGraph:
+    """
+    In-memory map of a guild: each territory's terrain type and its set of neighbours.
+    Answers existence, terrain and adjacency questions without queries.
+    """
+    guild_id: Optional[int] = None
+    terrain_types: Dict[str, str] = field(default_factory=dict)
+    neighbors: Dict[str, Set[str]] = field(default_factory=dict)
+
+    @classmethod
+    async def load(cls, conn: asyncpg.Connection, guild_id: int) -> "TerritoryGraph":
+        """
+        Load every territory and adjacency of a guild in two queries.
+        """
+        territory_rows = await conn.fetch(
+            "SELECT territory_id, terrain_type FROM Territory WHERE guild_id = $1;",
+            guild_id
+        )
+        adjacency_rows = await conn.fetch(
+            "SELECT territory_a_id, territory_b_id FROM TerritoryAdjacency WHERE guild_id = $1;",
+            guild_id
+        )
+        graph = cls(guild_id=guild_id, terrain_types={row['territory_id']: row['terrain_type'] for row in territory_rows})
+        for row in adjacency_rows:
+            graph.neighbors.setdefault(row['territory_a_id'], set()).add(row['territory_b_id'])
+            graph.neighbors.setdefault(row['territory_b_id'], set()).add(row['territory_a_id'])
+        return graph
+
+    def exists(self, territory_id: str) -> bool:
+        return territory_id in self.terrain_types
+
+    def terrain_type(self, territory_id: str) -> Optional[str]:
+        return self.terrain_types.get(territory_id)
+
+    def adjacent(self, territory_id: str) -> Set[str]:
+        return self.neighbors.get(territory_id, set())
+
+    def are_adjacent(self, territory_1: str, territory_2: str) -> bool:
+        return territory_2 in self.neighbors.get(territory_1, ())
+
+    def first_missing(self, path: List[str]) -> Optional[str]:
+        """
+        The first territory of a path that does not exist, or None.
+        """
+        return next((t for t in path if t not in self.terrain_types), None)
+
+    def first_gap(self, path: List[str]) -> Optional[Tuple[str, str]]:
+        """
+        The first consecutive pair of a path that is not adjacent, or None.
+        """
+        return next(((a, b) for a, b in zip(path, path[1:]) if not self.are_adjacent(a, b)), None)
+
+
+class TerritoryGraphCache:
+    """
+    TerritoryGraphs per guild. Territory and TerritoryAdjacency writes report here
+    so a graph that no longer matches the tables is dropped and reloaded on next use.
+    A graph loaded across an invalidation is not stored.
+
+    Writes report before their transaction commits, so another connection can reload
+    and cache the old map in between. Code that writes territories or adjacencies
+    inside a transaction must call invalidate_guild again once it has committed.
+    """
+
+    def __init__(self):
+        self._graphs: Dict[int, TerritoryGraph] = {}
+        self._generations: Dict[int, int] = {}
+
+    async def get(self, conn: asyncpg.Connection, guild_id: int) -> TerritoryGraph:
+        """
+        The guild's graph, loading it if it is not cached.
+        """
+        graph = self._graphs.get(guild_id)
+        if graph is not None:
+            return graph
+
+        generation = self._generations.get(guild_id, 0)
+        graph = await TerritoryGraph.load(conn, guild_id)
+        if generation == self._generations.get(guild_id, 0):
+            self._graphs[guild_id] = graph
+            logger.info(f"Territory graph: cached {len(graph.terrain_types)} territories for guild {guild_id}")
+        return graph
+
+    def territory_written(self, guild_id: int, territory_id: str, terrain_type: str):
+        """
+        Drop the guild's graph if a written territory is new or changed terrain.
+        """
+        graph = self._graphs.get(guild_id)
+        if graph is None or graph.terrain_types.get(territory_id) != terrain_type:
+            self.invalidate_guild(guild_id)
+
+    def adjacency_written(self, guild_id: int, territory_1: str, territory_2: str):
+        """
+        Drop the guild's graph if a written adjacency is new.
+        """
+        graph = self._graphs.get(guild_id)
+        if graph is None or not graph.are_adjacent(territory_1, territory_2):
+            self.invalidate_guild(guild_id)
+
+    def invalidate_guild(self, guild_id: int):
+        """
+        Drop the guild's graph.
+        """
+        self._generations[guild_id] = self._generations.get(guild_id, 0) + 1
+        self._graphs.pop(guild_id, None)
+
+
+# Shared instance, kept in step by the Territory and TerritoryAdjacency models
+territory_graphs = TerritoryGraphCache()
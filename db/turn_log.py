@@ -43,6 +43,34 @@ class TurnLog:
             self.guild_id
         )
 
+    @classmethod
+    async def insert_many(cls, conn: asyncpg.Connection, logs: List["TurnLog"]):
+        """
+        Insert many TurnLog entries in one batch, preserving their order.
+        """
+        if not logs:
+            return
+        now = datetime.now()
+        await conn.executemany("""
+            INSERT INTO TurnLog (
+                turn_number, phase, event_type, entity_type, entity_id,
+                event_data, timestamp, guild_id
+            )
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8);
+        """, [
+            (
+                log.turn_number,
+                log.phase,
+                log.event_type,
+                log.entity_type,
+                log.entity_id,
+                json.dumps(log.event_data) if log.event_data else '{}',
+                log.timestamp or now,
+                log.guild_id
+            )
+            for log in logs
+        ])
+
     @classmethod
     async def fetch_by_turn(cls, conn: asyncpg.Connection, turn_number: int, guild_id: int) -> List["TurnLog"]:
         """
@@ -53,7 +81,7 @@ class TurnLog:
                    event_data, timestamp, guild_id
             FROM TurnLog
             WHERE turn_number = $1 AND guild_id = $2
-            ORDER BY timestamp;
+            ORDER BY timestamp, id;
         """, turn_number, guild_id)
         result = []
         for row in rows:
@@ -62,6 +90,16 @@ class TurnLog:
             result.append(cls(**data))
         return result
 
+    @classmethod
+    async def count_by_turn(cls, conn: asyncpg.Connection, turn_number: int, guild_id: int) -> int:
+        """
+        Count all logs for a specific turn.
+        """
+        return await conn.fetchval(
+            'SELECT COUNT(*) FROM TurnLog WHERE turn_number = $1 AND guild_id = $2;',
+            turn_number, guild_id
+        )
+
     @classmethod
     async def fetch_by_entity(
         cls, conn: asyncpg.Connection, entity_type: str, entity_id: int, guild_id: int
@@ -74,7 +112,7 @@ class TurnLog:
                    event_data, timestamp, guild_id
             FROM TurnLog
             WHERE entity_type = $1 AND entity_id = $2 AND guild_id = $3
-            ORDER BY timestamp;
+            ORDER BY timestamp, id;
         """, entity_type, entity_id, guild_id)
         result = []
         for row in rows:
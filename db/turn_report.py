@@ -0,0 +1,86 @@
+import asyncpg
+from dataclasses import dataclass, field
+from typing import Optional, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TurnReport:
+    """
+    The rendered lines of one phase of a turn report, written once when the turn resolves.
+    character_id is None for the GM report; event_types[i] is the event type behind lines[i].
+    """
+    id: Optional[int] = None
+    turn_number: int = 0
+    character_id: Optional[int] = None
+    phase: str = ""
+    event_count: int = 0
+    lines: List[str] = field(default_factory=list)
+    event_types: List[str] = field(default_factory=list)
+    guild_id: Optional[int] = None
+
+    @classmethod
+    async def insert_many(cls, conn: asyncpg.Connection, reports: List["TurnReport"]):
+        """
+        Insert many report sections with COPY, preserving their order.
+        """
+        if not reports:
+            return
+        await conn.copy_records_to_table(
+            'turnreport',
+            records=[
+                (r.turn_number, r.character_id, r.phase, r.event_count, r.lines, r.event_types, r.guild_id)
+                for r in reports
+            ],
+            columns=['turn_number', 'character_id', 'phase', 'event_count', 'lines', 'event_types', 'guild_id']
+        )
+
+    @classmethod
+    async def fetch_for_turn(
+        cls,
+        conn: asyncpg.Connection,
+        turn_number: int,
+        guild_id: int,
+        character_id: Optional[int] = None
+    ) -> List["TurnReport"]:
+        """
+        Fetch the sections of one report in phase order; the GM report if character_id is None.
+        """
+        rows = await conn.fetch("""
+            SELECT id, turn_number, character_id, phase, event_count, lines, event_types, guild_id
+            FROM TurnReport
+            WHERE turn_number = $1 AND guild_id = $2 AND character_id IS NOT DISTINCT FROM $3
+            ORDER BY id;
+        """, turn_number, guild_id, character_id)
+        return [cls(**row) for row in rows]
+
+    @classmethod
+    async def exists_for_turn(cls, conn: asyncpg.Connection, turn_number: int, guild_id: int) -> bool:
+        """
+        Check whether reports were materialized for a turn.
+        """
+        return await conn.fetchval("""
+            SELECT EXISTS (
+                SELECT 1 FROM TurnReport WHERE turn_number = $1 AND guild_id = $2
+            );
+        """, turn_number, guild_id)
+
+    @classmethod
+    async def delete_turn(cls, conn: asyncpg.Connection, turn_number: int, guild_id: int):
+        """
+        Delete every report section of a turn.
+        """
+        await conn.execute(
+            "DELETE FROM TurnReport WHERE turn_number = $1 AND guild_id = $2;",
+            turn_number, guild_id
+        )
+
+    @classmethod
+    async def delete_all(cls, conn: asyncpg.Connection, guild_id: int):
+        """
+        Delete all report sections of a guild.
+        """
+        result = await conn.execute("DELETE FROM TurnReport WHERE guild_id = $1;", guild_id)
+        logger.warning(f"All TurnReport entries deleted for guild {guild_id}. Result: {result}")
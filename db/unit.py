@@ -1,6 +1,6 @@
 import asyncpg
 from dataclasses import dataclass
-from typing import Optional, List, Union, TYPE_CHECKING
+from typing import Optional, List, Tuple, Union, TYPE_CHECKING
 import logging
 
 if TYPE_CHECKING:
@@ -42,50 +42,59 @@ class Unit:
     guild_id: Optional[int] = None
     status: str = "ACTIVE"
 
+    _UPSERT_QUERY = """
+    INSERT INTO Unit (
+        unit_id, name, unit_type, owner_character_id, owner_faction_id, commander_character_id,
+        commander_assigned_turn, faction_id, movement, organization, max_organization,
+        attack, defense, siege_attack, siege_defense, size, capacity,
+        current_territory_id, is_naval, upkeep_ore, upkeep_lumber, upkeep_coal,
+        upkeep_rations, upkeep_cloth, upkeep_platinum, keywords, guild_id, status
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27, $28)
+    ON CONFLICT (unit_id, guild_id) DO UPDATE
+    SET name = EXCLUDED.name,
+        unit_type = EXCLUDED.unit_type,
+        owner_character_id = EXCLUDED.owner_character_id,
+        owner_faction_id = EXCLUDED.owner_faction_id,
+        commander_character_id = EXCLUDED.commander_character_id,
+        commander_assigned_turn = EXCLUDED.commander_assigned_turn,
+        faction_id = EXCLUDED.faction_id,
+        movement = EXCLUDED.movement,
+        organization = EXCLUDED.organization,
+        max_organization = EXCLUDED.max_organization,
+        attack = EXCLUDED.attack,
+        defense = EXCLUDED.defense,
+        siege_attack = EXCLUDED.siege_attack,
+        siege_defense = EXCLUDED.siege_defense,
+        size = EXCLUDED.size,
+        capacity = EXCLUDED.capacity,
+        current_territory_id = EXCLUDED.current_territory_id,
+        is_naval = EXCLUDED.is_naval,
+        upkeep_ore = EXCLUDED.upkeep_ore,
+        upkeep_lumber = EXCLUDED.upkeep_lumber,
+        upkeep_coal = EXCLUDED.upkeep_coal,
+        upkeep_rations = EXCLUDED.upkeep_rations,
+        upkeep_cloth = EXCLUDED.upkeep_cloth,
+        upkeep_platinum = EXCLUDED.upkeep_platinum,
+        keywords = EXCLUDED.keywords,
+        status = EXCLUDED.status;
+    """
+
     async def upsert(self, conn: asyncpg.Connection):
         """
         Insert or update this Unit entry.
         The pair (unit_id, guild_id) must be unique.
         """
-        query = """
-        INSERT INTO Unit (
-            unit_id, name, unit_type, owner_character_id, owner_faction_id, commander_character_id,
-            commander_assigned_turn, faction_id, movement, organization, max_organization,
-            attack, defense, siege_attack, siege_defense, size, capacity,
-            current_territory_id, is_naval, upkeep_ore, upkeep_lumber, upkeep_coal,
-            upkeep_rations, upkeep_cloth, upkeep_platinum, keywords, guild_id, status
+        await conn.execute(
+            self._UPSERT_QUERY,
+            *self._upsert_args()
         )
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27, $28)
-        ON CONFLICT (unit_id, guild_id) DO UPDATE
-        SET name = EXCLUDED.name,
-            unit_type = EXCLUDED.unit_type,
-            owner_character_id = EXCLUDED.owner_character_id,
-            owner_faction_id = EXCLUDED.owner_faction_id,
-            commander_character_id = EXCLUDED.commander_character_id,
-            commander_assigned_turn = EXCLUDED.commander_assigned_turn,
-            faction_id = EXCLUDED.faction_id,
-            movement = EXCLUDED.movement,
-            organization = EXCLUDED.organization,
-            max_organization = EXCLUDED.max_organization,
-            attack = EXCLUDED.attack,
-            defense = EXCLUDED.defense,
-            siege_attack = EXCLUDED.siege_attack,
-            siege_defense = EXCLUDED.siege_defense,
-            size = EXCLUDED.size,
-            capacity = EXCLUDED.capacity,
-            current_territory_id = EXCLUDED.current_territory_id,
-            is_naval = EXCLUDED.is_naval,
-            upkeep_ore = EXCLUDED.upkeep_ore,
-            upkeep_lumber = EXCLUDED.upkeep_lumber,
-            upkeep_coal = EXCLUDED.upkeep_coal,
-            upkeep_rations = EXCLUDED.upkeep_rations,
-            upkeep_cloth = EXCLUDED.upkeep_cloth,
-            upkeep_platinum = EXCLUDED.upkeep_platinum,
-            keywords = EXCLUDED.keywords,
-            status = EXCLUDED.status;
+
+    def _upsert_args(self) -> tuple:
         """
-        await conn.execute(
-            query,
+        Positional arguments for _UPSERT_QUERY, in column order.
+        """
+        return (
             self.unit_id, self.name, self.unit_type, self.owner_character_id,
             self.owner_faction_id, self.commander_character_id, self.commander_assigned_turn,
             self.faction_id, self.movement, self.organization, self.max_organization,
@@ -95,6 +104,15 @@ class Unit:
             self.upkeep_platinum, self.keywords if self.keywords else [], self.guild_id, self.status
         )
 
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, entries: List["Unit"]):
+        """
+        Insert or update many Unit entries with a single executemany.
+        """
+        if not entries:
+            return
+        await conn.executemany(cls._UPSERT_QUERY, [e._upsert_args() for e in entries])
+
     @classmethod
     async def fetch_by_id(cls, conn: asyncpg.Connection, unit_internal_id: int) -> Optional["Unit"]:
         """
@@ -135,6 +153,28 @@ class Unit:
         data['keywords'] = list(data['keywords']) if data['keywords'] else []
         return cls(**data)
 
+    @classmethod
+    async def fetch_by_unit_ids(cls, conn: asyncpg.Connection, unit_ids: List[str], guild_id: int) -> List["Unit"]:
+        """
+        Fetch the Units with the given unit_ids in a guild in one query.
+        Unknown IDs are skipped.
+        """
+        rows = await conn.fetch("""
+            SELECT id, unit_id, name, unit_type, owner_character_id, owner_faction_id,
+                   commander_character_id, commander_assigned_turn, faction_id, movement,
+                   organization, max_organization, attack, defense, siege_attack, siege_defense,
+                   size, capacity, current_territory_id, is_naval, upkeep_ore, upkeep_lumber,
+                   upkeep_coal, upkeep_rations, upkeep_cloth, upkeep_platinum, keywords, guild_id, status
+            FROM Unit
+            WHERE unit_id = ANY($1::TEXT[]) AND guild_id = $2;
+        """, unit_ids, guild_id)
+        result = []
+        for row in rows:
+            data = dict(row)
+            data['keywords'] = list(data['keywords']) if data['keywords'] else []
+            result.append(cls(**data))
+        return result
+
     @classmethod
     async def fetch_all(cls, conn: asyncpg.Connection, guild_id: int) -> List["Unit"]:
         """
@@ -157,6 +197,45 @@ class Unit:
             result.append(cls(**data))
         return result
 
+    @classmethod
+    async def fetch_page_with_names(
+        cls,
+        conn: asyncpg.Connection,
+        guild_id: int,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Tuple[List[Tuple["Unit", Optional[str], Optional[str]]], int]:
+        """
+        Fetch a page of Units in a guild with their owner character's and faction's names in one query.
+        Returns ([(unit, owner_name or None, faction_name or None)], total number of units).
+        """
+        rows = await conn.fetch("""
+            SELECT u.id, u.unit_id, u.name, u.unit_type, u.owner_character_id, u.owner_faction_id,
+                   u.commander_character_id, u.commander_assigned_turn, u.faction_id, u.movement,
+                   u.organization, u.max_organization, u.attack, u.defense, u.siege_attack, u.siege_defense,
+                   u.size, u.capacity, u.current_territory_id, u.is_naval, u.upkeep_ore, u.upkeep_lumber,
+                   u.upkeep_coal, u.upkeep_rations, u.upkeep_cloth, u.upkeep_platinum, u.keywords, u.guild_id, u.status,
+                   c.name AS owner_name,
+                   f.name AS faction_name,
+                   COUNT(*) OVER () AS total_count
+            FROM Unit u
+            LEFT JOIN Character c ON c.id = u.owner_character_id
+            LEFT JOIN Faction f ON f.id = u.faction_id
+            WHERE u.guild_id = $1
+            ORDER BY u.unit_id
+            LIMIT $2 OFFSET $3;
+        """, guild_id, limit, offset)
+        total = rows[0]['total_count'] if rows else 0
+        result = []
+        for row in rows:
+            data = dict(row)
+            owner_name = data.pop('owner_name')
+            faction_name = data.pop('faction_name')
+            data.pop('total_count')
+            data['keywords'] = list(data['keywords']) if data['keywords'] else []
+            result.append((cls(**data), owner_name, faction_name))
+        return result, total
+
     @classmethod
     async def fetch_by_faction(cls, conn: asyncpg.Connection, faction_id: int, guild_id: int) -> List["Unit"]:
         """
@@ -267,6 +346,34 @@ class Unit:
             result.append(cls(**data))
         return result
 
+    @classmethod
+    async def update_organization_many(cls, conn: asyncpg.Connection, units: List["Unit"]):
+        """
+        Write the organization of many units in one statement.
+        """
+        if not units:
+            return
+        await conn.execute("""
+            UPDATE Unit
+            SET organization = v.organization
+            FROM unnest($1::INTEGER[], $2::INTEGER[]) AS v(id, organization)
+            WHERE Unit.id = v.id;
+        """, [u.id for u in units], [u.organization for u in units])
+
+    @classmethod
+    async def update_status_many(cls, conn: asyncpg.Connection, units: List["Unit"]):
+        """
+        Write the status of many units in one statement.
+        """
+        if not units:
+            return
+        await conn.execute("""
+            UPDATE Unit
+            SET status = v.status
+            FROM unnest($1::INTEGER[], $2::VARCHAR[]) AS v(id, status)
+            WHERE Unit.id = v.id;
+        """, [u.id for u in units], [u.status for u in units])
+
     @classmethod
     async def delete(cls, conn: asyncpg.Connection, unit_id: str, guild_id: int) -> bool:
         """
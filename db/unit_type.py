@@ -36,48 +36,57 @@ class UnitType:
     upkeep_platinum: int = 0
     guild_id: Optional[int] = None
 
+    _UPSERT_QUERY = """
+    INSERT INTO UnitType (
+        type_id, name, nation, movement, organization, attack, defense,
+        siege_attack, siege_defense, size, capacity, is_naval, keywords,
+        cost_ore, cost_lumber, cost_coal, cost_rations, cost_cloth, cost_platinum,
+        upkeep_ore, upkeep_lumber, upkeep_coal, upkeep_rations, upkeep_cloth, upkeep_platinum,
+        guild_id
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26)
+    ON CONFLICT (type_id, guild_id) DO UPDATE
+    SET name = EXCLUDED.name,
+        nation = EXCLUDED.nation,
+        movement = EXCLUDED.movement,
+        organization = EXCLUDED.organization,
+        attack = EXCLUDED.attack,
+        defense = EXCLUDED.defense,
+        siege_attack = EXCLUDED.siege_attack,
+        siege_defense = EXCLUDED.siege_defense,
+        size = EXCLUDED.size,
+        capacity = EXCLUDED.capacity,
+        is_naval = EXCLUDED.is_naval,
+        keywords = EXCLUDED.keywords,
+        cost_ore = EXCLUDED.cost_ore,
+        cost_lumber = EXCLUDED.cost_lumber,
+        cost_coal = EXCLUDED.cost_coal,
+        cost_rations = EXCLUDED.cost_rations,
+        cost_cloth = EXCLUDED.cost_cloth,
+        cost_platinum = EXCLUDED.cost_platinum,
+        upkeep_ore = EXCLUDED.upkeep_ore,
+        upkeep_lumber = EXCLUDED.upkeep_lumber,
+        upkeep_coal = EXCLUDED.upkeep_coal,
+        upkeep_rations = EXCLUDED.upkeep_rations,
+        upkeep_cloth = EXCLUDED.upkeep_cloth,
+        upkeep_platinum = EXCLUDED.upkeep_platinum;
+    """
+
     async def upsert(self, conn: asyncpg.Connection):
         """
         Insert or update this UnitType entry.
         The tuple (type_id, guild_id) must be unique.
         """
-        query = """
-        INSERT INTO UnitType (
-            type_id, name, nation, movement, organization, attack, defense,
-            siege_attack, siege_defense, size, capacity, is_naval, keywords,
-            cost_ore, cost_lumber, cost_coal, cost_rations, cost_cloth, cost_platinum,
-            upkeep_ore, upkeep_lumber, upkeep_coal, upkeep_rations, upkeep_cloth, upkeep_platinum,
-            guild_id
+        await conn.execute(
+            self._UPSERT_QUERY,
+            *self._upsert_args()
         )
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26)
-        ON CONFLICT (type_id, guild_id) DO UPDATE
-        SET name = EXCLUDED.name,
-            nation = EXCLUDED.nation,
-            movement = EXCLUDED.movement,
-            organization = EXCLUDED.organization,
-            attack = EXCLUDED.attack,
-            defense = EXCLUDED.defense,
-            siege_attack = EXCLUDED.siege_attack,
-            siege_defense = EXCLUDED.siege_defense,
-            size = EXCLUDED.size,
-            capacity = EXCLUDED.capacity,
-            is_naval = EXCLUDED.is_naval,
-            keywords = EXCLUDED.keywords,
-            cost_ore = EXCLUDED.cost_ore,
-            cost_lumber = EXCLUDED.cost_lumber,
-            cost_coal = EXCLUDED.cost_coal,
-            cost_rations = EXCLUDED.cost_rations,
-            cost_cloth = EXCLUDED.cost_cloth,
-            cost_platinum = EXCLUDED.cost_platinum,
-            upkeep_ore = EXCLUDED.upkeep_ore,
-            upkeep_lumber = EXCLUDED.upkeep_lumber,
-            upkeep_coal = EXCLUDED.upkeep_coal,
-            upkeep_rations = EXCLUDED.upkeep_rations,
-            upkeep_cloth = EXCLUDED.upkeep_cloth,
-            upkeep_platinum = EXCLUDED.upkeep_platinum;
+
+    def _upsert_args(self) -> tuple:
         """
-        await conn.execute(
-            query,
+        Positional arguments for _UPSERT_QUERY, in column order.
+        """
+        return (
             self.type_id, self.name, self.nation, self.movement, self.organization,
             self.attack, self.defense, self.siege_attack, self.siege_defense,
             self.size, self.capacity, self.is_naval, self.keywords if self.keywords else [],
@@ -86,6 +95,15 @@ class UnitType:
             self.upkeep_cloth, self.upkeep_platinum, self.guild_id
         )
 
+    @classmethod
+    async def upsert_many(cls, conn: asyncpg.Connection, entries: List["UnitType"]):
+        """
+        Insert or update many UnitType entries with a single executemany.
+        """
+        if not entries:
+            return
+        await conn.executemany(cls._UPSERT_QUERY, [e._upsert_args() for e in entries])
+
     @classmethod
     async def fetch_by_id(cls, conn: asyncpg.Connection, unit_type_internal_id: int) -> Optional["UnitType"]:
         """
@@ -1,11 +1,10 @@
-import asyncio
 import asyncpg
 import discord
 import yaml
 from typing import Optional, Tuple, Dict, Any, List
 from dataclasses import dataclass
 from db import Character, Alias, ServerConfig
-from handlers import create_character_with_channel, sort_category_channels
+from handlers import plan_channel_categories, create_channels_concurrently, sort_category_channels
 import logging
 
 logger = logging.getLogger(__name__)
@@ -88,44 +87,40 @@ class CharacterConfigManager:
         return True, ""
 
     @staticmethod
-    async def _create_alias(
-        conn: asyncpg.Connection,
+    def _plan_alias(
         character: Character,
         alias_str: str,
         guild_id: int,
+        identifiers: set,
+        aliases: set,
+        new_aliases: List[Alias],
         stats: ImportStats
     ) -> None:
         """
-        Create an alias for a character if it doesn't already exist.
+        Queue an alias for a character unless it conflicts or already exists.
 
         Args:
-            conn: Database connection
             character: The character to create an alias for
             alias_str: The alias string
             guild_id: Discord guild ID
+            identifiers: All character identifiers in the guild, including new ones
+            aliases: All aliases in the guild, including queued ones (updated in place)
+            new_aliases: Aliases to insert (appended to)
             stats: ImportStats object to update
         """
         # Check if alias already exists as a character identifier
-        existing_char = await Character.fetch_by_identifier(conn, alias_str, guild_id)
-        if existing_char is not None:
+        if alias_str in identifiers:
             stats.aliases_skipped += 1
             stats.errors.append(f"Alias '{alias_str}' conflicts with existing character identifier")
             return
 
         # Check if alias already exists
-        if await Alias.exists(conn, alias_str, guild_id):
+        if alias_str in aliases:
             stats.aliases_skipped += 1
             return
 
-        # Create the alias
-        new_alias = Alias(
-            character_id=character.id,
-            alias=alias_str,
-            guild_id=guild_id
-        )
-        await new_alias.insert(conn)
-        stats.aliases_created += 1
-        logger.info(f"Created alias '{alias_str}' for character '{character.identifier}'")
+        aliases.add(alias_str)
+        new_aliases.append(Alias(character_id=character.id, alias=alias_str, guild_id=guild_id))
 
     @staticmethod
     async def import_config(
@@ -137,6 +132,12 @@ class CharacterConfigManager:
         """
         Import characters and aliases from YAML configuration.
 
+        The YAML is diffed against the guild's existing characters and aliases
+        (one query each). Only missing channels are created, concurrently, and
+        new characters and aliases are inserted in one transaction. If that
+        transaction fails, the channels created for the import are deleted.
+        Channel order is fixed once per category at the end.
+
         Args:
             conn: Database connection
             guild_id: Discord guild ID
@@ -172,14 +173,28 @@ class CharacterConfigManager:
         if category is None:
             return False, "Configured category not found in guild.", stats
 
+        # Diff against what already exists
+        existing_characters = {c.identifier: c for c in await Character.fetch_all(conn, guild_id)}
+        existing_aliases = {a.alias for a in await Alias.fetch_all_by_guild(conn, guild_id)}
+
         # Process characters - sort alphabetically by identifier for consistent ordering
         characters = config.get('characters', [])
         characters = sorted(characters, key=lambda c: c.get('identifier', '').lower())
-        created_characters: Dict[str, Character] = {}
+
+        new_characters: List[Character] = []
+        inline_aliases: Dict[str, List[str]] = {}
+        needs_channel: List[Character] = []
 
         for char_config in characters:
             identifier = char_config['identifier']
-            name = char_config.get('name', identifier)  # Default to identifier if not provided
+            inline_aliases.setdefault(identifier, []).extend(char_config.get('aliases', []))
+
+            if identifier in existing_characters:
+                stats.characters_skipped += 1
+                logger.info(f"Skipped existing character '{identifier}'")
+                continue
+            if any(c.identifier == identifier for c in new_characters):
+                continue
 
             # Determine letter_limit: use config value, or server default if not specified
             # A value of `null` in YAML means unlimited (None)
@@ -188,79 +203,99 @@ class CharacterConfigManager:
             else:
                 letter_limit = server_config.default_limit
 
-            # Check if character already exists
-            existing = await Character.fetch_by_identifier(conn, identifier, guild_id)
-            if existing is not None:
-                stats.characters_skipped += 1
-                created_characters[identifier] = existing
-                logger.info(f"Skipped existing character '{identifier}'")
-
-                # Still process inline aliases for existing characters
-                inline_aliases = char_config.get('aliases', [])
-                for alias_str in inline_aliases:
-                    await CharacterConfigManager._create_alias(
-                        conn, existing, alias_str, guild_id, stats
-                    )
-                continue
-
-            # Track if we're creating a new channel
-            existing_channel = discord.utils.get(category.channels, name=identifier)
-
-            # Create character with channel using the shared handler
-            # Skip sorting during bulk import - we'll sort once at the end
-            success, message, character = await create_character_with_channel(
-                conn=conn,
-                guild=guild,
+            character = Character(
                 identifier=identifier,
-                name=name,
+                name=char_config.get('name', identifier),  # Default to identifier if not provided
                 letter_limit=letter_limit,
-                category_id=server_config.category_id,
-                sort_channels=False
+                guild_id=guild_id
             )
 
-            if success and character:
-                stats.characters_created += 1
-                if existing_channel is None:
-                    stats.channels_created += 1
-                created_characters[identifier] = character
-
-                # Process inline aliases
-                inline_aliases = char_config.get('aliases', [])
-                for alias_str in inline_aliases:
-                    await CharacterConfigManager._create_alias(
-                        conn, character, alias_str, guild_id, stats
-                    )
+            # Reuse a channel with this name in the base category if there is one
+            existing_channel = discord.utils.get(category.channels, name=identifier)
+            if existing_channel is not None:
+                character.channel_id = existing_channel.id
+                logger.info(f"Using existing channel '{identifier}' for character")
             else:
-                stats.characters_failed += 1
-                stats.errors.append(f"Failed to create character '{identifier}': {message}")
-
-            # Sleep to avoid rate limiting
-            await asyncio.sleep(0.5)
+                needs_channel.append(character)
+            new_characters.append(character)
+
+        # Create only the missing channels, concurrently
+        touched_categories = {}
+        created = {}
+        if needs_channel:
+            planned = await plan_channel_categories(guild, server_config.category_id, len(needs_channel))
+            requests = []
+            for character, target in zip(needs_channel, planned):
+                if target is None:
+                    continue
+                requests.append((character.identifier, target))
+                touched_categories[target.id] = target
+
+            created = await create_channels_concurrently(guild, requests)
+            for character in needs_channel:
+                channel = created.get(character.identifier)
+                if channel is not None:
+                    character.channel_id = channel.id
+                    stats.channels_created += 1
 
-        # Process standalone aliases
-        standalone_aliases = config.get('standalone_aliases', [])
-        for alias_entry in standalone_aliases:
-            char_identifier = alias_entry['character_identifier']
-            alias_str = alias_entry['alias']
-
-            # Get the character (may have been created above or already existed)
-            character = created_characters.get(char_identifier)
-            if character is None:
-                # Try to fetch from database
-                character = await Character.fetch_by_identifier(conn, char_identifier, guild_id)
-
-            if character is None:
-                stats.aliases_skipped += 1
-                stats.errors.append(f"Standalone alias '{alias_str}': character '{char_identifier}' not found")
-                continue
+        failed = [c for c in new_characters if c.channel_id is None]
+        for character in failed:
+            stats.characters_failed += 1
+            stats.errors.append(f"Failed to create character '{character.identifier}': could not create channel")
+        new_characters = [c for c in new_characters if c.channel_id is not None]
 
-            await CharacterConfigManager._create_alias(
-                conn, character, alias_str, guild_id, stats
-            )
+        try:
+            async with conn.transaction():
+                await Character.insert_many(conn, new_characters)
+                stats.characters_created = len(new_characters)
+
+                all_characters = dict(existing_characters)
+                all_characters.update({c.identifier: c for c in new_characters})
+                identifiers = set(all_characters)
+                aliases = set(existing_aliases)
+                new_aliases: List[Alias] = []
+
+                # Inline aliases, for new and existing characters alike
+                for identifier, alias_list in inline_aliases.items():
+                    character = all_characters.get(identifier)
+                    if character is None:
+                        continue
+                    for alias_str in alias_list:
+                        CharacterConfigManager._plan_alias(
+                            character, alias_str, guild_id, identifiers, aliases, new_aliases, stats
+                        )
+
+                # Process standalone aliases
+                for alias_entry in config.get('standalone_aliases', []):
+                    char_identifier = alias_entry['character_identifier']
+                    alias_str = alias_entry['alias']
+
+                    character = all_characters.get(char_identifier)
+                    if character is None:
+                        stats.aliases_skipped += 1
+                        stats.errors.append(f"Standalone alias '{alias_str}': character '{char_identifier}' not found")
+                        continue
+
+                    CharacterConfigManager._plan_alias(
+                        character, alias_str, guild_id, identifiers, aliases, new_aliases, stats
+                    )
 
-        # Sort channels alphabetically after all characters are created
-        #if stats.channels_created > 0:
-        #    await sort_category_channels(category)
+                await Alias.insert_many(conn, new_aliases)
+                stats.aliases_created = len(new_aliases)
+        except Exception as e:
+            # Nothing was saved, so the channels made for this import belong to no character
+            logger.error(f"Character config import failed for guild {guild_id}: {e}")
+            for channel in created.values():
+                try:
+                    await channel.delete()
+                except discord.HTTPException as delete_error:
+                    logger.error(f"Failed to delete channel '{channel.name}' after failed import: {delete_error}")
+            stats.channels_created = stats.characters_created = stats.aliases_created = 0
+            return False, f"Failed to save characters, created channels were removed: {e}", stats
+
+        # Sort channels alphabetically once per category that received new channels
+        for touched in touched_categories.values():
+            await sort_category_channels(touched)
 
         # Build summary message
         summary_parts = []
@@ -0,0 +1,199 @@
+"""
+In-memory directory of characters and aliases for hawky.
+
+Each guild's characters and aliases are loaded with two queries, kept current by
+hawky's own commands, and reloaded once they are DIRECTORY_TTL_SECONDS old so
+writes made outside hawky (iroh, scripts) are picked up. Letter sending, dropdowns
+and autocomplete read from here instead of querying Character and Alias on every
+interaction. A lookup that misses falls back to the database. Callers get copies,
+so changing a returned character never changes the directory.
+"""
+
+import asyncpg
+import copy
+import logging
+import time
+from typing import Dict, List, Optional
+
+from db import Character, Alias
+
+logger = logging.getLogger(__name__)
+
+# Discord allows at most 25 autocomplete choices
+AUTOCOMPLETE_LIMIT = 25
+
+# Seconds before a guild's directory is reloaded from the database
+DIRECTORY_TTL_SECONDS = 60
+
+
+class GuildDirectory:
+    """Characters and aliases for a single guild."""
+
+    def __init__(self, characters: List[Character], aliases: List[Alias]):
+        self.loaded_at = time.monotonic()
+        self.by_id: Dict[int, Character] = {}
+        self.by_identifier: Dict[str, Character] = {}
+        self.by_user: Dict[int, Character] = {}
+        self.aliases: Dict[str, int] = {}
+
+        for character in characters:
+            self.add_character(character)
+        for alias in aliases:
+            self.aliases[alias.alias] = alias.character_id
+
+    def add_character(self, character: Character):
+        """Add or replace a character, keeping its aliases."""
+        self._unindex(character.id)
+        self.by_id[character.id] = character
+        self.by_identifier[character.identifier] = character
+        if character.user_id is not None:
+            self.by_user[character.user_id] = character
+
+    def remove_character(self, character_id: int):
+        """Remove a character and its aliases."""
+        self._unindex(character_id)
+        for alias in [a for a, cid in self.aliases.items() if cid == character_id]:
+            del self.aliases[alias]
+
+    def _unindex(self, character_id: int):
+        character = self.by_id.pop(character_id, None)
+        if character is None:
+            return
+        if self.by_identifier.get(character.identifier) is character:
+            del self.by_identifier[character.identifier]
+        if character.user_id is not None and self.by_user.get(character.user_id) is character:
+            del self.by_user[character.user_id]
+
+    def resolve(self, name: str) -> Optional[Character]:
+        """Resolve an identifier or alias to a character."""
+        character = self.by_identifier.get(name)
+        if character is None and name in self.aliases:
+            character = self.by_id.get(self.aliases[name])
+        return character
+
+    def aliases_for(self, character_id: int) -> List[str]:
+        """All aliases pointing at a character, sorted."""
+        return sorted(a for a, cid in self.aliases.items() if cid == character_id)
+
+    def match_names(self, current: str, include_aliases: bool = False) -> List[str]:
+        """Identifiers (and optionally aliases) containing `current`, for autocomplete."""
+        current = current.lower()
+        names = list(self.by_identifier)
+        if include_aliases:
+            names.extend(self.aliases)
+        return sorted(n for n in names if current in n.lower())[:AUTOCOMPLETE_LIMIT]
+
+    def match_aliases(self, current: str) -> List[str]:
+        """Aliases containing `current`, for autocomplete."""
+        current = current.lower()
+        return sorted(a for a in self.aliases if current in a.lower())[:AUTOCOMPLETE_LIMIT]
+
+
+class CharacterDirectory:
+    """Per-guild character directories, loaded lazily."""
+
+    def __init__(self, ttl_seconds: float = DIRECTORY_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._guilds: Dict[int, GuildDirectory] = {}
+
+    async def get(self, conn: asyncpg.Connection, guild_id: int) -> GuildDirectory:
+        """Return the guild's directory, loading it with two queries when missing or expired."""
+        directory = self._guilds.get(guild_id)
+        if directory is None or time.monotonic() - directory.loaded_at >= self.ttl_seconds:
+            characters = await Character.fetch_all(conn, guild_id)
+            aliases = await Alias.fetch_all_by_guild(conn, guild_id)
+            directory = GuildDirectory(characters, aliases)
+            self._guilds[guild_id] = directory
+            logger.info(f"Loaded character directory for guild {guild_id}: "
+                        f"{len(characters)} characters, {len(aliases)} aliases")
+        return directory
+
+    def invalidate(self, guild_id: int):
+        """Drop a guild's directory so it is reloaded on next use."""
+        self._guilds.pop(guild_id, None)
+
+    async def fetch_by_identifier(self, conn: asyncpg.Connection, identifier: str,
+                                  guild_id: int) -> Optional[Character]:
+        """Look up a character by identifier, falling back to the database on a miss."""
+        directory = await self.get(conn, guild_id)
+        character = directory.by_identifier.get(identifier)
+        if character is None:
+            character = await Character.fetch_by_identifier(conn, identifier, guild_id)
+            if character is not None:
+                directory.add_character(copy.copy(character))
+            return character
+        return copy.copy(character)
+
+    async def fetch_by_user(self, conn: asyncpg.Connection, user_id: int,
+                            guild_id: int) -> Optional[Character]:
+        """Look up a user's character, falling back to the database on a miss."""
+        directory = await self.get(conn, guild_id)
+        character = directory.by_user.get(user_id)
+        if character is None:
+            character = await Character.fetch_by_user(conn, user_id, guild_id)
+            if character is not None:
+                directory.add_character(copy.copy(character))
+            return character
+        return copy.copy(character)
+
+    async def fetch_by_id(self, conn: asyncpg.Connection, character_id: int,
+                          guild_id: int) -> Optional[Character]:
+        """Look up a character by internal ID, falling back to the database on a miss."""
+        directory = await self.get(conn, guild_id)
+        character = directory.by_id.get(character_id)
+        if character is None:
+            character = await Character.fetch_by_id(conn, character_id)
+            if character is not None and character.guild_id == guild_id:
+                directory.add_character(copy.copy(character))
+            return character
+        return copy.copy(character)
+
+    async def resolve(self, conn: asyncpg.Connection, name: str,
+                      guild_id: int) -> Optional[Character]:
+        """Resolve an identifier or alias, falling back to the database on a miss."""
+        directory = await self.get(conn, guild_id)
+        character = directory.resolve(name)
+        if character is not None:
+            return copy.copy(character)
+
+        character = await self.fetch_by_identifier(conn, name, guild_id)
+        if character is None:
+            alias_entry = await Alias.fetch_by_alias(conn, name, guild_id)
+            if alias_entry is not None:
+                directory.aliases[alias_entry.alias] = alias_entry.character_id
+                character = await self.fetch_by_id(conn, alias_entry.character_id, guild_id)
+        return character
+
+    async def autocomplete(self, conn: asyncpg.Connection, guild_id: int, current: str,
+                           include_aliases: bool = False) -> List[str]:
+        """Identifier (and optionally alias) suggestions for a partially typed name."""
+        directory = await self.get(conn, guild_id)
+        return directory.match_names(current, include_aliases)
+
+    def character_updated(self, character: Character):
+        """Record a created or edited character."""
+        directory = self._guilds.get(character.guild_id)
+        if directory is not None:
+            directory.add_character(copy.copy(character))
+
+    def character_removed(self, guild_id: int, character_id: int):
+        """Record a deleted character."""
+        directory = self._guilds.get(guild_id)
+        if directory is not None:
+            directory.remove_character(character_id)
+
+    def alias_added(self, guild_id: int, alias: str, character_id: int):
+        """Record a new alias."""
+        directory = self._guilds.get(guild_id)
+        if directory is not None:
+            directory.aliases[alias] = character_id
+
+    def alias_removed(self, guild_id: int, alias: str):
+        """Record a deleted alias."""
+        directory = self._guilds.get(guild_id)
+        if directory is not None:
+            directory.aliases.pop(alias, None)
+
+
+# Shared instance used by commands, views and tasks
+character_directory = CharacterDirectory()
@@ -2,6 +2,8 @@ from .character_handler import (
     create_character_with_channel,
     sort_category_channels,
     get_or_create_available_category,
+    plan_channel_categories,
+    create_channels_concurrently,
     CATEGORY_CHANNEL_LIMIT
 )
 from .view_callbacks import assign_character_callback, config_character_callback
@@ -10,6 +12,8 @@ __all__ = [
     'create_character_with_channel',
     'sort_category_channels',
     'get_or_create_available_category',
+    'plan_channel_categories',
+    'create_channels_concurrently',
     'CATEGORY_CHANNEL_LIMIT',
     'assign_character_callback',
     'config_character_callback'
@@ -1,7 +1,9 @@
+import asyncio
 import asyncpg
 import discord
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from db import Character
+from character_directory import character_directory
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,6 +11,9 @@ logger = logging.getLogger(__name__)
 # Discord allows 50 channels per category, but we use 45 to leave headroom
 CATEGORY_CHANNEL_LIMIT = 45
 
+# Channel creations in flight at once during bulk provisioning
+CHANNEL_CREATE_CONCURRENCY = 4
+
 
 async def get_or_create_available_category(
     guild: discord.Guild,
@@ -55,6 +60,86 @@ async def get_or_create_available_category(
             return None
 
 
+async def plan_channel_categories(
+    guild: discord.Guild,
+    base_category_id: int,
+    count: int
+) -> List[Optional[discord.CategoryChannel]]:
+    """
+    Choose a category for each of `count` new channels before any are created.
+
+    Fills the base category and then overflow categories ("-2", "-3", ...) up to
+    CATEGORY_CHANNEL_LIMIT, counting channels planned but not yet created, so
+    concurrent creation cannot overfill a category. Missing overflow categories
+    are created here.
+
+    Returns:
+        A list of length `count`; entries are None once no category has room.
+    """
+    base_category = discord.utils.get(guild.categories, id=base_category_id)
+    if base_category is None:
+        return [None] * count
+
+    planned: List[Optional[discord.CategoryChannel]] = []
+    category = base_category
+    room = CATEGORY_CHANNEL_LIMIT - len(base_category.channels)
+    suffix = 2
+
+    while len(planned) < count:
+        if room > 0:
+            take = min(room, count - len(planned))
+            planned.extend([category] * take)
+            room -= take
+            continue
+
+        if suffix > 10:  # Safety limit, matching get_or_create_available_category
+            logger.error(f"Reached overflow category limit (10) for base category '{base_category.name}'")
+            planned.extend([None] * (count - len(planned)))
+            break
+
+        overflow_name = f"{base_category.name}-{suffix}"
+        category = discord.utils.get(guild.categories, name=overflow_name)
+        if category is None:
+            category = await guild.create_category(overflow_name)
+            logger.info(f"Created overflow category '{overflow_name}'")
+        room = CATEGORY_CHANNEL_LIMIT - len(category.channels)
+        suffix += 1
+
+    return planned
+
+
+async def create_channels_concurrently(
+    guild: discord.Guild,
+    requests: List[Tuple[str, discord.CategoryChannel]]
+) -> Dict[str, discord.TextChannel]:
+    """
+    Create text channels with a bounded number of concurrent Discord calls.
+
+    Channels are created without positions; sort each category once afterwards
+    with sort_category_channels. Rate limits are waited out by discord.py.
+
+    Args:
+        guild: Discord guild object
+        requests: (channel name, category) pairs
+
+    Returns:
+        Dict of channel name to created channel. Failed names are omitted.
+    """
+    semaphore = asyncio.Semaphore(CHANNEL_CREATE_CONCURRENCY)
+    created: Dict[str, discord.TextChannel] = {}
+
+    async def worker(name: str, category: discord.CategoryChannel):
+        async with semaphore:
+            try:
+                created[name] = await guild.create_text_channel(name, category=category)
+                logger.info(f"Created channel '{name}' in category '{category.name}'")
+            except discord.HTTPException as e:
+                logger.error(f"Failed to create channel '{name}': {e}")
+
+    await asyncio.gather(*(worker(name, category) for name, category in requests))
+    return created
+
+
 async def sort_category_channels(category: discord.CategoryChannel) -> None:
     """
     Sort all text channels in a category alphabetically.
@@ -68,6 +153,11 @@ async def sort_category_channels(category: discord.CategoryChannel) -> None:
         key=lambda c: c.name.lower()
     )
 
+    # Nothing to do if the channels are already in alphabetical order
+    current_order = sorted(text_channels, key=lambda c: c.position)
+    if [c.id for c in current_order] == [c.id for c in text_channels]:
+        return
+
     # Move each channel to its correct position
     for i, ch in enumerate(text_channels):
         try:
@@ -170,6 +260,7 @@ async def create_character_with_channel(
 
     # Fetch the character back to get the database-assigned ID
     character = await Character.fetch_by_identifier(conn, identifier, guild.id)
+    character_directory.character_updated(character)
 
     logger.info(f"Created character with identifier: {identifier}")
     return (True, f"Created character '{identifier}'", character)
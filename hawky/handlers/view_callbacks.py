@@ -1,8 +1,9 @@
 import discord
 from helpers import emotive_message
 import asyncpg
-from db import Character
+from db import Character, LetterCount, ServerConfig, letter_period_start
 from typing import Optional
+from character_directory import character_directory
 
 
 async def assign_character_callback(interaction: discord.Interaction,
@@ -23,6 +24,7 @@ async def assign_character_callback(interaction: discord.Interaction,
             # Update the old character to not have a user ID
             old_character.user_id = None
             await old_character.upsert(conn)
+            character_directory.character_updated(old_character)
 
         if new_identifier != "None":
             # Get the new character
@@ -50,6 +52,7 @@ async def assign_character_callback(interaction: discord.Interaction,
 
             # Write to Database
             await new_character.upsert(conn)
+            character_directory.character_updated(new_character)
         await conn.close()
 
 
@@ -105,6 +108,12 @@ async def config_character_callback(interaction: discord.Interaction,
     # Upsert result
     conn = await asyncpg.connect("postgresql://AVATAR:password@db:5432/AVATAR")
     await character.upsert(conn)
+    character_directory.character_updated(character)
+    if count is not None:
+        # Today's count lives in the current period's LetterCount row
+        server_config = await ServerConfig.fetch(conn, character.guild_id)
+        period_start = letter_period_start(server_config.reset_time if server_config else None)
+        await LetterCount.set_count(conn, character.id, character.guild_id, period_start, count)
     await conn.close()
     await interaction.response.send_message(
         emotive_message(f"Character {character.identifier} Updated"), ephemeral=True)
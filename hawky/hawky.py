@@ -1,7 +1,7 @@
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
-from typing import Optional
+from typing import List, Optional
 from helpers import *
 from views import *
 import os
@@ -16,6 +16,7 @@ from tasks.send_response import handle_send_response
 from herbalism import make_blend
 from handlers import create_character_with_channel
 from character_config import CharacterConfigManager
+from character_directory import character_directory
 import re
 import os
 
@@ -61,11 +62,8 @@ async def process_hawky_tasks():
                     except Exception as e:
                         logger.error(f"Error sending letter (task {task.id}): {e}", exc_info=True)
                 elif task.task == "reset_counts":
-                    try:
-                        await handle_reset_counts(conn, task)
-                        logger.info(f"Successfully reset letter counts for guild {task.guild_id}")
-                    except Exception as e:
-                        logger.error(f"Error resetting counts (task {task.id}): {e}", exc_info=True)
+                    # Letter counts now roll over with each reset period; drop tasks left from older versions
+                    logger.info(f"Discarded obsolete reset_counts task {task.id} for guild {task.guild_id}")
                 elif task.task == "remind_me":
                     try:
                         await handle_remind_me(client, conn, task)
@@ -87,35 +85,20 @@ async def process_hawky_tasks():
         except Exception as e:
             logger.error(f"Error processing tasks: {e}", exc_info=True)
 
-async def handle_reset_counts(conn: asyncpg.Connection, task: HawkyTask):
-    """
-    Handle a reset_counts task by resetting letter counts for a guild
-    and scheduling the next reset based on the server's configured reset_time.
-    """
-    # Reset letter counts for the guild
-    await Character.reset_letter_counts(conn, task.guild_id)
-
-    # Get the server config to find the reset time
-    server_config = await ServerConfig.fetch(conn, task.guild_id)
-
-    # Determine the reset time (default to midnight if not configured)
-    from datetime import time as time_type
-    reset_time = server_config.reset_time if server_config and server_config.reset_time else time_type(0, 0)
-
-    # Calculate next reset occurrence
-    now = datetime.now()
-    next_reset = datetime.combine(now.date() + timedelta(days=1), reset_time)
-
-    # Schedule the next reset task
-    next_task = HawkyTask(
-        task="reset_counts",
-        guild_id=task.guild_id,
-        scheduled_time=next_reset
-    )
-    await next_task.insert(conn)
+# Autocomplete
+async def character_identifier_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+    """Suggest character identifiers from the cached character directory."""
+    async with db_pool.acquire() as conn:
+        names = await character_directory.autocomplete(conn, interaction.guild_id, current)
+    return [app_commands.Choice(name=name, value=name) for name in names]
 
 
-    logger.info(f"Scheduled next reset for guild {task.guild_id} at {next_reset}")
+async def alias_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+    """Suggest existing aliases from the cached character directory."""
+    async with db_pool.acquire() as conn:
+        directory = await character_directory.get(conn, interaction.guild_id)
+    names = directory.match_aliases(current)
+    return [app_commands.Choice(name=name, value=name) for name in names]
 
 
 # Public Commands
@@ -148,9 +131,13 @@ async def whistle(interaction: discord.Interaction):
 async def send_letter(interaction: discord.Interaction, message: discord.Message):
     # Get the sender character
     async with db_pool.acquire() as conn:
-        sender = await Character.fetch_by_user(conn, interaction.user.id, interaction.guild_id)
+        sender = await character_directory.fetch_by_user(conn, interaction.user.id, interaction.guild_id)
         server_config = await ServerConfig.fetch(conn, interaction.guild_id)
 
+        if sender is not None and sender.letter_limit is not None:
+            period_start = letter_period_start(server_config.reset_time if server_config else None)
+            sender.letter_count = await LetterCount.fetch_count(conn, sender.id, period_start)
+
     # Check if user is an admin without a character
     is_admin = interaction.user.guild_permissions.manage_guild
     if sender is None and is_admin and server_config and server_config.admin_response_channel_id:
@@ -178,14 +165,7 @@ async def send_letter_modal_callback(interaction: discord.Interaction,
     """
     # Verify that a character with this identifier exists (or an alias)
     async with db_pool.acquire() as conn:
-        recipient = await Character.fetch_by_identifier(conn, recipient_identifier, interaction.guild_id)
-
-        # If not found, check if it's an alias
-        if recipient is None:
-            alias_entry = await Alias.fetch_by_alias(conn, recipient_identifier, interaction.guild_id)
-            if alias_entry is not None:
-                # Found an alias, get the actual character
-                recipient = await Character.fetch_by_id(conn, alias_entry.character_id)
+        recipient = await character_directory.resolve(conn, recipient_identifier, interaction.guild_id)
 
     if recipient is None:
         await interaction.response.send_message(
@@ -221,13 +201,15 @@ async def send_letter_callback(interaction: discord.Interaction,
                 ephemeral=True)
             return
 
-        # Get the ServerConfig for this server to get the letter delay
+        # Get the ServerConfig for this server to get the letter delay and reset time
         config = await ServerConfig.fetch(conn, guild_id)
+        reset_time = config.reset_time if config else None
 
         # Confirm that the user wants to send a letter to this character
         view = Confirm()
         message_content = f"Are you sure you want to send this message to {recipient_identifier}?"
         if sender is not None and sender.letter_limit is not None:
+            sender.letter_count = await LetterCount.fetch_count(conn, sender.id, letter_period_start(reset_time))
             message_content = f"You have {sender.letter_limit - sender.letter_count} letters remaining today. " + message_content
         await interaction.followup.send(
             emotive_message(message_content),
@@ -264,12 +246,20 @@ async def send_letter_callback(interaction: discord.Interaction,
                          scheduled_time = scheduled_time,
                          guild_id = guild_id)
 
-        await task.insert(conn)
+        # Count the letter against the period it was confirmed in. The check and increment
+        # are one statement, and share a transaction with the queued task.
+        async with conn.transaction():
+            if sender is not None:
+                new_count = await LetterCount.try_increment(
+                    conn, sender.id, guild_id, letter_period_start(reset_time), sender.letter_limit
+                )
+                if new_count is None:
+                    await interaction.response.edit_message(
+                        content=emotive_message("You have no letters remaining!"),
+                        view=None)
+                    return
 
-        # Update count only if sender is a character
-        if sender is not None:
-            sender.letter_count += 1
-            await sender.upsert(conn)
+            await task.insert(conn)
 
     # Send confirmation
     logger.info(f"Letter queued from {sender_identifier} to {recipient.identifier} (scheduled: {scheduled_time})")
@@ -346,7 +336,7 @@ async def send_response(interaction: discord.Interaction, message: discord.Messa
     await interaction.response.defer(ephemeral=False)
     # Get the character of the sender
     async with db_pool.acquire() as conn:
-        sender = await Character.fetch_by_user(conn, interaction.user.id, interaction.guild_id)
+        sender = await character_directory.fetch_by_user(conn, interaction.user.id, interaction.guild_id)
 
         if sender is None:
             await interaction.followup.send(
@@ -448,7 +438,7 @@ async def send_response_selection_callback(interaction: discord.Interaction, mes
     Callback after user selects which letter to respond to.
     """
     async with db_pool.acquire() as conn:
-        sender = await Character.fetch_by_user(conn, interaction.user.id, interaction.guild_id)
+        sender = await character_directory.fetch_by_user(conn, interaction.user.id, interaction.guild_id)
 
         await send_response_confirmation(interaction, message, selected_letter, sender, conn)
 
@@ -473,7 +463,7 @@ async def send_response_confirmation(interaction: discord.Interaction, message:
             mention_length += 100  # Conservative estimate for the link line
         else:
             # Character recipient - check if they have a user assigned
-            original_sender = await Character.fetch_by_identifier(conn, recipient_identifier, interaction.guild_id)
+            original_sender = await character_directory.fetch_by_identifier(conn, recipient_identifier, interaction.guild_id)
             mention_length = len(f"<@{original_sender.user_id}>\n") if original_sender and original_sender.user_id else 0
 
         total_length = mention_length + len(message.content)
@@ -643,6 +633,7 @@ async def blend_herbs(
     app_commands.Choice(name="Bath", value="bath"),
     app_commands.Choice(name="Incense", value="incense"),
 ])
+@app_commands.autocomplete(character_identifier=character_identifier_autocomplete)
 async def apply_herbs(
     interaction: discord.Interaction,
     item_number: str,
@@ -777,7 +768,12 @@ async def analyze_evidence(interaction: discord.Interaction, analysis_number: st
 )
 async def check_letter_limit(interaction: discord.Interaction):
     async with db_pool.acquire() as conn:
-        character = await Character.fetch_by_user(conn, interaction.user.id, interaction.guild_id)
+        character = await character_directory.fetch_by_user(conn, interaction.user.id, interaction.guild_id)
+
+        if character is not None and character.letter_limit is not None:
+            server_config = await ServerConfig.fetch(conn, interaction.guild_id)
+            period_start = letter_period_start(server_config.reset_time if server_config else None)
+            character.letter_count = await LetterCount.fetch_count(conn, character.id, period_start)
 
     if character is None:
         await interaction.response.send_message(
@@ -908,6 +904,7 @@ async def create_character(interaction: discord.Interaction, identifier: str):
     identifier="The identifier of the character you want to remove"
 )
 @app_commands.default_permissions(manage_guild=True)
+@app_commands.autocomplete(identifier=character_identifier_autocomplete)
 async def remove_character(interaction: discord.Interaction, identifier: str):
     # Get the character from the database
     async with db_pool.acquire() as conn:
@@ -948,6 +945,7 @@ async def remove_character(interaction: discord.Interaction, identifier: str):
 
         await delete_channel
         await delete_database
+        character_directory.character_removed(interaction.guild_id, character.id)
 
     # Send confirmation
     logger.info(f"Successfully deleted {identifier}")
@@ -965,10 +963,16 @@ async def remove_character(interaction: discord.Interaction, identifier: str):
     identifier="The identifier of the character you want to configure"
 )
 @app_commands.default_permissions(manage_guild=True)
+@app_commands.autocomplete(identifier=character_identifier_autocomplete)
 async def config_character(interaction: discord.Interaction, identifier: str):
     # Get exisitng character entry
     async with db_pool.acquire() as conn:
         character = await Character.fetch_by_identifier(conn, identifier, interaction.guild_id)
+
+        if character is not None:
+            server_config = await ServerConfig.fetch(conn, interaction.guild_id)
+            period_start = letter_period_start(server_config.reset_time if server_config else None)
+            character.letter_count = await LetterCount.fetch_count(conn, character.id, period_start)
     
     # If it doesn't exist, send an error message
     if character is None:
@@ -997,10 +1001,13 @@ async def view_character(interaction: discord.Interaction, member: discord.Membe
         # Check if the user is an admin
         is_admin = interaction.user.guild_permissions.manage_guild
 
-        # Fetch aliases if admin
+        # Fetch aliases and current letter count if admin
         aliases = []
         if is_admin and character is not None:
             aliases = await Alias.fetch_by_character_id(conn, character.id)
+            server_config = await ServerConfig.fetch(conn, interaction.guild_id)
+            period_start = letter_period_start(server_config.reset_time if server_config else None)
+            character.letter_count = await LetterCount.fetch_count(conn, character.id, period_start)
 
     if character is None:
         await interaction.response.send_message(
@@ -1176,30 +1183,14 @@ async def config_server_callback(interaction: discord.Interaction,
 
         await config.upsert(conn)
 
-        # If reset_time was changed, cancel existing reset_counts tasks and schedule a new one
+        # Letter counts are keyed by reset period, so a new reset_time takes effect
+        # with no scheduled task. Clean up any reset_counts tasks from older versions.
         if reset_time_changed and reset_time_obj is not None:
-            # Delete all existing reset_counts tasks for this guild
-            deleted_count = await HawkyTask.delete_by_type_and_guild(conn, "reset_counts", interaction.guild_id)
-
-            # Calculate the next occurrence of the reset time
-            now = datetime.now()
-            next_reset = datetime.combine(now.date(), reset_time_obj)
-
-            # If the time has already passed today, schedule for tomorrow
-            if next_reset <= now:
-                next_reset = datetime.combine(now.date() + timedelta(days=1), reset_time_obj)
-
-            # Schedule the new reset task
-            reset_task = HawkyTask(
-                task="reset_counts",
-                guild_id=interaction.guild_id,
-                scheduled_time=next_reset
-            )
-            await reset_task.insert(conn)
+            await HawkyTask.delete_by_type_and_guild(conn, "reset_counts", interaction.guild_id)
 
-            logger.info(f"Server config updated for guild {interaction.guild_id}. Reset time: {reset_time_obj.strftime('%H:%M')} UTC, next reset: {next_reset}")
+            logger.info(f"Server config updated for guild {interaction.guild_id}. Reset time: {reset_time_obj.strftime('%H:%M')} UTC")
             await interaction.response.send_message(
-                emotive_message(f"Server Config Updated. Reset time changed to {reset_time_obj.strftime('%H:%M')} UTC. Next reset scheduled for {next_reset.strftime('%Y-%m-%d %H:%M:%S')} UTC"),
+                emotive_message(f"Server Config Updated. Letter counts now reset daily at {reset_time_obj.strftime('%H:%M')} UTC"),
                 ephemeral=True)
         else:
             logger.info(f"Server config updated for guild {interaction.guild_id}")
@@ -1212,43 +1203,11 @@ async def config_server_callback(interaction: discord.Interaction,
 @app_commands.default_permissions(manage_guild=True)
 async def reset_counts(interaction: discord.Interaction):
     async with db_pool.acquire() as conn:
-        # Reset letter counts
-        await Character.reset_letter_counts(conn, interaction.guild_id)
-
-        # Check if a reset_counts task already exists for this guild
-        task_exists = await HawkyTask.exists_for_guild(conn, "reset_counts", interaction.guild_id)
-
-        message = "Reset daily letter counts"
-
-        if not task_exists:
-            # Get the server config to find the reset time
-            server_config = await ServerConfig.fetch(conn, interaction.guild_id)
-
-            # Determine the reset time (default to midnight if not configured)
-            from datetime import time as time_type
-            reset_time = server_config.reset_time if server_config and server_config.reset_time else time_type(0, 0)
-
-            # Calculate the next occurrence of the reset time
-            now = datetime.now()
-            next_reset = datetime.combine(now.date(), reset_time)
-
-            # If the time has already passed today, schedule for tomorrow
-            if next_reset <= now:
-                next_reset = datetime.combine(now.date() + timedelta(days=1), reset_time)
-
-            reset_task = HawkyTask(
-                task="reset_counts",
-                guild_id=interaction.guild_id,
-                scheduled_time=next_reset
-            )
-            await reset_task.insert(conn)
-            message += f" and scheduled automatic daily resets at {reset_time.strftime('%H:%M')} UTC (next reset: {next_reset.strftime('%Y-%m-%d %H:%M:%S')})"
-            logger.info(f"Manual reset triggered for guild {interaction.guild_id}. Scheduled next reset at {next_reset}")
-        else:
-            logger.info(f"Manual reset triggered for guild {interaction.guild_id}. Auto-reset already scheduled")
-
+        # Clear this guild's letter counters; later periods start from zero on their own
+        await LetterCount.reset_guild(conn, interaction.guild_id)
 
-    await interaction.response.send_message(emotive_message(message),
+    logger.info(f"Manual reset triggered for guild {interaction.guild_id}")
+    await interaction.response.send_message(emotive_message("Reset daily letter counts"),
                                             ephemeral=True)
 
 @tree.command(
@@ -1260,6 +1219,7 @@ async def reset_counts(interaction: discord.Interaction):
     alias="The alias identifier to add"
 )
 @app_commands.default_permissions(manage_guild=True)
+@app_commands.autocomplete(identifier=character_identifier_autocomplete)
 async def add_alias(interaction: discord.Interaction, identifier: str, alias: str):
     async with db_pool.acquire() as conn:
         # Get the character
@@ -1294,6 +1254,7 @@ async def add_alias(interaction: discord.Interaction, identifier: str, alias: st
             guild_id=interaction.guild_id
         )
         await new_alias.insert(conn)
+        character_directory.alias_added(interaction.guild_id, alias, character.id)
 
     logger.info(f"Added alias '{alias}' for character '{identifier}' in guild {interaction.guild_id}")
     await interaction.response.send_message(
@@ -1325,7 +1286,7 @@ async def list_aliases(interaction: discord.Interaction):
         # Fetch character names
         lines = []
         for char_id, alias_list in alias_by_char_id.items():
-            character = await Character.fetch_by_id(conn, char_id)
+            character = await character_directory.fetch_by_id(conn, char_id, interaction.guild_id)
             char_name = character.identifier if character else f"Unknown ({char_id})"
             aliases_str = ", ".join(alias_list)
             lines.append(f"**{char_name}**: {aliases_str}")
@@ -1343,6 +1304,7 @@ async def list_aliases(interaction: discord.Interaction):
     alias="The alias identifier to remove"
 )
 @app_commands.default_permissions(manage_guild=True)
+@app_commands.autocomplete(alias=alias_autocomplete)
 async def remove_alias(interaction: discord.Interaction, alias: str):
     async with db_pool.acquire() as conn:
         # Check if the alias exists
@@ -1359,6 +1321,7 @@ async def remove_alias(interaction: discord.Interaction, alias: str):
 
         # Delete the alias
         await Alias.delete_by_alias(conn, alias, interaction.guild_id)
+        character_directory.alias_removed(interaction.guild_id, alias)
 
     logger.info(f"Removed alias '{alias}' from character '{character.identifier}' in guild {interaction.guild_id}")
     await interaction.response.send_message(
@@ -1406,6 +1369,7 @@ async def clear_characters(interaction: discord.Interaction):
 
         # Delete all characters from database
         characters_deleted = await Character.delete_all_by_guild(conn, interaction.guild_id)
+        character_directory.invalidate(interaction.guild_id)
 
     # Delete Discord channels
     channels_deleted = 0
@@ -1477,6 +1441,8 @@ async def load_characters_config(interaction: discord.Interaction, config_file:
             config_yaml=config_yaml,
             guild=interaction.guild
         )
+        # Reload the directory on next use to pick up every created character and alias
+        character_directory.invalidate(interaction.guild_id)
 
     if success:
         logger.info(f"Config import for guild {interaction.guild_id}: {stats.characters_created} created, "
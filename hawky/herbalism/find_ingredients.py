@@ -31,6 +31,7 @@ from blending import (
     count_property,
     VALID_PRODUCT_TYPES,
 )
+from db import compile_ingredient_matcher
 
 # --- Configuration ---
 INGREDIENTS_FILE = "production_data/herbal_ingredients.csv"
@@ -115,14 +116,7 @@ class ConstraintRecipe:
         """Check if provided ingredients match all required recipe ingredients."""
         if self.ingredients is None or len(self.ingredients) == 0:
             return True
-        for required in self.ingredients:
-            matched = any(
-                self._pattern_matches(required, actual)
-                for actual in ingredient_numbers
-            )
-            if not matched:
-                return False
-        return True
+        return compile_ingredient_matcher(tuple(self.ingredients)).matches(ingredient_numbers)
 
 
 # --- CSV Loading Functions ---
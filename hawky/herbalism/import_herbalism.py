@@ -11,8 +11,9 @@ import asyncio
 import asyncpg
 import logging
 import sys
+import time
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 # Handle both direct execution and module import
 if __name__ == "__main__":
@@ -28,28 +29,34 @@ if __name__ == "__main__":
     from loaders import (
         load_ingredients,
         load_products,
+        validate_ingredients_unique,
         validate_products_unique,
         validate_products_have_recipes,
         validate_subset_recipes_unique,
         validate_constraint_recipes_unique,
+        validate_failed_blends_unique,
         load_subset_recipes,
         load_constraint_recipes,
         load_failed_blends,
     )
     from clear_data import clear_herbal_data
+    from db import Ingredient, Product, SubsetRecipe, ConstraintRecipe, FailedBlend
 else:
     from .loaders import (
         load_ingredients,
         load_products,
+        validate_ingredients_unique,
         validate_products_unique,
         validate_products_have_recipes,
         validate_subset_recipes_unique,
         validate_constraint_recipes_unique,
+        validate_failed_blends_unique,
         load_subset_recipes,
         load_constraint_recipes,
         load_failed_blends,
     )
     from .clear_data import clear_herbal_data
+    from db import Ingredient, Product, SubsetRecipe, ConstraintRecipe, FailedBlend
 
 # Configure logging
 logging.basicConfig(
@@ -74,18 +81,24 @@ FAILED_BLENDS_FILE = "production_data/failed_blends.csv"
 
 DB_URL = "postgresql://AVATAR:password@db:5432/AVATAR"
 
+# Use COPY in a single transaction instead of row-by-row upserts
+USE_BULK_IMPORT = True
 
-async def import_herbalism_data(
-    conn: asyncpg.Connection,
+
+def load_and_validate_herbalism_data(
     ingredients_file: str,
     products_file: str,
     subset_recipes_file: str,
     constraint_recipes_files: List[str],
     failed_blends_file: str
-):
+) -> Dict[str, list]:
     """
-    Import all herbalism data from the specified files.
-    Clears existing data before importing.
+    Load all herbalism data from the specified files and validate it in memory.
+    Raises ValueError if validation fails; nothing touches the database.
+
+    Returns:
+        Dict with keys "ingredients", "products", "subset_recipes",
+        "constraint_recipes" and "failed_blends".
     """
     # === Phase 1: Load all data ===
     logger.info(f"Loading ingredients from {ingredients_file}...")
@@ -107,6 +120,11 @@ async def import_herbalism_data(
     failed_blends = load_failed_blends(failed_blends_file)
 
     # === Phase 2: Validate all data ===
+    logger.info("Validating ingredients...")
+    valid, error_msg = validate_ingredients_unique(ingredients)
+    if not valid:
+        raise ValueError(f"Ingredient validation failed:\n{error_msg}")
+
     logger.info("Validating products...")
     valid, error_msg = validate_products_unique(products)
     if not valid:
@@ -128,38 +146,119 @@ async def import_herbalism_data(
     if not valid:
         raise ValueError(f"Constraint recipe validation failed:\n{error_msg}")
 
-    # === Phase 3: Clear existing data and insert ===
-    logger.info("Clearing existing herbalism data...")
-    await clear_herbal_data(conn)
+    logger.info("Validating failed blends for duplicates...")
+    valid, error_msg = validate_failed_blends_unique(failed_blends)
+    if not valid:
+        raise ValueError(f"Failed blend validation failed:\n{error_msg}")
 
-    logger.info(f"Inserting {len(ingredients)} ingredients...")
+    # Normalize chakra names to lowercase
     for ing in ingredients:
-        # Normalize chakra names to lowercase
         if ing.primary_chakra:
             ing.primary_chakra = ing.primary_chakra.lower()
         if ing.secondary_chakra:
             ing.secondary_chakra = ing.secondary_chakra.lower()
+
+    return {
+        "ingredients": ingredients,
+        "products": products,
+        "subset_recipes": subset_recipes,
+        "constraint_recipes": all_constraint_recipes,
+        "failed_blends": failed_blends,
+    }
+
+
+async def import_herbalism_data(
+    conn: asyncpg.Connection,
+    ingredients_file: str,
+    products_file: str,
+    subset_recipes_file: str,
+    constraint_recipes_files: List[str],
+    failed_blends_file: str
+):
+    """
+    Import all herbalism data from the specified files.
+    Clears existing data before importing.
+    """
+    data = load_and_validate_herbalism_data(
+        ingredients_file, products_file, subset_recipes_file,
+        constraint_recipes_files, failed_blends_file
+    )
+
+    # === Phase 3: Clear existing data and insert ===
+    logger.info("Clearing existing herbalism data...")
+    await clear_herbal_data(conn)
+
+    logger.info(f"Inserting {len(data['ingredients'])} ingredients...")
+    for ing in data["ingredients"]:
         await ing.upsert(conn)
 
-    logger.info(f"Inserting {len(products)} products...")
-    for prod in products:
+    logger.info(f"Inserting {len(data['products'])} products...")
+    for prod in data["products"]:
         await prod.upsert(conn)
 
-    logger.info(f"Inserting {len(subset_recipes)} subset recipes...")
-    for recipe in subset_recipes:
+    logger.info(f"Inserting {len(data['subset_recipes'])} subset recipes...")
+    for recipe in data["subset_recipes"]:
         await recipe.upsert(conn)
 
-    logger.info(f"Inserting {len(all_constraint_recipes)} constraint recipes...")
-    for recipe in all_constraint_recipes:
+    logger.info(f"Inserting {len(data['constraint_recipes'])} constraint recipes...")
+    for recipe in data["constraint_recipes"]:
         await recipe.insert(conn)
 
-    logger.info(f"Inserting {len(failed_blends)} failed blends...")
-    for fb in failed_blends:
+    logger.info(f"Inserting {len(data['failed_blends'])} failed blends...")
+    for fb in data["failed_blends"]:
         await fb.upsert(conn)
 
     logger.info("Herbalism data import complete!")
 
 
+async def bulk_import_herbalism_data(
+    conn: asyncpg.Connection,
+    ingredients_file: str,
+    products_file: str,
+    subset_recipes_file: str,
+    constraint_recipes_files: List[str],
+    failed_blends_file: str
+) -> Dict[str, float]:
+    """
+    Import all herbalism data using COPY inside a single transaction.
+
+    Everything is loaded and validated in memory before the database is touched.
+    The clear and every COPY run in one transaction, so a running hawky keeps
+    seeing the old catalogue until the commit and never sees a partial import.
+
+    Returns:
+        Dict mapping table name to seconds spent loading it.
+    """
+    data = load_and_validate_herbalism_data(
+        ingredients_file, products_file, subset_recipes_file,
+        constraint_recipes_files, failed_blends_file
+    )
+
+    tables = [
+        ("Ingredient", Ingredient, data["ingredients"]),
+        ("Product", Product, data["products"]),
+        ("SubsetRecipe", SubsetRecipe, data["subset_recipes"]),
+        ("ConstraintRecipe", ConstraintRecipe, data["constraint_recipes"]),
+        ("FailedBlend", FailedBlend, data["failed_blends"]),
+    ]
+
+    timings = {}
+    async with conn.transaction():
+        logger.info("Clearing existing herbalism data...")
+        start = time.perf_counter()
+        await clear_herbal_data(conn)
+        timings["clear"] = time.perf_counter() - start
+
+        for table_name, model, rows in tables:
+            start = time.perf_counter()
+            await model.bulk_insert(conn, rows)
+            timings[table_name] = time.perf_counter() - start
+            logger.info(f"Copied {len(rows)} rows into {table_name} in {timings[table_name]:.3f}s")
+
+    logger.info(f"Herbalism bulk import complete in {sum(timings.values()):.3f}s!")
+    return timings
+
+
 async def main():
     """
     Main entry point for the import script.
@@ -167,8 +266,10 @@ async def main():
     logger.info("Connecting to database...")
     conn = await asyncpg.connect(DB_URL)
 
+    import_fn = bulk_import_herbalism_data if USE_BULK_IMPORT else import_herbalism_data
+
     try:
-        await import_herbalism_data(
+        await import_fn(
             conn,
             INGREDIENTS_FILE,
             PRODUCTS_FILE,
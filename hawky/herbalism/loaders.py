@@ -96,6 +96,32 @@ def load_products(filename: str) -> List[Product]:
     return products
 
 
+def validate_ingredients_unique(ingredients: List[Ingredient]) -> tuple[bool, str]:
+    """
+    Validate that all ingredients have unique item numbers.
+
+    Returns:
+        (True, "") if valid
+        (False, error_message) if duplicates found
+    """
+    seen = {}
+    duplicates = []
+
+    for i, ing in enumerate(ingredients):
+        if ing.item_number in seen:
+            duplicates.append((ing.item_number, seen[ing.item_number], i))
+        else:
+            seen[ing.item_number] = i
+
+    if duplicates:
+        lines = ["Duplicate ingredient item numbers found:"]
+        for item_number, first_idx, dup_idx in duplicates:
+            lines.append(f"  {item_number} - rows {first_idx + 2} and {dup_idx + 2}")  # +2 for 1-indexing and header row
+        return False, "\n".join(lines)
+
+    return True, ""
+
+
 def validate_products_unique(products: List[Product]) -> tuple[bool, str]:
     """
     Validate that all products have unique (product_type, item_number) pairs.
@@ -123,6 +149,32 @@ def validate_products_unique(products: List[Product]) -> tuple[bool, str]:
     return True, ""
 
 
+def validate_failed_blends_unique(failed_blends: List[FailedBlend]) -> tuple[bool, str]:
+    """
+    Validate that each product type has at most one failed blend.
+
+    Returns:
+        (True, "") if valid
+        (False, error_message) if duplicates found
+    """
+    seen = {}
+    duplicates = []
+
+    for i, fb in enumerate(failed_blends):
+        if fb.product_type in seen:
+            duplicates.append((fb.product_type, seen[fb.product_type], i))
+        else:
+            seen[fb.product_type] = i
+
+    if duplicates:
+        lines = ["Duplicate failed blend product types found:"]
+        for product_type, first_idx, dup_idx in duplicates:
+            lines.append(f"  {product_type} - rows {first_idx + 2} and {dup_idx + 2}")  # +2 for 1-indexing and header row
+        return False, "\n".join(lines)
+
+    return True, ""
+
+
 def validate_products_have_recipes(
     products: List[Product],
     subset_recipes: List[SubsetRecipe],
@@ -1,4 +1,5 @@
 from db import *
+from character_directory import character_directory
 import discord
 from datetime import datetime
 
@@ -8,7 +9,7 @@ async def handle_send_letter(client: discord.Client, conn: asyncpg.Connection, t
     Handle a send_letter task by fetching the original message and sending it to the recipient's channel.
     """
     # Get the recipient
-    recipient = await Character.fetch_by_identifier(conn, task.recipient_identifier, task.guild_id)
+    recipient = await character_directory.fetch_by_identifier(conn, task.recipient_identifier, task.guild_id)
 
     # Get the message
     params = task.parameter.split(" ")
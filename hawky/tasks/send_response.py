@@ -1,4 +1,5 @@
 from db import *
+from character_directory import character_directory
 import discord
 
 
@@ -40,7 +41,7 @@ async def handle_send_response(client: discord.Client, conn: asyncpg.Connection,
         return
 
     # Get the original sender (who will receive the response)
-    original_sender = await Character.fetch_by_identifier(conn, task.recipient_identifier, task.guild_id)
+    original_sender = await character_directory.fetch_by_identifier(conn, task.recipient_identifier, task.guild_id)
 
     # Get Channel where the response should be sent (original sender's channel)
     channel = await client.fetch_channel(original_sender.channel_id)
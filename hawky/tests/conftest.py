@@ -0,0 +1,53 @@
+"""
+Pytest configuration for hawky test path setup and shared fixtures.
+"""
+import sys
+from pathlib import Path
+import pytest
+import asyncpg
+
+# Add parent directories to path so tests can import hawky modules and db
+hawky_dir = Path(__file__).parent.parent
+avatar_bots_dir = hawky_dir.parent
+sys.path.insert(0, str(hawky_dir))
+sys.path.insert(0, str(avatar_bots_dir))
+
+# Import DB models after path is set
+from db import ServerConfig
+
+# Test guild ID; distinct from iroh's test guilds since both suites share the database
+TEST_GUILD_ID = 999999999999999997
+
+
+@pytest.fixture(scope="function")
+async def db_conn():
+    """Provide a database connection for each test."""
+    pool = await asyncpg.create_pool(
+        host='db',
+        port=5432,
+        user='AVATAR',
+        password='password',
+        database='AVATAR',
+        min_size=1,
+        max_size=3
+    )
+    try:
+        async with pool.acquire() as conn:
+            yield conn
+    finally:
+        await pool.close()
+
+
+@pytest.fixture(scope="function")
+async def test_server(db_conn):
+    """Set up test server config for TEST_GUILD_ID."""
+    server_config = ServerConfig(guild_id=TEST_GUILD_ID)
+    await server_config.upsert(db_conn)
+
+    yield
+
+    # Cleanup in reverse dependency order
+    await db_conn.execute("DELETE FROM LetterCount WHERE guild_id = $1;", TEST_GUILD_ID)
+    await db_conn.execute("DELETE FROM Alias WHERE guild_id = $1;", TEST_GUILD_ID)
+    await db_conn.execute("DELETE FROM Character WHERE guild_id = $1;", TEST_GUILD_ID)
+    await db_conn.execute("DELETE FROM ServerConfig WHERE guild_id = $1;", TEST_GUILD_ID)
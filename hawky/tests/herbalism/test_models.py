@@ -3,6 +3,7 @@ Tests for herbalism database models.
 """
 import pytest
 from db import Ingredient, Product, SubsetRecipe, ConstraintRecipe, FailedBlend
+from db import compile_ingredient_matcher, encode_item_numbers
 
 
 @pytest.mark.asyncio
@@ -203,6 +204,30 @@ async def test_constraint_recipe_wildcard_matching(db_conn, clean_herbalism_data
     assert len(matches) == 0
 
 
+def test_compiled_ingredient_matcher():
+    """Test compiled wildcard matching against raw and pre-encoded ingredients."""
+    matcher = compile_ingredient_matcher(("51*1", "5200"))
+
+    assert matcher.matches(["5111", "5200"])
+    assert matcher.matches(["5101", "5200", "5300"])
+    assert not matcher.matches(["5111"])  # missing fixed ingredient
+    assert not matcher.matches(["5112", "5200"])  # wrong last digit
+    assert not matcher.matches(["51011", "5200"])  # wrong length
+    assert matcher.matches_encoded(encode_item_numbers(["5200", "5121"]))
+
+    # Same patterns share one compiled matcher
+    assert compile_ingredient_matcher(("51*1", "5200")) is matcher
+
+
+def test_constraint_recipe_matches_with_encoded_ingredients():
+    """Test ConstraintRecipe.matches reuses a pre-encoded blend."""
+    recipe = ConstraintRecipe(product_item_number="6111", product_type="tea", ingredients=["51*1"])
+    encoded = encode_item_numbers(["5121"])
+
+    assert recipe.matches(["5121"], None, None, None, None, 1, encoded_ingredients=encoded)
+    assert not recipe.matches(["5122"], None, None, None, None, 1)
+
+
 @pytest.mark.asyncio
 async def test_failed_blend_upsert_and_fetch(db_conn, clean_herbalism_data):
     """Test inserting and fetching failed blends."""
@@ -6,7 +6,9 @@ from pathlib import Path
 from hawky.herbalism.loaders import (
     load_ingredients,
     load_products,
+    validate_ingredients_unique,
     validate_products_unique,
+    validate_failed_blends_unique,
     load_subset_recipes,
     load_constraint_recipes,
     load_failed_blends,
@@ -91,6 +93,32 @@ class TestLoaders:
         assert "('tea', '001')" in error_msg
         assert "('salve', '002')" in error_msg
 
+    def test_validate_ingredients_unique_with_duplicates(self):
+        """Test validation fails when two ingredients share an item number."""
+        ingredients = [
+            Ingredient(item_number="5111", name="Calming Chamomile"),
+            Ingredient(item_number="5101", name="Other"),
+            Ingredient(item_number="5111", name="Chamomile Again"),  # duplicate
+        ]
+        valid, error_msg = validate_ingredients_unique(ingredients)
+        assert valid is False
+        assert "Duplicate ingredient item numbers found" in error_msg
+        assert "5111 - rows 2 and 4" in error_msg
+
+        valid, error_msg = validate_ingredients_unique(ingredients[:2])
+        assert valid is True
+        assert error_msg == ""
+
+    def test_validate_failed_blends_unique_with_duplicates(self):
+        """Test validation fails when a product type has two failed blends."""
+        failed_blends = [
+            FailedBlend(product_item_number="6000", product_type="salve"),
+            FailedBlend(product_item_number="6001", product_type="salve"),  # duplicate
+        ]
+        valid, error_msg = validate_failed_blends_unique(failed_blends)
+        assert valid is False
+        assert "salve - rows 2 and 3" in error_msg
+
     def test_load_subset_recipes(self):
         """Test loading subset recipes from CSV."""
         recipes = load_subset_recipes(str(TEST_DATA_DIR / "test_subset_recipes.csv"))
@@ -200,3 +228,50 @@ class TestClearFunctions:
         assert len(await SubsetRecipe.fetch_all(db_conn)) == 0
         assert len(await ConstraintRecipe.fetch_all(db_conn)) == 0
         assert len(await FailedBlend.fetch_all(db_conn)) == 0
+
+
+@pytest.mark.asyncio
+class TestBulkInsert:
+    """Tests for COPY-based bulk insert used by the bulk importer."""
+
+    async def test_bulk_insert_ingredients(self, db_conn, clean_herbalism_data):
+        """Test bulk inserting ingredients."""
+        await Ingredient.bulk_insert(db_conn, [
+            Ingredient(item_number="test1", name="Test 1", primary_chakra="earth"),
+            Ingredient(item_number="test2", name="Test 2", properties="ingestible"),
+        ])
+
+        ing = await Ingredient.fetch_by_item_number(db_conn, "test1")
+        assert ing is not None
+        assert ing.primary_chakra == "earth"
+        assert (await Ingredient.fetch_by_item_number(db_conn, "test2")).has_property("ingestible")
+
+    async def test_bulk_insert_subset_recipes_sorts_ingredients(self, db_conn, clean_herbalism_data):
+        """Test bulk inserted subset recipes store ingredients sorted descending."""
+        await SubsetRecipe.bulk_insert(db_conn, [
+            SubsetRecipe(product_item_number="test1", product_type="tea", ingredients=["5101", "5111"]),
+        ])
+
+        recipes = await SubsetRecipe.fetch_all(db_conn)
+        assert len(recipes) == 1
+        assert recipes[0].ingredients == ["5111", "5101"]
+
+    async def test_bulk_insert_constraint_recipes_preserves_order(self, db_conn, clean_herbalism_data):
+        """Test bulk inserted constraint recipes keep FIFO order."""
+        await ConstraintRecipe.bulk_insert(db_conn, [
+            ConstraintRecipe(product_item_number="first", product_type="tea", ingredients=["51*1"]),
+            ConstraintRecipe(product_item_number="second", product_type="tea", tier=1),
+        ])
+
+        recipes = await ConstraintRecipe.fetch_all(db_conn)
+        assert [r.product_item_number for r in recipes] == ["first", "second"]
+        assert recipes[0].ingredients == ["51*1"]
+        assert recipes[1].tier == 1
+
+    async def test_bulk_insert_products_and_failed_blends(self, db_conn, clean_herbalism_data):
+        """Test bulk inserting products and failed blends."""
+        await Product.bulk_insert(db_conn, [Product(item_number="6000", name="Sludge", product_type="salve")])
+        await FailedBlend.bulk_insert(db_conn, [FailedBlend(product_item_number="6000", product_type="salve")])
+
+        assert (await Product.fetch_by_item_number_and_type(db_conn, "6000", "salve")).name == "Sludge"
+        assert (await FailedBlend.fetch_by_type(db_conn, "salve")).product_item_number == "6000"
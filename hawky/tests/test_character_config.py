@@ -0,0 +1,140 @@
+"""
+Pytest tests for character config import and bulk channel provisioning.
+
+Tests verify:
+- Channels are planned into the base category, then overflow categories
+- Only missing channels are created; existing ones are reused
+- Characters and aliases are inserted together
+- A failed insert deletes the channels created for the import
+
+Discord is replaced by minimal in-memory guild, category and channel objects.
+"""
+import pytest
+from character_config import CharacterConfigManager
+from handlers.character_handler import plan_channel_categories, create_channels_concurrently, CATEGORY_CHANNEL_LIMIT
+from db import Character, Alias, ServerConfig
+from tests.conftest import TEST_GUILD_ID
+
+BASE_CATEGORY_ID = 999000000000000600
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int, name: str, category: "FakeCategory"):
+        self.id = channel_id
+        self.name = name
+        self.category = category
+        self.position = len(category.channels)
+
+    async def delete(self):
+        self.category.channels.remove(self)
+
+
+class FakeCategory:
+    def __init__(self, category_id: int, name: str):
+        self.id = category_id
+        self.name = name
+        self.channels = []
+
+
+class FakeGuild:
+    def __init__(self):
+        self._next_id = BASE_CATEGORY_ID
+        self.categories = [FakeCategory(self._new_id(), "Letters")]
+        self.created_channels = []
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id - 1
+
+    async def create_category(self, name: str) -> FakeCategory:
+        category = FakeCategory(self._new_id(), name)
+        self.categories.append(category)
+        return category
+
+    async def create_text_channel(self, name: str, category: FakeCategory) -> FakeChannel:
+        channel = FakeChannel(self._new_id(), name, category)
+        category.channels.append(channel)
+        self.created_channels.append(channel)
+        return channel
+
+
+@pytest.mark.asyncio
+async def test_plan_channel_categories_overflows():
+    """Test that channels fill the base category before overflow categories are created."""
+    guild = FakeGuild()
+    base = guild.categories[0]
+    base.channels = [FakeChannel(i, f"existing-{i}", base) for i in range(CATEGORY_CHANNEL_LIMIT - 1)]
+
+    planned = await plan_channel_categories(guild, base.id, 3)
+    assert [c.name for c in planned] == ["Letters", "Letters-2", "Letters-2"]
+
+    created = await create_channels_concurrently(guild, [(f"new-{i}", c) for i, c in enumerate(planned)])
+    assert sorted(created) == ["new-0", "new-1", "new-2"]
+    assert len(base.channels) == CATEGORY_CHANNEL_LIMIT
+    assert len(guild.categories[1].channels) == 2
+
+
+@pytest.mark.asyncio
+async def test_import_config_creates_characters_and_aliases(db_conn, test_server):
+    """Test that only missing channels are created and characters and aliases are saved."""
+    guild = FakeGuild()
+    base = guild.categories[0]
+    await ServerConfig(guild_id=TEST_GUILD_ID, default_limit=3, category_id=base.id).upsert(db_conn)
+    await guild.create_text_channel("cfg-toph", category=base)
+    guild.created_channels.clear()
+
+    success, message, stats = await CharacterConfigManager.import_config(db_conn, TEST_GUILD_ID, """
+characters:
+  - identifier: cfg-zuko
+    aliases: [cfg-prince]
+  - identifier: cfg-toph
+    letter_limit: null
+standalone_aliases:
+  - character_identifier: cfg-toph
+    alias: cfg-blind-bandit
+""", guild)
+
+    assert success, message
+    assert stats.characters_created == 2
+    assert stats.channels_created == 1
+    assert stats.aliases_created == 2
+    assert [c.name for c in guild.created_channels] == ["cfg-zuko"]
+
+    zuko = await Character.fetch_by_identifier(db_conn, "cfg-zuko", TEST_GUILD_ID)
+    toph = await Character.fetch_by_identifier(db_conn, "cfg-toph", TEST_GUILD_ID)
+    assert zuko.channel_id == guild.created_channels[0].id
+    assert zuko.letter_limit == 3
+    assert toph.letter_limit is None
+    assert (await Alias.fetch_by_alias(db_conn, "cfg-blind-bandit", TEST_GUILD_ID)).character_id == toph.id
+
+    # Importing again skips everything
+    success, _, stats = await CharacterConfigManager.import_config(
+        db_conn, TEST_GUILD_ID, "characters:\n  - identifier: cfg-zuko\n", guild
+    )
+    assert success
+    assert stats.characters_skipped == 1
+    assert stats.channels_created == 0
+
+
+@pytest.mark.asyncio
+async def test_import_config_failure_removes_created_channels(db_conn, test_server):
+    """Test that channels created for an import are deleted when the insert fails."""
+    guild = FakeGuild()
+    base = guild.categories[0]
+    await ServerConfig(guild_id=TEST_GUILD_ID, category_id=base.id).upsert(db_conn)
+
+    # letter_limit is a SMALLINT column, so this insert fails after the channels exist
+    success, message, stats = await CharacterConfigManager.import_config(db_conn, TEST_GUILD_ID, """
+characters:
+  - identifier: cfg-aang
+  - identifier: cfg-sokka
+    letter_limit: 100000
+""", guild)
+
+    assert not success
+    assert "created channels were removed" in message
+    assert stats.characters_created == 0
+    assert stats.channels_created == 0
+    assert len(guild.created_channels) == 2
+    assert base.channels == []
+    assert await Character.fetch_by_identifier(db_conn, "cfg-aang", TEST_GUILD_ID) is None
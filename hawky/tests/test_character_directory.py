@@ -0,0 +1,74 @@
+"""
+Pytest tests for the cached character directory.
+
+Tests verify:
+- Identifiers, users and aliases resolve from the loaded directory
+- Lookups that miss fall back to the database
+- Returned characters are copies of the cached ones
+- Directories are reloaded once they expire
+"""
+import pytest
+from character_directory import CharacterDirectory
+from db import Character, Alias
+from tests.conftest import TEST_GUILD_ID
+
+
+async def _character(db_conn, identifier: str, user_id: int, channel_id: int) -> Character:
+    await Character(
+        identifier=identifier, name=identifier.title(),
+        user_id=user_id, channel_id=channel_id, guild_id=TEST_GUILD_ID
+    ).upsert(db_conn)
+    return await Character.fetch_by_identifier(db_conn, identifier, TEST_GUILD_ID)
+
+
+@pytest.mark.asyncio
+async def test_directory_lookups(db_conn, test_server):
+    """Test that identifiers, users and aliases resolve, with database fallback on a miss."""
+    char = await _character(db_conn, "dir-aang", 100000000000000701, 999000000000000701)
+    await Alias(character_id=char.id, alias="dir-avatar", guild_id=TEST_GUILD_ID).insert(db_conn)
+
+    directory = CharacterDirectory()
+    assert (await directory.fetch_by_identifier(db_conn, "dir-aang", TEST_GUILD_ID)).id == char.id
+    assert (await directory.fetch_by_user(db_conn, 100000000000000701, TEST_GUILD_ID)).id == char.id
+    assert (await directory.resolve(db_conn, "dir-avatar", TEST_GUILD_ID)).id == char.id
+    assert await directory.autocomplete(db_conn, TEST_GUILD_ID, "dir-", include_aliases=True) == ["dir-aang", "dir-avatar"]
+
+    # Created after the directory was loaded: found through the database fallback
+    later = await _character(db_conn, "dir-katara", 100000000000000702, 999000000000000702)
+    assert (await directory.resolve(db_conn, "dir-katara", TEST_GUILD_ID)).id == later.id
+    assert "dir-katara" in (await directory.get(db_conn, TEST_GUILD_ID)).by_identifier
+
+    assert await directory.resolve(db_conn, "dir-nobody", TEST_GUILD_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_directory_returns_copies(db_conn, test_server):
+    """Test that changing a returned character does not change the directory."""
+    await _character(db_conn, "dir-copy", 100000000000000703, 999000000000000703)
+    directory = CharacterDirectory()
+
+    character = await directory.fetch_by_identifier(db_conn, "dir-copy", TEST_GUILD_ID)
+    character.letter_limit = 99
+    assert (await directory.fetch_by_identifier(db_conn, "dir-copy", TEST_GUILD_ID)).letter_limit is None
+
+    # Recording an update stores a copy too
+    directory.character_updated(character)
+    character.letter_limit = 1
+    assert (await directory.fetch_by_identifier(db_conn, "dir-copy", TEST_GUILD_ID)).letter_limit == 99
+
+
+@pytest.mark.asyncio
+async def test_directory_reloads_when_expired(db_conn, test_server):
+    """Test that writes made outside the directory are picked up once it expires."""
+    char = await _character(db_conn, "dir-ttl", 100000000000000704, 999000000000000704)
+
+    cached = CharacterDirectory()
+    expiring = CharacterDirectory(ttl_seconds=0)
+    await cached.get(db_conn, TEST_GUILD_ID)
+    await expiring.get(db_conn, TEST_GUILD_ID)
+
+    # Rename outside the directory, as iroh or a script would
+    await db_conn.execute("UPDATE Character SET name = 'Renamed' WHERE id = $1;", char.id)
+
+    assert (await cached.fetch_by_id(db_conn, char.id, TEST_GUILD_ID)).name == "Dir-Ttl"
+    assert (await expiring.fetch_by_id(db_conn, char.id, TEST_GUILD_ID)).name == "Renamed"
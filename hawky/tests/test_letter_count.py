@@ -0,0 +1,59 @@
+"""
+Pytest tests for per-period letter counting.
+
+Tests verify:
+- Quota periods start at the daily reset time
+- Letters are counted up to the character's limit
+- Rolling over into a new period resets the count and prunes older counters
+"""
+import pytest
+from datetime import datetime, time
+from db import Character, LetterCount, letter_period_start
+from tests.conftest import TEST_GUILD_ID
+
+
+async def _character(db_conn, identifier: str, channel_id: int) -> Character:
+    await Character(identifier=identifier, name=identifier.title(), channel_id=channel_id, guild_id=TEST_GUILD_ID).upsert(db_conn)
+    return await Character.fetch_by_identifier(db_conn, identifier, TEST_GUILD_ID)
+
+
+def test_letter_period_start():
+    """Test that a period starts at the most recent reset time."""
+    assert letter_period_start(None, datetime(2024, 5, 2, 9, 30)) == datetime(2024, 5, 2, 0, 0)
+    assert letter_period_start(time(12, 0), datetime(2024, 5, 2, 13, 0)) == datetime(2024, 5, 2, 12, 0)
+    assert letter_period_start(time(12, 0), datetime(2024, 5, 2, 11, 59)) == datetime(2024, 5, 1, 12, 0)
+
+
+@pytest.mark.asyncio
+async def test_try_increment_respects_limit(db_conn, test_server):
+    """Test that letters are counted until the limit is reached."""
+    char = await _character(db_conn, "letter-limit", 999000000000000801)
+    period = datetime(2024, 5, 2)
+
+    assert await LetterCount.try_increment(db_conn, char.id, TEST_GUILD_ID, period, 2) == 1
+    assert await LetterCount.try_increment(db_conn, char.id, TEST_GUILD_ID, period, 2) == 2
+    assert await LetterCount.try_increment(db_conn, char.id, TEST_GUILD_ID, period, 2) is None
+    assert await LetterCount.fetch_count(db_conn, char.id, period) == 2
+
+    # No limit means unlimited; a limit of zero allows nothing
+    assert await LetterCount.try_increment(db_conn, char.id, TEST_GUILD_ID, period, None) == 3
+    assert await LetterCount.try_increment(db_conn, char.id, TEST_GUILD_ID, period, 0) is None
+
+
+@pytest.mark.asyncio
+async def test_try_increment_prunes_past_periods(db_conn, test_server):
+    """Test that the first letter of a new period resets the count and deletes older counters."""
+    char = await _character(db_conn, "letter-rollover", 999000000000000802)
+    other = await _character(db_conn, "letter-other", 999000000000000803)
+    yesterday, today = datetime(2024, 5, 1), datetime(2024, 5, 2)
+
+    await LetterCount.set_count(db_conn, char.id, TEST_GUILD_ID, yesterday, 3)
+    await LetterCount.set_count(db_conn, other.id, TEST_GUILD_ID, yesterday, 1)
+
+    assert await LetterCount.try_increment(db_conn, char.id, TEST_GUILD_ID, today, 3) == 1
+
+    periods = await db_conn.fetch(
+        "SELECT character_id, period_start FROM LetterCount WHERE guild_id = $1 ORDER BY character_id;",
+        TEST_GUILD_ID
+    )
+    assert [(r['character_id'], r['period_start']) for r in periods] == [(char.id, today), (other.id, yesterday)]
@@ -1,13 +1,15 @@
+import io
 import yaml
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TextIO, AsyncIterator, Tuple
 import asyncpg
 import logging
 from db import (
     Territory, Faction, FactionMember, Unit, UnitType, BuildingType, Building,
     PlayerResources, TerritoryAdjacency, WargameConfig, Character,
     FactionResources, FactionPermission, VALID_PERMISSION_TYPES, SpiritNexus,
-    Alliance
+    Alliance, territory_graphs
 )
+from handlers.finance_cache import finance_projections
 
 logger = logging.getLogger(__name__)
 
@@ -27,26 +29,71 @@ class ConfigManager:
         Returns:
             YAML string representing the complete wargame state
         """
-        config_dict = {}
+        stream = io.StringIO()
+        await ConfigManager.export_config_to(conn, guild_id, stream)
+        return stream.getvalue()
+
+    @staticmethod
+    async def export_config_to(conn: asyncpg.Connection, guild_id: int, stream: TextIO) -> int:
+        """
+        Export current wargame state as YAML, writing it to a text stream one
+        section at a time.
+
+        The output is identical to export_config. Each section is fetched with
+        a single query and dumped before the next is fetched, so only one
+        section is held in memory at once.
+
+        Args:
+            conn: Database connection
+            guild_id: Guild ID to export
+            stream: Writable text stream, e.g. an open file
+
+        Returns:
+            Number of sections written
+        """
+        count = 0
+        async for key, section in ConfigManager._export_sections(conn, guild_id):
+            yaml.dump({key: section}, stream, default_flow_style=False, sort_keys=False)
+            count += 1
+        return count
+
+    @staticmethod
+    async def _export_sections(conn: asyncpg.Connection, guild_id: int) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Yield (key, section) pairs of the exported document in output order.
+
+        Characters and factions are fetched once up front; every internal ID in
+        later sections is resolved through the resulting maps rather than with
+        a lookup per row.
+        """
+        characters = await Character.fetch_all(conn, guild_id)
+        factions = await Faction.fetch_all(conn, guild_id)
+        character_identifiers = {c.id: c.identifier for c in characters}
+        faction_id_map = {f.id: f.faction_id for f in factions}
 
         # Export WargameConfig
         wargame_config = await WargameConfig.fetch(conn, guild_id)
         if wargame_config:
-            config_dict['wargame'] = {
+            yield 'wargame', {
                 'turn': wargame_config.current_turn,
                 'max_movement_stat': wargame_config.max_movement_stat,
                 'turn_resolution_enabled': wargame_config.turn_resolution_enabled
             }
         else:
-            config_dict['wargame'] = {
+            yield 'wargame', {
                 'turn': 0,
                 'max_movement_stat': 4,
                 'turn_resolution_enabled': False
             }
 
         # Export Factions
-        factions = await Faction.fetch_all(conn, guild_id)
-        config_dict['factions'] = []
+        members_by_faction: Dict[int, List[str]] = {}
+        for member in await FactionMember.fetch_all(conn, guild_id):
+            identifier = character_identifiers.get(member.character_id)
+            if identifier:
+                members_by_faction.setdefault(member.faction_id, []).append(identifier)
+
+        faction_section = []
         for faction in factions:
             faction_dict = {
                 'faction_id': faction.faction_id,
@@ -58,20 +105,12 @@ class ConfigManager:
                 faction_dict['nation'] = faction.nation
 
             # Get leader character identifier
-            if faction.leader_character_id:
-                leader = await Character.fetch_by_id(conn, faction.leader_character_id)
-                if leader:
-                    faction_dict['leader'] = leader.identifier
+            if faction.leader_character_id in character_identifiers:
+                faction_dict['leader'] = character_identifiers[faction.leader_character_id]
 
             # Get faction members
-            members = await FactionMember.fetch_by_faction(conn, faction.id, guild_id)
-            if members:
-                member_identifiers = []
-                for member in members:
-                    char = await Character.fetch_by_id(conn, member.character_id)
-                    if char:
-                        member_identifiers.append(char.identifier)
-                faction_dict['members'] = member_identifiers
+            if faction.id in members_by_faction:
+                faction_dict['members'] = members_by_faction[faction.id]
 
             # Include spending if any values are non-zero
             if (faction.ore_spending or faction.lumber_spending or faction.coal_spending or
@@ -85,17 +124,19 @@ class ConfigManager:
                     'platinum': faction.platinum_spending
                 }
 
-            config_dict['factions'].append(faction_dict)
+            faction_section.append(faction_dict)
+        yield 'factions', faction_section
 
         # Export Player Resources
-        # Get all characters first, then fetch their resources
-        characters = await Character.fetch_all(conn, guild_id)
-        config_dict['player_resources'] = []
+        resources_by_character = {
+            r.character_id: r for r in await PlayerResources.fetch_all(conn, guild_id)
+        }
+        player_resources_section = []
         for character in characters:
-            resources = await PlayerResources.fetch_by_character(conn, character.id, guild_id)
+            resources = resources_by_character.get(character.id)
             if resources and (resources.ore or resources.lumber or resources.coal or
                             resources.rations or resources.cloth or resources.platinum):
-                config_dict['player_resources'].append({
+                player_resources_section.append({
                     'character': character.identifier,
                     'resources': {
                         'ore': resources.ore,
@@ -106,9 +147,10 @@ class ConfigManager:
                         'platinum': resources.platinum
                     }
                 })
+        yield 'player_resources', player_resources_section
 
         # Export Character production and VP
-        config_dict['characters'] = []
+        character_section = []
         for character in characters:
             has_production = (character.ore_production or character.lumber_production or
                             character.coal_production or character.rations_production or
@@ -126,11 +168,17 @@ class ConfigManager:
                     }
                 if character.victory_points:
                     char_dict['victory_points'] = character.victory_points
-                config_dict['characters'].append(char_dict)
+                character_section.append(char_dict)
+        yield 'characters', character_section
 
         # Export Territories
+        adjacent: Dict[str, List[str]] = {}
+        for adjacency in await TerritoryAdjacency.fetch_all(conn, guild_id):
+            adjacent.setdefault(adjacency.territory_a_id, []).append(adjacency.territory_b_id)
+            adjacent.setdefault(adjacency.territory_b_id, []).append(adjacency.territory_a_id)
+
         territories = await Territory.fetch_all(conn, guild_id)
-        config_dict['territories'] = []
+        territory_section = []
         for territory in territories:
             territory_dict = {
                 'territory_id': territory.territory_id,
@@ -145,13 +193,11 @@ class ConfigManager:
 
             # Get controller - character or faction
             if territory.controller_character_id:
-                controller = await Character.fetch_by_id(conn, territory.controller_character_id)
-                if controller:
-                    territory_dict['controller_character_identifier'] = controller.identifier
+                if territory.controller_character_id in character_identifiers:
+                    territory_dict['controller_character_identifier'] = character_identifiers[territory.controller_character_id]
             elif territory.controller_faction_id:
-                faction = await Faction.fetch_by_id(conn, territory.controller_faction_id)
-                if faction:
-                    territory_dict['controller_faction_id'] = faction.faction_id
+                if territory.controller_faction_id in faction_id_map:
+                    territory_dict['controller_faction_id'] = faction_id_map[territory.controller_faction_id]
 
             # Production
             territory_dict['production'] = {
@@ -176,15 +222,15 @@ class ConfigManager:
                 territory_dict['keywords'] = territory.keywords
 
             # Adjacent territories
-            adjacent_ids = await TerritoryAdjacency.fetch_adjacent(conn, territory.territory_id, guild_id)
-            if adjacent_ids:
-                territory_dict['adjacent_to'] = sorted(adjacent_ids)
+            if territory.territory_id in adjacent:
+                territory_dict['adjacent_to'] = sorted(adjacent[territory.territory_id])
 
-            config_dict['territories'].append(territory_dict)
+            territory_section.append(territory_dict)
+        yield 'territories', territory_section
 
         # Export Unit Types
         unit_types = await UnitType.fetch_all(conn, guild_id)
-        config_dict['unit_types'] = []
+        unit_type_section = []
         for unit_type in unit_types:
             unit_type_dict = {
                 'type_id': unit_type.type_id,
@@ -230,11 +276,12 @@ class ConfigManager:
                 'platinum': unit_type.upkeep_platinum
             }
 
-            config_dict['unit_types'].append(unit_type_dict)
+            unit_type_section.append(unit_type_dict)
+        yield 'unit_types', unit_type_section
 
         # Export Building Types
         building_types = await BuildingType.fetch_all(conn, guild_id)
-        config_dict['building_types'] = []
+        building_type_section = []
         for building_type in building_types:
             building_type_dict = {
                 'type_id': building_type.type_id,
@@ -266,11 +313,12 @@ class ConfigManager:
             if building_type.keywords:
                 building_type_dict['keywords'] = building_type.keywords
 
-            config_dict['building_types'].append(building_type_dict)
+            building_type_section.append(building_type_dict)
+        yield 'building_types', building_type_section
 
         # Export Buildings
         buildings = await Building.fetch_all(conn, guild_id)
-        config_dict['buildings'] = []
+        building_section = []
         for building in buildings:
             building_dict = {
                 'building_id': building.building_id,
@@ -293,11 +341,12 @@ class ConfigManager:
             if building.keywords:
                 building_dict['keywords'] = building.keywords
 
-            config_dict['buildings'].append(building_dict)
+            building_section.append(building_dict)
+        yield 'buildings', building_section
 
         # Export Units
         units = await Unit.fetch_all(conn, guild_id)
-        config_dict['units'] = []
+        unit_section = []
         for unit in units:
             unit_dict = {
                 'unit_id': unit.unit_id,
@@ -309,24 +358,18 @@ class ConfigManager:
 
             # Get owner - either character or faction
             if unit.owner_character_id:
-                owner = await Character.fetch_by_id(conn, unit.owner_character_id)
-                if owner:
-                    unit_dict['owner'] = owner.identifier
+                if unit.owner_character_id in character_identifiers:
+                    unit_dict['owner'] = character_identifiers[unit.owner_character_id]
             elif unit.owner_faction_id:
-                owner_faction = await Faction.fetch_by_id(conn, unit.owner_faction_id)
-                if owner_faction:
-                    unit_dict['owner_faction'] = owner_faction.faction_id
+                if unit.owner_faction_id in faction_id_map:
+                    unit_dict['owner_faction'] = faction_id_map[unit.owner_faction_id]
 
-            if unit.commander_character_id:
-                commander = await Character.fetch_by_id(conn, unit.commander_character_id)
-                if commander:
-                    unit_dict['commander'] = commander.identifier
+            if unit.commander_character_id in character_identifiers:
+                unit_dict['commander'] = character_identifiers[unit.commander_character_id]
 
             # Get faction_id
-            if unit.faction_id:
-                faction = await Faction.fetch_by_id(conn, unit.faction_id)
-                if faction:
-                    unit_dict['faction_id'] = faction.faction_id
+            if unit.faction_id in faction_id_map:
+                unit_dict['faction_id'] = faction_id_map[unit.faction_id]
 
             if unit.current_territory_id is not None:
                 unit_dict['current_territory_id'] = unit.current_territory_id
@@ -335,15 +378,19 @@ class ConfigManager:
             if unit.organization != unit.max_organization:
                 unit_dict['current_organization'] = unit.organization
 
-            config_dict['units'].append(unit_dict)
+            unit_section.append(unit_dict)
+        yield 'units', unit_section
 
         # Export Faction Resources
-        config_dict['faction_resources'] = []
+        resources_by_faction = {
+            r.faction_id: r for r in await FactionResources.fetch_all(conn, guild_id)
+        }
+        faction_resources_section = []
         for faction in factions:
-            resources = await FactionResources.fetch_by_faction(conn, faction.id, guild_id)
+            resources = resources_by_faction.get(faction.id)
             if resources and (resources.ore or resources.lumber or resources.coal or
                             resources.rations or resources.cloth or resources.platinum):
-                config_dict['faction_resources'].append({
+                faction_resources_section.append({
                     'faction_id': faction.faction_id,
                     'resources': {
                         'ore': resources.ore,
@@ -354,35 +401,38 @@ class ConfigManager:
                         'platinum': resources.platinum
                     }
                 })
+        yield 'faction_resources', faction_resources_section
 
         # Export Faction Permissions
-        config_dict['faction_permissions'] = []
+        # fetch_all orders by faction, character and type; regroup in faction export order
+        permissions_by_faction: Dict[int, List[FactionPermission]] = {}
+        for perm in await FactionPermission.fetch_all(conn, guild_id):
+            permissions_by_faction.setdefault(perm.faction_id, []).append(perm)
+        permission_section = []
         for faction in factions:
-            permissions = await FactionPermission.fetch_by_faction(conn, faction.id, guild_id)
-            for perm in permissions:
-                char = await Character.fetch_by_id(conn, perm.character_id)
-                if char:
-                    config_dict['faction_permissions'].append({
+            for perm in permissions_by_faction.get(faction.id, []):
+                if perm.character_id in character_identifiers:
+                    permission_section.append({
                         'faction_id': faction.faction_id,
-                        'character': char.identifier,
+                        'character': character_identifiers[perm.character_id],
                         'permission_type': perm.permission_type
                     })
+        yield 'faction_permissions', permission_section
 
         # Export Spirit Nexuses
         spirit_nexuses = await SpiritNexus.fetch_all(conn, guild_id)
-        config_dict['spirit_nexuses'] = []
-        for nexus in spirit_nexuses:
-            config_dict['spirit_nexuses'].append({
+        yield 'spirit_nexuses', [
+            {
                 'identifier': nexus.identifier,
                 'territory_id': nexus.territory_id,
                 'health': nexus.health
-            })
+            }
+            for nexus in spirit_nexuses
+        ]
 
         # Export Alliances
-        # Create reverse map from internal faction ID to faction_id string
-        faction_id_map = {f.id: f.faction_id for f in factions}
         alliances = await Alliance.fetch_all(conn, guild_id)
-        config_dict['alliances'] = []
+        alliance_section = []
         for alliance in alliances:
             faction_a_str = faction_id_map.get(alliance.faction_a_id)
             faction_b_str = faction_id_map.get(alliance.faction_b_id)
@@ -391,19 +441,30 @@ class ConfigManager:
                     'factions': [faction_a_str, faction_b_str],
                     'status': alliance.status
                 }
-                config_dict['alliances'].append(alliance_dict)
-
-        return yaml.dump(config_dict, default_flow_style=False, sort_keys=False)
+                alliance_section.append(alliance_dict)
+        yield 'alliances', alliance_section
 
     @staticmethod
-    async def import_config(conn: asyncpg.Connection, guild_id: int, config_yaml: str) -> tuple[bool, str]:
+    async def import_config(
+        conn: asyncpg.Connection,
+        guild_id: int,
+        config_yaml: str,
+        diff: bool = False
+    ) -> tuple[bool, str]:
         """
         Import YAML string and populate database.
 
+        The whole document is validated before anything is written: every
+        character identifier and referenced faction ID is resolved with one
+        query per table. Each table is then loaded in bulk inside a single
+        transaction, so a failed import leaves the guild untouched.
+
         Args:
             conn: Database connection
             guild_id: Guild ID to import into
             config_yaml: YAML string to import
+            diff: Only write rows that differ from what is already stored.
+                The resulting state is the same as a full import.
 
         Returns:
             Tuple of (success: bool, message: str)
@@ -449,83 +510,14 @@ class ConfigManager:
                 character_identifiers_needed.add(perm['character'])
 
         # Validate characters exist
-        missing_characters = []
-        character_map = {}  # identifier -> Character object
-        for identifier in character_identifiers_needed:
-            char = await Character.fetch_by_identifier(conn, identifier, guild_id)
-            if not char:
-                missing_characters.append(identifier)
-            else:
-                character_map[identifier] = char
-
+        character_map = {  # identifier -> Character object
+            char.identifier: char
+            for char in await Character.fetch_by_identifiers(conn, list(character_identifiers_needed), guild_id)
+        }
+        missing_characters = character_identifiers_needed - character_map.keys()
         if missing_characters:
             return False, f"Missing characters (create with hawky first): {', '.join(sorted(missing_characters))}"
 
-        # Import WargameConfig
-        if 'wargame' in config_dict:
-            wargame = config_dict['wargame']
-            wg_config = WargameConfig(
-                guild_id=guild_id,
-                current_turn=wargame.get('turn', 0),
-                max_movement_stat=wargame.get('max_movement_stat', 4),
-                turn_resolution_enabled=wargame.get('turn_resolution_enabled', False)
-            )
-            await wg_config.upsert(conn)
-
-        # Import Factions (first pass - without leaders)
-        faction_map = {}  # faction_id -> internal id
-        if 'factions' in config_dict:
-            for faction_data in config_dict['factions']:
-                spending = faction_data.get('spending', {})
-                faction = Faction(
-                    faction_id=faction_data['faction_id'],
-                    name=faction_data['name'],
-                    nation=faction_data.get('nation'),
-                    ore_spending=spending.get('ore', 0),
-                    lumber_spending=spending.get('lumber', 0),
-                    coal_spending=spending.get('coal', 0),
-                    rations_spending=spending.get('rations', 0),
-                    cloth_spending=spending.get('cloth', 0),
-                    platinum_spending=spending.get('platinum', 0),
-                    guild_id=guild_id
-                )
-                await faction.upsert(conn)
-
-                # Fetch back to get internal ID
-                faction_obj = await Faction.fetch_by_faction_id(conn, faction_data['faction_id'], guild_id)
-                if faction_obj:
-                    faction_map[faction_data['faction_id']] = faction_obj.id
-
-        # Import Factions (second pass - set leaders)
-        if 'factions' in config_dict:
-            for faction_data in config_dict['factions']:
-                if 'leader' in faction_data:
-                    leader_char = character_map.get(faction_data['leader'])
-                    if leader_char:
-                        faction = await Faction.fetch_by_faction_id(conn, faction_data['faction_id'], guild_id)
-                        if faction:
-                            faction.leader_character_id = leader_char.id
-                            await faction.upsert(conn)
-
-        # Import Faction Members
-        if 'factions' in config_dict:
-            for faction_data in config_dict['factions']:
-                faction_internal_id = faction_map.get(faction_data['faction_id'])
-                if faction_internal_id and 'members' in faction_data:
-                    wg_config = await WargameConfig.fetch(conn, guild_id)
-                    current_turn = wg_config.current_turn if wg_config else 0
-
-                    for member_identifier in faction_data['members']:
-                        member_char = character_map.get(member_identifier)
-                        if member_char:
-                            faction_member = FactionMember(
-                                faction_id=faction_internal_id,
-                                character_id=member_char.id,
-                                joined_turn=current_turn,
-                                guild_id=guild_id
-                            )
-                            await faction_member.upsert(conn)
-
         # Collect all referenced faction IDs and validate they exist
         referenced_faction_ids = set()
         if 'territories' in config_dict:
@@ -550,260 +542,432 @@ class ConfigManager:
             for perm in config_dict['faction_permissions']:
                 referenced_faction_ids.add(perm['faction_id'])
 
-        # Validate all referenced faction IDs exist (either created in this import or pre-existing)
-        missing_factions = []
-        for faction_id in referenced_faction_ids:
-            if faction_id not in faction_map:
-                # Try to find in database
-                faction_obj = await Faction.fetch_by_faction_id(conn, faction_id, guild_id)
-                if faction_obj:
-                    faction_map[faction_id] = faction_obj.id
-                else:
-                    missing_factions.append(faction_id)
-
+        # Referenced factions must be created by this import or already exist
+        imported_faction_ids = {f['faction_id'] for f in config_dict.get('factions') or []}
+        existing_faction_ids = {
+            faction.faction_id
+            for faction in await Faction.fetch_by_faction_ids(
+                conn, list(referenced_faction_ids - imported_faction_ids), guild_id
+            )
+        }
+        missing_factions = referenced_faction_ids - imported_faction_ids - existing_faction_ids
         if missing_factions:
             return False, f"Missing factions: {', '.join(sorted(missing_factions))}"
 
-        # Import Player Resources
-        if 'player_resources' in config_dict:
-            for player_res_data in config_dict['player_resources']:
-                char = character_map.get(player_res_data['character'])
-                if char:
-                    resources = player_res_data.get('resources', {})
-                    player_res = PlayerResources(
-                        character_id=char.id,
-                        ore=resources.get('ore', 0),
-                        lumber=resources.get('lumber', 0),
-                        coal=resources.get('coal', 0),
-                        rations=resources.get('rations', 0),
-                        cloth=resources.get('cloth', 0),
-                        platinum=resources.get('platinum', 0),
-                        guild_id=guild_id
-                    )
-                    await player_res.upsert(conn)
-
-        # Import Faction Resources
-        if 'faction_resources' in config_dict:
-            for faction_res_data in config_dict['faction_resources']:
-                faction_internal_id = faction_map.get(faction_res_data['faction_id'])
-                if faction_internal_id:
-                    resources = faction_res_data.get('resources', {})
-                    faction_res = FactionResources(
-                        faction_id=faction_internal_id,
-                        ore=resources.get('ore', 0),
-                        lumber=resources.get('lumber', 0),
-                        coal=resources.get('coal', 0),
-                        rations=resources.get('rations', 0),
-                        cloth=resources.get('cloth', 0),
-                        platinum=resources.get('platinum', 0),
-                        guild_id=guild_id
-                    )
-                    await faction_res.upsert(conn)
+        async with conn.transaction():
+            written = await ConfigManager._load_config(
+                conn, guild_id, config_dict, character_map, referenced_faction_ids, diff
+            )
+
+        # The model writes invalidated the graph before commit, when other connections could
+        # still reload and cache the old map; drop it again now the import is visible
+        finance_projections.invalidate_guild(guild_id)
+        territory_graphs.invalidate_guild(guild_id)
+        logger.info(f"Successfully imported wargame config for guild {guild_id} "
+                    f"({'diff' if diff else 'full'} import, rows written: {written})")
+        if diff:
+            changed = sum(written.values())
+            return True, f"Configuration imported successfully ({changed} row{'s' if changed != 1 else ''} changed)"
+        return True, "Configuration imported successfully"
+
+    @staticmethod
+    def _changed(desired: list, existing: Dict[Any, Any], key, values) -> list:
+        """
+        Entries of desired that are new or whose values differ from the stored
+        entry with the same key.
+        """
+        changed = []
+        for entry in desired:
+            stored = existing.get(key(entry))
+            if stored is None or values(stored) != values(entry):
+                changed.append(entry)
+        return changed
+
+    @staticmethod
+    async def _load_config(
+        conn: asyncpg.Connection,
+        guild_id: int,
+        config_dict: Dict[str, Any],
+        character_map: Dict[str, Character],
+        referenced_faction_ids: set,
+        diff: bool
+    ) -> Dict[str, int]:
+        """
+        Write a validated document to the database, one bulk statement per table.
+
+        Returns:
+            Rows written per table
+        """
+        written: Dict[str, int] = {}
+        upsert_args = lambda entry: entry._upsert_args()
+        resource_values = lambda r: (r.ore, r.lumber, r.coal, r.rations, r.cloth, r.platinum)
+
+        # Import WargameConfig
+        if 'wargame' in config_dict:
+            wargame = config_dict['wargame']
+            wg_config = WargameConfig(
+                guild_id=guild_id,
+                current_turn=wargame.get('turn', 0),
+                max_movement_stat=wargame.get('max_movement_stat', 4),
+                turn_resolution_enabled=wargame.get('turn_resolution_enabled', False)
+            )
+            wg_values = lambda c: (c.current_turn, c.turn_resolution_enabled, c.last_turn_time,
+                                   c.max_movement_stat, c.gm_reports_channel_id)
+            stored = await WargameConfig.fetch(conn, guild_id) if diff else None
+            if stored is None or wg_values(stored) != wg_values(wg_config):
+                await wg_config.upsert(conn)
+                written['wargame'] = 1
+            current_turn = wg_config.current_turn
+        else:
+            stored = await WargameConfig.fetch(conn, guild_id)
+            current_turn = stored.current_turn if stored else 0
+
+        # Import Factions, with leaders resolved up front
+        factions = []
+        for faction_data in config_dict.get('factions') or []:
+            spending = faction_data.get('spending', {})
+            leader_char = character_map.get(faction_data.get('leader'))
+            factions.append(Faction(
+                faction_id=faction_data['faction_id'],
+                name=faction_data['name'],
+                leader_character_id=leader_char.id if leader_char else None,
+                nation=faction_data.get('nation'),
+                ore_spending=spending.get('ore', 0),
+                lumber_spending=spending.get('lumber', 0),
+                coal_spending=spending.get('coal', 0),
+                rations_spending=spending.get('rations', 0),
+                cloth_spending=spending.get('cloth', 0),
+                platinum_spending=spending.get('platinum', 0),
+                guild_id=guild_id
+            ))
+        if diff:
+            stored_factions = {f.faction_id: f for f in await Faction.fetch_all(conn, guild_id)}
+            factions = ConfigManager._changed(factions, stored_factions, lambda f: f.faction_id, upsert_args)
+        await Faction.upsert_many(conn, factions)
+        written['factions'] = len(factions)
+
+        # faction_id -> internal id, for factions imported here and those merely referenced
+        faction_ids = {f['faction_id'] for f in config_dict.get('factions') or []} | referenced_faction_ids
+        faction_map = {
+            f.faction_id: f.id for f in await Faction.fetch_by_faction_ids(conn, list(faction_ids), guild_id)
+        }
+
+        # Import Faction Members
+        members = []
+        for faction_data in config_dict.get('factions') or []:
+            faction_internal_id = faction_map.get(faction_data['faction_id'])
+            if not faction_internal_id:
+                continue
+            for member_identifier in faction_data.get('members', []):
+                members.append(FactionMember(
+                    faction_id=faction_internal_id,
+                    character_id=character_map[member_identifier].id,
+                    joined_turn=current_turn,
+                    guild_id=guild_id
+                ))
+        if diff:
+            stored_members = {(m.faction_id, m.character_id): m for m in await FactionMember.fetch_all(conn, guild_id)}
+            members = ConfigManager._changed(
+                members, stored_members, lambda m: (m.faction_id, m.character_id), lambda m: m.joined_turn
+            )
+        await FactionMember.upsert_many(conn, members)
+        written['faction_members'] = len(members)
+
+        # Import Player Resources (last entry per character wins)
+        player_resources = {}
+        for player_res_data in config_dict.get('player_resources') or []:
+            char = character_map[player_res_data['character']]
+            resources = player_res_data.get('resources', {})
+            player_resources[char.id] = PlayerResources(
+                character_id=char.id,
+                ore=resources.get('ore', 0),
+                lumber=resources.get('lumber', 0),
+                coal=resources.get('coal', 0),
+                rations=resources.get('rations', 0),
+                cloth=resources.get('cloth', 0),
+                platinum=resources.get('platinum', 0),
+                guild_id=guild_id
+            )
+        player_resources = list(player_resources.values())
+        if diff:
+            stored_resources = {r.character_id: r for r in await PlayerResources.fetch_all(conn, guild_id)}
+            player_resources = ConfigManager._changed(
+                player_resources, stored_resources, lambda r: r.character_id, resource_values
+            )
+        await PlayerResources.upsert_many(conn, player_resources)
+        written['player_resources'] = len(player_resources)
+
+        # Import Faction Resources (last entry per faction wins)
+        faction_resources = {}
+        for faction_res_data in config_dict.get('faction_resources') or []:
+            faction_internal_id = faction_map[faction_res_data['faction_id']]
+            resources = faction_res_data.get('resources', {})
+            faction_resources[faction_internal_id] = FactionResources(
+                faction_id=faction_internal_id,
+                ore=resources.get('ore', 0),
+                lumber=resources.get('lumber', 0),
+                coal=resources.get('coal', 0),
+                rations=resources.get('rations', 0),
+                cloth=resources.get('cloth', 0),
+                platinum=resources.get('platinum', 0),
+                guild_id=guild_id
+            )
+        faction_resources = list(faction_resources.values())
+        if diff:
+            stored_resources = {r.faction_id: r for r in await FactionResources.fetch_all(conn, guild_id)}
+            faction_resources = ConfigManager._changed(
+                faction_resources, stored_resources, lambda r: r.faction_id, resource_values
+            )
+        await FactionResources.upsert_many(conn, faction_resources)
+        written['faction_resources'] = len(faction_resources)
 
         # Import Faction Permissions
         if 'faction_permissions' in config_dict:
+            # Character -> the faction FactionMember.fetch_by_character would return
+            primary_factions = await FactionMember.fetch_represented_factions(conn, guild_id)
+            permissions = []
             for perm_data in config_dict['faction_permissions']:
-                faction_internal_id = faction_map.get(perm_data['faction_id'])
-                char = character_map.get(perm_data['character'])
+                faction_internal_id = faction_map[perm_data['faction_id']]
+                char = character_map[perm_data['character']]
                 permission_type = perm_data.get('permission_type', '')
 
-                if faction_internal_id and char and permission_type in VALID_PERMISSION_TYPES:
+                if permission_type in VALID_PERMISSION_TYPES:
                     # Validate character is a member of the faction
-                    member = await FactionMember.fetch_by_character(conn, char.id, guild_id)
-                    if member and member.faction_id == faction_internal_id:
-                        perm = FactionPermission(
+                    if primary_factions.get(char.id) == faction_internal_id:
+                        permissions.append(FactionPermission(
                             faction_id=faction_internal_id,
                             character_id=char.id,
                             permission_type=permission_type,
                             guild_id=guild_id
-                        )
-                        await perm.upsert(conn)
+                        ))
                     else:
                         logger.warning(f"Skipping permission for {perm_data['character']} - not a member of faction {perm_data['faction_id']}")
+            # Existing permissions are skipped, so this only ever writes changes
+            written['faction_permissions'] = await FactionPermission.insert_many(conn, permissions, guild_id)
 
         # Import Character production and VP
-        if 'characters' in config_dict:
-            for char_data in config_dict['characters']:
-                char = character_map.get(char_data['character'])
-                if char:
-                    production = char_data.get('production', {})
-                    char.ore_production = production.get('ore', 0)
-                    char.lumber_production = production.get('lumber', 0)
-                    char.coal_production = production.get('coal', 0)
-                    char.rations_production = production.get('rations', 0)
-                    char.cloth_production = production.get('cloth', 0)
-                    char.platinum_production = production.get('platinum', 0)
-                    char.victory_points = char_data.get('victory_points', 0)
-                    await char.upsert(conn)
+        characters = []
+        for char_data in config_dict.get('characters') or []:
+            char = character_map[char_data['character']]
+            before = char._upsert_args()
+            production = char_data.get('production', {})
+            char.ore_production = production.get('ore', 0)
+            char.lumber_production = production.get('lumber', 0)
+            char.coal_production = production.get('coal', 0)
+            char.rations_production = production.get('rations', 0)
+            char.cloth_production = production.get('cloth', 0)
+            char.platinum_production = production.get('platinum', 0)
+            char.victory_points = char_data.get('victory_points', 0)
+            if not diff or char._upsert_args() != before:
+                characters.append(char)
+        await Character.upsert_many(conn, characters)
+        written['characters'] = len(characters)
 
         # Import Territories
-        if 'territories' in config_dict:
-            for territory_data in config_dict['territories']:
-                controller_character_id = None
-                controller_faction_id = None
-
-                if 'controller_character_identifier' in territory_data:
-                    character = character_map.get(territory_data['controller_character_identifier'])
-                    if character:
-                        controller_character_id = character.id
-                elif 'controller_faction_id' in territory_data:
-                    controller_faction_id = faction_map.get(territory_data['controller_faction_id'])
-                elif 'controller' in territory_data:
-                    # Support 'controller' as alias for 'controller_faction_id'
-                    controller_faction_id = faction_map.get(territory_data['controller'])
-
-                production = territory_data.get('production', {})
-                territory = Territory(
-                    territory_id=str(territory_data['territory_id']),
-                    name=territory_data.get('name'),
-                    terrain_type=territory_data['terrain_type'],
-                    ore_production=production.get('ore', 0),
-                    lumber_production=production.get('lumber', 0),
-                    coal_production=production.get('coal', 0),
-                    rations_production=production.get('rations', 0),
-                    cloth_production=production.get('cloth', 0),
-                    platinum_production=production.get('platinum', 0),
-                    victory_points=territory_data.get('victory_points', 0),
-                    siege_defense=territory_data.get('siege_defense', 0),
-                    controller_character_id=controller_character_id,
-                    controller_faction_id=controller_faction_id,
-                    original_nation=territory_data.get('original_nation'),
-                    keywords=territory_data.get('keywords', []),
+        territories = []
+        adjacencies = []
+        for territory_data in config_dict.get('territories') or []:
+            controller_character_id = None
+            controller_faction_id = None
+
+            if 'controller_character_identifier' in territory_data:
+                controller_character_id = character_map[territory_data['controller_character_identifier']].id
+            elif 'controller_faction_id' in territory_data:
+                controller_faction_id = faction_map.get(territory_data['controller_faction_id'])
+            elif 'controller' in territory_data:
+                # Support 'controller' as alias for 'controller_faction_id'
+                controller_faction_id = faction_map.get(territory_data['controller'])
+
+            production = territory_data.get('production', {})
+            territories.append(Territory(
+                territory_id=str(territory_data['territory_id']),
+                name=territory_data.get('name'),
+                terrain_type=territory_data['terrain_type'],
+                ore_production=production.get('ore', 0),
+                lumber_production=production.get('lumber', 0),
+                coal_production=production.get('coal', 0),
+                rations_production=production.get('rations', 0),
+                cloth_production=production.get('cloth', 0),
+                platinum_production=production.get('platinum', 0),
+                victory_points=territory_data.get('victory_points', 0),
+                siege_defense=territory_data.get('siege_defense', 0),
+                controller_character_id=controller_character_id,
+                controller_faction_id=controller_faction_id,
+                original_nation=territory_data.get('original_nation'),
+                keywords=territory_data.get('keywords', []),
+                guild_id=guild_id
+            ))
+
+            # Import adjacencies
+            for adjacent_id in territory_data.get('adjacent_to', []):
+                adjacencies.append(TerritoryAdjacency(
+                    territory_a_id=str(territory_data['territory_id']),
+                    territory_b_id=str(adjacent_id),
                     guild_id=guild_id
-                )
-                await territory.upsert(conn)
-
-                # Import adjacencies
-                if 'adjacent_to' in territory_data:
-                    for adjacent_id in territory_data['adjacent_to']:
-                        adjacency = TerritoryAdjacency(
-                            territory_a_id=str(territory_data['territory_id']),
-                            territory_b_id=str(adjacent_id),
-                            guild_id=guild_id
-                        )
-                        await adjacency.insert(conn)
+                ))
+        if diff:
+            stored_territories = {t.territory_id: t for t in await Territory.fetch_all(conn, guild_id)}
+            territories = ConfigManager._changed(
+                territories, stored_territories, lambda t: t.territory_id, upsert_args
+            )
+        await Territory.upsert_many(conn, territories)
+        written['territories'] = len(territories)
+        # Existing pairs are skipped, so this only ever writes changes
+        written['adjacencies'] = await TerritoryAdjacency.insert_many(conn, adjacencies, guild_id)
 
         # Import Spirit Nexuses
-        if 'spirit_nexuses' in config_dict:
-            for nexus_data in config_dict['spirit_nexuses']:
-                nexus = SpiritNexus(
-                    identifier=nexus_data['identifier'],
-                    territory_id=str(nexus_data['territory_id']),
-                    health=nexus_data.get('health', 0),
-                    guild_id=guild_id
-                )
-                await nexus.upsert(conn)
+        nexuses = [
+            SpiritNexus(
+                identifier=nexus_data['identifier'],
+                territory_id=str(nexus_data['territory_id']),
+                health=nexus_data.get('health', 0),
+                guild_id=guild_id
+            )
+            for nexus_data in config_dict.get('spirit_nexuses') or []
+        ]
+        if diff:
+            stored_nexuses = {n.identifier: n for n in await SpiritNexus.fetch_all(conn, guild_id)}
+            nexuses = ConfigManager._changed(nexuses, stored_nexuses, lambda n: n.identifier, upsert_args)
+        await SpiritNexus.upsert_many(conn, nexuses)
+        written['spirit_nexuses'] = len(nexuses)
 
         # Import Alliances
-        if 'alliances' in config_dict:
-            for alliance_data in config_dict['alliances']:
-                # Support both formats: 'factions' list or 'faction_a'/'faction_b' keys
-                if 'factions' in alliance_data:
-                    faction_ids = alliance_data['factions']
-                    if len(faction_ids) >= 2:
-                        faction_a_internal = faction_map.get(faction_ids[0])
-                        faction_b_internal = faction_map.get(faction_ids[1])
-                    else:
-                        logger.warning(f"Skipping alliance - need 2 factions: {alliance_data}")
-                        continue
+        alliances = []
+        for alliance_data in config_dict.get('alliances') or []:
+            # Support both formats: 'factions' list or 'faction_a'/'faction_b' keys
+            if 'factions' in alliance_data:
+                faction_ids = alliance_data['factions']
+                if len(faction_ids) >= 2:
+                    faction_a_internal = faction_map.get(faction_ids[0])
+                    faction_b_internal = faction_map.get(faction_ids[1])
                 else:
-                    faction_a_internal = faction_map.get(alliance_data.get('faction_a'))
-                    faction_b_internal = faction_map.get(alliance_data.get('faction_b'))
-
-                if faction_a_internal and faction_b_internal:
-                    # Ensure canonical ordering (a < b)
-                    if faction_a_internal > faction_b_internal:
-                        faction_a_internal, faction_b_internal = faction_b_internal, faction_a_internal
-
-                    status = alliance_data.get('status', 'ACTIVE')
-                    # Determine initiated_by based on status
-                    if status == 'PENDING_FACTION_A':
-                        initiated_by = faction_a_internal
-                    elif status == 'PENDING_FACTION_B':
-                        initiated_by = faction_b_internal
-                    else:
-                        initiated_by = faction_a_internal  # Default for ACTIVE
-
-                    alliance = Alliance(
-                        faction_a_id=faction_a_internal,
-                        faction_b_id=faction_b_internal,
-                        status=status,
-                        initiated_by_faction_id=initiated_by,
-                        guild_id=guild_id
-                    )
-                    await alliance.upsert(conn)
+                    logger.warning(f"Skipping alliance - need 2 factions: {alliance_data}")
+                    continue
+            else:
+                faction_a_internal = faction_map.get(alliance_data.get('faction_a'))
+                faction_b_internal = faction_map.get(alliance_data.get('faction_b'))
+
+            if faction_a_internal and faction_b_internal:
+                # Ensure canonical ordering (a < b)
+                if faction_a_internal > faction_b_internal:
+                    faction_a_internal, faction_b_internal = faction_b_internal, faction_a_internal
+
+                status = alliance_data.get('status', 'ACTIVE')
+                # Determine initiated_by based on status
+                if status == 'PENDING_FACTION_A':
+                    initiated_by = faction_a_internal
+                elif status == 'PENDING_FACTION_B':
+                    initiated_by = faction_b_internal
                 else:
-                    logger.warning(f"Skipping alliance - faction not found: {alliance_data}")
+                    initiated_by = faction_a_internal  # Default for ACTIVE
 
-        # Import Unit Types
-        if 'unit_types' in config_dict:
-            for unit_type_data in config_dict['unit_types']:
-                stats = unit_type_data.get('stats', {})
-                cost = unit_type_data.get('cost', {})
-                upkeep = unit_type_data.get('upkeep', {})
-
-                unit_type = UnitType(
-                    type_id=unit_type_data['type_id'],
-                    name=unit_type_data['name'],
-                    nation=unit_type_data.get('nation'),
-                    movement=stats.get('movement', 1),
-                    organization=stats.get('organization', 10),
-                    attack=stats.get('attack', 0),
-                    defense=stats.get('defense', 0),
-                    siege_attack=stats.get('siege_attack', 0),
-                    siege_defense=stats.get('siege_defense', 0),
-                    size=stats.get('size', 1),
-                    capacity=stats.get('capacity', 0),
-                    is_naval=stats.get('is_naval', False),
-                    keywords=stats.get('keywords', []),
-                    cost_ore=cost.get('ore', 0),
-                    cost_lumber=cost.get('lumber', 0),
-                    cost_coal=cost.get('coal', 0),
-                    cost_rations=cost.get('rations', 0),
-                    cost_cloth=cost.get('cloth', 0),
-                    cost_platinum=cost.get('platinum', 0),
-                    upkeep_ore=upkeep.get('ore', 0),
-                    upkeep_lumber=upkeep.get('lumber', 0),
-                    upkeep_coal=upkeep.get('coal', 0),
-                    upkeep_rations=upkeep.get('rations', 0),
-                    upkeep_cloth=upkeep.get('cloth', 0),
-                    upkeep_platinum=upkeep.get('platinum', 0),
+                alliances.append(Alliance(
+                    faction_a_id=faction_a_internal,
+                    faction_b_id=faction_b_internal,
+                    status=status,
+                    initiated_by_faction_id=initiated_by,
                     guild_id=guild_id
-                )
-                await unit_type.upsert(conn)
+                ))
+            else:
+                logger.warning(f"Skipping alliance - faction not found: {alliance_data}")
+        if diff:
+            # An existing alliance only has its status and activation updated
+            stored_alliances = {(a.faction_a_id, a.faction_b_id): a for a in await Alliance.fetch_all(conn, guild_id)}
+            alliances = ConfigManager._changed(
+                alliances, stored_alliances, lambda a: (a.faction_a_id, a.faction_b_id),
+                lambda a: (a.status, a.activated_at, a.activated_turn)
+            )
+        await Alliance.upsert_many(conn, alliances)
+        written['alliances'] = len(alliances)
+
+        # Import Unit Types
+        unit_types = []
+        for unit_type_data in config_dict.get('unit_types') or []:
+            stats = unit_type_data.get('stats', {})
+            cost = unit_type_data.get('cost', {})
+            upkeep = unit_type_data.get('upkeep', {})
+
+            unit_types.append(UnitType(
+                type_id=unit_type_data['type_id'],
+                name=unit_type_data['name'],
+                nation=unit_type_data.get('nation'),
+                movement=stats.get('movement', 1),
+                organization=stats.get('organization', 10),
+                attack=stats.get('attack', 0),
+                defense=stats.get('defense', 0),
+                siege_attack=stats.get('siege_attack', 0),
+                siege_defense=stats.get('siege_defense', 0),
+                size=stats.get('size', 1),
+                capacity=stats.get('capacity', 0),
+                is_naval=stats.get('is_naval', False),
+                keywords=stats.get('keywords', []),
+                cost_ore=cost.get('ore', 0),
+                cost_lumber=cost.get('lumber', 0),
+                cost_coal=cost.get('coal', 0),
+                cost_rations=cost.get('rations', 0),
+                cost_cloth=cost.get('cloth', 0),
+                cost_platinum=cost.get('platinum', 0),
+                upkeep_ore=upkeep.get('ore', 0),
+                upkeep_lumber=upkeep.get('lumber', 0),
+                upkeep_coal=upkeep.get('coal', 0),
+                upkeep_rations=upkeep.get('rations', 0),
+                upkeep_cloth=upkeep.get('cloth', 0),
+                upkeep_platinum=upkeep.get('platinum', 0),
+                guild_id=guild_id
+            ))
+        if diff:
+            stored_unit_types = {t.type_id: t for t in await UnitType.fetch_all(conn, guild_id)}
+            unit_types = ConfigManager._changed(unit_types, stored_unit_types, lambda t: t.type_id, upsert_args)
+        await UnitType.upsert_many(conn, unit_types)
+        written['unit_types'] = len(unit_types)
 
         # Import Building Types
-        if 'building_types' in config_dict:
-            for building_type_data in config_dict['building_types']:
-                cost = building_type_data.get('cost', {})
-                upkeep = building_type_data.get('upkeep', {})
-
-                building_type = BuildingType(
-                    type_id=building_type_data['type_id'],
-                    name=building_type_data['name'],
-                    description=building_type_data.get('description'),
-                    cost_ore=cost.get('ore', 0),
-                    cost_lumber=cost.get('lumber', 0),
-                    cost_coal=cost.get('coal', 0),
-                    cost_rations=cost.get('rations', 0),
-                    cost_cloth=cost.get('cloth', 0),
-                    cost_platinum=cost.get('platinum', 0),
-                    upkeep_ore=upkeep.get('ore', 0),
-                    upkeep_lumber=upkeep.get('lumber', 0),
-                    upkeep_coal=upkeep.get('coal', 0),
-                    upkeep_rations=upkeep.get('rations', 0),
-                    upkeep_cloth=upkeep.get('cloth', 0),
-                    upkeep_platinum=upkeep.get('platinum', 0),
-                    keywords=building_type_data.get('keywords', []),
-                    guild_id=guild_id
-                )
-                await building_type.upsert(conn)
+        building_types = []
+        for building_type_data in config_dict.get('building_types') or []:
+            cost = building_type_data.get('cost', {})
+            upkeep = building_type_data.get('upkeep', {})
+
+            building_types.append(BuildingType(
+                type_id=building_type_data['type_id'],
+                name=building_type_data['name'],
+                description=building_type_data.get('description'),
+                cost_ore=cost.get('ore', 0),
+                cost_lumber=cost.get('lumber', 0),
+                cost_coal=cost.get('coal', 0),
+                cost_rations=cost.get('rations', 0),
+                cost_cloth=cost.get('cloth', 0),
+                cost_platinum=cost.get('platinum', 0),
+                upkeep_ore=upkeep.get('ore', 0),
+                upkeep_lumber=upkeep.get('lumber', 0),
+                upkeep_coal=upkeep.get('coal', 0),
+                upkeep_rations=upkeep.get('rations', 0),
+                upkeep_cloth=upkeep.get('cloth', 0),
+                upkeep_platinum=upkeep.get('platinum', 0),
+                keywords=building_type_data.get('keywords', []),
+                guild_id=guild_id
+            ))
+        if diff:
+            stored_building_types = {t.type_id: t for t in await BuildingType.fetch_all(conn, guild_id)}
+            building_types = ConfigManager._changed(
+                building_types, stored_building_types, lambda t: t.type_id, upsert_args
+            )
+        await BuildingType.upsert_many(conn, building_types)
+        written['building_types'] = len(building_types)
 
         # Import Buildings
         if 'buildings' in config_dict:
+            building_type_map = {t.type_id: t for t in await BuildingType.fetch_all(conn, guild_id)}
+            terrain_map = {t.territory_id: t.terrain_type for t in await Territory.fetch_all(conn, guild_id)}
+            stored_buildings = await Building.fetch_all(conn, guild_id)
+            types_in_territory: Dict[str, set] = {}
+            for building in stored_buildings:
+                if building.territory_id:
+                    types_in_territory.setdefault(building.territory_id, set()).add(building.building_type)
+
+            buildings = []
             for building_data in config_dict['buildings']:
                 # Get building type to copy upkeep values
-                building_type = await BuildingType.fetch_by_type_id(conn, building_data['type'], guild_id)
+                building_type = building_type_map.get(building_data['type'])
                 if not building_type:
                     logger.warning(f"Building type {building_data['type']} not found, skipping building {building_data['building_id']}")
                     continue
@@ -811,17 +975,16 @@ class ConfigManager:
                 # Check for duplicate building type in territory
                 territory_id_str = str(building_data['territory_id']) if building_data.get('territory_id') else None
                 if territory_id_str:
-                    existing = await Building.fetch_by_territory(conn, territory_id_str, guild_id)
-                    if any(b.building_type == building_data['type'] for b in existing):
+                    if building_data['type'] in types_in_territory.get(territory_id_str, set()):
                         logger.warning(f"Territory {territory_id_str} already has building type {building_data['type']}, skipping")
                         continue
 
                 # Check fortification city-only restriction
                 if building_type.keywords and 'fortification' in [k.lower() for k in building_type.keywords]:
-                    if territory_id_str:
-                        territory = await Territory.fetch_by_territory_id(conn, territory_id_str, guild_id)
-                        if territory and territory.terrain_type.lower() != 'city':
-                            logger.warning(f"Fortification building {building_data['building_id']} can only be placed in cities, skipping (territory {territory_id_str} is {territory.terrain_type})")
+                    if territory_id_str and territory_id_str in terrain_map:
+                        terrain_type = terrain_map[territory_id_str]
+                        if terrain_type.lower() != 'city':
+                            logger.warning(f"Fortification building {building_data['building_id']} can only be placed in cities, skipping (territory {territory_id_str} is {terrain_type})")
                             continue
 
                 # Keywords: use building_data keywords if provided, otherwise inherit from building_type
@@ -830,11 +993,11 @@ class ConfigManager:
                 else:
                     building_keywords = building_type.keywords.copy() if building_type.keywords else []
 
-                building = Building(
+                buildings.append(Building(
                     building_id=building_data['building_id'],
                     name=building_data.get('name'),
                     building_type=building_data['type'],
-                    territory_id=str(building_data['territory_id']) if building_data.get('territory_id') else None,
+                    territory_id=territory_id_str,
                     durability=building_data.get('durability', 10),
                     status=building_data.get('status', 'ACTIVE'),
                     upkeep_ore=building_type.upkeep_ore,
@@ -845,54 +1008,47 @@ class ConfigManager:
                     upkeep_platinum=building_type.upkeep_platinum,
                     keywords=building_keywords,
                     guild_id=guild_id
+                ))
+                if territory_id_str:
+                    types_in_territory.setdefault(territory_id_str, set()).add(building_data['type'])
+            if diff:
+                buildings = ConfigManager._changed(
+                    buildings, {b.building_id: b for b in stored_buildings}, lambda b: b.building_id, upsert_args
                 )
-                await building.upsert(conn)
+            await Building.upsert_many(conn, buildings)
+            written['buildings'] = len(buildings)
 
         # Import Units
         if 'units' in config_dict:
+            unit_type_map = {t.type_id: t for t in await UnitType.fetch_all(conn, guild_id)}
+            units = []
             for unit_data in config_dict['units']:
                 # Determine owner - either character or faction
                 owner_character_id = None
                 owner_faction_id = None
 
                 if 'owner' in unit_data:
-                    owner_char = character_map.get(unit_data['owner'])
-                    if not owner_char:
-                        logger.warning(f"Owner character {unit_data['owner']} not found, skipping unit {unit_data['unit_id']}")
-                        continue
-                    owner_character_id = owner_char.id
+                    owner_character_id = character_map[unit_data['owner']].id
                 elif 'owner_faction' in unit_data:
-                    owner_faction_id = faction_map.get(unit_data['owner_faction'])
-                    if not owner_faction_id:
-                        logger.warning(f"Owner faction {unit_data['owner_faction']} not found, skipping unit {unit_data['unit_id']}")
-                        continue
+                    owner_faction_id = faction_map[unit_data['owner_faction']]
                 else:
                     logger.warning(f"Unit {unit_data['unit_id']} has no owner or owner_faction, skipping")
                     continue
 
                 commander_char_id = None
                 if 'commander' in unit_data:
-                    commander_char = character_map.get(unit_data['commander'])
-                    if commander_char:
-                        commander_char_id = commander_char.id
+                    commander_char_id = character_map[unit_data['commander']].id
 
                 faction_internal_id = None
                 if 'faction_id' in unit_data:
-                    # Try to get from faction_map first (if factions were imported in same run)
-                    faction_internal_id = faction_map.get(unit_data['faction_id'])
-
-                    # If not in map, fetch from database
-                    if not faction_internal_id:
-                        faction_obj = await Faction.fetch_by_faction_id(conn, unit_data['faction_id'], guild_id)
-                        if faction_obj:
-                            faction_internal_id = faction_obj.id
+                    faction_internal_id = faction_map[unit_data['faction_id']]
 
                 # For faction-owned units, the faction_id field should be the owning faction
                 if owner_faction_id and not faction_internal_id:
                     faction_internal_id = owner_faction_id
 
                 # Get unit type to determine default stats
-                unit_type = await UnitType.fetch_by_type_id(conn, unit_data['type'], guild_id)
+                unit_type = unit_type_map.get(unit_data['type'])
 
                 if not unit_type:
                     logger.warning(f"Unit type {unit_data['type']} not found, skipping unit {unit_data['unit_id']}")
@@ -903,7 +1059,7 @@ class ConfigManager:
                 max_org = stats.get('organization', unit_type.organization)
                 current_org = unit_data.get('current_organization', max_org)
 
-                unit = Unit(
+                units.append(Unit(
                     unit_id=unit_data['unit_id'],
                     name=unit_data.get('name'),
                     unit_type=unit_data['type'],
@@ -930,9 +1086,11 @@ class ConfigManager:
                     upkeep_platinum=unit_type.upkeep_platinum,
                     keywords=stats.get('keywords', unit_type.keywords),
                     guild_id=guild_id
-                )
-                
-                await unit.upsert(conn)
-
-        logger.info(f"Successfully imported wargame config for guild {guild_id}")
-        return True, "Configuration imported successfully"
+                ))
+            if diff:
+                stored_units = {u.unit_id: u for u in await Unit.fetch_all(conn, guild_id)}
+                units = ConfigManager._changed(units, stored_units, lambda u: u.unit_id, upsert_args)
+            await Unit.upsert_many(conn, units)
+            written['units'] = len(units)
+
+        return written
@@ -1013,6 +1013,23 @@ def format_resource_totals(totals, show_zeros: bool = False) -> str:
     return " | ".join(parts) if parts else "None"
 
 
+def _add_last_turn_ledger_field(embed: discord.Embed, last_turn: Optional[dict]):
+    """Add the ledger summary of the last resolved turn to a finances embed."""
+    if not last_turn or not last_turn['by_reason']:
+        return
+    lines = [
+        f"{reason.replace('_', ' ').title()}: {format_resource_totals(totals)}"
+        for reason, totals in last_turn['by_reason'].items()
+        if not totals.is_empty()
+    ]
+    lines.append(f"**Net: {format_resource_totals(last_turn['net'], show_zeros=True)}**")
+    embed.add_field(
+        name=f"Last Turn (Turn {last_turn['turn_number']})",
+        value="\n".join(lines),
+        inline=False
+    )
+
+
 def create_character_finances_embed(data: dict) -> discord.Embed:
     """Create a rich embed displaying character financial report."""
     character = data['character']
@@ -1131,6 +1148,8 @@ def create_character_finances_embed(data: dict) -> discord.Embed:
         inline=False
     )
 
+    _add_last_turn_ledger_field(embed, data.get('last_turn'))
+
     return embed
 
 
@@ -1252,6 +1271,8 @@ def create_faction_finances_embed(data: dict) -> discord.Embed:
         inline=False
     )
 
+    _add_last_turn_ledger_field(embed, data.get('last_turn'))
+
     return embed
 
 
@@ -18,4 +18,6 @@ from .turn_handlers import *
 from .config_handlers import *
 from .report_handlers import *
 from .finance_handlers import *
+from .snapshot_handlers import *
+from .route_handlers import *
 
@@ -0,0 +1,196 @@
+"""
+In-memory resource balances for turn phases.
+
+A phase loads every PlayerResources and FactionResources row for the guild
+with one query, deducts or credits in memory, and writes the touched
+balances back with one bulk statement per table. When the ledger is bound to
+a turn and phase, every change is also journalled to ResourceLedger, summed
+per (owner, reason), in one COPY. Orders and GM edits that change a single
+owner's balance use load_owner, so their changes are journalled the same way.
+"""
+import asyncpg
+from typing import Dict, List, Tuple, Optional
+import logging
+from db import PlayerResources, FactionResources, ResourceLedgerEntry
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_TYPES = ('ore', 'lumber', 'coal', 'rations', 'cloth', 'platinum')
+
+# Owner types, matching Territory.get_owner_type() / Unit.get_owner_type()
+CHARACTER = 'character'
+FACTION = 'faction'
+
+# ResourceLedger reasons
+REASON_CHARACTER_PRODUCTION = 'CHARACTER_PRODUCTION'
+REASON_TERRITORY_PRODUCTION = 'TERRITORY_PRODUCTION'
+REASON_WAR_BONUS = 'WAR_BONUS'
+REASON_FACTION_SPENDING = 'FACTION_SPENDING'
+REASON_BUILDING_UPKEEP = 'BUILDING_UPKEEP'
+REASON_UNIT_UPKEEP = 'UNIT_UPKEEP'
+REASON_TRANSFER_OUT = 'TRANSFER_OUT'
+REASON_TRANSFER_IN = 'TRANSFER_IN'
+REASON_MOBILIZATION = 'MOBILIZATION'
+REASON_CONSTRUCTION = 'CONSTRUCTION'
+REASON_GM_ADJUSTMENT = 'GM_ADJUSTMENT'
+
+# ResourceLedger phase for GM edits; they count towards the next turn to resolve
+PHASE_GM = 'GM'
+
+
+class BalanceLedger:
+    """
+    Resource balances for every character and faction in a guild.
+
+    Balances are keyed by (owner_type, owner_id) where owner_id is the
+    internal Character.id or Faction.id. Owners without a row start at zero.
+    """
+
+    def __init__(
+        self,
+        guild_id: int,
+        balances: Dict[Tuple[str, int], Dict[str, int]],
+        turn_number: Optional[int] = None,
+        phase: Optional[str] = None
+    ):
+        self.guild_id = guild_id
+        self.turn_number = turn_number
+        self.phase = phase
+        self._balances = balances
+        self._dirty = set()
+        self._journal: Dict[Tuple[str, int, str], Dict[str, int]] = {}
+
+    @classmethod
+    async def load(
+        cls,
+        conn: asyncpg.Connection,
+        guild_id: int,
+        turn_number: Optional[int] = None,
+        phase: Optional[str] = None
+    ) -> "BalanceLedger":
+        """
+        Load all character and faction balances for a guild in one query.
+        Pass turn_number and phase to journal changes to ResourceLedger on flush.
+        """
+        rows = await conn.fetch("""
+            SELECT 'character' AS owner_type, character_id AS owner_id,
+                   ore, lumber, coal, rations, cloth, platinum
+            FROM PlayerResources
+            WHERE guild_id = $1
+            UNION ALL
+            SELECT 'faction' AS owner_type, faction_id AS owner_id,
+                   ore, lumber, coal, rations, cloth, platinum
+            FROM FactionResources
+            WHERE guild_id = $1;
+        """, guild_id)
+        balances = {
+            (row['owner_type'], row['owner_id']): {rt: row[rt] or 0 for rt in RESOURCE_TYPES}
+            for row in rows
+        }
+        return cls(guild_id, balances, turn_number, phase)
+
+    @classmethod
+    async def load_owner(
+        cls,
+        conn: asyncpg.Connection,
+        guild_id: int,
+        owner_type: str,
+        owner_id: int,
+        turn_number: Optional[int] = None,
+        phase: Optional[str] = None
+    ) -> "BalanceLedger":
+        """
+        Load a single character's or faction's balance.
+        Pass turn_number and phase to journal changes to ResourceLedger on flush.
+        """
+        if owner_type == CHARACTER:
+            row = await PlayerResources.fetch_by_character(conn, owner_id, guild_id)
+        else:
+            row = await FactionResources.fetch_by_faction(conn, owner_id, guild_id)
+        balances = {}
+        if row:
+            balances[(owner_type, owner_id)] = {rt: getattr(row, rt) or 0 for rt in RESOURCE_TYPES}
+        return cls(guild_id, balances, turn_number, phase)
+
+    def has(self, owner_type: str, owner_id: int) -> bool:
+        """Whether the owner has a balance row (or has been credited/debited this phase)."""
+        return (owner_type, owner_id) in self._balances
+
+    def balance(self, owner_type: str, owner_id: int) -> Dict[str, int]:
+        """Current balance for an owner (zero if they have no row yet)."""
+        key = (owner_type, owner_id)
+        if key not in self._balances:
+            self._balances[key] = {rt: 0 for rt in RESOURCE_TYPES}
+        return self._balances[key]
+
+    def _record(self, owner_type: str, owner_id: int, reason: Optional[str], deltas: Dict[str, int]):
+        if reason is None or self.turn_number is None:
+            return
+        totals = self._journal.setdefault((owner_type, owner_id, reason), {rt: 0 for rt in RESOURCE_TYPES})
+        for rt, amount in deltas.items():
+            totals[rt] += amount
+
+    def deduct(
+        self,
+        owner_type: str,
+        owner_id: int,
+        needed: Dict[str, int],
+        reason: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Deduct as much of `needed` as the owner can afford.
+
+        Returns:
+            Dict of amount actually deducted per resource in `needed`
+        """
+        balance = self.balance(owner_type, owner_id)
+        self._dirty.add((owner_type, owner_id))
+        deducted = {}
+        for rt, amount in needed.items():
+            taken = min(amount, balance[rt])
+            balance[rt] -= taken
+            deducted[rt] = taken
+        self._record(owner_type, owner_id, reason, {rt: -v for rt, v in deducted.items()})
+        return deducted
+
+    def credit(self, owner_type: str, owner_id: int, amounts: Dict[str, int], reason: Optional[str] = None):
+        """Add resources to an owner's balance. Negative amounts are taken away as given."""
+        balance = self.balance(owner_type, owner_id)
+        self._dirty.add((owner_type, owner_id))
+        for rt, amount in amounts.items():
+            balance[rt] += amount
+        self._record(owner_type, owner_id, reason, amounts)
+
+    async def flush(self, conn: asyncpg.Connection):
+        """Write every touched balance back, one statement per table."""
+        player_rows: List[PlayerResources] = []
+        faction_rows: List[FactionResources] = []
+        for owner_type, owner_id in sorted(self._dirty):
+            balance = self._balances[(owner_type, owner_id)]
+            if owner_type == CHARACTER:
+                player_rows.append(PlayerResources(character_id=owner_id, guild_id=self.guild_id, **balance))
+            else:
+                faction_rows.append(FactionResources(faction_id=owner_id, guild_id=self.guild_id, **balance))
+
+        entries = [
+            ResourceLedgerEntry(
+                turn_number=self.turn_number,
+                phase=self.phase or '',
+                reason=reason,
+                owner_type=owner_type,
+                owner_id=owner_id,
+                guild_id=self.guild_id,
+                **totals
+            )
+            for (owner_type, owner_id, reason), totals in self._journal.items()
+            if any(totals.values())
+        ]
+
+        await PlayerResources.upsert_many(conn, player_rows)
+        await FactionResources.upsert_many(conn, faction_rows)
+        await ResourceLedgerEntry.insert_many(conn, entries)
+        logger.info(f"Balance ledger: wrote {len(player_rows)} character and "
+                    f"{len(faction_rows)} faction balances, {len(entries)} journal entries "
+                    f"for guild {self.guild_id}")
+        self._dirty.clear()
+        self._journal.clear()
@@ -4,6 +4,7 @@ Building management command handlers.
 import asyncpg
 from typing import Optional, Tuple
 from db import Building, BuildingType, Territory
+from handlers.finance_cache import finance_projections
 
 
 async def create_building(
@@ -70,6 +71,7 @@ async def create_building(
         return False, f"Invalid building data: {error_msg}"
 
     await building.upsert(conn)
+    finance_projections.invalidate_territory(guild_id, territory)
 
     display_name = name or building_id
     return True, f"Building '{display_name}' ({building_type.name}) created in territory '{territory.name or territory_id}'."
@@ -125,6 +127,8 @@ async def edit_building(
         return False, "No changes specified."
 
     await building.upsert(conn)
+    # Buildings are rarely edited, so skip looking up the territory's controller
+    finance_projections.invalidate_guild(guild_id)
 
     display_name = building.name or building_id
     return True, f"Building '{display_name}' updated: {', '.join(changes)}"
@@ -138,5 +142,6 @@ async def delete_building(conn: asyncpg.Connection, building_id: str, guild_id:
 
     display_name = building.name or building_id
     await Building.delete(conn, building_id, guild_id)
+    finance_projections.invalidate_guild(guild_id)
 
     return True, f"Building '{display_name}' has been deleted."
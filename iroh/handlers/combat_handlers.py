@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from collections import defaultdict
 import logging
 
-from db import Unit, Territory, TurnLog, Building, Order, Faction, FactionPermission, Character
+from db import Unit, Territory, TurnLog, Building, Order, Faction
 from order_types import OrderStatus, TurnPhase
 from handlers.movement_handlers import (
     are_factions_at_war,
@@ -21,6 +21,7 @@ from handlers.movement_handlers import (
     unit_has_keyword,
 )
 from handlers.encirclement_handlers import is_unit_exempt_from_engagement
+from handlers.turn_context import fetch_character, fetch_permission_holders
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +71,7 @@ async def get_unit_faction_id(conn: asyncpg.Connection, unit: Unit, guild_id: in
 
     # For character-owned units, check the owner's represented faction
     if unit.owner_character_id:
-        character = await Character.fetch_by_id(conn, unit.owner_character_id)
+        character = await fetch_character(conn, unit.owner_character_id)
         if character:
             return character.represented_faction_id
 
@@ -798,7 +799,7 @@ async def resolve_territory_capture(
     if old_controller_char and old_controller_char not in affected_ids:
         affected_ids.append(old_controller_char)
     if old_controller_faction:
-        old_faction_chars = await FactionPermission.fetch_characters_with_permission(
+        old_faction_chars = await fetch_permission_holders(
             conn, old_controller_faction, "COMMAND", guild_id
         )
         for char_id in old_faction_chars:
@@ -807,7 +808,7 @@ async def resolve_territory_capture(
 
     # Get new controller name
     if new_controller_type == 'character':
-        controller = await Character.fetch_by_id(conn, new_controller_id)
+        controller = await fetch_character(conn, new_controller_id)
         new_controller_name = controller.name if controller else 'Unknown'
     else:
         faction = await Faction.fetch_by_id(conn, new_controller_id)
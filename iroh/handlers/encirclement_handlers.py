@@ -12,9 +12,10 @@ import logging
 import json
 
 from db import (
-    Unit, Territory, Character, Alliance, WarParticipant, TerritoryAdjacency,
-    FactionPermission, Order
+    Unit, Territory, Alliance, WarParticipant, TerritoryAdjacency, Order
 )
+from handlers.turn_context import fetch_character, fetch_permission_holders
+from handlers.naval_occupancy import NavalOccupancyIndex
 
 logger = logging.getLogger(__name__)
 
@@ -109,7 +110,7 @@ async def get_territory_controller_faction(
     """
     if territory.controller_character_id is not None:
         # Character-controlled: look up their represented faction
-        character = await Character.fetch_by_id(conn, territory.controller_character_id)
+        character = await fetch_character(conn, territory.controller_character_id)
         if character:
             return character.represented_faction_id
         return None
@@ -261,7 +262,7 @@ async def get_unit_home_faction_id(
         Faction ID (internal) or None if unaffiliated
     """
     if unit.owner_character_id is not None:
-        character = await Character.fetch_by_id(conn, unit.owner_character_id)
+        character = await fetch_character(conn, unit.owner_character_id)
         if character:
             return character.represented_faction_id
         return None
@@ -395,7 +396,8 @@ def is_unit_exempt_from_engagement(unit: Unit) -> bool:
 async def get_naval_convoy_territories(
     conn: asyncpg.Connection,
     guild_id: int,
-    allied_ids: Set[int]
+    allied_ids: Set[int],
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> Set[str]:
     """
     Get ocean territories traversable via naval convoy.
@@ -409,6 +411,7 @@ async def get_naval_convoy_territories(
         conn: Database connection
         guild_id: Guild ID
         allied_ids: Set of allied faction IDs
+        occupancy: Optional naval occupancy index to read naval units from
 
     Returns:
         Set of territory IDs traversable via naval convoy
@@ -421,7 +424,10 @@ async def get_naval_convoy_territories(
     for order in convoy_orders:
         # Get units involved in this convoy order
         for unit_id in order.unit_ids:
-            unit = await Unit.fetch_by_id(conn, unit_id)
+            if occupancy is not None:
+                unit = occupancy.unit(unit_id)
+            else:
+                unit = await Unit.fetch_by_id(conn, unit_id)
             if not unit or not unit.is_naval:
                 continue
 
@@ -499,7 +505,8 @@ async def get_convoy_traversable_territories(
     guild_id: int,
     home_faction_id: int,
     allied_ids: Set[int],
-    enemy_ids: Set[int]
+    enemy_ids: Set[int],
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> Set[str]:
     """
     Combine naval and aerial convoy territories.
@@ -510,11 +517,12 @@ async def get_convoy_traversable_territories(
         home_faction_id: The unit's home faction ID
         allied_ids: Set of allied faction IDs
         enemy_ids: Set of enemy faction IDs
+        occupancy: Optional naval occupancy index to read naval units from
 
     Returns:
         Set of territory IDs traversable via convoy (naval or aerial)
     """
-    naval_convoys = await get_naval_convoy_territories(conn, guild_id, allied_ids)
+    naval_convoys = await get_naval_convoy_territories(conn, guild_id, allied_ids, occupancy)
     aerial_convoys = await get_aerial_convoy_territories(conn, guild_id, allied_ids, enemy_ids)
 
     combined = naval_convoys | aerial_convoys
@@ -553,7 +561,7 @@ async def get_affected_character_ids_for_unit(
 
     # Add faction members with COMMAND permission (if unit has a faction)
     if unit.faction_id is not None:
-        command_holders = await FactionPermission.fetch_characters_with_permission(
+        command_holders = await fetch_permission_holders(
             conn, unit.faction_id, "COMMAND", guild_id
         )
         affected_ids.update(command_holders)
@@ -564,7 +572,8 @@ async def get_affected_character_ids_for_unit(
 async def check_unit_encircled(
     conn: asyncpg.Connection,
     unit: Unit,
-    guild_id: int
+    guild_id: int,
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> bool:
     """
     Check if a single unit is encircled.
@@ -581,6 +590,7 @@ async def check_unit_encircled(
         conn: Database connection
         unit: The unit to check
         guild_id: Guild ID
+        occupancy: Optional naval occupancy index to read convoy units from
 
     Returns:
         True if unit is encircled, False otherwise
@@ -616,7 +626,7 @@ async def check_unit_encircled(
 
     # Get convoy traversable territories (Phase 2)
     convoy_traversable_ids = await get_convoy_traversable_territories(
-        conn, guild_id, home_faction_id, allied_ids, enemy_ids
+        conn, guild_id, home_faction_id, allied_ids, enemy_ids, occupancy
     )
 
     # BFS to find path to friendly territory (with convoy support)
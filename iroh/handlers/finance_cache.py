@@ -0,0 +1,113 @@
+"""
+Cached finance projections for the wargame system.
+
+The finance views project next turn's production, upkeep and transfers from
+everything an owner holds. Holdings only change at turn resolution or through
+a handful of commands, so projections are computed once per turn and kept
+until one of those commands invalidates the owners it touched.
+"""
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+OwnerKey = Tuple[str, int]
+
+
+def transfer_parties(order) -> List[OwnerKey]:
+    """
+    The (owner_type, owner_id) sender and recipient of a RESOURCE_TRANSFER order.
+
+    Handles both the new format (recipient_type/recipient_id) and the old
+    format (to_character_id). Characters send unless sender_type is 'faction'.
+    """
+    order_data = order.order_data or {}
+    parties = []
+    if order_data.get('sender_type') == 'faction':
+        parties.append(('faction', int(order_data['sender_faction_id'])))
+    else:
+        parties.append(('character', order.character_id))
+
+    recipient_type = order_data.get('recipient_type')
+    if recipient_type is None:
+        if order_data.get('to_character_id') is not None:
+            parties.append(('character', int(order_data['to_character_id'])))
+    elif order_data.get('recipient_id') is not None:
+        parties.append((recipient_type, int(order_data['recipient_id'])))
+    return parties
+
+
+class FinanceProjectionCache:
+    """
+    Finance projections per guild, keyed by (owner_type, owner_id).
+
+    Each guild's projections are tagged with the turn they were computed for,
+    so they all expire when the turn advances. Invalidation bumps the guild's
+    generation; a projection computed across an invalidation is not stored.
+    """
+
+    def __init__(self):
+        self._guilds: Dict[int, Tuple[int, Dict[OwnerKey, dict]]] = {}
+        self._generations: Dict[int, int] = {}
+
+    def generation(self, guild_id: int) -> int:
+        """Current invalidation generation; pass it back to put()."""
+        return self._generations.get(guild_id, 0)
+
+    def get(self, guild_id: int, turn_number: int, owner_type: str, owner_id: int) -> Optional[dict]:
+        """Cached projection for an owner, or None if missing or from another turn."""
+        entry = self._guilds.get(guild_id)
+        if entry is None or entry[0] != turn_number:
+            return None
+        return entry[1].get((owner_type, owner_id))
+
+    def put(self, guild_id: int, turn_number: int, owner_type: str, owner_id: int,
+            projection: dict, generation: int):
+        """Store a projection computed at `generation` unless it has since been invalidated."""
+        if generation != self.generation(guild_id):
+            return
+        entry = self._guilds.get(guild_id)
+        if entry is None or entry[0] != turn_number:
+            entry = (turn_number, {})
+            self._guilds[guild_id] = entry
+        entry[1][(owner_type, owner_id)] = projection
+
+    def replace_guild(self, guild_id: int, turn_number: int, projections: Dict[OwnerKey, dict],
+                      generation: int):
+        """Store every owner's projection for a turn at once."""
+        if generation != self.generation(guild_id):
+            return
+        self._guilds[guild_id] = (turn_number, dict(projections))
+        logger.info(f"Finance projections: cached {len(projections)} owners for turn {turn_number} "
+                    f"in guild {guild_id}")
+
+    def invalidate(self, guild_id: int, owner_type: str, owner_id: Optional[int]):
+        """Drop one owner's projection."""
+        self._generations[guild_id] = self.generation(guild_id) + 1
+        entry = self._guilds.get(guild_id)
+        if entry is not None and owner_id is not None:
+            entry[1].pop((owner_type, owner_id), None)
+
+    def invalidate_unit(self, guild_id: int, unit):
+        """Drop the projection of a unit's owner (character or faction)."""
+        self.invalidate(guild_id, 'character', unit.owner_character_id)
+        self.invalidate(guild_id, 'faction', unit.owner_faction_id)
+
+    def invalidate_territory(self, guild_id: int, territory):
+        """Drop the projection of a territory's controller (character or faction)."""
+        self.invalidate(guild_id, 'character', territory.controller_character_id)
+        self.invalidate(guild_id, 'faction', territory.controller_faction_id)
+
+    def invalidate_transfer(self, guild_id: int, order):
+        """Drop the projections of both parties to a resource transfer order."""
+        for owner_type, owner_id in transfer_parties(order):
+            self.invalidate(guild_id, owner_type, owner_id)
+
+    def invalidate_guild(self, guild_id: int):
+        """Drop every projection for a guild."""
+        self._generations[guild_id] = self.generation(guild_id) + 1
+        self._guilds.pop(guild_id, None)
+
+
+# Shared instance used by handlers, views and commands
+finance_projections = FinanceProjectionCache()
@@ -3,12 +3,14 @@ Finance handler functions for viewing character and faction financial reports.
 """
 import asyncpg
 from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict
 from db import (
     Character, Faction, FactionMember, FactionPermission, FactionResources,
-    Territory, Unit, Building, Order, PlayerResources
+    Territory, Unit, Building, Order, PlayerResources, WargameConfig, ResourceLedgerEntry
 )
-from handlers.turn_handlers import calculate_building_production_bonus
+from order_types import OrderType, OrderStatus, TurnPhase
+from handlers.territory_modifiers import compute_production_bonus
+from handlers.finance_cache import finance_projections, transfer_parties
 
 
 @dataclass
@@ -60,6 +62,282 @@ class ResourceTotals:
                 self.rations == 0 and self.cloth == 0 and self.platinum == 0)
 
 
+def _sum_production(territories: List[Territory]) -> ResourceTotals:
+    """Natural production of territories, skipping sacred-land (which produces nothing)."""
+    totals = ResourceTotals()
+    for t in territories:
+        if t.keywords and 'sacred-land' in t.keywords:
+            continue
+        totals.ore += t.ore_production
+        totals.lumber += t.lumber_production
+        totals.coal += t.coal_production
+        totals.rations += t.rations_production
+        totals.cloth += t.cloth_production
+        totals.platinum += t.platinum_production
+    return totals
+
+
+def _sum_building_production(
+    territories: List[Territory],
+    buildings_by_territory: Dict[str, List[Building]]
+) -> ResourceTotals:
+    """Building production bonuses, skipping sacred-land territories."""
+    totals = ResourceTotals()
+    for t in territories:
+        if t.keywords and 'sacred-land' in t.keywords:
+            continue
+        bonus = compute_production_bonus(t, buildings_by_territory.get(t.territory_id, []))
+        totals = totals.add(ResourceTotals(**bonus))
+    return totals
+
+
+def _sum_upkeep(items) -> ResourceTotals:
+    """Upkeep of units or buildings."""
+    totals = ResourceTotals()
+    for item in items:
+        totals.ore += item.upkeep_ore
+        totals.lumber += item.upkeep_lumber
+        totals.coal += item.upkeep_coal
+        totals.rations += item.upkeep_rations
+        totals.cloth += item.upkeep_cloth
+        totals.platinum += item.upkeep_platinum
+    return totals
+
+
+def _sum_transfers(orders: List[Order]) -> ResourceTotals:
+    """Per-turn amounts of resource transfer orders."""
+    totals = ResourceTotals()
+    for order in orders:
+        order_data = order.order_data or {}
+        totals.ore += order_data.get('ore', 0)
+        totals.lumber += order_data.get('lumber', 0)
+        totals.coal += order_data.get('coal', 0)
+        totals.rations += order_data.get('rations', 0)
+        totals.cloth += order_data.get('cloth', 0)
+        totals.platinum += order_data.get('platinum', 0)
+    return totals
+
+
+def _build_last_turn(turn_number: int, summary: Dict[str, Dict[str, int]]) -> Optional[dict]:
+    """Turn a ResourceLedger summary into the last_turn dict (see get_last_turn_ledger)."""
+    if not turn_number:
+        return None
+    by_reason = {reason: ResourceTotals(**amounts) for reason, amounts in summary.items()}
+    net = ResourceTotals()
+    for totals in by_reason.values():
+        net = net.add(totals)
+    return {
+        'turn_number': turn_number,
+        'by_reason': by_reason,
+        'net': net
+    }
+
+
+def _build_projection(
+    territories: List[Territory],
+    units: List[Unit],
+    buildings_by_territory: Dict[str, List[Building]],
+    outgoing_orders: List[Order],
+    incoming_orders: List[Order],
+    last_turn: Optional[dict]
+) -> dict:
+    """
+    Project an owner's next turn from their holdings.
+
+    buildings_by_territory holds ACTIVE buildings only.
+    """
+    active_units = [u for u in units if u.status == 'ACTIVE']
+    held_buildings = [
+        b for t in territories for b in buildings_by_territory.get(t.territory_id, [])
+    ]
+    return {
+        'territory_production': _sum_production(territories),
+        'building_production': _sum_building_production(territories, buildings_by_territory),
+        'territory_count': len(territories),
+        'unit_upkeep': _sum_upkeep(active_units),
+        'unit_count': len(active_units),
+        'building_upkeep': _sum_upkeep(held_buildings),
+        'building_count': len(held_buildings),
+        'outgoing_transfers': _sum_transfers(outgoing_orders),
+        'outgoing_transfer_count': len(outgoing_orders),
+        'incoming_transfers': _sum_transfers(incoming_orders),
+        'incoming_transfer_count': len(incoming_orders),
+        'last_turn': last_turn
+    }
+
+
+async def _fetch_active_buildings(
+    conn: asyncpg.Connection,
+    territories: List[Territory],
+    guild_id: int
+) -> Dict[str, List[Building]]:
+    """ACTIVE buildings in each of the given territories, in one query."""
+    buildings_by_territory = {t.territory_id: [] for t in territories}
+    for building in await Building.fetch_active_by_territories(conn, list(buildings_by_territory), guild_id):
+        buildings_by_territory[building.territory_id].append(building)
+    return buildings_by_territory
+
+
+async def get_last_turn_ledger(
+    conn: asyncpg.Connection,
+    owner_type: str,
+    owner_id: int,
+    guild_id: int,
+    turn_number: Optional[int] = None
+) -> Optional[dict]:
+    """
+    Summarize what actually happened to an owner's resources in the last resolved turn,
+    from the ResourceLedger journal.
+
+    Args:
+        turn_number: The last resolved turn, if the caller already knows it
+
+    Returns:
+        None if no turn has been resolved, otherwise a dict with:
+        - turn_number: The last resolved turn
+        - by_reason: {reason: ResourceTotals} of signed changes
+        - net: ResourceTotals net change over the turn
+    """
+    if turn_number is None:
+        config = await WargameConfig.fetch(conn, guild_id)
+        turn_number = config.current_turn if config else 0
+    if not turn_number:
+        return None
+
+    summary = await ResourceLedgerEntry.fetch_turn_summary(
+        conn, owner_type, owner_id, turn_number, guild_id
+    )
+    return _build_last_turn(turn_number, summary)
+
+
+async def _compute_character_projection(
+    conn: asyncpg.Connection,
+    character_id: int,
+    guild_id: int,
+    turn_number: int
+) -> dict:
+    territories = await Territory.fetch_by_controller(conn, character_id, guild_id)
+    buildings_by_territory = await _fetch_active_buildings(conn, territories, guild_id)
+    units = await Unit.fetch_by_owner(conn, character_id, guild_id)
+
+    # Faction-sender transfers are faction expenses, not character expenses
+    transfer_orders = await Order.fetch_by_character_and_type(
+        conn, character_id, guild_id, 'RESOURCE_TRANSFER', 'ONGOING'
+    )
+    outgoing_orders = [
+        o for o in transfer_orders
+        if (o.order_data or {}).get('sender_type') != 'faction'
+    ]
+    incoming_orders = await Order.fetch_incoming_transfers_for_character(conn, character_id, guild_id)
+
+    last_turn = await get_last_turn_ledger(conn, 'character', character_id, guild_id, turn_number)
+    return _build_projection(
+        territories, units, buildings_by_territory, outgoing_orders, incoming_orders, last_turn
+    )
+
+
+async def _compute_faction_projection(
+    conn: asyncpg.Connection,
+    faction_id: int,
+    guild_id: int,
+    turn_number: int
+) -> dict:
+    territories = await Territory.fetch_by_faction_controller(conn, faction_id, guild_id)
+    buildings_by_territory = await _fetch_active_buildings(conn, territories, guild_id)
+    units = await Unit.fetch_by_faction_owner(conn, faction_id, guild_id)
+    outgoing_orders = await Order.fetch_outgoing_transfers_for_faction(conn, faction_id, guild_id)
+    incoming_orders = await Order.fetch_incoming_transfers_for_faction(conn, faction_id, guild_id)
+
+    last_turn = await get_last_turn_ledger(conn, 'faction', faction_id, guild_id, turn_number)
+    return _build_projection(
+        territories, units, buildings_by_territory, outgoing_orders, incoming_orders, last_turn
+    )
+
+
+async def get_finance_projection(
+    conn: asyncpg.Connection,
+    owner_type: str,
+    owner_id: int,
+    guild_id: int
+) -> dict:
+    """
+    Projected production, upkeep and transfers for a character or faction.
+
+    Served from the finance projection cache for the current turn, computing
+    and caching it on a miss.
+    """
+    config = await WargameConfig.fetch(conn, guild_id)
+    turn_number = config.current_turn if config else 0
+
+    projection = finance_projections.get(guild_id, turn_number, owner_type, owner_id)
+    if projection is None:
+        generation = finance_projections.generation(guild_id)
+        if owner_type == 'character':
+            projection = await _compute_character_projection(conn, owner_id, guild_id, turn_number)
+        else:
+            projection = await _compute_faction_projection(conn, owner_id, guild_id, turn_number)
+        finance_projections.put(guild_id, turn_number, owner_type, owner_id, projection, generation)
+    return projection
+
+
+async def warm_finance_projections(conn: asyncpg.Connection, guild_id: int) -> int:
+    """
+    Compute every character's and faction's projection for the current turn
+    from guild-wide queries and cache them. Called after turn resolution.
+
+    Returns:
+        Number of projections cached
+    """
+    generation = finance_projections.generation(guild_id)
+    config = await WargameConfig.fetch(conn, guild_id)
+    turn_number = config.current_turn if config else 0
+
+    characters = await Character.fetch_all(conn, guild_id)
+    factions = await Faction.fetch_all(conn, guild_id)
+    territories = await Territory.fetch_all(conn, guild_id)
+    units = await Unit.fetch_all(conn, guild_id)
+    buildings = await Building.fetch_active_for_upkeep(conn, guild_id)
+    transfer_orders = await Order.fetch_by_phase_status_and_type(
+        conn, guild_id, TurnPhase.RESOURCE_TRANSFER.value,
+        [OrderStatus.ONGOING.value], OrderType.RESOURCE_TRANSFER.value
+    )
+    summaries = await ResourceLedgerEntry.fetch_turn_summaries(conn, turn_number, guild_id) if turn_number else {}
+
+    owners = [('character', c.id) for c in characters] + [('faction', f.id) for f in factions]
+    holdings = {owner: {'territories': [], 'units': [], 'outgoing': [], 'incoming': []} for owner in owners}
+
+    for t in territories:
+        owner = (t.get_owner_type(), t.get_owner_id())
+        if owner in holdings:
+            holdings[owner]['territories'].append(t)
+    for u in units:
+        owner = (u.get_owner_type(), u.get_owner_id())
+        if owner in holdings:
+            holdings[owner]['units'].append(u)
+    for order in transfer_orders:
+        parties = transfer_parties(order)
+        if parties[0] in holdings:
+            holdings[parties[0]]['outgoing'].append(order)
+        if len(parties) > 1 and parties[1] in holdings:
+            holdings[parties[1]]['incoming'].append(order)
+
+    buildings_by_territory: Dict[str, List[Building]] = {}
+    for b in buildings:
+        if b.territory_id is not None:
+            buildings_by_territory.setdefault(b.territory_id, []).append(b)
+
+    projections = {
+        owner: _build_projection(
+            held['territories'], held['units'], buildings_by_territory,
+            held['outgoing'], held['incoming'],
+            _build_last_turn(turn_number, summaries.get(owner, {}))
+        )
+        for owner, held in holdings.items()
+    }
+    finance_projections.replace_guild(guild_id, turn_number, projections, generation)
+    return len(projections)
+
+
 async def get_character_finances(
     conn: asyncpg.Connection,
     character_id: int,
@@ -68,6 +346,9 @@ async def get_character_finances(
     """
     Get comprehensive financial report for a character.
 
+    Holdings-based figures come from the finance projection cache; current
+    resources and personal production are always read live.
+
     Returns:
         (success, message, data) where data contains:
         - character: Character object
@@ -84,6 +365,7 @@ async def get_character_finances(
         - incoming_transfers: ResourceTotals from ONGOING transfers targeting this character
         - incoming_transfer_count: Number of incoming transfers
         - net_resources: ResourceTotals (production + incoming - expenses)
+        - last_turn: Ledger summary of the last resolved turn (see get_last_turn_ledger)
     """
     character = await Character.fetch_by_id(conn, character_id)
     if not character:
@@ -113,115 +395,35 @@ async def get_character_finances(
         platinum=character.platinum_production
     )
 
-    # Territory production (excluding sacred-land territories)
-    territories = await Territory.fetch_by_controller(conn, character_id, guild_id)
-    territory_production = ResourceTotals()
-    for t in territories:
-        # Skip sacred-land territories - they don't produce resources
-        if t.keywords and 'sacred-land' in t.keywords:
-            continue
-        territory_production.ore += t.ore_production
-        territory_production.lumber += t.lumber_production
-        territory_production.coal += t.coal_production
-        territory_production.rations += t.rations_production
-        territory_production.cloth += t.cloth_production
-        territory_production.platinum += t.platinum_production
-
-    # Building production bonuses (excluding sacred-land territories)
-    building_production = ResourceTotals()
-    for t in territories:
-        # Skip sacred-land territories - buildings don't provide production bonuses
-        if t.keywords and 'sacred-land' in t.keywords:
-            continue
-        bonus = await calculate_building_production_bonus(conn, t, guild_id)
-        building_production.ore += bonus.get('ore', 0)
-        building_production.lumber += bonus.get('lumber', 0)
-        building_production.coal += bonus.get('coal', 0)
-        building_production.rations += bonus.get('rations', 0)
-        building_production.cloth += bonus.get('cloth', 0)
-        building_production.platinum += bonus.get('platinum', 0)
-
-    # Unit upkeep (ACTIVE only)
-    units = await Unit.fetch_by_owner(conn, character_id, guild_id)
-    active_units = [u for u in units if u.status == 'ACTIVE']
-    unit_upkeep = ResourceTotals()
-    for u in active_units:
-        unit_upkeep.ore += u.upkeep_ore
-        unit_upkeep.lumber += u.upkeep_lumber
-        unit_upkeep.coal += u.upkeep_coal
-        unit_upkeep.rations += u.upkeep_rations
-        unit_upkeep.cloth += u.upkeep_cloth
-        unit_upkeep.platinum += u.upkeep_platinum
-
-    # Building upkeep (ACTIVE buildings in controlled territories)
-    building_upkeep = ResourceTotals()
-    building_count = 0
-    for t in territories:
-        buildings = await Building.fetch_by_territory(conn, t.territory_id, guild_id)
-        active_buildings = [b for b in buildings if b.status == 'ACTIVE']
-        building_count += len(active_buildings)
-        for b in active_buildings:
-            building_upkeep.ore += b.upkeep_ore
-            building_upkeep.lumber += b.upkeep_lumber
-            building_upkeep.coal += b.upkeep_coal
-            building_upkeep.rations += b.upkeep_rations
-            building_upkeep.cloth += b.upkeep_cloth
-            building_upkeep.platinum += b.upkeep_platinum
-
-    # Outgoing resource transfers (ONGOING orders, excluding faction-sender orders)
-    transfer_orders = await Order.fetch_by_character_and_type(
-        conn, character_id, guild_id, 'RESOURCE_TRANSFER', 'ONGOING'
-    )
-    outgoing_transfers = ResourceTotals()
-    outgoing_transfer_count = 0
-    for order in transfer_orders:
-        order_data = order.order_data or {}
-        # Skip faction-sender transfers — those are faction expenses, not character expenses
-        if order_data.get('sender_type') == 'faction':
-            continue
-        outgoing_transfer_count += 1
-        outgoing_transfers.ore += order_data.get('ore', 0)
-        outgoing_transfers.lumber += order_data.get('lumber', 0)
-        outgoing_transfers.coal += order_data.get('coal', 0)
-        outgoing_transfers.rations += order_data.get('rations', 0)
-        outgoing_transfers.cloth += order_data.get('cloth', 0)
-        outgoing_transfers.platinum += order_data.get('platinum', 0)
-
-    # Incoming resource transfers (ONGOING orders targeting this character)
-    incoming_transfer_orders = await Order.fetch_incoming_transfers_for_character(
-        conn, character_id, guild_id
-    )
-    incoming_transfers = ResourceTotals()
-    for order in incoming_transfer_orders:
-        order_data = order.order_data or {}
-        incoming_transfers.ore += order_data.get('ore', 0)
-        incoming_transfers.lumber += order_data.get('lumber', 0)
-        incoming_transfers.coal += order_data.get('coal', 0)
-        incoming_transfers.rations += order_data.get('rations', 0)
-        incoming_transfers.cloth += order_data.get('cloth', 0)
-        incoming_transfers.platinum += order_data.get('platinum', 0)
+    projection = await get_finance_projection(conn, 'character', character_id, guild_id)
 
     # Calculate total production and expenses
-    total_production = personal_production.add(territory_production).add(building_production).add(incoming_transfers)
-    total_expenses = unit_upkeep.add(building_upkeep).add(outgoing_transfers)
+    total_production = (personal_production
+                        .add(projection['territory_production'])
+                        .add(projection['building_production'])
+                        .add(projection['incoming_transfers']))
+    total_expenses = (projection['unit_upkeep']
+                      .add(projection['building_upkeep'])
+                      .add(projection['outgoing_transfers']))
     net_resources = total_production.subtract(total_expenses)
 
     return True, "", {
         'character': character,
         'current_resources': current_resources,
         'personal_production': personal_production,
-        'territory_production': territory_production,
-        'building_production': building_production,
-        'territory_count': len(territories),
-        'unit_upkeep': unit_upkeep,
-        'unit_count': len(active_units),
-        'building_upkeep': building_upkeep,
-        'building_count': building_count,
-        'outgoing_transfers': outgoing_transfers,
-        'transfer_count': outgoing_transfer_count,
-        'incoming_transfers': incoming_transfers,
-        'incoming_transfer_count': len(incoming_transfer_orders),
-        'net_resources': net_resources
+        'territory_production': projection['territory_production'],
+        'building_production': projection['building_production'],
+        'territory_count': projection['territory_count'],
+        'unit_upkeep': projection['unit_upkeep'],
+        'unit_count': projection['unit_count'],
+        'building_upkeep': projection['building_upkeep'],
+        'building_count': projection['building_count'],
+        'outgoing_transfers': projection['outgoing_transfers'],
+        'transfer_count': projection['outgoing_transfer_count'],
+        'incoming_transfers': projection['incoming_transfers'],
+        'incoming_transfer_count': projection['incoming_transfer_count'],
+        'net_resources': net_resources,
+        'last_turn': projection['last_turn']
     }
 
 
@@ -233,6 +435,9 @@ async def get_faction_finances(
     """
     Get comprehensive financial report for a faction.
 
+    Holdings-based figures come from the finance projection cache; the
+    treasury and spending targets are always read live.
+
     Returns:
         (success, message, data) where data contains:
         - faction: Faction object
@@ -249,6 +454,7 @@ async def get_faction_finances(
         - incoming_transfers: ResourceTotals from ONGOING transfers targeting this faction
         - incoming_transfer_count: Number of incoming transfers
         - net_resources: ResourceTotals (production + incoming - expenses)
+        - last_turn: Ledger summary of the last resolved turn (see get_last_turn_ledger)
     """
     faction = await Faction.fetch_by_id(conn, faction_id)
     if not faction:
@@ -268,61 +474,6 @@ async def get_faction_finances(
     else:
         current_resources = ResourceTotals()
 
-    # Territory production (faction-controlled territories, excluding sacred-land)
-    territories = await Territory.fetch_by_faction_controller(conn, faction_id, guild_id)
-    territory_production = ResourceTotals()
-    for t in territories:
-        # Skip sacred-land territories - they don't produce resources
-        if t.keywords and 'sacred-land' in t.keywords:
-            continue
-        territory_production.ore += t.ore_production
-        territory_production.lumber += t.lumber_production
-        territory_production.coal += t.coal_production
-        territory_production.rations += t.rations_production
-        territory_production.cloth += t.cloth_production
-        territory_production.platinum += t.platinum_production
-
-    # Building production bonuses (excluding sacred-land territories)
-    building_production = ResourceTotals()
-    for t in territories:
-        # Skip sacred-land territories - buildings don't provide production bonuses
-        if t.keywords and 'sacred-land' in t.keywords:
-            continue
-        bonus = await calculate_building_production_bonus(conn, t, guild_id)
-        building_production.ore += bonus.get('ore', 0)
-        building_production.lumber += bonus.get('lumber', 0)
-        building_production.coal += bonus.get('coal', 0)
-        building_production.rations += bonus.get('rations', 0)
-        building_production.cloth += bonus.get('cloth', 0)
-        building_production.platinum += bonus.get('platinum', 0)
-
-    # Unit upkeep (faction-owned units, ACTIVE only)
-    units = await Unit.fetch_by_faction_owner(conn, faction_id, guild_id)
-    active_units = [u for u in units if u.status == 'ACTIVE']
-    unit_upkeep = ResourceTotals()
-    for u in active_units:
-        unit_upkeep.ore += u.upkeep_ore
-        unit_upkeep.lumber += u.upkeep_lumber
-        unit_upkeep.coal += u.upkeep_coal
-        unit_upkeep.rations += u.upkeep_rations
-        unit_upkeep.cloth += u.upkeep_cloth
-        unit_upkeep.platinum += u.upkeep_platinum
-
-    # Building upkeep (ACTIVE buildings in faction territories)
-    building_upkeep = ResourceTotals()
-    building_count = 0
-    for t in territories:
-        buildings = await Building.fetch_by_territory(conn, t.territory_id, guild_id)
-        active_buildings = [b for b in buildings if b.status == 'ACTIVE']
-        building_count += len(active_buildings)
-        for b in active_buildings:
-            building_upkeep.ore += b.upkeep_ore
-            building_upkeep.lumber += b.upkeep_lumber
-            building_upkeep.coal += b.upkeep_coal
-            building_upkeep.rations += b.upkeep_rations
-            building_upkeep.cloth += b.upkeep_cloth
-            building_upkeep.platinum += b.upkeep_platinum
-
     # Spending targets from faction configuration
     spending_targets = ResourceTotals(
         ore=faction.ore_spending,
@@ -333,55 +484,35 @@ async def get_faction_finances(
         platinum=faction.platinum_spending
     )
 
-    # Outgoing resource transfers (ONGOING orders sent from this faction)
-    outgoing_transfer_orders = await Order.fetch_outgoing_transfers_for_faction(
-        conn, faction_id, guild_id
-    )
-    outgoing_transfers = ResourceTotals()
-    for order in outgoing_transfer_orders:
-        order_data = order.order_data or {}
-        outgoing_transfers.ore += order_data.get('ore', 0)
-        outgoing_transfers.lumber += order_data.get('lumber', 0)
-        outgoing_transfers.coal += order_data.get('coal', 0)
-        outgoing_transfers.rations += order_data.get('rations', 0)
-        outgoing_transfers.cloth += order_data.get('cloth', 0)
-        outgoing_transfers.platinum += order_data.get('platinum', 0)
-
-    # Incoming resource transfers (ONGOING orders targeting this faction)
-    incoming_transfer_orders = await Order.fetch_incoming_transfers_for_faction(
-        conn, faction_id, guild_id
-    )
-    incoming_transfers = ResourceTotals()
-    for order in incoming_transfer_orders:
-        order_data = order.order_data or {}
-        incoming_transfers.ore += order_data.get('ore', 0)
-        incoming_transfers.lumber += order_data.get('lumber', 0)
-        incoming_transfers.coal += order_data.get('coal', 0)
-        incoming_transfers.rations += order_data.get('rations', 0)
-        incoming_transfers.cloth += order_data.get('cloth', 0)
-        incoming_transfers.platinum += order_data.get('platinum', 0)
+    projection = await get_finance_projection(conn, 'faction', faction_id, guild_id)
 
     # Calculate net resources
-    total_production = territory_production.add(building_production).add(incoming_transfers)
-    total_expenses = unit_upkeep.add(building_upkeep).add(spending_targets).add(outgoing_transfers)
+    total_production = (projection['territory_production']
+                        .add(projection['building_production'])
+                        .add(projection['incoming_transfers']))
+    total_expenses = (projection['unit_upkeep']
+                      .add(projection['building_upkeep'])
+                      .add(spending_targets)
+                      .add(projection['outgoing_transfers']))
     net_resources = total_production.subtract(total_expenses)
 
     return True, "", {
         'faction': faction,
         'current_resources': current_resources,
-        'territory_production': territory_production,
-        'building_production': building_production,
-        'territory_count': len(territories),
-        'unit_upkeep': unit_upkeep,
-        'unit_count': len(active_units),
-        'building_upkeep': building_upkeep,
-        'building_count': building_count,
+        'territory_production': projection['territory_production'],
+        'building_production': projection['building_production'],
+        'territory_count': projection['territory_count'],
+        'unit_upkeep': projection['unit_upkeep'],
+        'unit_count': projection['unit_count'],
+        'building_upkeep': projection['building_upkeep'],
+        'building_count': projection['building_count'],
         'spending_targets': spending_targets,
-        'outgoing_transfers': outgoing_transfers,
-        'outgoing_transfer_count': len(outgoing_transfer_orders),
-        'incoming_transfers': incoming_transfers,
-        'incoming_transfer_count': len(incoming_transfer_orders),
-        'net_resources': net_resources
+        'outgoing_transfers': projection['outgoing_transfers'],
+        'outgoing_transfer_count': projection['outgoing_transfer_count'],
+        'incoming_transfers': projection['incoming_transfers'],
+        'incoming_transfer_count': projection['incoming_transfer_count'],
+        'net_resources': net_resources,
+        'last_turn': projection['last_turn']
     }
 
 
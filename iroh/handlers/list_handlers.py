@@ -3,64 +3,88 @@ List command handlers for viewing all entities.
 """
 import asyncpg
 from typing import Tuple, List, Optional
-from db import Faction, FactionMember, Territory, UnitType, BuildingType, Unit, Character
+from db import Faction, Territory, UnitType, BuildingType, Unit
 
 
-async def list_factions(conn: asyncpg.Connection, guild_id: int) -> Tuple[bool, str, Optional[List[dict]]]:
+def _page_message(noun: str, offset: int, shown: int, total: int, limit: Optional[int]) -> str:
+    """
+    Describe the page shown, or "" when the whole list is returned.
+    """
+    if limit is None:
+        return ""
+    return f"Showing {noun} {offset + 1}-{offset + shown} of {total}"
+
+
+async def list_factions(
+    conn: asyncpg.Connection,
+    guild_id: int,
+    offset: int = 0,
+    limit: Optional[int] = None
+) -> Tuple[bool, str, Optional[List[dict]]]:
     """
     List all factions with member counts.
 
+    Args:
+        conn: Database connection
+        guild_id: Guild ID
+        offset: Number of factions to skip
+        limit: Maximum number of factions to return, or None for all
+
     Returns:
         (success, message, data) where data is list of dicts with:
         - faction: Faction object
         - member_count: Number of members
+        message describes the page when limit is given
     """
-    factions = await Faction.fetch_all(conn, guild_id)
+    rows, total = await Faction.fetch_page_with_member_counts(conn, guild_id, limit, offset)
 
-    if not factions:
+    if not rows:
+        if offset > 0:
+            return False, "There are no factions on that page.", None
         return False, "No factions found. Use `/create-test-config` to set up a test configuration.", None
 
-    faction_list = []
-    for faction in factions:
-        # Get member count
-        members = await FactionMember.fetch_by_faction(conn, faction.id, guild_id)
-        faction_list.append({
-            'faction': faction,
-            'member_count': len(members)
-        })
+    faction_list = [
+        {'faction': faction, 'member_count': member_count}
+        for faction, member_count in rows
+    ]
 
-    return True, "", faction_list
+    return True, _page_message("factions", offset, len(faction_list), total, limit), faction_list
 
 
-async def list_territories(conn: asyncpg.Connection, guild_id: int) -> Tuple[bool, str, Optional[List[dict]]]:
+async def list_territories(
+    conn: asyncpg.Connection,
+    guild_id: int,
+    offset: int = 0,
+    limit: Optional[int] = None
+) -> Tuple[bool, str, Optional[List[dict]]]:
     """
     List all territories with controllers.
 
+    Args:
+        conn: Database connection
+        guild_id: Guild ID
+        offset: Number of territories to skip
+        limit: Maximum number of territories to return, or None for all
+
     Returns:
         (success, message, data) where data is list of dicts with:
         - territory: Territory object
         - controller_name: Name of controlling character (or "Uncontrolled")
+        message describes the page when limit is given
     """
-    territories = await Territory.fetch_all(conn, guild_id)
+    rows, total = await Territory.fetch_page_with_controller_names(conn, guild_id, limit, offset)
 
-    if not territories:
+    if not rows:
+        if offset > 0:
+            return False, "There are no territories on that page.", None
         return False, "No territories found. Use `/create-test-config` to set up a test configuration.", None
 
-    territory_list = []
-    for territory in territories:
-        # Get controller character name
-        controller_name = "Uncontrolled"
-        if territory.controller_character_id:
-            character = await Character.fetch_by_id(conn, territory.controller_character_id)
-            if character:
-                controller_name = character.name
-
-        territory_list.append({
-            'territory': territory,
-            'controller_name': controller_name
-        })
+    territory_list = [
+        {'territory': territory, 'controller_name': controller_name or "Uncontrolled"}
+        for territory, controller_name in rows
+    ]
 
-    return True, "", territory_list
+    return True, _page_message("territories", offset, len(territory_list), total, limit), territory_list
 
 
 async def list_unit_types(conn: asyncpg.Connection, guild_id: int) -> Tuple[bool, str, Optional[List[UnitType]]]:
@@ -93,38 +117,42 @@ async def list_building_types(conn: asyncpg.Connection, guild_id: int) -> Tuple[
     return True, "", building_types
 
 
-async def list_units(conn: asyncpg.Connection, guild_id: int) -> Tuple[bool, str, Optional[List[dict]]]:
+async def list_units(
+    conn: asyncpg.Connection,
+    guild_id: int,
+    offset: int = 0,
+    limit: Optional[int] = None
+) -> Tuple[bool, str, Optional[List[dict]]]:
     """
     List all units with details.
 
+    Args:
+        conn: Database connection
+        guild_id: Guild ID
+        offset: Number of units to skip
+        limit: Maximum number of units to return, or None for all
+
     Returns:
         (success, message, data) where data is list of dicts with:
         - unit: Unit object
         - owner_name: Name of owner character
         - faction_name: Name of faction (or "No faction")
+        message describes the page when limit is given
     """
-    units = await Unit.fetch_all(conn, guild_id)
+    rows, total = await Unit.fetch_page_with_names(conn, guild_id, limit, offset)
 
-    if not units:
+    if not rows:
+        if offset > 0:
+            return False, "There are no units on that page.", None
         return False, "No units found.", None
 
-    unit_list = []
-    for unit in units:
-        # Get owner name
-        owner = await Character.fetch_by_id(conn, unit.owner_character_id)
-        owner_name = owner.name if owner else "Unknown"
-
-        # Get faction name
-        faction_name = "No faction"
-        if unit.faction_id:
-            faction = await Faction.fetch_by_id(conn, unit.faction_id)
-            if faction:
-                faction_name = faction.name
-
-        unit_list.append({
+    unit_list = [
+        {
             'unit': unit,
-            'owner_name': owner_name,
-            'faction_name': faction_name
-        })
+            'owner_name': owner_name or "Unknown",
+            'faction_name': faction_name or "No faction"
+        }
+        for unit, owner_name, faction_name in rows
+    ]
 
-    return True, "", unit_list
+    return True, _page_message("units", offset, len(unit_list), total, limit), unit_list
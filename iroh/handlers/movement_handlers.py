@@ -10,10 +10,12 @@ from datetime import datetime
 import logging
 from collections import defaultdict
 
-from db import Order, Unit, Territory, TurnLog, FactionPermission, Character, Alliance, WarParticipant, TerritoryAdjacency, Faction, NavalUnitPosition
+from db import Order, Unit, Territory, TurnLog, FactionPermission, Alliance, WarParticipant, TerritoryAdjacency, Faction, NavalUnitPosition, TerritoryGraph, territory_graphs
 from order_types import OrderType, OrderStatus, TurnPhase
 from orders.movement_state import MovementUnitState, MovementStatus, MovementAction
 from handlers.encirclement_handlers import is_unit_exempt_from_engagement
+from handlers.turn_context import TurnContext, fetch_character, fetch_permission_holders
+from handlers.naval_occupancy import NavalOccupancyIndex
 
 # Import is deferred to avoid circular imports - loaded when needed
 # from handlers.naval_movement_handlers import update_naval_transport_cargo
@@ -29,6 +31,9 @@ TERRAIN_COSTS = {
 }
 DEFAULT_TERRAIN_COST = 1
 
+# Terrain cost table per guild, with the territory graph it was built from
+_terrain_cost_tables: Dict[int, Tuple[TerritoryGraph, Dict[str, int]]] = {}
+
 
 async def get_terrain_cost(conn: asyncpg.Connection, territory_id: str, guild_id: int) -> int:
     """
@@ -42,13 +47,37 @@ async def get_terrain_cost(conn: asyncpg.Connection, territory_id: str, guild_id
     Returns:
         Movement point cost (mountains=3, desert=2, default=1)
     """
-    territory = await Territory.fetch_by_territory_id(conn, territory_id, guild_id)
-    if not territory:
+    terrain_costs = await terrain_cost_table(conn, guild_id)
+    if territory_id not in terrain_costs:
         logger.warning(f"Territory {territory_id} not found, using default cost")
         return DEFAULT_TERRAIN_COST
 
-    terrain_type = territory.terrain_type.lower()
-    return TERRAIN_COSTS.get(terrain_type, DEFAULT_TERRAIN_COST)
+    return terrain_costs[territory_id]
+
+
+async def terrain_cost_table(conn: asyncpg.Connection, guild_id: int) -> Dict[str, int]:
+    """
+    Movement cost of entering each territory of a guild, by territory ID.
+
+    Built from the cached territory graph and rebuilt only when a territory edit
+    has made the graph reload, so the movement phase reads costs without I/O.
+    """
+    graph = await territory_graphs.get(conn, guild_id)
+    cached = _terrain_cost_tables.get(guild_id)
+    if cached is None or cached[0] is not graph:
+        cached = (graph, {
+            territory_id: terrain_type_cost(terrain_type)
+            for territory_id, terrain_type in graph.terrain_types.items()
+        })
+        _terrain_cost_tables[guild_id] = cached
+    return cached[1]
+
+
+def terrain_type_cost(terrain_type: str) -> int:
+    """
+    Movement point cost for entering a territory of the given terrain type.
+    """
+    return TERRAIN_COSTS.get(terrain_type.lower(), DEFAULT_TERRAIN_COST)
 
 
 def calculate_movement_points(units: List[Unit], action: str) -> int:
@@ -132,7 +161,7 @@ async def get_affected_character_ids(conn: asyncpg.Connection, units: List[Unit]
         elif owner_type == 'faction':
             # Add all characters with COMMAND permission for this faction
             if unit.owner_faction_id:
-                command_holders = await FactionPermission.fetch_characters_with_permission(
+                command_holders = await fetch_permission_holders(
                     conn, unit.owner_faction_id, "COMMAND", guild_id
                 )
                 affected_ids.update(command_holders)
@@ -175,7 +204,7 @@ async def get_unit_group_faction_id(
 
     if unit.owner_character_id is not None:
         # Character-owned unit: look up the character's represented faction
-        character = await Character.fetch_by_id(conn, unit.owner_character_id)
+        character = await fetch_character(conn, unit.owner_character_id)
         if character:
             logger.debug(f"get_unit_group_faction_id: character {character.identifier} "
                         f"represented_faction_id={character.represented_faction_id}")
@@ -570,7 +599,8 @@ async def build_movement_states(
 async def try_move_unit_group(
     conn: asyncpg.Connection,
     state: MovementUnitState,
-    guild_id: int
+    guild_id: int,
+    terrain_costs: Optional[Dict[str, int]] = None
 ) -> Tuple[bool, Optional[int]]:
     """
     Attempt to move a unit group one step along its path.
@@ -579,6 +609,7 @@ async def try_move_unit_group(
         conn: Database connection
         state: MovementUnitState to update
         guild_id: Guild ID
+        terrain_costs: The guild's terrain_cost_table, if already loaded
 
     Returns:
         (moved, terrain_cost) - whether move succeeded and the cost if applicable
@@ -609,6 +640,8 @@ async def try_move_unit_group(
     # Get terrain cost (infiltrator/aerial units always pay 1)
     if unit_group_ignores_terrain_cost(state.units):
         terrain_cost = DEFAULT_TERRAIN_COST
+    elif terrain_costs is not None:
+        terrain_cost = terrain_costs.get(next_territory, DEFAULT_TERRAIN_COST)
     else:
         terrain_cost = await get_terrain_cost(conn, next_territory, guild_id)
 
@@ -644,7 +677,8 @@ async def process_movement_tick(
     conn: asyncpg.Connection,
     states: List[MovementUnitState],
     tick: int,
-    guild_id: int
+    guild_id: int,
+    terrain_costs: Optional[Dict[str, int]] = None
 ) -> List[TurnLog]:
     """
     Process one tick of movement for all states.
@@ -654,11 +688,14 @@ async def process_movement_tick(
         states: List of MovementUnitState objects
         tick: Current tick number (counting down from max)
         guild_id: Guild ID
+        terrain_costs: The guild's terrain_cost_table; loaded here if not given
 
     Returns:
         List of events generated during this tick
     """
     events = []
+    if terrain_costs is None:
+        terrain_costs = await terrain_cost_table(conn, guild_id)
 
     for state in states:
         # Skip if not moving
@@ -674,7 +711,7 @@ async def process_movement_tick(
             continue
 
         # Try to move
-        moved, terrain_cost = await try_move_unit_group(conn, state, guild_id)
+        moved, terrain_cost = await try_move_unit_group(conn, state, guild_id, terrain_costs)
 
         # If blocked by terrain cost, generate event
         if not moved and state.status == MovementStatus.OUT_OF_MP and state.blocked_at:
@@ -880,7 +917,8 @@ async def process_patrol_engagement(
     conn: asyncpg.Connection,
     states: List[MovementUnitState],
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    terrain_costs: Optional[Dict[str, int]] = None
 ) -> List[TurnLog]:
     """
     Process patrol engagement opportunities.
@@ -900,11 +938,14 @@ async def process_patrol_engagement(
         states: List of MovementUnitState objects
         guild_id: Guild ID
         turn_number: Current turn number
+        terrain_costs: The guild's terrain_cost_table; loaded here if not given
 
     Returns:
         List of TurnLog events for patrol engagements
     """
     events: List[TurnLog] = []
+    if terrain_costs is None:
+        terrain_costs = await terrain_cost_table(conn, guild_id)
 
     # 1. Filter to patrol states that are still MOVING
     patrol_states = [s for s in states
@@ -947,7 +988,7 @@ async def process_patrol_engagement(
             if unit_group_ignores_terrain_cost(patrol_state.units):
                 terrain_cost = DEFAULT_TERRAIN_COST
             else:
-                terrain_cost = await get_terrain_cost(conn, territory_id, guild_id)
+                terrain_cost = terrain_costs.get(territory_id, DEFAULT_TERRAIN_COST)
             if terrain_cost <= patrol_state.remaining_mp:
                 reachable.append((territory_id, terrain_cost))
 
@@ -1348,7 +1389,7 @@ async def get_observation_recipients(
         return recipients
     elif observer.owner_faction_id is not None:
         # Faction-owned unit
-        return await FactionPermission.fetch_characters_with_permission(
+        return await fetch_permission_holders(
             conn, observer.owner_faction_id, "COMMAND", guild_id
         )
     return []
@@ -1360,7 +1401,8 @@ async def generate_observation_reports(
     guild_id: int,
     turn_number: int,
     tick: Optional[int] = None,
-    observation_tracker: Optional[Dict[Tuple[int, int], int]] = None
+    observation_tracker: Optional[Dict[Tuple[int, int], int]] = None,
+    turn_context: Optional[TurnContext] = None
 ) -> Tuple[List[TurnLog], Dict[Tuple[int, int], int]]:
     """
     Generate observation events for all units seeing other units.
@@ -1379,12 +1421,14 @@ async def generate_observation_reports(
         turn_number: Current turn number
         tick: Current tick number (for deduplication tracking)
         observation_tracker: Dict tracking (recipient_char_id, observed_unit_id) -> tick
+        turn_context: Optional turn context giving the submarines that engaged in combat
 
     Returns:
         (events, updated_tracker): Tuple of events and updated tracker dict
     """
     if observation_tracker is None:
         observation_tracker = {}
+    submarines_in_combat = turn_context.submarines_in_combat if turn_context is not None else set()
 
     events: List[TurnLog] = []
 
@@ -1451,10 +1495,8 @@ async def generate_observation_reports(
                         # Submarines can't see other submarines (like infiltrators)
                         if unit_has_keyword(observer, 'submarine'):
                             continue
-                        # Non-submarines only see submarines if they engaged in combat this turn
-                        # Use deferred import to avoid circular imports
-                        from handlers.naval_combat_handlers import is_submarine_in_combat_this_turn
-                        if not is_submarine_in_combat_this_turn(observed.id):
+                        # Non-submarines only see submarines if they engaged in combat
+                        if observed.id not in submarines_in_combat:
                             continue
 
                     # Get observed unit's faction info
@@ -1502,6 +1544,7 @@ async def generate_aerial_scout_observations(
     states: List[MovementUnitState],
     guild_id: int,
     turn_number: int,
+    turn_context: Optional[TurnContext] = None
 ) -> List[TurnLog]:
     """
     Generate observation events for aerial scout units.
@@ -1514,11 +1557,13 @@ async def generate_aerial_scout_observations(
         states: List of MovementUnitState objects
         guild_id: Guild ID
         turn_number: Current turn number
+        turn_context: Optional turn context giving the submarines that engaged in combat
 
     Returns:
         List of TurnLog observation events
     """
     events: List[TurnLog] = []
+    submarines_in_combat = turn_context.submarines_in_combat if turn_context is not None else set()
 
     # Filter to aerial scout states only
     scout_states = [s for s in states if s.is_aerial_scout()]
@@ -1547,8 +1592,7 @@ async def generate_aerial_scout_observations(
                         # Skip submarines (invisible unless in combat)
                         if unit_has_keyword(observed, 'submarine'):
                             # Aerial scouts can only see submarines in combat
-                            from handlers.naval_combat_handlers import is_submarine_in_combat_this_turn
-                            if not is_submarine_in_combat_this_turn(observed.id):
+                            if observed.id not in submarines_in_combat:
                                 continue
                         # Skip self
                         if any(observed.id == u.id for u in state.units):
@@ -1719,7 +1763,8 @@ async def is_water_territory(
 async def get_naval_transport_capacity(
     conn: asyncpg.Connection,
     order: Order,
-    guild_id: int
+    guild_id: int,
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> int:
     """
     Get total capacity of naval units in a naval_transport order.
@@ -1728,13 +1773,17 @@ async def get_naval_transport_capacity(
         conn: Database connection
         order: The naval transport order
         guild_id: Guild ID
+        occupancy: Optional naval occupancy index to read units from
 
     Returns:
         Total capacity (sum of all naval unit capacities)
     """
     total_capacity = 0
     for unit_id in order.unit_ids:
-        unit = await Unit.fetch_by_id(conn, unit_id)
+        if occupancy is not None:
+            unit = occupancy.unit(unit_id)
+        else:
+            unit = await Unit.fetch_by_id(conn, unit_id)
         if unit and unit.is_naval and unit.status == 'ACTIVE':
             # Capacity is stored on the unit (default to 0 if not set)
             total_capacity += getattr(unit, 'capacity', 0) or 0
@@ -1788,7 +1837,8 @@ async def find_matching_naval_transport(
     conn: asyncpg.Connection,
     land_state: MovementUnitState,
     naval_states: List[MovementUnitState],
-    guild_id: int
+    guild_id: int,
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> Optional[MovementUnitState]:
     """
     Find a naval transport order that matches a land unit's transport requirements.
@@ -1804,6 +1854,7 @@ async def find_matching_naval_transport(
         land_state: The land transport MovementUnitState
         naval_states: List of naval_transport MovementUnitStates to check
         guild_id: Guild ID
+        occupancy: Optional naval occupancy index to read naval units from
 
     Returns:
         Matching naval MovementUnitState, or None if no match found
@@ -1836,7 +1887,7 @@ async def find_matching_naval_transport(
             continue
 
         # Check capacity
-        naval_capacity = await get_naval_transport_capacity(conn, naval_state.order, guild_id)
+        naval_capacity = await get_naval_transport_capacity(conn, naval_state.order, guild_id, occupancy)
         if naval_capacity < land_size:
             logger.debug(f"find_matching_naval_transport: naval {naval_state.order.order_id} insufficient capacity: "
                          f"{naval_capacity} < {land_size}")
@@ -1959,7 +2010,8 @@ async def process_transport_boarding(
     land_states: List[MovementUnitState],
     naval_states: List[MovementUnitState],
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> List[TurnLog]:
     """
     Process boarding for land units at their coast territory.
@@ -1975,6 +2027,7 @@ async def process_transport_boarding(
         naval_states: List of naval_transport MovementUnitStates
         guild_id: Guild ID
         turn_number: Current turn number
+        occupancy: Optional naval occupancy index to read naval units from
 
     Returns:
         List of TurnLog events for boarding attempts
@@ -2033,7 +2086,7 @@ async def process_transport_boarding(
             continue
 
         # Find matching naval transport
-        naval_state = await find_matching_naval_transport(conn, land_state, naval_states, guild_id)
+        naval_state = await find_matching_naval_transport(conn, land_state, naval_states, guild_id, occupancy)
 
         if not naval_state:
             # No match found - wait
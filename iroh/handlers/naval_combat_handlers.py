@@ -15,7 +15,7 @@ from dataclasses import dataclass, field
 from collections import defaultdict
 import logging
 
-from db import Unit, TurnLog, Faction, FactionPermission, Order, NavalUnitPosition
+from db import Unit, TurnLog, Faction, Order, NavalUnitPosition
 from order_types import OrderStatus, TurnPhase
 from handlers.movement_handlers import (
     are_factions_at_war,
@@ -23,28 +23,11 @@ from handlers.movement_handlers import (
     unit_has_keyword,
 )
 from handlers.combat_handlers import get_unit_faction_id
+from handlers.turn_context import TurnContext, fetch_permission_holders
+from handlers.naval_occupancy import NavalOccupancyIndex
 
 logger = logging.getLogger(__name__)
 
-# Track which submarines engaged in combat this turn (for observation visibility)
-_submarines_in_combat_this_turn: Set[int] = set()
-
-
-def mark_submarine_in_combat(unit_id: int) -> None:
-    """Mark a submarine as having engaged in combat this turn."""
-    _submarines_in_combat_this_turn.add(unit_id)
-
-
-def is_submarine_in_combat_this_turn(unit_id: int) -> bool:
-    """Check if a submarine engaged in combat this turn."""
-    return unit_id in _submarines_in_combat_this_turn
-
-
-def clear_submarine_combat_tracking() -> None:
-    """Clear the submarine combat tracking for a new turn."""
-    _submarines_in_combat_this_turn.clear()
-
-
 @dataclass
 class NavalCombatSide:
     """Represents one side in naval combat (can be multiple allied factions)."""
@@ -56,7 +39,8 @@ class NavalCombatSide:
 
 async def find_naval_patrol_units(
     conn: asyncpg.Connection,
-    guild_id: int
+    guild_id: int,
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> List[Unit]:
     """
     Find all active naval units with active patrol orders.
@@ -64,6 +48,7 @@ async def find_naval_patrol_units(
     Args:
         conn: Database connection
         guild_id: Guild ID
+        occupancy: Optional naval occupancy index to read units from
 
     Returns:
         List of naval units with patrol orders
@@ -80,7 +65,10 @@ async def find_naval_patrol_units(
 
     patrol_units = []
     for row in rows:
-        unit = await Unit.fetch_by_id(conn, row['unit_id'])
+        if occupancy is not None:
+            unit = occupancy.active_unit(row['unit_id'])
+        else:
+            unit = await Unit.fetch_by_id(conn, row['unit_id'])
         if unit and unit.is_naval and unit.status == 'ACTIVE':
             patrol_units.append(unit)
 
@@ -91,7 +79,8 @@ async def find_naval_patrol_units(
 async def get_naval_unit_occupied_territories(
     conn: asyncpg.Connection,
     unit_id: int,
-    guild_id: int
+    guild_id: int,
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> List[str]:
     """
     Get territories a naval unit occupies from NavalUnitPosition table.
@@ -100,17 +89,21 @@ async def get_naval_unit_occupied_territories(
         conn: Database connection
         unit_id: Unit's internal ID
         guild_id: Guild ID
+        occupancy: Optional naval occupancy index to read the window from
 
     Returns:
         List of territory_ids the unit occupies
     """
+    if occupancy is not None:
+        return occupancy.window(unit_id)
     return await NavalUnitPosition.fetch_territories_by_unit(conn, unit_id, guild_id)
 
 
 async def get_all_naval_units_in_territory(
     conn: asyncpg.Connection,
     territory_id: str,
-    guild_id: int
+    guild_id: int,
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> List[Unit]:
     """
     Get ALL naval units that occupy a given territory.
@@ -121,10 +114,13 @@ async def get_all_naval_units_in_territory(
         conn: Database connection
         territory_id: Territory ID to check
         guild_id: Guild ID
+        occupancy: Optional naval occupancy index to read occupants from
 
     Returns:
         List of active naval Unit objects occupying this territory
     """
+    if occupancy is not None:
+        return occupancy.active_units_in(territory_id)
     unit_ids = await NavalUnitPosition.fetch_units_in_territory(conn, territory_id, guild_id)
     units = []
     for unit_id in unit_ids:
@@ -137,7 +133,8 @@ async def get_all_naval_units_in_territory(
 async def find_combat_territories_for_patrol(
     conn: asyncpg.Connection,
     patrol_unit: Unit,
-    guild_id: int
+    guild_id: int,
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> List[str]:
     """
     Find territories where patrol unit triggers combat (has hostile units present).
@@ -148,17 +145,18 @@ async def find_combat_territories_for_patrol(
         conn: Database connection
         patrol_unit: The patrolling naval unit
         guild_id: Guild ID
+        occupancy: Optional naval occupancy index to read positions from
 
     Returns:
         List of territory_ids where combat will occur
     """
     patrol_faction_id = await get_unit_faction_id(conn, patrol_unit, guild_id)
-    patrol_territories = await get_naval_unit_occupied_territories(conn, patrol_unit.id, guild_id)
+    patrol_territories = await get_naval_unit_occupied_territories(conn, patrol_unit.id, guild_id, occupancy)
 
     combat_territories = []
     for territory_id in patrol_territories:
         # Get all naval units in this territory
-        units_in_territory = await get_all_naval_units_in_territory(conn, territory_id, guild_id)
+        units_in_territory = await get_all_naval_units_in_territory(conn, territory_id, guild_id, occupancy)
 
         # Check if any unit is hostile
         for other_unit in units_in_territory:
@@ -285,7 +283,8 @@ def should_submarine_engage(
 
 def filter_submarines_from_combat(
     sides: List[NavalCombatSide],
-    hostile_pairs: List[Tuple[int, int]]
+    hostile_pairs: List[Tuple[int, int]],
+    turn_context: Optional[TurnContext] = None
 ) -> List[NavalCombatSide]:
     """
     Filter out submarines that won't engage from combat sides.
@@ -296,6 +295,7 @@ def filter_submarines_from_combat(
     Args:
         sides: List of NavalCombatSide objects
         hostile_pairs: List of hostile (side_index, side_index) pairs
+        turn_context: Optional turn context; engaging submarines are recorded on it
 
     Returns:
         Modified list of NavalCombatSide objects with non-engaging submarines removed
@@ -311,14 +311,15 @@ def filter_submarines_from_combat(
             if unit_has_keyword(unit, 'submarine') and unit.status == 'ACTIVE':
                 if should_submarine_engage(unit, side_a, side_b):
                     engaging_submarines.add(unit.id)
-                    mark_submarine_in_combat(unit.id)
 
         # Check submarines in side_b
         for unit in side_b.units:
             if unit_has_keyword(unit, 'submarine') and unit.status == 'ACTIVE':
                 if should_submarine_engage(unit, side_b, side_a):
                     engaging_submarines.add(unit.id)
-                    mark_submarine_in_combat(unit.id)
+
+    if turn_context is not None:
+        turn_context.submarines_in_combat.update(engaging_submarines)
 
     # Create new sides with non-engaging submarines filtered out
     filtered_sides = []
@@ -407,7 +408,7 @@ async def get_affected_character_ids_for_naval_units(
         # Add faction members with COMMAND permission
         faction_id = await get_unit_faction_id(conn, unit, guild_id)
         if faction_id is not None:
-            command_holders = await FactionPermission.fetch_characters_with_permission(
+            command_holders = await fetch_permission_holders(
                 conn, faction_id, "COMMAND", guild_id
             )
             affected_ids.update(command_holders)
@@ -417,7 +418,8 @@ async def get_affected_character_ids_for_naval_units(
 
 async def find_all_naval_combat_territories(
     conn: asyncpg.Connection,
-    guild_id: int
+    guild_id: int,
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> Set[str]:
     """
     Find all territories where naval combat will occur.
@@ -429,6 +431,7 @@ async def find_all_naval_combat_territories(
     Args:
         conn: Database connection
         guild_id: Guild ID
+        occupancy: Optional naval occupancy index to read positions and units from
 
     Returns:
         Set of territory IDs where combat will occur
@@ -436,11 +439,11 @@ async def find_all_naval_combat_territories(
     all_combat_territories: Set[str] = set()
 
     # Find all patrol units
-    patrol_units = await find_naval_patrol_units(conn, guild_id)
+    patrol_units = await find_naval_patrol_units(conn, guild_id, occupancy)
 
     # For each patrol unit, find territories where they trigger combat
     for patrol_unit in patrol_units:
-        combat_territories = await find_combat_territories_for_patrol(conn, patrol_unit, guild_id)
+        combat_territories = await find_combat_territories_for_patrol(conn, patrol_unit, guild_id, occupancy)
         all_combat_territories.update(combat_territories)
 
     return all_combat_territories
@@ -450,7 +453,9 @@ async def resolve_naval_combat_in_territory(
     conn: asyncpg.Connection,
     territory_id: str,
     guild_id: int,
-    damage_accumulator: Dict[int, int]
+    damage_accumulator: Dict[int, int],
+    turn_context: Optional[TurnContext] = None,
+    occupancy: Optional[NavalOccupancyIndex] = None
 ) -> List[TurnLog]:
     """
     Calculate naval combat damage for a single territory.
@@ -463,6 +468,8 @@ async def resolve_naval_combat_in_territory(
         territory_id: Territory where combat occurs
         guild_id: Guild ID
         damage_accumulator: Dict to accumulate damage per unit_id
+        turn_context: Optional turn context; engaging submarines are recorded on it
+        occupancy: Optional naval occupancy index to read occupants from
 
     Returns:
         List of TurnLog events for this combat
@@ -470,7 +477,7 @@ async def resolve_naval_combat_in_territory(
     events: List[TurnLog] = []
 
     # Get all naval units in this territory
-    all_units = await get_all_naval_units_in_territory(conn, territory_id, guild_id)
+    all_units = await get_all_naval_units_in_territory(conn, territory_id, guild_id, occupancy)
 
     if len(all_units) < 2:
         return events
@@ -525,7 +532,7 @@ async def resolve_naval_combat_in_territory(
 
     # Filter submarines that won't engage (submarines only engage if they would deal damage)
     # This also marks engaging submarines for observation visibility
-    filtered_sides = filter_submarines_from_combat(sides, hostile_pairs)
+    filtered_sides = filter_submarines_from_combat(sides, hostile_pairs, turn_context)
 
     # Generate NAVAL_COMBAT_STARTED event (using original sides for reporting)
     all_participating_units = []
@@ -730,7 +737,8 @@ async def handle_transport_destruction(
 async def execute_naval_combat_phase(
     conn: asyncpg.Connection,
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    turn_context: Optional[TurnContext] = None
 ) -> List[TurnLog]:
     """
     Execute naval combat for all patrolling units.
@@ -749,6 +757,7 @@ async def execute_naval_combat_phase(
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
+        turn_context: Optional turn context; engaging submarines are recorded on it
 
     Returns:
         List of TurnLog events for all naval combat
@@ -756,11 +765,17 @@ async def execute_naval_combat_phase(
     events: List[TurnLog] = []
     logger.info(f"Naval combat phase: starting for guild {guild_id}, turn {turn_number}")
 
-    # Clear submarine combat tracking from previous turn
-    clear_submarine_combat_tracking()
+    # Submarines seen in the previous turn's combat are no longer revealed
+    if turn_context is not None:
+        turn_context.submarines_in_combat.clear()
+
+    # Positions are settled after naval movement; read them from one index for the whole phase
+    occupancy = turn_context.naval_occupancy if turn_context is not None else None
+    if occupancy is None:
+        occupancy = await NavalOccupancyIndex.build(conn, guild_id)
 
     # Find all territories where naval combat will occur
-    combat_territories = await find_all_naval_combat_territories(conn, guild_id)
+    combat_territories = await find_all_naval_combat_territories(conn, guild_id, occupancy)
 
     if not combat_territories:
         logger.info(f"Naval combat phase: no combat territories found for guild {guild_id}")
@@ -774,7 +789,7 @@ async def execute_naval_combat_phase(
     # Phase 1: Calculate damage for all combats
     for territory_id in combat_territories:
         combat_events = await resolve_naval_combat_in_territory(
-            conn, territory_id, guild_id, damage_accumulator
+            conn, territory_id, guild_id, damage_accumulator, turn_context, occupancy
         )
         # Set turn_number for events
         for event in combat_events:
@@ -785,7 +800,8 @@ async def execute_naval_combat_phase(
     units_to_check_for_transport: List[Unit] = []
 
     for unit_id, total_damage in damage_accumulator.items():
-        unit = await Unit.fetch_by_id(conn, unit_id)
+        # The index's copy is updated in place so the ended events below see the damage
+        unit = occupancy.unit(unit_id)
         if not unit or unit.status != 'ACTIVE':
             continue
 
@@ -839,7 +855,7 @@ async def execute_naval_combat_phase(
 
     # Phase 4: Generate NAVAL_COMBAT_ENDED events for each territory
     for territory_id in combat_territories:
-        all_units = await get_all_naval_units_in_territory(conn, territory_id, guild_id)
+        all_units = await get_all_naval_units_in_territory(conn, territory_id, guild_id, occupancy)
         surviving_units = [u for u in all_units if u.organization > 0]
 
         affected_ids = await get_affected_character_ids_for_naval_units(conn, all_units, guild_id)
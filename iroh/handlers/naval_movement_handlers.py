@@ -14,10 +14,10 @@ from datetime import datetime
 import logging
 
 from db import (
-    Order, Unit, Territory, TurnLog, NavalUnitPosition,
-    FactionPermission, TerritoryAdjacency
+    Order, Unit, TurnLog, NavalUnitPosition, territory_graphs
 )
 from order_types import OrderType, OrderStatus, TurnPhase
+from handlers.turn_context import fetch_permission_holders
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +34,10 @@ async def is_water_territory(
     guild_id: int
 ) -> bool:
     """Check if a territory is a water territory."""
-    territory = await Territory.fetch_by_territory_id(conn, territory_id, guild_id)
-    if not territory:
+    terrain_type = (await territory_graphs.get(conn, guild_id)).terrain_type(territory_id)
+    if terrain_type is None:
         return False
-    return territory.terrain_type.lower() in WATER_TERRAIN_TYPES
+    return terrain_type.lower() in WATER_TERRAIN_TYPES
 
 
 async def is_land_territory(
@@ -46,10 +46,10 @@ async def is_land_territory(
     guild_id: int
 ) -> bool:
     """Check if a territory is a land territory."""
-    territory = await Territory.fetch_by_territory_id(conn, territory_id, guild_id)
-    if not territory:
+    terrain_type = (await territory_graphs.get(conn, guild_id)).terrain_type(territory_id)
+    if terrain_type is None:
         return False
-    return territory.terrain_type.lower() not in WATER_TERRAIN_TYPES
+    return terrain_type.lower() not in WATER_TERRAIN_TYPES
 
 
 async def get_affected_character_ids(
@@ -76,7 +76,7 @@ async def get_affected_character_ids(
 
         elif owner_type == 'faction':
             if unit.owner_faction_id:
-                command_holders = await FactionPermission.fetch_characters_with_permission(
+                command_holders = await fetch_permission_holders(
                     conn, unit.owner_faction_id, "COMMAND", guild_id
                 )
                 affected_ids.update(command_holders)
@@ -250,9 +250,9 @@ async def validate_transport_coastal(
     Returns:
         (valid, error_message)
     """
-    adjacent = await TerritoryAdjacency.fetch_adjacent(conn, first_territory, guild_id)
+    adjacent = (await territory_graphs.get(conn, guild_id)).adjacent(first_territory)
 
-    for adj_territory_id in adjacent:
+    for adj_territory_id in sorted(adjacent):
         if await is_land_territory(conn, adj_territory_id, guild_id):
             return True, ""
 
@@ -284,12 +284,41 @@ def validate_territory_count(
     return True, ""
 
 
+async def apply_naval_window(
+    conn: asyncpg.Connection,
+    units: List[Unit],
+    occupied: List[str],
+    guild_id: int,
+    pending_windows: Optional[Dict[int, List[str]]] = None
+) -> None:
+    """
+    Move naval units onto a new window of occupied territories.
+
+    Args:
+        conn: Database connection
+        units: Naval units in the order
+        occupied: Territory IDs the units now occupy, in order
+        guild_id: Guild ID
+        pending_windows: If given, the window is recorded here for
+            NavalUnitPosition.set_windows instead of being written immediately
+    """
+    for unit in units:
+        if pending_windows is not None:
+            pending_windows[unit.id] = occupied
+        else:
+            await NavalUnitPosition.set_positions(conn, unit.id, occupied, guild_id)
+        # Update unit's current_territory_id to first territory (for backwards compatibility)
+        unit.current_territory_id = occupied[0] if occupied else unit.current_territory_id
+        await unit.upsert(conn)
+
+
 async def process_naval_convoy(
     conn: asyncpg.Connection,
     order: Order,
     units: List[Unit],
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    pending_windows: Optional[Dict[int, List[str]]] = None
 ) -> Tuple[Order, List[TurnLog]]:
     """
     Process a naval convoy order.
@@ -303,6 +332,8 @@ async def process_naval_convoy(
         units: Naval units in the order
         guild_id: Guild ID
         turn_number: Current turn number
+        pending_windows: If given, new windows are collected here for one bulk write
+            instead of being written immediately
 
     Returns:
         (updated_order, events)
@@ -315,11 +346,7 @@ async def process_naval_convoy(
     occupied = calculate_occupied_territories('naval_convoy', territory_path, window_size, 0)
 
     # Update positions for each unit
-    for unit in units:
-        await NavalUnitPosition.set_positions(conn, unit.id, occupied, guild_id)
-        # Update unit's current_territory_id to first territory (for backwards compatibility)
-        unit.current_territory_id = occupied[0] if occupied else unit.current_territory_id
-        await unit.upsert(conn)
+    await apply_naval_window(conn, units, occupied, guild_id, pending_windows)
 
     # Update order
     order.status = OrderStatus.SUCCESS.value
@@ -358,7 +385,8 @@ async def process_naval_patrol(
     order: Order,
     units: List[Unit],
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    pending_windows: Optional[Dict[int, List[str]]] = None
 ) -> Tuple[Order, List[TurnLog]]:
     """
     Process a naval patrol order.
@@ -372,6 +400,8 @@ async def process_naval_patrol(
         units: Naval units in the order
         guild_id: Guild ID
         turn_number: Current turn number
+        pending_windows: If given, new windows are collected here for one bulk write
+            instead of being written immediately
 
     Returns:
         (updated_order, events)
@@ -384,10 +414,7 @@ async def process_naval_patrol(
     occupied = calculate_occupied_territories('naval_patrol', territory_path, window_size, 0)
 
     # Update positions for each unit
-    for unit in units:
-        await NavalUnitPosition.set_positions(conn, unit.id, occupied, guild_id)
-        unit.current_territory_id = occupied[0] if occupied else unit.current_territory_id
-        await unit.upsert(conn)
+    await apply_naval_window(conn, units, occupied, guild_id, pending_windows)
 
     # Update order
     order.status = OrderStatus.SUCCESS.value
@@ -426,7 +453,8 @@ async def process_naval_transit(
     order: Order,
     units: List[Unit],
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    pending_windows: Optional[Dict[int, List[str]]] = None
 ) -> Tuple[Order, List[TurnLog]]:
     """
     Process a naval transit order.
@@ -441,6 +469,8 @@ async def process_naval_transit(
         units: Naval units in the order
         guild_id: Guild ID
         turn_number: Current turn number
+        pending_windows: If given, new windows are collected here for one bulk write
+            instead of being written immediately
 
     Returns:
         (updated_order, events)
@@ -465,10 +495,7 @@ async def process_naval_transit(
     path_complete = (window_start_index + window_size >= len(territory_path))
 
     # Update positions for each unit
-    for unit in units:
-        await NavalUnitPosition.set_positions(conn, unit.id, occupied, guild_id)
-        unit.current_territory_id = occupied[0] if occupied else unit.current_territory_id
-        await unit.upsert(conn)
+    await apply_naval_window(conn, units, occupied, guild_id, pending_windows)
 
     # Update order
     if path_complete:
@@ -516,7 +543,8 @@ async def process_naval_transport(
     order: Order,
     units: List[Unit],
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    pending_windows: Optional[Dict[int, List[str]]] = None
 ) -> Tuple[Order, List[TurnLog]]:
     """
     Process a naval transport order.
@@ -532,6 +560,8 @@ async def process_naval_transport(
         units: Naval units in the order
         guild_id: Guild ID
         turn_number: Current turn number
+        pending_windows: If given, new windows are collected here for one bulk write
+            instead of being written immediately
 
     Returns:
         (updated_order, events)
@@ -562,10 +592,7 @@ async def process_naval_transport(
                      window_start_index + window_size >= len(territory_path))
 
     # Update positions for each unit
-    for unit in units:
-        await NavalUnitPosition.set_positions(conn, unit.id, occupied, guild_id)
-        unit.current_territory_id = occupied[0] if occupied else unit.current_territory_id
-        await unit.upsert(conn)
+    await apply_naval_window(conn, units, occupied, guild_id, pending_windows)
 
     # Update order
     if path_complete:
@@ -738,6 +765,9 @@ async def execute_naval_movement_phase(
 
     logger.info(f"Naval movement phase: processing {len(naval_orders)} naval orders")
 
+    # New windows for every unit, written together once all orders are processed
+    pending_windows: Dict[int, List[str]] = {}
+
     for order in naval_orders:
         # Get units from order
         units = []
@@ -798,28 +828,30 @@ async def execute_naval_movement_phase(
 
         if action == 'naval_convoy':
             order, order_events = await process_naval_convoy(
-                conn, order, units, guild_id, turn_number
+                conn, order, units, guild_id, turn_number, pending_windows
             )
             events.extend(order_events)
 
         elif action == 'naval_patrol':
             order, order_events = await process_naval_patrol(
-                conn, order, units, guild_id, turn_number
+                conn, order, units, guild_id, turn_number, pending_windows
             )
             events.extend(order_events)
 
         elif action == 'naval_transit':
             order, order_events = await process_naval_transit(
-                conn, order, units, guild_id, turn_number
+                conn, order, units, guild_id, turn_number, pending_windows
             )
             events.extend(order_events)
 
         elif action == 'naval_transport':
             order, order_events = await process_naval_transport(
-                conn, order, units, guild_id, turn_number
+                conn, order, units, guild_id, turn_number, pending_windows
             )
             events.extend(order_events)
 
+    await NavalUnitPosition.set_windows(conn, pending_windows, guild_id)
+
     logger.info(f"Naval movement phase: finished, generated {len(events)} events")
     return events
 
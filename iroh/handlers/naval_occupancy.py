@@ -0,0 +1,92 @@
+"""
+Naval occupancy index for the wargame system.
+
+Naval units occupy a window of territories recorded in NavalUnitPosition.
+Windows only change during naval movement, so the turn resolver builds a
+NavalOccupancyIndex once afterwards and combat detection, transport matching
+and convoy traversal read from it instead of re-querying positions and units
+per unit and per territory.
+"""
+import asyncpg
+from typing import Dict, List, Optional
+import logging
+from db import NavalUnitPosition, Unit
+
+logger = logging.getLogger(__name__)
+
+
+class NavalOccupancyIndex:
+    """
+    Territory -> naval unit IDs and unit -> occupied window for a guild,
+    built from one NavalUnitPosition scan and one Unit scan.
+
+    Units handed out are shared with the index, so changes a phase saves to
+    them (such as combat damage) are seen by later lookups.
+    """
+
+    def __init__(self, positions: List[NavalUnitPosition], naval_units: List[Unit]):
+        self._units: Dict[int, Unit] = {u.id: u for u in naval_units}
+        self._windows: Dict[int, List[str]] = {}
+        self._occupants: Dict[str, List[int]] = {}
+
+        # Positions arrive ordered by unit then position_index
+        for position in positions:
+            self._windows.setdefault(position.unit_id, []).append(position.territory_id)
+            occupants = self._occupants.setdefault(position.territory_id, [])
+            if position.unit_id not in occupants:
+                occupants.append(position.unit_id)
+
+    @classmethod
+    async def build(
+        cls,
+        conn: asyncpg.Connection,
+        guild_id: int,
+        units: Optional[List[Unit]] = None
+    ) -> "NavalOccupancyIndex":
+        """
+        Build the index for a guild.
+
+        Args:
+            conn: Database connection
+            guild_id: Guild ID
+            units: The guild's units already fetched by the caller, if any
+
+        Returns:
+            The populated index
+        """
+        if units is None:
+            units = await Unit.fetch_all(conn, guild_id)
+        positions = await NavalUnitPosition.fetch_all(conn, guild_id)
+        naval_units = [u for u in units if u.is_naval]
+        index = cls(positions, naval_units)
+        logger.info(f"Naval occupancy: indexed {len(index._windows)} naval units across "
+                    f"{len(index._occupants)} territories for guild {guild_id}")
+        return index
+
+    def unit(self, unit_id: int) -> Optional[Unit]:
+        """A naval unit by internal ID, or None if it is not a naval unit of this guild."""
+        return self._units.get(unit_id)
+
+    def active_unit(self, unit_id: int) -> Optional[Unit]:
+        """A naval unit by internal ID if it is ACTIVE, otherwise None."""
+        unit = self._units.get(unit_id)
+        if unit is not None and unit.status == 'ACTIVE':
+            return unit
+        return None
+
+    def window(self, unit_id: int) -> List[str]:
+        """Territories a naval unit occupies, ordered by position_index."""
+        return list(self._windows.get(unit_id, []))
+
+    def unit_ids_in(self, territory_id: str) -> List[int]:
+        """Internal IDs of naval units whose window includes a territory."""
+        return list(self._occupants.get(territory_id, []))
+
+    def active_units_in(self, territory_id: str) -> List[Unit]:
+        """ACTIVE naval units whose window includes a territory."""
+        units = []
+        for unit_id in self._occupants.get(territory_id, []):
+            unit = self.active_unit(unit_id)
+            if unit is not None:
+                units.append(unit)
+        return units
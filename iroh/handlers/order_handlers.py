@@ -2,17 +2,24 @@
 Order management command handlers.
 """
 import asyncpg
-from typing import Tuple, List, Optional
-from db import Order, Unit, Character, Faction, FactionMember, Territory, TurnLog, Alliance, FactionPermission, UnitType, BuildingType, NavalUnitPosition
+import csv
+import io
+import re
+import yaml
+from dataclasses import dataclass, field
+from typing import Tuple, List, Optional, Dict, Set
+from db import Order, Unit, Character, Faction, FactionMember, Territory, TerritoryGraph, territory_graphs, TurnLog, Alliance, FactionPermission, UnitType, BuildingType, NavalUnitPosition
 from order_types import OrderType, ORDER_PHASE_MAP, ORDER_PRIORITY_MAP, OrderStatus, TurnPhase
 from datetime import datetime
+from handlers.finance_cache import finance_projections
 
 
 async def check_unit_order_authorization(
     conn: asyncpg.Connection,
     unit: Unit,
     character_id: int,
-    guild_id: int
+    guild_id: int,
+    command_faction_ids: Optional[Set[int]] = None
 ) -> Tuple[bool, str]:
     """
     Check if a character can issue orders for a unit.
@@ -25,6 +32,7 @@ async def check_unit_order_authorization(
         unit: The unit to check authorization for
         character_id: Internal character ID
         guild_id: Guild ID
+        command_faction_ids: Factions the character holds COMMAND permission for, if already loaded
 
     Returns:
         (authorized, error_message)
@@ -47,9 +55,12 @@ async def check_unit_order_authorization(
             return True, ""
 
         # Check if character has COMMAND permission for this faction
-        has_permission = await FactionPermission.has_permission(
-            conn, unit.owner_faction_id, character_id, "COMMAND", guild_id
-        )
+        if command_faction_ids is not None:
+            has_permission = unit.owner_faction_id in command_faction_ids
+        else:
+            has_permission = await FactionPermission.has_permission(
+                conn, unit.owner_faction_id, character_id, "COMMAND", guild_id
+            )
         if has_permission:
             return True, ""
 
@@ -506,13 +517,34 @@ async def validate_transport_path(
     if len(path) < 3:
         return False, "Transport path must have at least 3 territories (land-water-land).", None
 
+    graph = await territory_graphs.get(conn, guild_id)
+    return split_transport_path(path, graph.terrain_types)
+
+
+def split_transport_path(
+    path: List[str],
+    terrain_types: Dict[str, str]
+) -> Tuple[bool, str, Optional[dict]]:
+    """
+    Split a transport path into its coast, water and disembark parts using known terrain types.
+
+    Args:
+        path: Full path including land start/end and water portion
+        terrain_types: Terrain type by territory ID for (at least) every territory in the path
+
+    Returns:
+        (success, error_message, transport_data), as validate_transport_path
+    """
+    if len(path) < 3:
+        return False, "Transport path must have at least 3 territories (land-water-land).", None
+
     # Classify each territory as land or water
     territory_types = []
     for territory_id in path:
-        territory = await Territory.fetch_by_territory_id(conn, territory_id, guild_id)
-        if not territory:
+        terrain_type = terrain_types.get(territory_id)
+        if terrain_type is None:
             return False, f"Territory '{territory_id}' not found.", None
-        is_water = territory.terrain_type.lower() in WATER_TERRAIN_TYPES
+        is_water = terrain_type.lower() in WATER_TERRAIN_TYPES
         territory_types.append((territory_id, is_water))
 
     # Path must start with land
@@ -571,36 +603,78 @@ async def validate_transport_path(
     return True, "", transport_data
 
 
-async def submit_unit_order(
+@dataclass
+class UnitOrderPreload:
+    """
+    Everything needed to validate unit orders, loaded up front in a fixed number of queries
+    no matter how many orders, units or path hops are checked against it.
+    """
+    units: Dict[str, Unit] = field(default_factory=dict)
+    graph: TerritoryGraph = field(default_factory=TerritoryGraph)
+    command_faction_ids: Set[int] = field(default_factory=set)
+    naval_positions: Dict[int, List[str]] = field(default_factory=dict)
+    existing_orders: List[Order] = field(default_factory=list)
+
+    @classmethod
+    async def load(
+        cls,
+        conn: asyncpg.Connection,
+        guild_id: int,
+        character_id: int,
+        unit_ids: List[str]
+    ) -> "UnitOrderPreload":
+        """
+        Load the given units, the guild's territory graph (usually cached), the character's
+        COMMAND permissions, naval positions and the units' active orders.
+        """
+        units = await Unit.fetch_by_unit_ids(conn, list(set(unit_ids)), guild_id)
+        permissions = await FactionPermission.fetch_by_character(conn, character_id, guild_id)
+        unit_internal_ids = [u.id for u in units]
+
+        return cls(
+            units={u.unit_id: u for u in units},
+            graph=await territory_graphs.get(conn, guild_id),
+            command_faction_ids={p.faction_id for p in permissions if p.permission_type == "COMMAND"},
+            naval_positions=await NavalUnitPosition.fetch_territories_by_units(
+                conn, [u.id for u in units if u.is_naval], guild_id
+            ),
+            existing_orders=await Order.fetch_by_units(
+                conn, unit_internal_ids, [OrderStatus.PENDING.value, OrderStatus.ONGOING.value], guild_id
+            ) if unit_internal_ids else []
+        )
+
+    def is_water(self, territory_id: str) -> bool:
+        terrain_type = self.graph.terrain_type(territory_id)
+        return terrain_type is not None and terrain_type.lower() in WATER_TERRAIN_TYPES
+
+
+async def validate_unit_order(
     conn: asyncpg.Connection,
+    preload: UnitOrderPreload,
     unit_ids: List[str],
     action: str,
     path: List[str],
     guild_id: int,
     character_id: int,
-    speed: Optional[int] = None,
-    override: bool = False
+    speed: Optional[int] = None
 ) -> Tuple[bool, str, Optional[dict]]:
     """
-    Submit a unit order for one or more units.
+    Validate one unit order against preloaded data. Existing orders are not checked here.
 
     Args:
-        conn: Database connection
+        conn: Database connection (only used for aerial convoy enemy-territory checks)
+        preload: Data loaded for the units and path territories
         unit_ids: List of unit IDs (user-facing)
-        action: Action type (one of VALID_UNIT_ACTIONS)
+        action: Normalized action type
         path: Full path (list of territory IDs as strings)
         guild_id: Guild ID
         character_id: Character submitting the order
         speed: Speed parameter for patrol orders only
-        override: If True, override existing orders (cancel them and create new)
 
     Returns:
-        (success, message, extra_data)
-        - extra_data may contain {'confirmation_needed': True, 'existing_orders': [...]} if orders exist
+        (valid, error_message, data)
+        - data contains: units (List[Unit]), transport_data (dict or None)
     """
-    # Normalize action to lowercase
-    action = action.lower().strip()
-
     # Validate action is one of the valid types
     if action not in VALID_UNIT_ACTIONS:
         return False, f"Invalid action '{action}'. Valid actions: {', '.join(VALID_UNIT_ACTIONS)}", None
@@ -609,10 +683,10 @@ async def submit_unit_order(
     if not path or len(path) < 2:
         return False, "Path must include at least a starting and destination territory.", None
 
-    # Fetch all units
+    # Look up all units
     units = []
     for unit_id in unit_ids:
-        unit = await Unit.fetch_by_unit_id(conn, unit_id, guild_id)
+        unit = preload.units.get(unit_id)
         if not unit:
             return False, f"Unit '{unit_id}' not found.", None
         units.append(unit)
@@ -648,7 +722,9 @@ async def submit_unit_order(
     # Validate authorization for all units
     unauthorized_units = []
     for unit in units:
-        authorized, _ = await check_unit_order_authorization(conn, unit, character_id, guild_id)
+        authorized, _ = await check_unit_order_authorization(
+            conn, unit, character_id, guild_id, command_faction_ids=preload.command_faction_ids
+        )
         if not authorized:
             unauthorized_units.append(unit.unit_id)
 
@@ -660,7 +736,7 @@ async def submit_unit_order(
         # Naval units occupy multiple territories; check that their position sets overlap
         territory_sets = {}
         for unit in units:
-            positions = await NavalUnitPosition.fetch_territories_by_unit(conn, unit.id, guild_id)
+            positions = preload.naval_positions.get(unit.id)
             if positions:
                 territory_sets[unit.unit_id] = set(positions)
             else:
@@ -690,17 +766,16 @@ async def submit_unit_order(
         if len(unique_territories) < 2:
             return False, "Patrol path must contain at least two different territories.", None
 
-    # Validate path using validate_path_with_details helper
-    valid, error_msg = await validate_path_with_details(conn, path, guild_id)
+    # Validate territories exist and each hop is adjacent
+    valid, error_msg = check_path_in_graph(preload.graph, path)
     if not valid:
         return False, error_msg, None
 
     # Validate terrain for naval actions (all territories must be water)
     if is_naval_action:
         for territory_id in path:
-            territory = await Territory.fetch_by_territory_id(conn, territory_id, guild_id)
-            if territory and territory.terrain_type.lower() not in WATER_TERRAIN_TYPES:
-                return False, f"Naval units cannot traverse land territory '{territory_id}' (terrain: {territory.terrain_type}).", None
+            if not preload.is_water(territory_id):
+                return False, f"Naval units cannot traverse land territory '{territory_id}' (terrain: {preload.graph.terrain_type(territory_id)}).", None
 
     # Validate terrain for land actions (no water unless all infiltrators/aerial/aerial-transport)
     if not is_naval_action and action != 'transport':
@@ -710,20 +785,19 @@ async def submit_unit_order(
         )
         if not all_can_traverse_water:
             for territory_id in path:
-                territory = await Territory.fetch_by_territory_id(conn, territory_id, guild_id)
-                if territory and territory.terrain_type.lower() in WATER_TERRAIN_TYPES:
+                if preload.is_water(territory_id):
                     return False, f"Land units cannot traverse water territory '{territory_id}'. Use transport orders for water crossing.", None
 
     # Action-specific validation: Siege requires city terrain at path end
     if action == 'siege':
-        final_territory = await Territory.fetch_by_territory_id(conn, path[-1], guild_id)
-        if final_territory and final_territory.terrain_type.lower() != 'city':
-            return False, f"Siege action requires a city at the destination. Territory '{path[-1]}' is '{final_territory.terrain_type}'.", None
+        final_terrain = preload.graph.terrain_type(path[-1])
+        if final_terrain.lower() != 'city':
+            return False, f"Siege action requires a city at the destination. Territory '{path[-1]}' is '{final_terrain}'.", None
 
     # Action-specific validation: Land transport path validation
     transport_data = None
     if action == 'transport':
-        valid, error_msg, transport_data = await validate_transport_path(conn, path, guild_id)
+        valid, error_msg, transport_data = split_transport_path(path, preload.graph.terrain_types)
         if not valid:
             return False, error_msg, None
 
@@ -767,11 +841,93 @@ async def submit_unit_order(
     elif speed is not None:
         return False, "Speed parameter is only valid for patrol actions.", None
 
-    # Check existing orders for all units
-    unit_internal_ids = [u.id for u in units]
-    existing_orders = await Order.fetch_by_units(
-        conn, unit_internal_ids, [OrderStatus.PENDING.value, OrderStatus.ONGOING.value], guild_id
+    return True, "", {'units': units, 'transport_data': transport_data}
+
+
+def _build_unit_order(
+    order_id: str,
+    units: List[Unit],
+    action: str,
+    path: List[str],
+    speed: Optional[int],
+    transport_data: Optional[dict],
+    character_id: int,
+    current_turn: int,
+    guild_id: int
+) -> Order:
+    """
+    Build a pending unit order that executes next turn.
+    """
+    # Build order_data
+    order_data = {
+        'action': action,
+        'path': path,
+        'path_index': 0
+    }
+    if speed is not None:
+        order_data['speed'] = speed
+
+    # Add transport-specific data for land transport orders
+    if transport_data is not None:
+        order_data['water_path'] = transport_data['water_path']
+        order_data['coast_territory'] = transport_data['coast_territory']
+        order_data['disembark_territory'] = transport_data['disembark_territory']
+
+    return Order(
+        order_id=order_id,
+        order_type=OrderType.UNIT.value,
+        unit_ids=[u.id for u in units],
+        character_id=character_id,
+        turn_number=current_turn + 1,  # Execute next turn
+        phase=ORDER_PHASE_MAP[OrderType.UNIT].value,
+        priority=ORDER_PRIORITY_MAP[OrderType.UNIT],
+        status=OrderStatus.PENDING.value,
+        order_data=order_data,
+        submitted_at=datetime.now(),
+        guild_id=guild_id
+    )
+
+
+async def submit_unit_order(
+    conn: asyncpg.Connection,
+    unit_ids: List[str],
+    action: str,
+    path: List[str],
+    guild_id: int,
+    character_id: int,
+    speed: Optional[int] = None,
+    override: bool = False
+) -> Tuple[bool, str, Optional[dict]]:
+    """
+    Submit a unit order for one or more units.
+
+    Args:
+        conn: Database connection
+        unit_ids: List of unit IDs (user-facing)
+        action: Action type (one of VALID_UNIT_ACTIONS)
+        path: Full path (list of territory IDs as strings)
+        guild_id: Guild ID
+        character_id: Character submitting the order
+        speed: Speed parameter for patrol orders only
+        override: If True, override existing orders (cancel them and create new)
+
+    Returns:
+        (success, message, extra_data)
+        - extra_data may contain {'confirmation_needed': True, 'existing_orders': [...]} if orders exist
+    """
+    # Normalize action to lowercase
+    action = action.lower().strip()
+
+    preload = await UnitOrderPreload.load(conn, guild_id, character_id, unit_ids)
+    valid, error_msg, validated = await validate_unit_order(
+        conn, preload, unit_ids, action, path, guild_id, character_id, speed
     )
+    if not valid:
+        return False, error_msg, None
+    units = validated['units']
+
+    # Check existing orders for all units
+    existing_orders = preload.existing_orders
 
     if existing_orders and not override:
         # Collect details about existing orders
@@ -823,34 +979,10 @@ async def submit_unit_order(
     path_length = len(path) - 1  # Number of steps
     will_be_ongoing = path_length > slowest_movement
 
-    # Build order_data
-    order_data = {
-        'action': action,
-        'path': path,
-        'path_index': 0
-    }
-    if speed is not None:
-        order_data['speed'] = speed
-
-    # Add transport-specific data for land transport orders
-    if transport_data is not None:
-        order_data['water_path'] = transport_data['water_path']
-        order_data['coast_territory'] = transport_data['coast_territory']
-        order_data['disembark_territory'] = transport_data['disembark_territory']
-
     # Create order
-    order = Order(
-        order_id=order_id,
-        order_type=OrderType.UNIT.value,
-        unit_ids=unit_internal_ids,
-        character_id=character_id,
-        turn_number=current_turn + 1,  # Execute next turn
-        phase=ORDER_PHASE_MAP[OrderType.UNIT].value,
-        priority=ORDER_PRIORITY_MAP[OrderType.UNIT],
-        status=OrderStatus.PENDING.value,
-        order_data=order_data,
-        submitted_at=datetime.now(),
-        guild_id=guild_id
+    order = _build_unit_order(
+        order_id, units, action, path, speed, validated['transport_data'],
+        character_id, current_turn, guild_id
     )
 
     await order.upsert(conn)
@@ -863,6 +995,176 @@ async def submit_unit_order(
     return True, f"Unit order submitted: {action} for {unit_list} -> Territory {path[-1]} (Order #{order_id}){ongoing_note}{override_note}. Slowest unit: {slowest_unit.unit_id} (movement={slowest_movement}{speed_note}).", None
 
 
+# Most orders accepted in one batch submission
+MAX_BATCH_ORDERS = 100
+
+
+async def submit_unit_orders(
+    conn: asyncpg.Connection,
+    orders: List[dict],
+    guild_id: int,
+    character_id: int,
+    override: bool = False
+) -> Tuple[bool, str, Optional[List[str]]]:
+    """
+    Validate and submit many unit orders at once. Either every order is submitted or none is.
+
+    Units, permissions, naval positions and active orders are loaded once for the whole
+    batch, paths are checked against the cached territory graph, and the new orders are inserted in one batch.
+
+    Args:
+        conn: Database connection
+        orders: List of dicts with keys: units (List[str]), action (str), path (List[str]), speed (optional int)
+        guild_id: Guild ID
+        character_id: Character submitting the orders
+        override: If True, cancel the units' existing orders instead of refusing the batch
+
+    Returns:
+        (success, message, summary_lines)
+        - summary_lines has one line per submitted order
+    """
+    if not orders:
+        return False, "No orders specified.", None
+    if len(orders) > MAX_BATCH_ORDERS:
+        return False, f"Too many orders in one batch ({len(orders)}). The limit is {MAX_BATCH_ORDERS}.", None
+
+    normalized = [
+        (
+            [str(u).strip() for u in entry.get('units', [])],
+            str(entry.get('action', '')).lower().strip(),
+            [str(t).strip() for t in entry.get('path', [])],
+            entry.get('speed')
+        )
+        for entry in orders
+    ]
+
+    preload = await UnitOrderPreload.load(
+        conn, guild_id, character_id,
+        [u for unit_ids, _, _, _ in normalized for u in unit_ids]
+    )
+
+    errors = []
+    validated_orders = []
+    ordered_units = {}
+    for number, (unit_ids, action, path, speed) in enumerate(normalized, start=1):
+        valid, error_msg, validated = await validate_unit_order(
+            conn, preload, unit_ids, action, path, guild_id, character_id, speed
+        )
+        if not valid:
+            errors.append(f"Order {number}: {error_msg}")
+            continue
+
+        repeated = [u.unit_id for u in validated['units'] if u.unit_id in ordered_units]
+        if repeated:
+            errors.append(f"Order {number}: units already given an order earlier in this batch: {', '.join(repeated)}")
+            continue
+        ordered_units.update({u.unit_id: number for u in validated['units']})
+        validated_orders.append((unit_ids, action, path, speed, validated))
+
+    # Units with pending/ongoing orders from earlier submissions
+    batch_unit_ids = {preload.units[u].id for u in ordered_units}
+    existing_orders = [o for o in preload.existing_orders if batch_unit_ids.intersection(o.unit_ids)]
+    if existing_orders and not override:
+        conflicting_units = sorted(
+            u for u in ordered_units
+            if any(preload.units[u].id in o.unit_ids for o in existing_orders)
+        )
+        errors.append(f"These units already have pending orders: {', '.join(conflicting_units)}. Resubmit with override to replace them.")
+
+    if errors:
+        return False, f"No orders were submitted. Fix these {len(errors)} problem(s):\n" + "\n".join(errors), None
+
+    # Get current turn from WargameConfig
+    wargame_config = await conn.fetchrow(
+        "SELECT current_turn FROM WargameConfig WHERE guild_id = $1;",
+        guild_id
+    )
+    current_turn = wargame_config['current_turn'] if wargame_config else 0
+
+    order_count = await Order.get_count(conn, guild_id)
+    new_orders = [
+        _build_unit_order(
+            f"ORD-{order_count + i + 1:04d}", validated['units'], action, path, speed,
+            validated['transport_data'], character_id, current_turn, guild_id
+        )
+        for i, (_, action, path, speed, validated) in enumerate(validated_orders)
+    ]
+
+    async with conn.transaction():
+        for existing_order in existing_orders:
+            existing_order.status = OrderStatus.CANCELLED.value
+            existing_order.updated_at = datetime.now()
+            existing_order.result_data = {'cancelled_reason': 'overridden_by_new_order'}
+            await existing_order.upsert(conn)
+
+        await Order.insert_many(conn, new_orders)
+
+    summary = [
+        f"#{order.order_id}: {action} for {', '.join(unit_ids)} -> Territory {path[-1]}"
+        for order, (unit_ids, action, path, _, _) in zip(new_orders, validated_orders)
+    ]
+    override_note = f" ({len(existing_orders)} previous orders cancelled)" if existing_orders else ""
+    return True, f"Submitted {len(new_orders)} unit orders{override_note}.", summary
+
+
+def parse_order_batch(content: str, filename: str) -> Tuple[bool, str, Optional[List[dict]]]:
+    """
+    Parse a batch of unit orders from a YAML or CSV file.
+
+    YAML: a list of mappings (optionally under an `orders` key) with units, action, path and
+    optional speed; units and path may be lists or comma-separated strings.
+    CSV: a header row with units, action, path and optional speed columns; units and path
+    are separated by commas, semicolons or spaces within their cell.
+
+    Returns:
+        (success, error_message, orders)
+    """
+    def split_ids(value) -> List[str]:
+        if isinstance(value, list):
+            return [str(v).strip() for v in value if str(v).strip()]
+        return [v for v in re.split(r'[,;\s]+', str(value or '')) if v]
+
+    def parse_speed(value, number: int) -> Optional[int]:
+        if value is None or str(value).strip() == '':
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Order {number}: speed must be a whole number, got '{value}'.")
+
+    if filename.lower().endswith('.csv'):
+        reader = csv.DictReader(io.StringIO(content))
+        missing = {'units', 'action', 'path'} - set(reader.fieldnames or [])
+        if missing:
+            return False, f"CSV header is missing columns: {', '.join(sorted(missing))}.", None
+        entries = list(reader)
+    else:
+        try:
+            loaded = yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            return False, f"Could not parse YAML: {e}", None
+        entries = loaded.get('orders') if isinstance(loaded, dict) else loaded
+        if not isinstance(entries, list) or not all(isinstance(e, dict) for e in entries):
+            return False, "YAML must be a list of orders, each with units, action and path.", None
+
+    orders = []
+    try:
+        for number, entry in enumerate(entries, start=1):
+            orders.append({
+                'units': split_ids(entry.get('units')),
+                'action': str(entry.get('action') or ''),
+                'path': split_ids(entry.get('path')),
+                'speed': parse_speed(entry.get('speed'), number)
+            })
+    except ValueError as e:
+        return False, str(e), None
+
+    if not orders:
+        return False, "The file contains no orders.", None
+
+    return True, "", orders
+
+
 async def validate_path_with_details(
     conn: asyncpg.Connection,
     path: List[str],
@@ -880,36 +1182,67 @@ async def validate_path_with_details(
     Returns:
         (success, error_message)
     """
+    return check_path_in_graph(await territory_graphs.get(conn, guild_id), path)
+
+
+def check_path_in_graph(graph: TerritoryGraph, path: List[str]) -> Tuple[bool, str]:
+    """
+    validate_path_with_details against an already loaded territory graph; runs no queries,
+    so it is cheap enough for autocomplete.
+    """
     if not path:
         return False, "Path is empty."
 
     # Check all territories exist
-    for territory_id in path:
-        territory = await Territory.fetch_by_territory_id(conn, territory_id, guild_id)
-        if not territory:
-            return False, f"Territory '{territory_id}' not found."
+    missing = graph.first_missing(path)
+    if missing is not None:
+        return False, f"Territory '{missing}' not found."
 
     # Check each consecutive pair is adjacent
-    for i in range(len(path) - 1):
-        territory_a = path[i]
-        territory_b = path[i + 1]
-
-        # Check adjacency (order doesn't matter due to canonical ordering in DB)
-        is_adjacent = await conn.fetchval("""
-            SELECT EXISTS(
-                SELECT 1 FROM TerritoryAdjacency
-                WHERE ((territory_a_id = $1 AND territory_b_id = $2)
-                   OR (territory_a_id = $2 AND territory_b_id = $1))
-                AND guild_id = $3
-            );
-        """, territory_a, territory_b, guild_id)
-
-        if not is_adjacent:
-            return False, f"Territories '{territory_a}' and '{territory_b}' are not adjacent."
+    gap = graph.first_gap(path)
+    if gap is not None:
+        return False, f"Territories '{gap[0]}' and '{gap[1]}' are not adjacent."
 
     return True, ""
 
 
+def suggest_path_completions(graph: TerritoryGraph, typed: str, limit: int = 25) -> List[Tuple[str, str]]:
+    """
+    Autocomplete suggestions for a comma-separated path being typed.
+
+    A valid path so far is offered extended by each neighbour of its last territory
+    (or completed, if the last ID is still partial); an invalid path is offered back
+    unchanged, labelled with the reason it is invalid.
+
+    Returns:
+        List of (label, value) pairs
+    """
+    parts = [p.strip() for p in typed.split(',')]
+    complete, partial = [p for p in parts[:-1] if p], parts[-1]
+
+    valid, error_msg = check_path_in_graph(graph, complete) if complete else (True, "")
+    if not valid:
+        return [(error_msg, typed)]
+
+    if complete:
+        candidates = graph.adjacent(complete[-1])
+    else:
+        candidates = graph.terrain_types.keys()
+    candidates = sorted(t for t in candidates if t.startswith(partial))
+
+    if partial in graph.terrain_types and partial not in candidates:
+        # The last ID is complete but does not continue the path
+        return [(f"Territories '{complete[-1]}' and '{partial}' are not adjacent.", typed)]
+
+    suggestions = []
+    for territory_id in candidates[:limit]:
+        value = ",".join(complete + [territory_id])
+        suggestions.append((f"{value} ({graph.terrain_type(territory_id)})", value))
+    if not suggestions:
+        return [(f"No territory matching '{partial}' can continue this path.", typed)]
+    return suggestions
+
+
 # Minimum turns before cancellation for specific order types
 # Orders not in this dict default to 0 (immediate cancellation allowed)
 CANCEL_MINIMUM_TURNS = {
@@ -969,9 +1302,13 @@ async def cancel_order(
                 return False, f"Cannot cancel '{order_id}' yet. Minimum commitment: {min_turns} turns. {turns_remaining} turn(s) remaining."
 
     # Update status to CANCELLED
+    was_ongoing_transfer = (order.order_type == OrderType.RESOURCE_TRANSFER.value
+                            and order.status == OrderStatus.ONGOING.value)
     order.status = OrderStatus.CANCELLED.value
     order.updated_at = datetime.now()
     await order.upsert(conn)
+    if was_ongoing_transfer:
+        finance_projections.invalidate_transfer(guild_id, order)
 
     # Create TurnLog entry for VP assignment cancellations
     if order.order_type == OrderType.ASSIGN_VICTORY_POINTS.value:
@@ -1241,6 +1578,8 @@ async def submit_resource_transfer_order(
     )
 
     await order.upsert(conn)
+    if is_ongoing:
+        finance_projections.invalidate_transfer(guild_id, order)
 
     # Format response message
     resource_strs = []
@@ -1875,29 +2214,17 @@ async def validate_path(
     if not path:
         return False, "Path is empty."
 
+    graph = await territory_graphs.get(conn, guild_id)
+
     # Check all territories exist
-    for territory_id in path:
-        territory = await Territory.fetch_by_territory_id(conn, territory_id, guild_id)
-        if not territory:
-            return False, f"Territory {territory_id} not found."
+    missing = graph.first_missing(path)
+    if missing is not None:
+        return False, f"Territory {missing} not found."
 
     # Check each consecutive pair is adjacent
-    for i in range(len(path) - 1):
-        territory_a = path[i]
-        territory_b = path[i + 1]
-
-        # Check adjacency (order doesn't matter due to canonical ordering in DB)
-        is_adjacent = await conn.fetchval("""
-            SELECT EXISTS(
-                SELECT 1 FROM TerritoryAdjacency
-                WHERE ((territory_a_id = $1 AND territory_b_id = $2)
-                   OR (territory_a_id = $2 AND territory_b_id = $1))
-                AND guild_id = $3
-            );
-        """, territory_a, territory_b, guild_id)
-
-        if not is_adjacent:
-            return False, f"Territories {territory_a} and {territory_b} are not adjacent."
+    gap = graph.first_gap(path)
+    if gap is not None:
+        return False, f"Territories {gap[0]} and {gap[1]} are not adjacent."
 
     return True, ""
 
@@ -1,15 +1,125 @@
 """
 Handlers for generating turn reports from historical turn log data.
+
+Report lines are rendered once when a turn resolves and stored in TurnReport;
+turns resolved before that are rendered from TurnLog on demand.
 """
 import asyncpg
 from typing import Tuple, List, Dict, Optional
-from db import Character, TurnLog, WargameConfig
+from db import Character, TurnLog, TurnReport, WargameConfig
 from order_types import PHASE_ORDER
+from event_logging import EVENT_HANDLERS
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def render_report_sections(
+    events: List[TurnLog],
+    turn_number: int,
+    guild_id: int,
+    character_id: Optional[int] = None
+) -> List[TurnReport]:
+    """
+    Render events into report sections in phase order.
+
+    Args:
+        events: Events to render, already filtered for the character if any
+        turn_number: Turn number
+        guild_id: Guild ID
+        character_id: Viewing character, or None for the GM report
+
+    Returns:
+        One TurnReport per phase. The GM report keeps phases without lines so their
+        events still count towards the summary; character reports drop them.
+    """
+    phases: Dict[str, List[TurnLog]] = {}
+    for event in events:
+        phases.setdefault(event.phase or 'UNKNOWN', []).append(event)
+
+    sections = []
+    for phase in PHASE_ORDER:
+        if phase not in phases:
+            continue
+
+        lines = []
+        event_types = []
+        for event in phases[phase]:
+            handler = EVENT_HANDLERS.get(event.event_type or 'UNKNOWN')
+            if not handler:
+                continue
+            event_data = event.event_data or {}
+            if character_id is None:
+                line = handler.get_gm_line(event_data)
+            else:
+                line = handler.get_character_line(event_data, character_id)
+            if line:
+                lines.append(line)
+                event_types.append(event.event_type)
+
+        if not lines and character_id is not None:
+            continue
+
+        sections.append(TurnReport(
+            turn_number=turn_number,
+            character_id=character_id,
+            phase=phase,
+            event_count=len(phases[phase]),
+            lines=lines,
+            event_types=event_types,
+            guild_id=guild_id
+        ))
+
+    return sections
+
+
+def _events_for_character(events: List[TurnLog], character_id: int) -> List[TurnLog]:
+    """
+    Filter events relevant to a character using affected_character_ids.
+    """
+    return [
+        event for event in events
+        if character_id in (event.event_data or {}).get('affected_character_ids', [])
+    ]
+
+
+async def materialize_turn_reports(
+    conn: asyncpg.Connection,
+    guild_id: int,
+    turn_number: int,
+    events: List[TurnLog]
+) -> int:
+    """
+    Render and store the GM report and every character's report for a resolved turn.
+
+    Args:
+        conn: Database connection
+        guild_id: Guild ID
+        turn_number: Turn that was just resolved
+        events: All events of the turn
+
+    Returns:
+        Number of report sections stored
+    """
+    by_character: Dict[int, List[TurnLog]] = {}
+    for event in events:
+        for character_id in (event.event_data or {}).get('affected_character_ids', []):
+            by_character.setdefault(character_id, []).append(event)
+
+    character_ids = {c.id for c in await Character.fetch_all(conn, guild_id)}
+
+    sections = render_report_sections(events, turn_number, guild_id)
+    for character_id, character_events in by_character.items():
+        if character_id not in character_ids:
+            continue
+        sections.extend(render_report_sections(character_events, turn_number, guild_id, character_id))
+
+    await TurnReport.delete_turn(conn, turn_number, guild_id)
+    await TurnReport.insert_many(conn, sections)
+    logger.info(f"Turn resolution: stored {len(sections)} report sections for guild {guild_id}, turn {turn_number}")
+    return len(sections)
+
+
 async def generate_character_report(
     conn: asyncpg.Connection,
     character: Character,
@@ -30,24 +140,21 @@ async def generate_character_report(
         data_dict contains:
         - character: Character object
         - turn_number: int
-        - events: List of TurnLog objects
+        - sections: List of TurnReport objects, one per phase with lines
     """
-    # Fetch all turn logs for this turn
-    turn_logs = await TurnLog.fetch_by_turn(conn, turn_number, guild_id)
-
-    # Filter events relevant to this character using affected_character_ids
-    character_events = []
-    for log in turn_logs:
-        event_data = log.event_data or {}
-        affected_ids = event_data.get('affected_character_ids', [])
+    sections = await TurnReport.fetch_for_turn(conn, turn_number, guild_id, character.id)
 
-        if character.id in affected_ids:
-            character_events.append(log)
+    if not sections and not await TurnReport.exists_for_turn(conn, turn_number, guild_id):
+        # Turn resolved before reports were stored; render from the log
+        turn_logs = await TurnLog.fetch_by_turn(conn, turn_number, guild_id)
+        sections = render_report_sections(
+            _events_for_character(turn_logs, character.id), turn_number, guild_id, character.id
+        )
 
     return True, "Report generated successfully.", {
         'character': character,
         'turn_number': turn_number,
-        'events': character_events
+        'sections': sections
     }
 
 
@@ -68,7 +175,7 @@ async def generate_gm_report(
         (success, message, data_dict)
         data_dict contains:
         - turn_number: int
-        - events: List of TurnLog objects
+        - sections: List of TurnReport objects, one per phase with events
         - summary: Dict with event counts by phase
     """
     # Get wargame config
@@ -84,16 +191,23 @@ async def generate_gm_report(
     if turn_number < 0 or turn_number > config.current_turn:
         return False, f"Invalid turn number. Must be between 0 and {config.current_turn}.", None
 
-    # Fetch all turn logs for this turn
-    turn_logs = await TurnLog.fetch_by_turn(conn, turn_number, guild_id)
+    sections = await TurnReport.fetch_for_turn(conn, turn_number, guild_id)
+    if sections:
+        # Sections only cover PHASE_ORDER; count every logged event
+        total_events = await TurnLog.count_by_turn(conn, turn_number, guild_id)
+    else:
+        # Turn resolved before reports were stored, or had no events; render from the log
+        turn_logs = await TurnLog.fetch_by_turn(conn, turn_number, guild_id)
+        sections = render_report_sections(turn_logs, turn_number, guild_id)
+        total_events = len(turn_logs)
 
     # Generate summary
-    summary = {'total_events': len(turn_logs)}
+    summary = {'total_events': total_events}
     for phase in PHASE_ORDER:
-        summary[f'{phase.lower()}_events'] = len([e for e in turn_logs if e.phase == phase])
+        summary[f'{phase.lower()}_events'] = sum(s.event_count for s in sections if s.phase == phase)
 
     return True, "Report generated successfully.", {
         'turn_number': turn_number,
-        'events': turn_logs,
+        'sections': sections,
         'summary': summary
     }
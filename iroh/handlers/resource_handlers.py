@@ -3,7 +3,20 @@ Resource management command handlers.
 """
 import asyncpg
 from typing import Tuple, Optional, Dict
-from db import PlayerResources, Character, Faction, FactionResources, FactionMember, FactionPermission
+from db import PlayerResources, Character, Faction, FactionResources, FactionMember, FactionPermission, WargameConfig
+from handlers.balance_ledger import (
+    BalanceLedger, CHARACTER, FACTION, RESOURCE_TYPES, REASON_GM_ADJUSTMENT, PHASE_GM
+)
+
+
+async def _load_gm_ledger(conn: asyncpg.Connection, guild_id: int, owner_type: str, owner_id: int) -> BalanceLedger:
+    """
+    Load one owner's balance for a GM edit. GM edits are journalled against the
+    next turn to resolve, so they fall between that turn's balance snapshots.
+    """
+    config = await WargameConfig.fetch(conn, guild_id)
+    next_turn = (config.current_turn if config else 0) + 1
+    return await BalanceLedger.load_owner(conn, guild_id, owner_type, owner_id, next_turn, PHASE_GM)
 
 
 async def modify_resources(conn: asyncpg.Connection, character_identifier: str, guild_id: int) -> Tuple[bool, str, Optional[dict]]:
@@ -61,6 +74,30 @@ async def modify_character_production(
     return True, "", {'character': char}
 
 
+async def set_character_resource(
+    conn: asyncpg.Connection,
+    character_id: int,
+    guild_id: int,
+    resource: str,
+    value: int
+) -> None:
+    """
+    Set one of a character's resources to a new value (GM operation).
+    The difference is journalled to ResourceLedger as a GM adjustment.
+
+    Args:
+        conn: Database connection
+        character_id: Internal character ID
+        guild_id: Guild ID
+        resource: One of ore, lumber, coal, rations, cloth, platinum
+        value: New amount
+    """
+    ledger = await _load_gm_ledger(conn, guild_id, CHARACTER, character_id)
+    current = ledger.balance(CHARACTER, character_id)[resource]
+    ledger.credit(CHARACTER, character_id, {resource: value - current}, REASON_GM_ADJUSTMENT)
+    await ledger.flush(conn)
+
+
 async def modify_character_vp(
     conn: asyncpg.Connection,
     character_identifier: str,
@@ -181,42 +218,33 @@ async def modify_faction_resources(
     if not faction:
         return False, f"Faction '{faction_id}' not found."
 
-    # Fetch or create resources
-    resources = await FactionResources.fetch_by_faction(conn, faction.id, guild_id)
-    if not resources:
-        resources = FactionResources(
-            faction_id=faction.id,
-            ore=0,
-            lumber=0,
-            coal=0,
-            rations=0,
-            cloth=0,
-            platinum=0,
-            guild_id=guild_id
-        )
+    # Fetch resources (owners without a row start at zero)
+    ledger = await _load_gm_ledger(conn, guild_id, FACTION, faction.id)
+    balance = ledger.balance(FACTION, faction.id)
 
     # Apply changes
-    resource_fields = ['ore', 'lumber', 'coal', 'rations', 'cloth', 'platinum']
+    applied = {}
     changes_made = []
 
-    for field in resource_fields:
+    for field in RESOURCE_TYPES:
         if field in changes and changes[field] != 0:
-            old_value = getattr(resources, field)
+            old_value = balance[field]
             new_value = old_value + changes[field]
 
             # Prevent negative resources
             if new_value < 0:
                 return False, f"Cannot reduce {field} below 0. Current: {old_value}, change: {changes[field]}"
 
-            setattr(resources, field, new_value)
+            applied[field] = changes[field]
             change_str = f"+{changes[field]}" if changes[field] > 0 else str(changes[field])
             changes_made.append(f"{field}: {old_value} → {new_value} ({change_str})")
 
     if not changes_made:
         return False, "No resource changes specified."
 
-    # Save changes
-    await resources.upsert(conn)
+    # Save changes and journal them
+    ledger.credit(FACTION, faction.id, applied, REASON_GM_ADJUSTMENT)
+    await ledger.flush(conn)
 
     return True, f"Updated {faction.name} resources:\n" + "\n".join(changes_made)
 
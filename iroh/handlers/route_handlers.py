@@ -0,0 +1,333 @@
+"""
+Route planning handlers: suggest the fastest path for a unit order.
+
+Routes are searched over the cached territory graph with the movement phase's
+rules: each turn the group gets calculate_movement_points MP, a step that costs
+more than the MP left waits for the next turn, and infiltrator/aerial groups pay
+1 MP everywhere. Labels are (turns, MP spent in the last turn), which only grow
+along a path, so Dijkstra finds the route that arrives in the fewest turns.
+
+Transport routes follow the transport tick: units board at the start of the turn
+after reaching the coast, cross one water territory per naval MP with no terrain
+cost, and disembark at the start of the turn after reaching the last water
+territory. The naval transport is not known when planning, so its MP is assumed
+to match the land group's and transport turn counts are an estimate.
+"""
+import asyncpg
+import heapq
+from dataclasses import dataclass, field
+from typing import Tuple, List, Optional, Dict, Iterable
+from db import Unit, NavalUnitPosition, TerritoryGraph, territory_graphs
+from handlers.movement_handlers import (
+    calculate_movement_points, unit_group_ignores_terrain_cost, terrain_type_cost, DEFAULT_TERRAIN_COST
+)
+from handlers.order_handlers import (
+    check_unit_order_authorization, VALID_UNIT_ACTIONS, VALID_NAVAL_ACTIONS, WATER_TERRAIN_TYPES
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Route legs: land before the water crossing, water, land after disembarking
+LEG_LAND, LEG_WATER, LEG_DISEMBARKED = 0, 1, 2
+
+# Route modes
+MODE_LAND = 'land'                    # Land only, or anywhere for infiltrator/aerial groups
+MODE_NAVAL = 'naval'                  # Water only
+MODE_TRANSPORT = 'transport'          # Land, one contiguous water crossing, land
+
+
+@dataclass
+class RouteSearch:
+    """
+    Result of a route search from a unit group's position: the best label of every reachable
+    (territory, leg) and the predecessor it was reached from.
+    """
+    mode: str = MODE_LAND
+    movement_points: int = 0
+    labels: Dict[Tuple[str, int], Tuple[int, int]] = field(default_factory=dict)
+    previous: Dict[Tuple[str, int], Optional[Tuple[str, int]]] = field(default_factory=dict)
+
+    def arrival_leg(self) -> int:
+        """Leg a route must end in: transport routes must have crossed water."""
+        if self.mode == MODE_TRANSPORT:
+            return LEG_DISEMBARKED
+        if self.mode == MODE_NAVAL:
+            return LEG_WATER
+        return LEG_LAND
+
+    def turns_to(self, territory_id: str) -> Optional[int]:
+        """Turns needed to reach a territory, or None if unreachable."""
+        label = self.labels.get((territory_id, self.arrival_leg()))
+        return label[0] if label else None
+
+    def path_to(self, territory_id: str) -> Optional[List[str]]:
+        """The fastest path to a territory, starting at the group's position, or None."""
+        state = (territory_id, self.arrival_leg())
+        if state not in self.labels:
+            return None
+        path = []
+        while state is not None:
+            path.append(state[0])
+            state = self.previous[state]
+        return path[::-1]
+
+
+def route_mode(action: str) -> str:
+    """
+    The route mode used for an order action.
+    """
+    if action in VALID_NAVAL_ACTIONS:
+        return MODE_NAVAL
+    if action == 'transport':
+        return MODE_TRANSPORT
+    return MODE_LAND
+
+
+def search_routes(
+    graph: TerritoryGraph,
+    sources: Iterable[str],
+    mode: str,
+    movement_points: int,
+    ignores_terrain: bool = False,
+    destination: Optional[str] = None,
+    water_movement_points: Optional[int] = None
+) -> RouteSearch:
+    """
+    Dijkstra over the territory graph from every source at once.
+
+    Args:
+        graph: The guild's territory graph
+        sources: Territories the group may start from
+        mode: MODE_LAND, MODE_NAVAL or MODE_TRANSPORT
+        movement_points: MP the group gets each turn
+        ignores_terrain: Whether the group pays 1 MP everywhere and may cross water on land orders
+        destination: Stop as soon as this territory is settled; search everything if None
+        water_movement_points: Naval transport MP for the water leg of transport routes;
+            defaults to movement_points
+
+    Returns:
+        RouteSearch with the best label of every settled (territory, leg)
+    """
+    search = RouteSearch(mode=mode, movement_points=movement_points)
+    if movement_points < 1:
+        return search
+    if water_movement_points is None:
+        water_movement_points = movement_points
+
+    def is_water(territory_id: str) -> bool:
+        return graph.terrain_type(territory_id).lower() in WATER_TERRAIN_TYPES
+
+    def next_leg(leg: int, territory_id: str) -> Optional[int]:
+        water = is_water(territory_id)
+        if mode == MODE_NAVAL:
+            return LEG_WATER if water else None
+        if mode == MODE_LAND:
+            return LEG_LAND if not water or ignores_terrain else None
+        # Transport: one contiguous water section between two land sections
+        if leg == LEG_LAND:
+            return LEG_WATER if water else LEG_LAND
+        if leg == LEG_WATER:
+            return LEG_WATER if water else LEG_DISEMBARKED
+        return None if water else LEG_DISEMBARKED
+
+    def step_cost(territory_id: str) -> int:
+        if ignores_terrain:
+            return DEFAULT_TERRAIN_COST
+        return terrain_type_cost(graph.terrain_type(territory_id))
+
+    # A label of (0, movement_points) makes the first step start turn 1
+    start_leg = LEG_WATER if mode == MODE_NAVAL else LEG_LAND
+    best: Dict[Tuple[str, int], Tuple[int, int]] = {}
+    heap = []
+    for source in set(sources):
+        if graph.exists(source) and next_leg(start_leg, source) == start_leg:
+            best[(source, start_leg)] = (0, movement_points)
+            search.previous[(source, start_leg)] = None
+            heap.append((0, movement_points, source, start_leg))
+    heapq.heapify(heap)
+
+    arrival_leg = search.arrival_leg()
+    while heap:
+        turns, spent, territory_id, leg = heapq.heappop(heap)
+        state = (territory_id, leg)
+        if state in search.labels:
+            continue
+        search.labels[state] = (turns, spent)
+        if territory_id == destination and leg == arrival_leg:
+            break
+
+        for neighbor in graph.adjacent(territory_id):
+            neighbor_leg = next_leg(leg, neighbor)
+            if neighbor_leg is None:
+                continue
+            if mode == MODE_TRANSPORT and neighbor_leg != leg:
+                # Boarding and disembarking are free moves at the start of the next turn
+                label = (turns + 1, 0)
+            else:
+                transported = mode == MODE_TRANSPORT and leg == LEG_WATER
+                cost = 1 if transported else step_cost(neighbor)
+                budget = water_movement_points if transported else movement_points
+                if cost > budget:
+                    # Never affordable, even at the start of a turn
+                    continue
+                label = (turns, spent + cost) if spent + cost <= budget else (turns + 1, cost)
+            neighbor_state = (neighbor, neighbor_leg)
+            if neighbor_state in search.labels or label >= best.get(neighbor_state, (float('inf'), 0)):
+                continue
+            best[neighbor_state] = label
+            search.previous[neighbor_state] = state
+            heapq.heappush(heap, (label[0], label[1], neighbor, neighbor_leg))
+
+    return search
+
+
+async def load_route_search(
+    conn: asyncpg.Connection,
+    unit_ids: List[str],
+    action: str,
+    guild_id: int,
+    character_id: int,
+    destination: Optional[str] = None
+) -> Tuple[bool, str, Optional[RouteSearch]]:
+    """
+    Search routes for a group of units the character may order.
+
+    Args:
+        conn: Database connection
+        unit_ids: List of unit IDs (user-facing)
+        action: Order action the route is for
+        guild_id: Guild ID
+        character_id: Character asking for the route
+        destination: Stop once this territory is reached; search everything if None
+
+    Returns:
+        (success, error_message, search)
+    """
+    action = action.lower().strip()
+    if action not in VALID_UNIT_ACTIONS:
+        return False, f"Invalid action '{action}'. Valid actions: {', '.join(VALID_UNIT_ACTIONS)}", None
+
+    found = {u.unit_id: u for u in await Unit.fetch_by_unit_ids(conn, list(set(unit_ids)), guild_id)}
+    units = []
+    for unit_id in unit_ids:
+        if unit_id not in found:
+            return False, f"Unit '{unit_id}' not found.", None
+        units.append(found[unit_id])
+    if not units:
+        return False, "No units specified.", None
+
+    for unit in units:
+        authorized, _ = await check_unit_order_authorization(conn, unit, character_id, guild_id)
+        if not authorized:
+            return False, f"You are not authorized to issue orders for unit '{unit.unit_id}'.", None
+
+    mode = route_mode(action)
+    if mode == MODE_NAVAL:
+        if not all(u.is_naval for u in units):
+            return False, f"Naval action '{action}' needs naval units.", None
+        # Naval units may start from any territory they all occupy
+        positions = await NavalUnitPosition.fetch_territories_by_units(conn, [u.id for u in units], guild_id)
+        occupied = [set(positions.get(u.id) or [u.current_territory_id]) for u in units]
+        sources = set.intersection(*occupied)
+        if not sources:
+            return False, "Naval units must share at least one common territory.", None
+        if action == 'naval_transport':
+            # Land units board from the first territory, which must touch land
+            graph = await territory_graphs.get(conn, guild_id)
+            sources = {
+                s for s in sources
+                if any(graph.exists(t) and graph.terrain_type(t).lower() not in WATER_TERRAIN_TYPES
+                       for t in graph.adjacent(s))
+            }
+            if not sources:
+                return False, "Naval transport must start next to at least one land territory for boarding.", None
+    else:
+        if any(u.is_naval for u in units):
+            return False, f"Land action '{action}' needs land units.", None
+        sources = {u.current_territory_id for u in units}
+        if len(sources) > 1:
+            return False, f"All units must be in the same territory. Units are in: {sources}", None
+
+    graph = await territory_graphs.get(conn, guild_id)
+    search = search_routes(
+        graph, sources, mode,
+        calculate_movement_points(units, action),
+        ignores_terrain=unit_group_ignores_terrain_cost(units),
+        destination=destination
+    )
+    return True, "", search
+
+
+async def suggest_route(
+    conn: asyncpg.Connection,
+    unit_ids: List[str],
+    action: str,
+    destination: str,
+    guild_id: int,
+    character_id: int
+) -> Tuple[bool, str, Optional[dict]]:
+    """
+    Suggest the fastest path for a unit order to a destination.
+
+    Args:
+        conn: Database connection
+        unit_ids: List of unit IDs (user-facing)
+        action: Order action the route is for
+        destination: Destination territory ID
+        guild_id: Guild ID
+        character_id: Character asking for the route
+
+    Returns:
+        (success, message, data)
+        - data contains: path (List[str]), turns (int), movement_points (int)
+    """
+    success, message, search = await load_route_search(
+        conn, unit_ids, action, guild_id, character_id, destination=destination
+    )
+    if not success:
+        return False, message, None
+
+    graph = await territory_graphs.get(conn, guild_id)
+    if not graph.exists(destination):
+        return False, f"Territory '{destination}' not found.", None
+
+    path = search.path_to(destination)
+    if path is None:
+        return False, f"No {search.mode} route to territory {destination} for these units.", None
+    if len(path) < 2:
+        return False, f"The units are already in territory {destination}.", None
+
+    turns = search.turns_to(destination)
+    turn_note = "1 turn" if turns == 1 else f"{turns} turns"
+    estimate_note = ""
+    if search.mode == MODE_TRANSPORT:
+        estimate_note = " Turns are an estimate: the water crossing depends on the naval transport's MP."
+    return True, (
+        f"Fastest route to territory {destination}: `{','.join(path)}` "
+        f"({len(path) - 1} steps, {turn_note} at {search.movement_points} MP per turn).{estimate_note}"
+    ), {
+        'path': path,
+        'turns': turns,
+        'movement_points': search.movement_points
+    }
+
+
+def suggest_route_destinations(search: RouteSearch, typed: str, limit: int = 25) -> List[Tuple[str, str]]:
+    """
+    Autocomplete suggestions for a route destination: reachable territories whose ID starts
+    with what was typed, nearest first, labelled with the turns needed to get there.
+
+    Returns:
+        List of (label, value) pairs
+    """
+    arrival_leg = search.arrival_leg()
+    reachable = sorted(
+        (label[0], territory_id)
+        for (territory_id, leg), label in search.labels.items()
+        if leg == arrival_leg and label[0] > 0 and territory_id.startswith(typed.strip())
+    )
+    return [
+        (f"{territory_id} ({'1 turn' if turns == 1 else f'{turns} turns'})", territory_id)
+        for turns, territory_id in reachable[:limit]
+    ]
@@ -0,0 +1,83 @@
+"""
+Snapshot handlers for checkpointing and restoring a guild's wargame state.
+"""
+import asyncpg
+from typing import Tuple, Optional
+from db import GuildSnapshot, WargameConfig, territory_graphs
+from handlers.finance_cache import finance_projections
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Automatic pre-turn snapshots kept per guild; manual snapshots are never pruned
+AUTOMATIC_SNAPSHOTS_KEPT = 5
+
+
+async def save_snapshot(
+    conn: asyncpg.Connection,
+    guild_id: int,
+    automatic: bool = False
+) -> Tuple[bool, str, Optional[GuildSnapshot]]:
+    """
+    Capture and store a snapshot of the guild's wargame state.
+
+    Args:
+        conn: Database connection
+        guild_id: Guild ID
+        automatic: True for the snapshot taken before turn resolution
+
+    Returns:
+        (success, message, snapshot)
+    """
+    config = await WargameConfig.fetch(conn, guild_id)
+    if not config:
+        return False, "Wargame not configured for this guild.", None
+
+    snapshot = await GuildSnapshot.capture(conn, guild_id, config.current_turn, automatic)
+    await snapshot.insert(conn)
+
+    if automatic:
+        pruned = await GuildSnapshot.prune_automatic(conn, guild_id, AUTOMATIC_SNAPSHOTS_KEPT)
+        if pruned:
+            logger.info(f"Pruned {pruned} automatic snapshots for guild {guild_id}")
+
+    return True, f"Saved snapshot #{snapshot.id} at turn {snapshot.turn_number} ({snapshot.size_bytes / 1024:.1f} KiB).", snapshot
+
+
+async def restore_snapshot(
+    conn: asyncpg.Connection,
+    guild_id: int,
+    snapshot_id: Optional[int] = None
+) -> Tuple[bool, str]:
+    """
+    Replace the guild's wargame state with a stored snapshot.
+
+    Args:
+        conn: Database connection
+        guild_id: Guild ID
+        snapshot_id: Snapshot to restore; the most recent one if None
+
+    Returns:
+        (success, message)
+    """
+    if snapshot_id is None:
+        snapshot = await GuildSnapshot.fetch_latest(conn, guild_id)
+        if not snapshot:
+            return False, "No snapshots have been saved for this guild."
+    else:
+        snapshot = await GuildSnapshot.fetch_by_id(conn, snapshot_id, guild_id)
+        if not snapshot:
+            return False, f"Snapshot #{snapshot_id} not found."
+
+    try:
+        async with conn.transaction():
+            rows = await snapshot.restore(conn)
+    except ValueError as e:
+        return False, f"Snapshot #{snapshot.id} cannot be restored: {e}"
+    except asyncpg.ForeignKeyViolationError as e:
+        # Typically a character referenced by the snapshot has since been deleted
+        return False, f"Snapshot #{snapshot.id} references data that no longer exists: {e}"
+
+    finance_projections.invalidate_guild(guild_id)
+    territory_graphs.invalidate_guild(guild_id)
+    return True, f"Restored snapshot #{snapshot.id} from turn {snapshot.turn_number} ({rows} rows)."
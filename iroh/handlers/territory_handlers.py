@@ -4,6 +4,7 @@ Territory management command handlers.
 import asyncpg
 from typing import Optional, Tuple, List
 from db import Territory, Character, TerritoryAdjacency, Faction
+from handlers.finance_cache import finance_projections
 
 
 async def create_territory(conn: asyncpg.Connection, territory_id: str, terrain_type: str, guild_id: int, name: Optional[str] = None) -> Tuple[bool, str]:
@@ -57,6 +58,7 @@ async def delete_territory(conn: asyncpg.Connection, territory_id: str, guild_id
 
     # Delete territory (CASCADE will delete adjacencies)
     await Territory.delete(conn, territory_id, guild_id)
+    finance_projections.invalidate_territory(guild_id, territory)
 
     return True, f"Territory {territory_id} has been deleted."
 
@@ -85,6 +87,9 @@ async def set_territory_controller(
     if not territory:
         return False, f"Territory {territory_id} not found."
 
+    # The previous controller loses this territory's production and upkeep
+    finance_projections.invalidate_territory(guild_id, territory)
+
     # Handle removing controller
     if controller_identifier.lower() == 'none':
         territory.controller_character_id = None
@@ -102,6 +107,7 @@ async def set_territory_controller(
         territory.controller_character_id = character.id
         territory.controller_faction_id = None
         await territory.upsert(conn)
+        finance_projections.invalidate_territory(guild_id, territory)
 
         return True, f"Territory {territory_id} is now controlled by {character.name}."
 
@@ -115,6 +121,7 @@ async def set_territory_controller(
         territory.controller_character_id = None
         territory.controller_faction_id = faction.id
         await territory.upsert(conn)
+        finance_projections.invalidate_territory(guild_id, territory)
 
         return True, f"Territory {territory_id} is now controlled by faction {faction.name}."
 
@@ -156,19 +163,9 @@ async def add_adjacency(conn: asyncpg.Connection, territory_id_1: str, territory
 async def remove_adjacency(conn: asyncpg.Connection, territory_id_1: str, territory_id_2: str, guild_id: int) -> Tuple[bool, str]:
     """Remove adjacency between two territories."""
     # Delete the adjacency
-    result = await conn.execute(
-        """
-        DELETE FROM TerritoryAdjacency
-        WHERE guild_id = $1
-        AND ((territory_a_id = $2 AND territory_b_id = $3)
-             OR (territory_a_id = $3 AND territory_b_id = $2));
-        """,
-        guild_id,
-        min(territory_id_1, territory_id_2),
-        max(territory_id_1, territory_id_2)
-    )
+    deleted = await TerritoryAdjacency.delete(conn, territory_id_1, territory_id_2, guild_id)
 
-    if result == "DELETE 0":
+    if not deleted:
         return False, f"Territories {territory_id_1} and {territory_id_2} are not adjacent."
     else:
         return True, f"Removed adjacency between territories {territory_id_1} and {territory_id_2}."
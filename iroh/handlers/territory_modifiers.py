@@ -0,0 +1,198 @@
+"""
+Per-territory building modifiers for the wargame system.
+
+Production bonuses, fortification and hospital counts only change when a
+building is constructed or destroyed, so the turn resolver builds a
+TerritoryModifierIndex once and reads from it instead of fetching each
+territory's buildings again for every territory, unit and capture.
+"""
+import asyncpg
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Iterable
+import logging
+from db import Building, Territory
+
+logger = logging.getLogger(__name__)
+
+# Resource keywords that buildings can provide production bonuses for
+RESOURCE_KEYWORDS = {'ore', 'lumber', 'coal', 'rations', 'cloth', 'platinum'}
+# Bonus production per building with matching resource keyword
+BONUS_PER_BUILDING = 2
+# Siege defense bonus per fortification building
+FORTIFICATION_BONUS = 2
+# Organization recovery bonus per hospital building
+HOSPITAL_BONUS = 2
+
+
+def compute_production_bonus(territory: Territory, active_buildings: Iterable[Building]) -> Dict[str, int]:
+    """
+    Calculate production bonuses from a territory's ACTIVE buildings.
+
+    Buildings provide production bonuses based on their keywords:
+    - Building with resource keyword (ore/lumber/coal/rations/cloth/platinum) + territory produces
+      that resource = +2 production for that resource
+    - Building with "industrial" + resource keyword = +2 regardless of territory production
+    - Industrial production enables non-industrial building bonuses (chaining)
+    - Multiple buildings with same keyword stack (+2 each)
+    - Building with multiple resource keywords gets +2 per matching keyword
+
+    Args:
+        territory: The territory the buildings stand in
+        active_buildings: ACTIVE buildings in the territory
+
+    Returns:
+        Dict mapping resource type to bonus amount
+    """
+    bonus = {rt: 0 for rt in RESOURCE_KEYWORDS}
+    active_buildings = list(active_buildings)
+    if not active_buildings:
+        return bonus
+
+    # Get natural production from territory
+    natural_production = {
+        'ore': territory.ore_production,
+        'lumber': territory.lumber_production,
+        'coal': territory.coal_production,
+        'rations': territory.rations_production,
+        'cloth': territory.cloth_production,
+        'platinum': territory.platinum_production
+    }
+
+    # Phase 1: Calculate industrial production (always applies regardless of natural production)
+    industrial_production = {rt: 0 for rt in RESOURCE_KEYWORDS}
+    for building in active_buildings:
+        keywords = building.keywords or []
+        if 'industrial' in keywords:
+            for keyword in keywords:
+                if keyword in RESOURCE_KEYWORDS:
+                    industrial_production[keyword] += BONUS_PER_BUILDING
+
+    # Phase 2: Calculate non-industrial bonuses (requires natural OR industrial production)
+    # Start with industrial production as base
+    for rt in RESOURCE_KEYWORDS:
+        bonus[rt] = industrial_production[rt]
+
+    for building in active_buildings:
+        keywords = building.keywords or []
+        if 'industrial' not in keywords:
+            for keyword in keywords:
+                if keyword in RESOURCE_KEYWORDS:
+                    # Check if there's natural or industrial production for this resource
+                    if natural_production[keyword] > 0 or industrial_production[keyword] > 0:
+                        bonus[keyword] += BONUS_PER_BUILDING
+
+    return bonus
+
+
+def count_keyword(active_buildings: Iterable[Building], keyword: str) -> int:
+    """Count ACTIVE buildings carrying a keyword (case-insensitive)."""
+    return sum(
+        1 for b in active_buildings
+        if b.keywords and keyword in [k.lower() for k in b.keywords]
+    )
+
+
+@dataclass
+class TerritoryModifiers:
+    """Precomputed building modifiers for one territory."""
+    production_bonus: Dict[str, int] = field(default_factory=lambda: {rt: 0 for rt in RESOURCE_KEYWORDS})
+    fortification_count: int = 0
+    hospital_count: int = 0
+
+
+class TerritoryModifierIndex:
+    """
+    Building modifiers for every territory in a guild, built from one query.
+
+    Call building_added / building_removed when a building is constructed or
+    destroyed mid-turn so later phases see the change.
+    """
+
+    def __init__(self, territories: List[Territory], active_buildings: List[Building]):
+        self._territories: Dict[str, Territory] = {t.territory_id: t for t in territories}
+        self._buildings: Dict[str, List[Building]] = {}
+        self._modifiers: Dict[str, TerritoryModifiers] = {}
+
+        for building in active_buildings:
+            if building.territory_id is not None:
+                self._buildings.setdefault(building.territory_id, []).append(building)
+        for territory_id in self._buildings:
+            self._recompute(territory_id)
+
+    @classmethod
+    async def build(
+        cls,
+        conn: asyncpg.Connection,
+        guild_id: int,
+        territories: Optional[List[Territory]] = None
+    ) -> "TerritoryModifierIndex":
+        """
+        Build the index for a guild.
+
+        Args:
+            conn: Database connection
+            guild_id: Guild ID
+            territories: Territories already fetched by the caller, if any
+
+        Returns:
+            The populated index
+        """
+        if territories is None:
+            territories = await Territory.fetch_all(conn, guild_id)
+        active_buildings = await Building.fetch_active_for_upkeep(conn, guild_id)
+        index = cls(territories, active_buildings)
+        logger.info(f"Territory modifiers: indexed {len(active_buildings)} active buildings "
+                    f"across {len(index._buildings)} territories for guild {guild_id}")
+        return index
+
+    def _recompute(self, territory_id: str):
+        buildings = self._buildings.get(territory_id, [])
+        if not buildings:
+            self._modifiers.pop(territory_id, None)
+            return
+
+        territory = self._territories.get(territory_id)
+        modifiers = TerritoryModifiers(
+            fortification_count=count_keyword(buildings, 'fortification'),
+            hospital_count=count_keyword(buildings, 'hospital'),
+        )
+        if territory is not None:
+            modifiers.production_bonus = compute_production_bonus(territory, buildings)
+        self._modifiers[territory_id] = modifiers
+
+    def get(self, territory_id: str) -> TerritoryModifiers:
+        """Modifiers for a territory (all zero if it has no active buildings)."""
+        return self._modifiers.get(territory_id) or TerritoryModifiers()
+
+    def production_bonus(self, territory_id: str) -> Dict[str, int]:
+        """Production bonus per resource for a territory."""
+        return dict(self.get(territory_id).production_bonus)
+
+    def siege_defense(self, territory: Territory) -> int:
+        """Base siege defense plus FORTIFICATION_BONUS per active fortification."""
+        return territory.siege_defense + self.get(territory.territory_id).fortification_count * FORTIFICATION_BONUS
+
+    def hospital_bonus(self, territory_id: str) -> int:
+        """Organization recovery bonus from active hospitals."""
+        return self.get(territory_id).hospital_count * HOSPITAL_BONUS
+
+    def building_added(self, building: Building):
+        """Record a newly constructed ACTIVE building."""
+        if building.status != 'ACTIVE' or building.territory_id is None:
+            return
+        buildings = self._buildings.setdefault(building.territory_id, [])
+        buildings[:] = [b for b in buildings if b.building_id != building.building_id]
+        buildings.append(building)
+        self._recompute(building.territory_id)
+
+    def building_removed(self, building: Building):
+        """Record a building that was destroyed or removed."""
+        if building.territory_id is None:
+            return
+        buildings = self._buildings.get(building.territory_id)
+        if not buildings:
+            return
+        buildings[:] = [b for b in buildings if b.building_id != building.building_id]
+        if not buildings:
+            del self._buildings[building.territory_id]
+        self._recompute(building.territory_id)
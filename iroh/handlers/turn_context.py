@@ -0,0 +1,132 @@
+"""
+Per-turn resolution context for the wargame system.
+
+resolve_turn creates one TurnContext per guild and passes it to the phases.
+It carries state one phase hands to another - submarines that engaged in
+naval combat, units found encircled - so nothing about a turn in progress
+lives in module globals and turns for different guilds can resolve
+concurrently in one event loop.
+
+Lookups that movement, combat, naval combat and encirclement repeat for the
+same units - the faction a character represents, who holds a faction
+permission - are loaded once and served from memory. For those the context
+is also installed in a ContextVar, so the helpers below find it without it
+being threaded through every call. Outside turn resolution they query the
+database directly.
+"""
+import asyncpg
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+from db import Character, FactionPermission
+from handlers.naval_occupancy import NavalOccupancyIndex
+
+logger = logging.getLogger(__name__)
+
+_current_context: ContextVar[Optional["TurnContext"]] = ContextVar('turn_context', default=None)
+
+# Submarines that engaged in each guild's last resolved turn: guild_id -> (turn_number, unit IDs)
+_last_turn_submarines: Dict[int, Tuple[int, Set[int]]] = {}
+
+
+class TurnContext:
+    """
+    State shared by the phases of one guild's turn.
+
+    Character and permission lookups are loaded lazily on first use. Call
+    invalidate() after anything that changes faction membership,
+    representation or permissions.
+
+    Attributes:
+        submarines_in_combat: Internal IDs of submarines that engaged in naval
+            combat. Observation reports only reveal these submarines. Until
+            this turn's naval combat runs it holds the previous turn's.
+        encircled_unit_ids: Internal IDs of units found encircled this turn.
+        naval_occupancy: Naval unit windows, built once naval movement has run.
+    """
+
+    def __init__(self, guild_id: int, turn_number: int):
+        self.guild_id = guild_id
+        self.turn_number = turn_number
+        self.submarines_in_combat: Set[int] = set()
+        self.encircled_unit_ids: Set[int] = set()
+        self.naval_occupancy: Optional[NavalOccupancyIndex] = None
+        self._characters: Optional[Dict[int, Optional[Character]]] = None
+        self._permission_holders: Optional[Dict[Tuple[int, str], List[int]]] = None
+
+        last_turn = _last_turn_submarines.get(guild_id)
+        if last_turn is not None and last_turn[0] == turn_number - 1:
+            self.submarines_in_combat = set(last_turn[1])
+
+    def finish(self):
+        """Record what later turns of this guild need once the turn has resolved."""
+        _last_turn_submarines[self.guild_id] = (self.turn_number, set(self.submarines_in_combat))
+
+    @contextmanager
+    def installed(self):
+        """Make this the current context for the duration of the block."""
+        token = _current_context.set(self)
+        try:
+            yield self
+        finally:
+            _current_context.reset(token)
+
+    def invalidate(self):
+        """Drop memoized lookups so they are reloaded on next use."""
+        self._characters = None
+        self._permission_holders = None
+
+    async def _load(self, conn: asyncpg.Connection):
+        characters = await Character.fetch_all(conn, self.guild_id)
+        permissions = await FactionPermission.fetch_all(conn, self.guild_id)
+
+        self._characters = {c.id: c for c in characters}
+        self._permission_holders = {}
+        for perm in permissions:
+            self._permission_holders.setdefault(
+                (perm.faction_id, perm.permission_type), []
+            ).append(perm.character_id)
+        logger.info(f"Turn context: loaded {len(characters)} characters and {len(permissions)} "
+                    f"permissions for guild {self.guild_id}, turn {self.turn_number}")
+
+    async def character(self, conn: asyncpg.Connection, character_id: int) -> Optional[Character]:
+        """A character by internal ID, or None if it does not exist."""
+        if self._characters is None:
+            await self._load(conn)
+        if character_id not in self._characters:
+            # Not in this guild's snapshot; look it up once and remember the answer
+            self._characters[character_id] = await Character.fetch_by_id(conn, character_id)
+        return self._characters[character_id]
+
+    async def permission_holders(self, conn: asyncpg.Connection, faction_id: int, permission_type: str) -> List[int]:
+        """IDs of characters holding a permission for a faction."""
+        if self._permission_holders is None:
+            await self._load(conn)
+        return list(self._permission_holders.get((faction_id, permission_type), []))
+
+
+def current_turn_context() -> Optional[TurnContext]:
+    """The context of the turn being resolved, if any."""
+    return _current_context.get()
+
+
+async def fetch_character(conn: asyncpg.Connection, character_id: int) -> Optional[Character]:
+    """Character.fetch_by_id, served from the current turn context when there is one."""
+    context = current_turn_context()
+    if context is not None:
+        return await context.character(conn, character_id)
+    return await Character.fetch_by_id(conn, character_id)
+
+
+async def fetch_permission_holders(
+    conn: asyncpg.Connection,
+    faction_id: int,
+    permission_type: str,
+    guild_id: int
+) -> List[int]:
+    """FactionPermission.fetch_characters_with_permission, served from the current turn context when there is one."""
+    context = current_turn_context()
+    if context is not None and context.guild_id == guild_id:
+        return await context.permission_holders(conn, faction_id, permission_type)
+    return await FactionPermission.fetch_characters_with_permission(conn, faction_id, permission_type, guild_id)
@@ -7,7 +7,7 @@ from datetime import datetime
 from db import (
     Order, Unit, Character, Faction, FactionMember, Territory,
     PlayerResources, WargameConfig, TurnLog, FactionJoinRequest, War, WarParticipant,
-    FactionResources, FactionPermission, Building, BuildingType
+    FactionResources, FactionPermission, Building, BuildingType, ResourceBalance
 )
 from order_types import *
 from orders import *
@@ -23,6 +23,7 @@ from handlers.movement_handlers import (
     build_movement_states,
     build_naval_transport_states,
     process_movement_tick,
+    terrain_cost_table,
     process_patrol_engagement,
     check_engagement,
     generate_observation_reports,
@@ -40,6 +41,10 @@ from handlers.naval_combat_handlers import (
     execute_naval_combat_phase as _execute_naval_combat_phase,
     handle_transport_destruction,
 )
+from handlers.turn_context import TurnContext
+from handlers.naval_occupancy import NavalOccupancyIndex
+from handlers.snapshot_handlers import save_snapshot
+from handlers.report_handlers import materialize_turn_reports
 from handlers.encirclement_handlers import (
     check_unit_encircled,
     get_unit_home_faction_id,
@@ -51,20 +56,32 @@ from handlers.spirit_nexus_handlers import (
 )
 from orders.movement_state import MovementStatus
 
-# Resource keywords that buildings can provide production bonuses for
-RESOURCE_KEYWORDS = {'ore', 'lumber', 'coal', 'rations', 'cloth', 'platinum'}
-# Bonus production per building with matching resource keyword
-BONUS_PER_BUILDING = 2
-# Siege defense bonus per fortification building
-FORTIFICATION_BONUS = 2
-# Organization recovery bonus per hospital building
-HOSPITAL_BONUS = 2
+from handlers.balance_ledger import (
+    BalanceLedger,
+    RESOURCE_TYPES,
+    CHARACTER,
+    FACTION,
+    REASON_CHARACTER_PRODUCTION,
+    REASON_TERRITORY_PRODUCTION,
+    REASON_WAR_BONUS,
+    REASON_FACTION_SPENDING,
+    REASON_BUILDING_UPKEEP,
+    REASON_UNIT_UPKEEP,
+)
+from handlers.territory_modifiers import (
+    TerritoryModifierIndex,
+    compute_production_bonus,
+    count_keyword,
+    FORTIFICATION_BONUS,
+    HOSPITAL_BONUS,
+)
 
 
 async def calculate_hospital_bonus(
     conn: asyncpg.Connection,
     territory_id: str,
-    guild_id: int
+    guild_id: int,
+    modifier_index: Optional[TerritoryModifierIndex] = None
 ) -> int:
     """
     Calculate organization recovery bonus from ACTIVE hospital buildings.
@@ -73,25 +90,25 @@ async def calculate_hospital_bonus(
         conn: Database connection
         territory_id: The territory to check for hospital buildings
         guild_id: Guild ID
+        modifier_index: Turn-wide building modifier index; queried directly if omitted
 
     Returns:
         Total organization recovery bonus (HOSPITAL_BONUS per active hospital)
     """
+    if modifier_index is not None:
+        return modifier_index.hospital_bonus(territory_id)
+
     buildings = await Building.fetch_by_territory(conn, territory_id, guild_id)
     active_buildings = [b for b in buildings if b.status == 'ACTIVE']
 
-    hospital_count = sum(
-        1 for b in active_buildings
-        if b.keywords and 'hospital' in [k.lower() for k in b.keywords]
-    )
-
-    return hospital_count * HOSPITAL_BONUS
+    return count_keyword(active_buildings, 'hospital') * HOSPITAL_BONUS
 
 
 async def calculate_territory_siege_defense(
     conn: asyncpg.Connection,
     territory: Territory,
-    guild_id: int
+    guild_id: int,
+    modifier_index: Optional[TerritoryModifierIndex] = None
 ) -> int:
     """
     Calculate total siege defense: base + (ACTIVE fortification buildings * FORTIFICATION_BONUS).
@@ -100,21 +117,20 @@ async def calculate_territory_siege_defense(
         conn: Database connection
         territory: The territory to calculate siege defense for
         guild_id: Guild ID
+        modifier_index: Turn-wide building modifier index; queried directly if omitted
 
     Returns:
         Total siege defense value
     """
+    if modifier_index is not None:
+        return modifier_index.siege_defense(territory)
+
     base_defense = territory.siege_defense
 
     buildings = await Building.fetch_by_territory(conn, territory.territory_id, guild_id)
     active_buildings = [b for b in buildings if b.status == 'ACTIVE']
 
-    fortification_count = sum(
-        1 for b in active_buildings
-        if b.keywords and 'fortification' in [k.lower() for k in b.keywords]
-    )
-
-    return base_defense + (fortification_count * FORTIFICATION_BONUS)
+    return base_defense + (count_keyword(active_buildings, 'fortification') * FORTIFICATION_BONUS)
 
 
 def deduplicate_observation_events(obs_events: List[TurnLog]) -> List[TurnLog]:
@@ -193,34 +209,50 @@ async def resolve_turn(
     turn_number = config.current_turn + 1
     all_events = []
 
+    # Checkpoint the pre-turn state so a bad resolution can be rolled back with /snapshot-restore
+    await save_snapshot(conn, guild_id, automatic=True)
+
+    # Building modifiers are read by several phases; index them once for the turn
+    modifier_index = await TerritoryModifierIndex.build(conn, guild_id)
+
+    # State handed between phases, plus memoized unit -> faction and notification lookups
+    turn_context = TurnContext(guild_id, turn_number)
+
     #try:
     # Execute phases in order
-    beginning_events = await execute_beginning_phase(conn, guild_id, turn_number)
-    all_events.extend(beginning_events)
+    with turn_context.installed():
+        beginning_events = await execute_beginning_phase(conn, guild_id, turn_number)
+        all_events.extend(beginning_events)
 
-    movement_events = await execute_movement_phase(conn, guild_id, turn_number)
-    all_events.extend(movement_events)
+        # Faction membership and permissions only change in the beginning phase
+        turn_context.invalidate()
 
-    combat_events = await execute_combat_phase(conn, guild_id, turn_number)
-    all_events.extend(combat_events)
+        movement_events = await execute_movement_phase(conn, guild_id, turn_number, turn_context)
+        all_events.extend(movement_events)
 
-    resource_events = await execute_resource_collection_phase(conn, guild_id, turn_number)
-    all_events.extend(resource_events)
+        combat_events = await execute_combat_phase(conn, guild_id, turn_number, turn_context)
+        all_events.extend(combat_events)
 
-    transfer_events = await execute_resource_transfer_phase(conn, guild_id, turn_number)
-    all_events.extend(transfer_events)
+        resource_events = await execute_resource_collection_phase(conn, guild_id, turn_number, modifier_index)
+        all_events.extend(resource_events)
 
-    encirclement_events, encircled_unit_ids = await execute_encirclement_phase(conn, guild_id, turn_number)
-    all_events.extend(encirclement_events)
+        transfer_events = await execute_resource_transfer_phase(conn, guild_id, turn_number)
+        all_events.extend(transfer_events)
 
-    upkeep_events = await execute_upkeep_phase(conn, guild_id, turn_number, encircled_unit_ids)
-    all_events.extend(upkeep_events)
+        encirclement_events, _ = await execute_encirclement_phase(conn, guild_id, turn_number, turn_context)
+        all_events.extend(encirclement_events)
 
-    organization_events = await execute_organization_phase(conn, guild_id, turn_number)
-    all_events.extend(organization_events)
+        upkeep_events = await execute_upkeep_phase(conn, guild_id, turn_number, turn_context=turn_context)
+        all_events.extend(upkeep_events)
 
-    construction_events = await execute_construction_phase(conn, guild_id, turn_number)
-    all_events.extend(construction_events)
+        organization_events = await execute_organization_phase(conn, guild_id, turn_number, modifier_index)
+        all_events.extend(organization_events)
+
+        construction_events = await execute_construction_phase(conn, guild_id, turn_number, modifier_index)
+        all_events.extend(construction_events)
+
+    # Materialize end-of-turn balances alongside the ResourceLedger journal
+    await ResourceBalance.snapshot_turn(conn, turn_number, guild_id)
 
     # Update config
     config.current_turn = turn_number
@@ -229,8 +261,11 @@ async def resolve_turn(
     logger.info(f"Turn resolution: updated config to turn {turn_number} for guild {guild_id}")
 
     # Write all events to TurnLog
-    for event in all_events:
-        await event.insert(conn)
+    await TurnLog.insert_many(conn, all_events)
+    turn_context.finish()
+
+    # Render reports once; report commands only split the stored lines into embeds
+    await materialize_turn_reports(conn, guild_id, turn_number, all_events)
 
     logger.info(f"Turn resolution: wrote {len(all_events)} events to TurnLog for guild {guild_id}, turn {turn_number}")
     logger.info(f"Turn resolution: turn {turn_number} resolved successfully for guild {guild_id}")
@@ -292,7 +327,8 @@ async def execute_beginning_phase(
 async def execute_movement_phase(
     conn: asyncpg.Connection,
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    turn_context: Optional[TurnContext] = None
 ) -> List[TurnLog]:
     """
     Execute the Movement phase: transit orders with tick-based movement.
@@ -317,6 +353,7 @@ async def execute_movement_phase(
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
+        turn_context: Optional turn context; observations reveal the submarines recorded on it
 
     Returns:
         List of TurnLog objects
@@ -329,6 +366,11 @@ async def execute_movement_phase(
     events.extend(naval_events)
     logger.info(f"Movement phase: naval movement generated {len(naval_events)} events")
 
+    # Naval windows are settled now; index them once for transport matching, combat and convoys
+    occupancy = await NavalOccupancyIndex.build(conn, guild_id)
+    if turn_context is not None:
+        turn_context.naval_occupancy = occupancy
+
     # 1. SETUP - Fetch PENDING/ONGOING UNIT orders for MOVEMENT phase
     all_orders = await Order.fetch_unresolved_by_phase(
         conn, guild_id, TurnPhase.MOVEMENT.value
@@ -340,7 +382,9 @@ async def execute_movement_phase(
     if not unit_orders:
         logger.info(f"Movement phase: no unit orders to process for guild {guild_id}")
         # Still generate observation reports for stationary units
-        obs_events, _ = await generate_observation_reports(conn, [], guild_id, turn_number, tick=0)
+        obs_events, _ = await generate_observation_reports(
+            conn, [], guild_id, turn_number, tick=0, turn_context=turn_context
+        )
         events.extend(deduplicate_observation_events(obs_events))
         logger.info(f"Movement phase: finished movement phase for guild {guild_id}, turn {turn_number}")
         return events
@@ -369,7 +413,9 @@ async def execute_movement_phase(
     if not land_states and not naval_states:
         logger.info(f"Movement phase: no valid movement states after validation")
         # Still generate observation reports for stationary units
-        obs_events, _ = await generate_observation_reports(conn, [], guild_id, turn_number, tick=0)
+        obs_events, _ = await generate_observation_reports(
+            conn, [], guild_id, turn_number, tick=0, turn_context=turn_context
+        )
         events.extend(deduplicate_observation_events(obs_events))
         logger.info(f"Movement phase: finished movement phase for guild {guild_id}, turn {turn_number}")
         return events
@@ -383,7 +429,9 @@ async def execute_movement_phase(
     logger.info(f"Movement phase: processed {len(disembark_events)} disembarkations")
 
     # 2. PRE-TICK - Process transport boarding
-    boarding_events = await process_transport_boarding(conn, land_states, naval_states, guild_id, turn_number)
+    boarding_events = await process_transport_boarding(
+        conn, land_states, naval_states, guild_id, turn_number, occupancy
+    )
     events.extend(boarding_events)
     logger.info(f"Movement phase: processed {len(boarding_events)} boarding events")
 
@@ -402,6 +450,9 @@ async def execute_movement_phase(
     logger.info(f"Movement phase: max_ticks={max_ticks}, processing {len(land_states)} land states, "
                 f"{len(naval_states)} naval states")
 
+    # Terrain costs are read on every step of every tick; load them once for the phase
+    terrain_costs = await terrain_cost_table(conn, guild_id)
+
     # Initialize observation tracker for deduplication
     # Tracks (recipient_char_id, observed_unit_id) -> tick
     observation_tracker = {}
@@ -413,7 +464,9 @@ async def execute_movement_phase(
 
         # a. Process patrol engagement
         non_transported_states = [s for s in land_states if s.status != MovementStatus.TRANSPORTED]
-        patrol_events = await process_patrol_engagement(conn, non_transported_states, guild_id, turn_number)
+        patrol_events = await process_patrol_engagement(
+            conn, non_transported_states, guild_id, turn_number, terrain_costs
+        )
         events.extend(patrol_events)
 
         # b. Process transport movement (transported land units move through water)
@@ -424,7 +477,7 @@ async def execute_movement_phase(
 
         # c. Process regular land movement (skip TRANSPORTED units)
         non_transported_states = [s for s in land_states if s.status != MovementStatus.TRANSPORTED]
-        tick_events = await process_movement_tick(conn, non_transported_states, tick, guild_id)
+        tick_events = await process_movement_tick(conn, non_transported_states, tick, guild_id, terrain_costs)
         events.extend(tick_events)
 
         # d. Check engagement (skip TRANSPORTED units - they're on water)
@@ -434,24 +487,26 @@ async def execute_movement_phase(
 
         # e. Generate observation reports (include all states for observation)
         obs_events, observation_tracker = await generate_observation_reports(
-            conn, land_states, guild_id, turn_number, tick, observation_tracker
+            conn, land_states, guild_id, turn_number, tick, observation_tracker, turn_context
         )
         all_obs_events.extend(obs_events)
 
     # 5. POST-LOOP - Run engagement and observation one more time
     non_transported_states = [s for s in land_states if s.status != MovementStatus.TRANSPORTED]
-    patrol_events = await process_patrol_engagement(conn, non_transported_states, guild_id, turn_number)
+    patrol_events = await process_patrol_engagement(
+        conn, non_transported_states, guild_id, turn_number, terrain_costs
+    )
     events.extend(patrol_events)
     engagement_events = await check_engagement(conn, non_transported_states, turn_number, guild_id)
     events.extend(engagement_events)
     obs_events, observation_tracker = await generate_observation_reports(
-        conn, land_states, guild_id, turn_number, 0, observation_tracker
+        conn, land_states, guild_id, turn_number, 0, observation_tracker, turn_context
     )
     all_obs_events.extend(obs_events)
 
     # Generate aerial scout observations
     aerial_scout_events = await generate_aerial_scout_observations(
-        conn, land_states, guild_id, turn_number
+        conn, land_states, guild_id, turn_number, turn_context
     )
     all_obs_events.extend(aerial_scout_events)
 
@@ -476,7 +531,8 @@ async def execute_movement_phase(
 async def execute_combat_phase(
     conn: asyncpg.Connection,
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    turn_context: Optional[TurnContext] = None
 ) -> List[TurnLog]:
     """
     Execute the Combat phase.
@@ -491,6 +547,7 @@ async def execute_combat_phase(
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
+        turn_context: Optional turn context; engaging submarines are recorded on it
 
     Returns:
         List of TurnLog objects
@@ -498,7 +555,7 @@ async def execute_combat_phase(
     events = []
 
     # Naval combat first
-    naval_events = await _execute_naval_combat_phase(conn, guild_id, turn_number)
+    naval_events = await _execute_naval_combat_phase(conn, guild_id, turn_number, turn_context)
     events.extend(naval_events)
     logger.info(f"Combat phase: naval combat generated {len(naval_events)} events")
 
@@ -512,77 +569,68 @@ async def execute_combat_phase(
 async def calculate_building_production_bonus(
     conn: asyncpg.Connection,
     territory: Territory,
-    guild_id: int
+    guild_id: int,
+    modifier_index: Optional[TerritoryModifierIndex] = None
 ) -> Dict[str, int]:
     """
     Calculate production bonuses from buildings in a territory.
 
-    Buildings provide production bonuses based on their keywords:
-    - Building with resource keyword (ore/lumber/coal/rations/cloth/platinum) + territory produces
-      that resource = +2 production for that resource
-    - Building with "industrial" + resource keyword = +2 regardless of territory production
-    - Industrial production enables non-industrial building bonuses (chaining)
-    - Multiple buildings with same keyword stack (+2 each)
-    - Building with multiple resource keywords gets +2 per matching keyword
+    See compute_production_bonus for the keyword rules.
 
     Args:
         conn: Database connection
         territory: The territory to calculate bonuses for
         guild_id: Guild ID
+        modifier_index: Turn-wide building modifier index; queried directly if omitted
 
     Returns:
         Dict mapping resource type to bonus amount
     """
-    # Initialize bonus dict
-    bonus = {rt: 0 for rt in RESOURCE_KEYWORDS}
+    if modifier_index is not None:
+        return modifier_index.production_bonus(territory.territory_id)
 
     # Fetch ACTIVE buildings in territory
     buildings = await Building.fetch_by_territory(conn, territory.territory_id, guild_id)
     active_buildings = [b for b in buildings if b.status == 'ACTIVE']
 
-    if not active_buildings:
-        return bonus
-
-    # Get natural production from territory
-    natural_production = {
-        'ore': territory.ore_production,
-        'lumber': territory.lumber_production,
-        'coal': territory.coal_production,
-        'rations': territory.rations_production,
-        'cloth': territory.cloth_production,
-        'platinum': territory.platinum_production
-    }
+    return compute_production_bonus(territory, active_buildings)
+
+
+def _production_vector(entity) -> Tuple[int, ...]:
+    """Natural production of a Character or Territory as a resource vector."""
+    return tuple(getattr(entity, f'{rt}_production') for rt in RESOURCE_TYPES)
+
 
-    # Phase 1: Calculate industrial production (always applies regardless of natural production)
-    industrial_production = {rt: 0 for rt in RESOURCE_KEYWORDS}
-    for building in active_buildings:
-        keywords = building.keywords or []
-        if 'industrial' in keywords:
-            for keyword in keywords:
-                if keyword in RESOURCE_KEYWORDS:
-                    industrial_production[keyword] += BONUS_PER_BUILDING
+def _add_vectors(a: Tuple[int, ...], b: Tuple[int, ...]) -> Tuple[int, ...]:
+    return tuple(x + y for x, y in zip(a, b))
 
-    # Phase 2: Calculate non-industrial bonuses (requires natural OR industrial production)
-    # Start with industrial production as base
-    for rt in RESOURCE_KEYWORDS:
-        bonus[rt] = industrial_production[rt]
 
-    for building in active_buildings:
-        keywords = building.keywords or []
-        if 'industrial' not in keywords:
-            for keyword in keywords:
-                if keyword in RESOURCE_KEYWORDS:
-                    # Check if there's natural or industrial production for this resource
-                    if natural_production[keyword] > 0 or industrial_production[keyword] > 0:
-                        bonus[keyword] += BONUS_PER_BUILDING
+def _vector_dict(vector: Tuple[int, ...]) -> Dict[str, int]:
+    return dict(zip(RESOURCE_TYPES, vector))
 
-    return bonus
+
+_ZERO_VECTOR = (0,) * len(RESOURCE_TYPES)
+
+
+def _accumulate_character_resources(character_resources: dict, character: Character, vector: Tuple[int, ...]):
+    """Add a production vector to a character's entry in the shared character_resources dict."""
+    if character.id not in character_resources:
+        character_resources[character.id] = {
+            'name': character.name,
+            'resources': {rt: 0 for rt in RESOURCE_TYPES}
+        }
+    resources = character_resources[character.id]['resources']
+    for rt, amount in zip(RESOURCE_TYPES, vector):
+        resources[rt] += amount
 
 
 async def _collect_character_production(
     conn: asyncpg.Connection,
     guild_id: int,
-    character_resources: dict
+    character_resources: dict,
+    ledger: Optional[BalanceLedger] = None,
+    characters: Optional[List[Character]] = None,
+    turn_number: Optional[int] = None
 ) -> None:
     """
     Collect resources from character production values into the character_resources dict.
@@ -594,70 +642,33 @@ async def _collect_character_production(
         conn: Database connection
         guild_id: Guild ID
         character_resources: Dict to accumulate {character_id: {'name': str, 'resources': dict}}
+        ledger: Shared balance ledger; loaded and written back here if omitted
+        characters: All characters in the guild, if already fetched
+        turn_number: Current turn number, journalled when the ledger is loaded here
     """
     logger.info(f"Character production: starting for guild {guild_id}")
 
-    # Fetch all characters in the guild
-    characters = await Character.fetch_all(conn, guild_id)
+    own_ledger = ledger is None
+    if own_ledger:
+        ledger = await BalanceLedger.load(conn, guild_id, turn_number, TurnPhase.RESOURCE_COLLECTION.value)
+    if characters is None:
+        characters = await Character.fetch_all(conn, guild_id)
 
     for character in characters:
-        # Check if character has any production
-        total_production = (
-            character.ore_production + character.lumber_production +
-            character.coal_production + character.rations_production +
-            character.cloth_production + character.platinum_production
-        )
+        production = _production_vector(character)
 
-        if total_production == 0:
+        # Check if character has any production
+        if sum(production) == 0:
             continue
 
-        # Fetch or create PlayerResources
-        player_resources = await PlayerResources.fetch_by_character(conn, character.id, guild_id)
-
-        if not player_resources:
-            # Create new PlayerResources entry
-            player_resources = PlayerResources(
-                character_id=character.id,
-                ore=character.ore_production,
-                lumber=character.lumber_production,
-                coal=character.coal_production,
-                rations=character.rations_production,
-                cloth=character.cloth_production,
-                platinum=character.platinum_production,
-                guild_id=guild_id
-            )
-        else:
-            # Add to existing resources
-            player_resources.ore += character.ore_production
-            player_resources.lumber += character.lumber_production
-            player_resources.coal += character.coal_production
-            player_resources.rations += character.rations_production
-            player_resources.cloth += character.cloth_production
-            player_resources.platinum += character.platinum_production
-
-        # Update database
-        await player_resources.upsert(conn)
-
-        # Initialize character entry if not exists
-        if character.id not in character_resources:
-            character_resources[character.id] = {
-                'name': character.name,
-                'resources': {
-                    'ore': 0, 'lumber': 0, 'coal': 0,
-                    'rations': 0, 'cloth': 0, 'platinum': 0
-                }
-            }
-
-        # Accumulate resources
-        character_resources[character.id]['resources']['ore'] += character.ore_production
-        character_resources[character.id]['resources']['lumber'] += character.lumber_production
-        character_resources[character.id]['resources']['coal'] += character.coal_production
-        character_resources[character.id]['resources']['rations'] += character.rations_production
-        character_resources[character.id]['resources']['cloth'] += character.cloth_production
-        character_resources[character.id]['resources']['platinum'] += character.platinum_production
+        ledger.credit(CHARACTER, character.id, _vector_dict(production), REASON_CHARACTER_PRODUCTION)
+        _accumulate_character_resources(character_resources, character, production)
 
         logger.info(f"Character production: Added production for character {character.name} (ID: {character.id})")
 
+    if own_ledger:
+        await ledger.flush(conn)
+
     logger.info(f"Character production: finished for guild {guild_id}")
 
 
@@ -665,12 +676,18 @@ async def _collect_territory_production(
     conn: asyncpg.Connection,
     guild_id: int,
     turn_number: int,
-    character_resources: dict
+    character_resources: dict,
+    modifier_index: Optional[TerritoryModifierIndex] = None,
+    ledger: Optional[BalanceLedger] = None,
+    characters: Optional[List[Character]] = None,
+    territories: Optional[List[Territory]] = None
 ) -> List[TurnLog]:
     """
     Collect resources from territory production.
 
-    For each territory, give production to the character or faction controlling it.
+    Each producing territory contributes natural production plus its building
+    bonus as one resource vector; vectors are summed per controller and then
+    credited to the controller's balance.
     Character resources are accumulated into the shared character_resources dict.
     Returns events only for faction territory production.
 
@@ -679,6 +696,10 @@ async def _collect_territory_production(
         guild_id: Guild ID
         turn_number: Current turn number
         character_resources: Dict to accumulate {character_id: {'name': str, 'resources': dict}}
+        modifier_index: Turn-wide building modifier index; built here if omitted
+        ledger: Shared balance ledger; loaded and written back here if omitted
+        characters: All characters in the guild, if already fetched
+        territories: All territories in the guild, if already fetched
 
     Returns:
         List of TurnLog objects (faction events only)
@@ -686,15 +707,18 @@ async def _collect_territory_production(
     events = []
     logger.info(f"Territory production: starting for guild {guild_id}, turn {turn_number}")
 
-    # Fetch all territories in the guild
-    territories = await Territory.fetch_all(conn, guild_id)
-
-    # Dictionary to aggregate territory resources per character (for DB update)
-    territory_char_resources = {}
+    own_ledger = ledger is None
+    if own_ledger:
+        ledger = await BalanceLedger.load(conn, guild_id, turn_number, TurnPhase.RESOURCE_COLLECTION.value)
+    if territories is None:
+        territories = await Territory.fetch_all(conn, guild_id)
+    if characters is None:
+        characters = await Character.fetch_all(conn, guild_id)
+    if modifier_index is None:
+        modifier_index = await TerritoryModifierIndex.build(conn, guild_id, territories)
 
-    # Dictionary to aggregate resources per faction
-    # Structure: {faction_id: {ore: amount, lumber: amount, ...}}
-    faction_resources = {}
+    # Group producing territories by controller: {(owner_type, owner_id): vector}
+    production_by_owner: Dict[Tuple[str, int], Tuple[int, ...]] = {}
 
     for territory in territories:
         # Check controller type using helper method
@@ -709,160 +733,53 @@ async def _collect_territory_production(
             logger.debug(f"Territory production: Territory {territory.territory_id} has sacred-land keyword, skipping production")
             continue
 
-        # Calculate building production bonus for this territory
-        building_bonus = await calculate_building_production_bonus(conn, territory, guild_id)
-
-        if owner_type == 'character':
-            char_id = territory.controller_character_id
-
-            # Initialize character entry if not exists
-            if char_id not in territory_char_resources:
-                territory_char_resources[char_id] = {
-                    'ore': 0,
-                    'lumber': 0,
-                    'coal': 0,
-                    'rations': 0,
-                    'cloth': 0,
-                    'platinum': 0
-                }
-
-            # Aggregate resources (natural production + building bonus)
-            territory_char_resources[char_id]['ore'] += territory.ore_production + building_bonus['ore']
-            territory_char_resources[char_id]['lumber'] += territory.lumber_production + building_bonus['lumber']
-            territory_char_resources[char_id]['coal'] += territory.coal_production + building_bonus['coal']
-            territory_char_resources[char_id]['rations'] += territory.rations_production + building_bonus['rations']
-            territory_char_resources[char_id]['cloth'] += territory.cloth_production + building_bonus['cloth']
-            territory_char_resources[char_id]['platinum'] += territory.platinum_production + building_bonus['platinum']
-
-        elif owner_type == 'faction':
-            faction_id = territory.controller_faction_id
-
-            # Initialize faction entry if not exists
-            if faction_id not in faction_resources:
-                faction_resources[faction_id] = {
-                    'ore': 0,
-                    'lumber': 0,
-                    'coal': 0,
-                    'rations': 0,
-                    'cloth': 0,
-                    'platinum': 0
-                }
-
-            # Aggregate resources (natural production + building bonus)
-            faction_resources[faction_id]['ore'] += territory.ore_production + building_bonus['ore']
-            faction_resources[faction_id]['lumber'] += territory.lumber_production + building_bonus['lumber']
-            faction_resources[faction_id]['coal'] += territory.coal_production + building_bonus['coal']
-            faction_resources[faction_id]['rations'] += territory.rations_production + building_bonus['rations']
-            faction_resources[faction_id]['cloth'] += territory.cloth_production + building_bonus['cloth']
-            faction_resources[faction_id]['platinum'] += territory.platinum_production + building_bonus['platinum']
-
-    # Process each character's aggregated territory resources
-    for char_id, resources in territory_char_resources.items():
-        # Fetch character
-        character = await Character.fetch_by_id(conn, char_id)
-        if not character:
-            logger.warning(f"Territory production: Character {char_id} not found, skipping resource allocation")
-            continue
+        # Natural production + building bonus
+        bonus = modifier_index.production_bonus(territory.territory_id)
+        vector = _add_vectors(_production_vector(territory), tuple(bonus[rt] for rt in RESOURCE_TYPES))
+
+        owner_id = territory.controller_character_id if owner_type == CHARACTER else territory.controller_faction_id
+        key = (owner_type, owner_id)
+        production_by_owner[key] = _add_vectors(production_by_owner.get(key, _ZERO_VECTOR), vector)
+
+    characters_by_id = {c.id: c for c in characters}
+    factions_by_id = {}
+    permission_holders = {}
+    if any(owner_type == FACTION for owner_type, _ in production_by_owner):
+        factions_by_id = {f.id: f for f in await Faction.fetch_all(conn, guild_id)}
+        permission_holders = _index_permissions(await FactionPermission.fetch_all(conn, guild_id))
+
+    faction_count = 0
+    for (owner_type, owner_id), vector in production_by_owner.items():
+        if owner_type == CHARACTER:
+            character = characters_by_id.get(owner_id)
+            if not character:
+                logger.warning(f"Territory production: Character {owner_id} not found, skipping resource allocation")
+                continue
+            if sum(vector) == 0:
+                logger.debug(f"Territory production: Character {owner_id} has no resources to collect")
+                continue
 
-        # Check if character has any resources to collect
-        total_resources = sum(resources.values())
-        if total_resources == 0:
-            logger.debug(f"Territory production: Character {char_id} has no resources to collect")
+            resources = _vector_dict(vector)
+            ledger.credit(CHARACTER, owner_id, resources, REASON_TERRITORY_PRODUCTION)
+            _accumulate_character_resources(character_resources, character, vector)
+            logger.info(f"Territory production: Awarded {resources} to character {character.name} (ID: {owner_id})")
             continue
 
-        # Fetch or create PlayerResources
-        player_resources = await PlayerResources.fetch_by_character(conn, char_id, guild_id)
-
-        if not player_resources:
-            # Create new PlayerResources entry
-            player_resources = PlayerResources(
-                character_id=char_id,
-                ore=resources['ore'],
-                lumber=resources['lumber'],
-                coal=resources['coal'],
-                rations=resources['rations'],
-                cloth=resources['cloth'],
-                platinum=resources['platinum'],
-                guild_id=guild_id
-            )
-        else:
-            # Add to existing resources
-            player_resources.ore += resources['ore']
-            player_resources.lumber += resources['lumber']
-            player_resources.coal += resources['coal']
-            player_resources.rations += resources['rations']
-            player_resources.cloth += resources['cloth']
-            player_resources.platinum += resources['platinum']
-
-        # Update database
-        await player_resources.upsert(conn)
-
-        logger.info(f"Territory production: Awarded {resources} to character {character.name} (ID: {char_id})")
-
-        # Accumulate into shared character_resources dict for combined event creation
-        if char_id not in character_resources:
-            character_resources[char_id] = {
-                'name': character.name,
-                'resources': {
-                    'ore': 0, 'lumber': 0, 'coal': 0,
-                    'rations': 0, 'cloth': 0, 'platinum': 0
-                }
-            }
-
-        character_resources[char_id]['resources']['ore'] += resources['ore']
-        character_resources[char_id]['resources']['lumber'] += resources['lumber']
-        character_resources[char_id]['resources']['coal'] += resources['coal']
-        character_resources[char_id]['resources']['rations'] += resources['rations']
-        character_resources[char_id]['resources']['cloth'] += resources['cloth']
-        character_resources[char_id]['resources']['platinum'] += resources['platinum']
-
-    # Process each faction's aggregated resources
-    for faction_id, resources in faction_resources.items():
-        # Fetch faction
-        faction = await Faction.fetch_by_id(conn, faction_id)
+        faction = factions_by_id.get(owner_id)
         if not faction:
-            logger.warning(f"Territory production: Faction {faction_id} not found, skipping resource allocation")
+            logger.warning(f"Territory production: Faction {owner_id} not found, skipping resource allocation")
             continue
-
-        # Check if faction has any resources to collect
-        total_resources = sum(resources.values())
-        if total_resources == 0:
-            logger.debug(f"Territory production: Faction {faction_id} has no resources to collect")
+        if sum(vector) == 0:
+            logger.debug(f"Territory production: Faction {owner_id} has no resources to collect")
             continue
 
-        # Fetch or create FactionResources
-        faction_res = await FactionResources.fetch_by_faction(conn, faction_id, guild_id)
-
-        if not faction_res:
-            # Create new FactionResources entry
-            faction_res = FactionResources(
-                faction_id=faction_id,
-                ore=resources['ore'],
-                lumber=resources['lumber'],
-                coal=resources['coal'],
-                rations=resources['rations'],
-                cloth=resources['cloth'],
-                platinum=resources['platinum'],
-                guild_id=guild_id
-            )
-        else:
-            # Add to existing resources
-            faction_res.ore += resources['ore']
-            faction_res.lumber += resources['lumber']
-            faction_res.coal += resources['coal']
-            faction_res.rations += resources['rations']
-            faction_res.cloth += resources['cloth']
-            faction_res.platinum += resources['platinum']
-
-        # Update database
-        await faction_res.upsert(conn)
-
-        logger.info(f"Territory production: Awarded {resources} to faction {faction.name} (ID: {faction_id})")
+        resources = _vector_dict(vector)
+        ledger.credit(FACTION, owner_id, resources, REASON_TERRITORY_PRODUCTION)
+        faction_count += 1
+        logger.info(f"Territory production: Awarded {resources} to faction {faction.name} (ID: {owner_id})")
 
         # Get affected character IDs - faction leader and those with FINANCIAL permission see resource events
-        affected_char_ids = await FactionPermission.fetch_characters_with_permission(
-            conn, faction_id, "FINANCIAL", guild_id
-        )
+        affected_char_ids = list(permission_holders.get((owner_id, 'FINANCIAL'), []))
         # Also include faction leader
         if faction.leader_character_id and faction.leader_character_id not in affected_char_ids:
             affected_char_ids.append(faction.leader_character_id)
@@ -873,25 +790,21 @@ async def _collect_territory_production(
             phase='RESOURCE_COLLECTION',
             event_type='FACTION_TERRITORY_PRODUCTION',
             entity_type='faction',
-            entity_id=faction_id,
+            entity_id=owner_id,
             event_data={
                 'affected_character_ids': affected_char_ids,
                 'faction_id': faction.faction_id,
                 'faction_name': faction.name,
-                'resources': {
-                    'ore': resources['ore'],
-                    'lumber': resources['lumber'],
-                    'coal': resources['coal'],
-                    'rations': resources['rations'],
-                    'cloth': resources['cloth'],
-                    'platinum': resources['platinum']
-                }
+                'resources': resources
             },
             guild_id=guild_id
         ))
 
+    if own_ledger:
+        await ledger.flush(conn)
+
     logger.info(f"Territory production: finished for guild {guild_id}, turn {turn_number}. "
-                f"Processed {len(character_resources)} characters and {len(faction_resources)} factions.")
+                f"Processed {len(character_resources)} characters and {faction_count} factions.")
     return events
 
 
@@ -899,7 +812,10 @@ async def _apply_first_war_production_bonus(
     conn: asyncpg.Connection,
     guild_id: int,
     turn_number: int,
-    character_resources: dict
+    character_resources: dict,
+    ledger: Optional[BalanceLedger] = None,
+    characters: Optional[List[Character]] = None,
+    territories: Optional[List[Territory]] = None
 ) -> Dict[int, dict]:
     """
     Apply the first-war production bonus to factions that declared their first war this turn.
@@ -912,6 +828,9 @@ async def _apply_first_war_production_bonus(
         guild_id: Guild ID
         turn_number: Current turn number
         character_resources: Dict to accumulate {character_id: {'name': str, 'resources': dict}}
+        ledger: Shared balance ledger; loaded and written back here if omitted
+        characters: All characters in the guild, if already fetched
+        territories: All territories in the guild, if already fetched
 
     Returns:
         Dict mapping character_id to bonus info: {char_id: {'faction_name': str, 'bonus': dict}}
@@ -936,6 +855,24 @@ async def _apply_first_war_production_bonus(
         logger.info(f"First-war bonus: no bonuses to apply for guild {guild_id}, turn {turn_number}")
         return bonus_info
 
+    own_ledger = ledger is None
+    if own_ledger:
+        ledger = await BalanceLedger.load(conn, guild_id, turn_number, TurnPhase.RESOURCE_COLLECTION.value)
+    if characters is None:
+        characters = await Character.fetch_all(conn, guild_id)
+    if territories is None:
+        territories = await Territory.fetch_all(conn, guild_id)
+    characters_by_id = {c.id: c for c in characters}
+
+    # Natural production of directly controlled territories, summed per character
+    controlled_production: Dict[int, Tuple[int, ...]] = {}
+    for territory in territories:
+        char_id = territory.controller_character_id
+        if char_id is not None:
+            controlled_production[char_id] = _add_vectors(
+                controlled_production.get(char_id, _ZERO_VECTOR), _production_vector(territory)
+            )
+
     # For each faction with bonus, double all faction members' production
     for faction_id in bonus_faction_ids:
         faction = await Faction.fetch_by_id(conn, faction_id)
@@ -945,64 +882,27 @@ async def _apply_first_war_production_bonus(
         members = await FactionMember.fetch_by_faction(conn, faction_id, guild_id)
 
         for member in members:
-            character = await Character.fetch_by_id(conn, member.character_id)
+            character = characters_by_id.get(member.character_id)
             if not character:
                 continue
 
-            # Get current resources (after normal production was added)
-            player_resources = await PlayerResources.fetch_by_character(conn, member.character_id, guild_id)
-            if not player_resources:
+            # Only characters that already hold resources receive the bonus
+            if not ledger.has(CHARACTER, character.id):
                 continue
 
-            # Calculate bonus from personal production values
-            bonus = {
-                'ore': character.ore_production,
-                'lumber': character.lumber_production,
-                'coal': character.coal_production,
-                'rations': character.rations_production,
-                'cloth': character.cloth_production,
-                'platinum': character.platinum_production
-            }
-
-            # Also include territory production for territories this character controls directly
-            territories = await Territory.fetch_by_controller(conn, character.id, guild_id)
-            for territory in territories:
-                bonus['ore'] += territory.ore_production
-                bonus['lumber'] += territory.lumber_production
-                bonus['coal'] += territory.coal_production
-                bonus['rations'] += territory.rations_production
-                bonus['cloth'] += territory.cloth_production
-                bonus['platinum'] += territory.platinum_production
-
-            # Add bonus resources to database
-            player_resources.ore += bonus['ore']
-            player_resources.lumber += bonus['lumber']
-            player_resources.coal += bonus['coal']
-            player_resources.rations += bonus['rations']
-            player_resources.cloth += bonus['cloth']
-            player_resources.platinum += bonus['platinum']
-            await player_resources.upsert(conn)
-
-            total_bonus = sum(bonus.values())
-            if total_bonus > 0:
+            # Bonus = personal production + production of territories this character controls directly
+            vector = _add_vectors(
+                _production_vector(character),
+                controlled_production.get(character.id, _ZERO_VECTOR)
+            )
+            bonus = _vector_dict(vector)
+            ledger.credit(CHARACTER, character.id, bonus, REASON_WAR_BONUS)
+
+            if sum(vector) > 0:
                 logger.info(f"First-war bonus: Doubled production for {character.name}: {bonus}")
 
                 # Accumulate bonus into character_resources for consolidated event creation
-                if character.id not in character_resources:
-                    character_resources[character.id] = {
-                        'name': character.name,
-                        'resources': {
-                            'ore': 0, 'lumber': 0, 'coal': 0,
-                            'rations': 0, 'cloth': 0, 'platinum': 0
-                        }
-                    }
-
-                character_resources[character.id]['resources']['ore'] += bonus['ore']
-                character_resources[character.id]['resources']['lumber'] += bonus['lumber']
-                character_resources[character.id]['resources']['coal'] += bonus['coal']
-                character_resources[character.id]['resources']['rations'] += bonus['rations']
-                character_resources[character.id]['resources']['cloth'] += bonus['cloth']
-                character_resources[character.id]['resources']['platinum'] += bonus['platinum']
+                _accumulate_character_resources(character_resources, character, vector)
 
                 # Track bonus info for this character
                 bonus_info[character.id] = {
@@ -1012,13 +912,17 @@ async def _apply_first_war_production_bonus(
 
         logger.info(f"First-war bonus: Applied double production to faction {faction.name}")
 
+    if own_ledger:
+        await ledger.flush(conn)
+
     return bonus_info
 
 
 async def execute_resource_collection_phase(
     conn: asyncpg.Connection,
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    modifier_index: Optional[TerritoryModifierIndex] = None
 ) -> List[TurnLog]:
     """
     Execute the Resource Collection phase.
@@ -1027,10 +931,14 @@ async def execute_resource_collection_phase(
     2. Territory production: Add resources based on controlled territories
     3. First-war bonus: Double production for factions that declared their first war this turn
 
+    All three steps credit one BalanceLedger, which is written back with one
+    bulk statement per resource table at the end.
+
     Args:
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
+        modifier_index: Turn-wide building modifier index; built on demand if omitted
 
     Returns:
         List of TurnLog objects
@@ -1038,19 +946,30 @@ async def execute_resource_collection_phase(
     events = []
     logger.info(f"Resource collection phase: starting for guild {guild_id}, turn {turn_number}")
 
+    ledger = await BalanceLedger.load(conn, guild_id, turn_number, TurnPhase.RESOURCE_COLLECTION.value)
+    characters = await Character.fetch_all(conn, guild_id)
+    territories = await Territory.fetch_all(conn, guild_id)
+
     # Shared dict to accumulate all character resources from both production sources
     # Structure: {character_id: {'name': str, 'resources': {ore: int, ...}}}
     character_resources = {}
 
     # Character production - accumulates into character_resources
-    await _collect_character_production(conn, guild_id, character_resources)
+    await _collect_character_production(conn, guild_id, character_resources, ledger, characters, turn_number)
 
     # Territory production - accumulates character resources into shared dict, returns faction events
-    faction_events = await _collect_territory_production(conn, guild_id, turn_number, character_resources)
+    faction_events = await _collect_territory_production(
+        conn, guild_id, turn_number, character_resources, modifier_index,
+        ledger, characters, territories
+    )
 
     # Apply first-war production bonus (doubles production for those who qualify)
     # This also accumulates bonus into character_resources and returns bonus info per character
-    war_bonus_info = await _apply_first_war_production_bonus(conn, guild_id, turn_number, character_resources)
+    war_bonus_info = await _apply_first_war_production_bonus(
+        conn, guild_id, turn_number, character_resources, ledger, characters, territories
+    )
+
+    await ledger.flush(conn)
 
     # Create combined events for each character (one event per character with all resources)
     for char_id, data in character_resources.items():
@@ -1146,7 +1065,8 @@ async def execute_resource_transfer_phase(
 async def execute_encirclement_phase(
     conn: asyncpg.Connection,
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    turn_context: Optional[TurnContext] = None
 ) -> Tuple[List[TurnLog], Set[int]]:
     """
     Execute the Encirclement phase.
@@ -1162,6 +1082,7 @@ async def execute_encirclement_phase(
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
+        turn_context: Optional turn context; encircled units are recorded on it
 
     Returns:
         Tuple of (List of TurnLog objects, Set of encircled unit internal IDs)
@@ -1176,11 +1097,16 @@ async def execute_encirclement_phase(
     # Filter to active land units only
     land_units = [u for u in all_units if not u.is_naval and u.status == 'ACTIVE']
 
+    # Naval convoy checks repeat for every land unit; read convoy ships from one index
+    occupancy = turn_context.naval_occupancy if turn_context is not None else None
+    if occupancy is None:
+        occupancy = await NavalOccupancyIndex.build(conn, guild_id, units=all_units)
+
     logger.info(f"Encirclement phase: checking {len(land_units)} active land units")
 
     for unit in land_units:
         # Check if unit is encircled
-        is_encircled = await check_unit_encircled(conn, unit, guild_id)
+        is_encircled = await check_unit_encircled(conn, unit, guild_id, occupancy)
 
         if is_encircled:
             encircled_unit_ids.add(unit.id)
@@ -1210,15 +1136,30 @@ async def execute_encirclement_phase(
 
             logger.info(f"Encirclement phase: unit {unit.unit_id} at {unit.current_territory_id} is ENCIRCLED")
 
+    if turn_context is not None:
+        turn_context.encircled_unit_ids = encircled_unit_ids
+
     logger.info(f"Encirclement phase: finished encirclement phase for guild {guild_id}, turn {turn_number}. "
                 f"{len(encircled_unit_ids)} units encircled.")
     return events, encircled_unit_ids
 
 
+def _index_permissions(permissions: List[FactionPermission]) -> Dict[Tuple[int, str], List[int]]:
+    """Map (faction_id, permission_type) to the character IDs holding it."""
+    holders: Dict[Tuple[int, str], List[int]] = {}
+    for perm in permissions:
+        ids = holders.setdefault((perm.faction_id, perm.permission_type), [])
+        if perm.character_id not in ids:
+            ids.append(perm.character_id)
+    return holders
+
+
 async def execute_faction_spending(
     conn: asyncpg.Connection,
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    ledger: Optional[BalanceLedger] = None,
+    permission_holders: Optional[Dict[Tuple[int, str], List[int]]] = None
 ) -> List[TurnLog]:
     """
     Execute faction spending deductions BEFORE unit upkeep.
@@ -1233,6 +1174,8 @@ async def execute_faction_spending(
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
+        ledger: Shared balance ledger; loaded and written back here if omitted
+        permission_holders: Output of _index_permissions; loaded here if omitted
 
     Returns:
         List of TurnLog events
@@ -1246,7 +1189,11 @@ async def execute_faction_spending(
         logger.info(f"Faction spending: no factions found for guild {guild_id}")
         return events
 
-    resource_types = ['ore', 'lumber', 'coal', 'rations', 'cloth', 'platinum']
+    own_ledger = ledger is None
+    if own_ledger:
+        ledger = await BalanceLedger.load(conn, guild_id, turn_number, TurnPhase.UPKEEP.value)
+    if permission_holders is None:
+        permission_holders = _index_permissions(await FactionPermission.fetch_all(conn, guild_id))
 
     for faction in factions:
         # Check if faction has any spending configured
@@ -1263,43 +1210,15 @@ async def execute_faction_spending(
         if total_spending == 0:
             continue
 
-        # Fetch faction resources
-        resources = await FactionResources.fetch_by_faction(conn, faction.id, guild_id)
-        if not resources:
-            resources = FactionResources(
-                faction_id=faction.id,
-                ore=0, lumber=0, coal=0, rations=0, cloth=0, platinum=0,
-                guild_id=guild_id
-            )
+        # Deduct spending from resources, taking what's available
+        needed = {rt: amount for rt, amount in spending.items() if amount != 0}
+        deducted = ledger.deduct(FACTION, faction.id, needed, REASON_FACTION_SPENDING)
 
-        # Deduct spending from resources
-        amounts_spent = {}
-        shortfall = {}
+        amounts_spent = {rt: v for rt, v in deducted.items() if v > 0}
+        shortfall = {rt: needed[rt] - v for rt, v in deducted.items() if v < needed[rt]}
 
-        for rt in resource_types:
-            needed = spending[rt]
-            if needed == 0:
-                continue
-
-            available = getattr(resources, rt)
-            deducted = min(needed, available)
-            setattr(resources, rt, available - deducted)
-
-            if deducted > 0:
-                amounts_spent[rt] = deducted
-
-            if deducted < needed:
-                shortfall[rt] = needed - deducted
-
-        # Save updated resources
-        await resources.upsert(conn)
-
-        # Get affected character IDs (those with FINANCIAL permission)
-        affected_ids = []
-        permissions = await FactionPermission.fetch_by_faction(conn, faction.id, guild_id)
-        for perm in permissions:
-            if perm.permission_type == 'FINANCIAL' and perm.character_id not in affected_ids:
-                affected_ids.append(perm.character_id)
+        # Characters with FINANCIAL permission are notified
+        affected_ids = list(permission_holders.get((faction.id, 'FINANCIAL'), []))
 
         # Generate FACTION_SPENDING event if any resources were spent
         if amounts_spent:
@@ -1337,6 +1256,9 @@ async def execute_faction_spending(
             ))
             logger.info(f"Faction spending: {faction.name} shortfall {shortfall}")
 
+    if own_ledger:
+        await ledger.flush(conn)
+
     logger.info(f"Faction spending: finished faction spending for guild {guild_id}, turn {turn_number}")
     return events
 
@@ -1344,7 +1266,9 @@ async def execute_faction_spending(
 async def execute_building_upkeep(
     conn: asyncpg.Connection,
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    ledger: Optional[BalanceLedger] = None,
+    permission_holders: Optional[Dict[Tuple[int, str], List[int]]] = None
 ) -> List[TurnLog]:
     """
     Execute building upkeep. Buildings are processed:
@@ -1358,6 +1282,8 @@ async def execute_building_upkeep(
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
+        ledger: Shared balance ledger; loaded and written back here if omitted
+        permission_holders: Output of _index_permissions; loaded here if omitted
 
     Returns:
         List of TurnLog events
@@ -1371,139 +1297,75 @@ async def execute_building_upkeep(
         logger.info(f"Building upkeep: no active buildings found for guild {guild_id}")
         return events
 
-    resource_types = ['ore', 'lumber', 'coal', 'rations', 'cloth', 'platinum']
+    own_ledger = ledger is None
+    if own_ledger:
+        ledger = await BalanceLedger.load(conn, guild_id, turn_number, TurnPhase.UPKEEP.value)
+    if permission_holders is None:
+        permission_holders = _index_permissions(await FactionPermission.fetch_all(conn, guild_id))
+
+    territories = {t.territory_id: t for t in await Territory.fetch_all(conn, guild_id)}
+    damaged_buildings = []
 
     for building in buildings:
+        upkeep = {rt: getattr(building, f'upkeep_{rt}') for rt in RESOURCE_TYPES}
+
         # Skip buildings with no upkeep
-        total_upkeep = (
-            building.upkeep_ore + building.upkeep_lumber + building.upkeep_coal +
-            building.upkeep_rations + building.upkeep_cloth + building.upkeep_platinum
-        )
-        if total_upkeep == 0:
+        if sum(upkeep.values()) == 0:
             continue
 
-        # Find the territory to determine controller
-        territory = await Territory.fetch_by_territory_id(conn, building.territory_id, guild_id)
-        if not territory:
-            logger.warning(f"Building upkeep: territory {building.territory_id} not found for building {building.building_id}")
-            # Building in nonexistent territory - all upkeep is deficit
-            deficit_types = []
-            for rt in resource_types:
-                if getattr(building, f'upkeep_{rt}') > 0:
-                    deficit_types.append(rt)
-
-            if deficit_types:
-                durability_penalty = len(deficit_types)
-                building.durability -= durability_penalty
-                await building.upsert(conn)
+        territory = territories.get(building.territory_id)
+        owner_type = territory.get_owner_type() if territory else None
 
-                events.append(TurnLog(
-                    turn_number=turn_number,
-                    phase=TurnPhase.UPKEEP.value,
-                    event_type='BUILDING_UPKEEP_DEFICIT',
-                    entity_type='building',
-                    entity_id=building.id,
-                    event_data={
-                        'building_id': building.building_id,
-                        'building_name': building.name,
-                        'territory_id': building.territory_id,
-                        'deficit_types': deficit_types,
-                        'durability_penalty': durability_penalty,
-                        'new_durability': building.durability,
-                        'affected_character_ids': []
-                    },
-                    guild_id=guild_id
-                ))
+        if owner_type is None:
+            # Building in nonexistent or uncontrolled territory - all upkeep is deficit
+            if not territory:
+                logger.warning(f"Building upkeep: territory {building.territory_id} not found for building {building.building_id}")
+            deficit_types = [rt for rt in RESOURCE_TYPES if upkeep[rt] > 0]
+
+            durability_penalty = len(deficit_types)
+            building.durability -= durability_penalty
+            damaged_buildings.append(building)
+
+            events.append(TurnLog(
+                turn_number=turn_number,
+                phase=TurnPhase.UPKEEP.value,
+                event_type='BUILDING_UPKEEP_DEFICIT',
+                entity_type='building',
+                entity_id=building.id,
+                event_data={
+                    'building_id': building.building_id,
+                    'building_name': building.name,
+                    'territory_id': building.territory_id,
+                    'deficit_types': deficit_types,
+                    'durability_penalty': durability_penalty,
+                    'new_durability': building.durability,
+                    'affected_character_ids': []
+                },
+                guild_id=guild_id
+            ))
             continue
 
         # Determine controller (character or faction)
-        owner_type = territory.get_owner_type()
-        resources = None
-        affected_character_ids = []
-
-        if owner_type == 'character':
-            controller_id = territory.controller_character_id
-            resources = await PlayerResources.fetch_by_character(conn, controller_id, guild_id)
-            if not resources:
-                resources = PlayerResources(
-                    character_id=controller_id,
-                    ore=0, lumber=0, coal=0, rations=0, cloth=0, platinum=0,
-                    guild_id=guild_id
-                )
-            affected_character_ids = [controller_id]
-
-        elif owner_type == 'faction':
-            faction_id = territory.controller_faction_id
-            resources = await FactionResources.fetch_by_faction(conn, faction_id, guild_id)
-            if not resources:
-                resources = FactionResources(
-                    faction_id=faction_id,
-                    ore=0, lumber=0, coal=0, rations=0, cloth=0, platinum=0,
-                    guild_id=guild_id
-                )
-            # Get characters with FINANCIAL permission for notifications
-            affected_character_ids = await FactionPermission.fetch_characters_with_permission(
-                conn, faction_id, "FINANCIAL", guild_id
-            )
-
+        if owner_type == CHARACTER:
+            owner_id = territory.controller_character_id
+            affected_character_ids = [owner_id]
         else:
-            # Uncontrolled territory - all upkeep is deficit
-            deficit_types = []
-            for rt in resource_types:
-                if getattr(building, f'upkeep_{rt}') > 0:
-                    deficit_types.append(rt)
-
-            if deficit_types:
-                durability_penalty = len(deficit_types)
-                building.durability -= durability_penalty
-                await building.upsert(conn)
-
-                events.append(TurnLog(
-                    turn_number=turn_number,
-                    phase=TurnPhase.UPKEEP.value,
-                    event_type='BUILDING_UPKEEP_DEFICIT',
-                    entity_type='building',
-                    entity_id=building.id,
-                    event_data={
-                        'building_id': building.building_id,
-                        'building_name': building.name,
-                        'territory_id': building.territory_id,
-                        'deficit_types': deficit_types,
-                        'durability_penalty': durability_penalty,
-                        'new_durability': building.durability,
-                        'affected_character_ids': []
-                    },
-                    guild_id=guild_id
-                ))
-            continue
+            owner_id = territory.controller_faction_id
+            # Get characters with FINANCIAL permission for notifications
+            affected_character_ids = list(permission_holders.get((owner_id, 'FINANCIAL'), []))
 
         # Process upkeep payment
-        resources_paid = {}
-        deficit_types = []
-
-        for rt in resource_types:
-            needed = getattr(building, f'upkeep_{rt}')
-            if needed == 0:
-                continue
-
-            available = getattr(resources, rt)
-            deducted = min(needed, available)
-            setattr(resources, rt, available - deducted)
-
-            if deducted > 0:
-                resources_paid[rt] = deducted
+        needed = {rt: amount for rt, amount in upkeep.items() if amount != 0}
+        deducted = ledger.deduct(owner_type, owner_id, needed, REASON_BUILDING_UPKEEP)
 
-            if deducted < needed:
-                deficit_types.append(rt)
-
-        # Save updated resources
-        await resources.upsert(conn)
+        resources_paid = {rt: v for rt, v in deducted.items() if v > 0}
+        deficit_types = [rt for rt, v in deducted.items() if v < needed[rt]]
 
         # Generate appropriate event
         if deficit_types:
             durability_penalty = len(deficit_types)
             building.durability -= durability_penalty
-            await building.upsert(conn)
+            damaged_buildings.append(building)
 
             events.append(TurnLog(
                 turn_number=turn_number,
@@ -1543,6 +1405,10 @@ async def execute_building_upkeep(
             ))
             logger.info(f"Building upkeep: {building.building_id} paid {resources_paid}")
 
+    await Building.update_durability_many(conn, damaged_buildings)
+    if own_ledger:
+        await ledger.flush(conn)
+
     logger.info(f"Building upkeep: finished for guild {guild_id}, turn {turn_number}")
     return events
 
@@ -1551,7 +1417,8 @@ async def execute_upkeep_phase(
     conn: asyncpg.Connection,
     guild_id: int,
     turn_number: int,
-    encircled_unit_ids: Optional[Set[int]] = None
+    encircled_unit_ids: Optional[Set[int]] = None,
+    turn_context: Optional[TurnContext] = None
 ) -> List[TurnLog]:
     """
     Execute the Upkeep phase.
@@ -1563,253 +1430,125 @@ async def execute_upkeep_phase(
     - Reduce organization by 1 for EACH missing resource TYPE
     - If organization <= 0, do nothing special (handled later)
 
+    Faction spending, building upkeep and unit upkeep all draw on one
+    BalanceLedger loaded up front; balances and unit organization are
+    written back in bulk at the end.
+
     Args:
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
         encircled_unit_ids: Optional set of unit IDs that are encircled (skip upkeep, penalize org)
+        turn_context: Optional turn context; its encircled units are used when encircled_unit_ids is not given
 
     Returns:
         List of TurnLog objects
     """
     if encircled_unit_ids is None:
-        encircled_unit_ids = set()
+        encircled_unit_ids = turn_context.encircled_unit_ids if turn_context is not None else set()
     events = []
     logger.info(f"Upkeep phase: starting upkeep phase for guild {guild_id}, turn {turn_number}")
 
+    ledger = await BalanceLedger.load(conn, guild_id, turn_number, TurnPhase.UPKEEP.value)
+    permission_holders = _index_permissions(await FactionPermission.fetch_all(conn, guild_id))
+
     # Process faction spending first, before unit upkeep
-    spending_events = await execute_faction_spending(conn, guild_id, turn_number)
+    spending_events = await execute_faction_spending(
+        conn, guild_id, turn_number, ledger, permission_holders
+    )
     events.extend(spending_events)
 
     # Process building upkeep before unit upkeep
-    building_events = await execute_building_upkeep(conn, guild_id, turn_number)
+    building_events = await execute_building_upkeep(
+        conn, guild_id, turn_number, ledger, permission_holders
+    )
     events.extend(building_events)
 
     # Fetch all units for the guild
     all_units = await Unit.fetch_all(conn, guild_id)
     if not all_units:
+        await ledger.flush(conn)
         logger.info(f"Upkeep phase: no units found for guild {guild_id}")
         logger.info(f"Upkeep phase: finished upkeep phase for guild {guild_id}, turn {turn_number}")
         return events
 
     # Group units by owner type and ID (only active units need upkeep)
     # Oldest units first (by id) to ensure oldest get upkeep priority
-    units_by_character: Dict[int, List[Unit]] = {}
-    units_by_faction: Dict[int, List[Unit]] = {}
-
+    units_by_owner: Dict[Tuple[str, int], List[Unit]] = {}
     for unit in sorted(all_units, key=lambda u: u.id):
         if unit.status != 'ACTIVE':
             continue
-
         owner_type = unit.get_owner_type()
-        if owner_type == 'character':
-            owner_id = unit.owner_character_id
-            if owner_id not in units_by_character:
-                units_by_character[owner_id] = []
-            units_by_character[owner_id].append(unit)
-        elif owner_type == 'faction':
-            owner_id = unit.owner_faction_id
-            if owner_id not in units_by_faction:
-                units_by_faction[owner_id] = []
-            units_by_faction[owner_id].append(unit)
-
-    resource_types = ['ore', 'lumber', 'coal', 'rations', 'cloth', 'platinum']
-
-    # Process upkeep for character-owned units
-    for owner_id, units in units_by_character.items():
-        owner = await Character.fetch_by_id(conn, owner_id)
-        if not owner:
-            logger.warning(f"Upkeep phase: owner character {owner_id} not found, skipping units")
-            continue
+        if owner_type in (CHARACTER, FACTION):
+            units_by_owner.setdefault((owner_type, unit.get_owner_id()), []).append(unit)
 
-        # Fetch or create player resources
-        resources = await PlayerResources.fetch_by_character(conn, owner_id, guild_id)
-        if not resources:
-            resources = PlayerResources(
-                character_id=owner_id,
-                ore=0, lumber=0, coal=0, rations=0, cloth=0, platinum=0,
-                guild_id=guild_id
-            )
+    characters = {c.id: c for c in await Character.fetch_all(conn, guild_id)}
+    factions = {f.id: f for f in await Faction.fetch_all(conn, guild_id)}
 
-        # Track total spent and deficits for summary events
-        total_spent = {rt: 0 for rt in resource_types}
-        total_deficit = {rt: 0 for rt in resource_types}
-        units_maintained = 0
-        units_with_deficit = 0
-
-        for unit in units:
-            # Check if unit is encircled - skip normal upkeep and apply encirclement penalty
-            if unit.id in encircled_unit_ids:
-                # Calculate org penalty = count of resource TYPES in upkeep (not amounts)
-                resource_types_needed = []
-                for rt in resource_types:
-                    if getattr(unit, f'upkeep_{rt}') > 0:
-                        resource_types_needed.append(rt)
+    # Character-owned units are processed before faction-owned units
+    owner_order = sorted(units_by_owner, key=lambda key: key[0] != CHARACTER)
+    penalized_units = []
 
-                penalty = len(resource_types_needed)
-                if penalty > 0:
-                    unit.organization -= penalty
-                    await unit.upsert(conn)
+    for owner_type, owner_id in owner_order:
+        units = units_by_owner[(owner_type, owner_id)]
 
-                    affected_ids = [owner_id]
-                    if unit.commander_character_id and unit.commander_character_id != owner_id:
-                        affected_ids.append(unit.commander_character_id)
-
-                    events.append(TurnLog(
-                        turn_number=turn_number,
-                        phase=TurnPhase.UPKEEP.value,
-                        event_type='UPKEEP_ENCIRCLED',
-                        entity_type='unit',
-                        entity_id=unit.id,
-                        event_data={
-                            'unit_id': unit.unit_id,
-                            'unit_name': unit.name or unit.unit_id,
-                            'organization_penalty': penalty,
-                            'new_organization': unit.organization,
-                            'resource_types_needed': resource_types_needed,
-                            'owner_character_id': owner_id,
-                            'owner_name': owner.name,
-                            'affected_character_ids': affected_ids
-                        },
-                        guild_id=guild_id
-                    ))
-                    logger.info(f"Upkeep phase: encircled unit {unit.unit_id} lost {penalty} org (no resources spent)")
-
-                # Skip normal upkeep processing for encircled units
+        if owner_type == CHARACTER:
+            owner = characters.get(owner_id)
+            if not owner:
+                logger.warning(f"Upkeep phase: owner character {owner_id} not found, skipping units")
                 continue
-
-            unit_deficit = {}
-
-            for rt in resource_types:
-                needed = getattr(unit, f'upkeep_{rt}')
-                available = getattr(resources, rt)
-                deducted = min(needed, available)
-
-                setattr(resources, rt, available - deducted)
-                total_spent[rt] += deducted
-
-                if deducted < needed:
-                    unit_deficit[rt] = needed - deducted
-                    total_deficit[rt] += needed - deducted
-
-            units_maintained += 1
-
-            if unit_deficit:
-                units_with_deficit += 1
-                penalty = len(unit_deficit)  # Count of different resource TYPES missing (1 per type)
-                unit.organization -= penalty
-                await unit.upsert(conn)
-
+            event_prefix = ''
+            owner_fields = {'owner_character_id': owner_id, 'owner_name': owner.name}
+            summary_fields = {'character_name': owner.name}
+            summary_entity_type = 'character'
+            summary_affected = [owner_id]
+        else:
+            owner = factions.get(owner_id)
+            if not owner:
+                logger.warning(f"Upkeep phase: owner faction {owner_id} not found, skipping units")
+                continue
+            event_prefix = 'FACTION_'
+            owner_fields = {'owner_faction_id': owner.faction_id, 'owner_faction_name': owner.name}
+            summary_fields = {'faction_id': owner.faction_id, 'faction_name': owner.name}
+            summary_entity_type = 'faction'
+            # Get COMMAND permission holders for affected_character_ids
+            summary_affected = list(permission_holders.get((owner_id, 'COMMAND'), []))
+
+        def unit_affected_ids(unit: Unit) -> List[int]:
+            if owner_type == CHARACTER:
                 affected_ids = [owner_id]
                 if unit.commander_character_id and unit.commander_character_id != owner_id:
                     affected_ids.append(unit.commander_character_id)
+            else:
+                # For faction units, affected includes COMMAND holders and commander
+                affected_ids = list(summary_affected)
+                if unit.commander_character_id and unit.commander_character_id not in affected_ids:
+                    affected_ids.append(unit.commander_character_id)
+            return affected_ids
 
-                events.append(TurnLog(
-                    turn_number=turn_number,
-                    phase=TurnPhase.UPKEEP.value,
-                    event_type='UPKEEP_DEFICIT',
-                    entity_type='unit',
-                    entity_id=unit.id,
-                    event_data={
-                        'unit_id': unit.unit_id,
-                        'unit_name': unit.name or unit.unit_id,
-                        'resources_deficit': unit_deficit,
-                        'organization_penalty': penalty,
-                        'new_organization': unit.organization,
-                        'owner_character_id': owner_id,
-                        'owner_name': owner.name,
-                        'affected_character_ids': affected_ids
-                    },
-                    guild_id=guild_id
-                ))
-                logger.info(f"Upkeep phase: unit {unit.unit_id} deficit {unit_deficit}, org -{penalty} -> {unit.organization}")
-
-        await resources.upsert(conn)
-
-        if any(total_spent[rt] > 0 for rt in resource_types):
-            events.append(TurnLog(
-                turn_number=turn_number,
-                phase=TurnPhase.UPKEEP.value,
-                event_type='UPKEEP_SUMMARY',
-                entity_type='character',
-                entity_id=owner_id,
-                event_data={
-                    'character_name': owner.name,
-                    'resources_spent': total_spent,
-                    'units_maintained': units_maintained,
-                    'affected_character_ids': [owner_id]
-                },
-                guild_id=guild_id
-            ))
-            logger.info(f"Upkeep phase: {owner.name} spent {total_spent} on {units_maintained} units")
-
-        if units_with_deficit > 0:
-            non_zero_deficit = {rt: v for rt, v in total_deficit.items() if v > 0}
-            events.append(TurnLog(
-                turn_number=turn_number,
-                phase=TurnPhase.UPKEEP.value,
-                event_type='UPKEEP_TOTAL_DEFICIT',
-                entity_type='character',
-                entity_id=owner_id,
-                event_data={
-                    'character_name': owner.name,
-                    'total_deficit': non_zero_deficit,
-                    'units_affected': units_with_deficit,
-                    'affected_character_ids': [owner_id]
-                },
-                guild_id=guild_id
-            ))
-            logger.info(f"Upkeep phase: {owner.name} total deficit {non_zero_deficit} affecting {units_with_deficit} units")
-
-    # Process upkeep for faction-owned units
-    for faction_id, units in units_by_faction.items():
-        faction = await Faction.fetch_by_id(conn, faction_id)
-        if not faction:
-            logger.warning(f"Upkeep phase: owner faction {faction_id} not found, skipping units")
-            continue
-
-        # Fetch or create faction resources
-        resources = await FactionResources.fetch_by_faction(conn, faction_id, guild_id)
-        if not resources:
-            resources = FactionResources(
-                faction_id=faction_id,
-                ore=0, lumber=0, coal=0, rations=0, cloth=0, platinum=0,
-                guild_id=guild_id
-            )
-
-        # Get COMMAND permission holders for affected_character_ids
-        command_holders = await FactionPermission.fetch_characters_with_permission(
-            conn, faction_id, "COMMAND", guild_id
-        )
-
-        total_spent = {rt: 0 for rt in resource_types}
-        total_deficit = {rt: 0 for rt in resource_types}
+        # Track total spent and deficits for summary events
+        total_spent = {rt: 0 for rt in RESOURCE_TYPES}
+        total_deficit = {rt: 0 for rt in RESOURCE_TYPES}
         units_maintained = 0
         units_with_deficit = 0
 
         for unit in units:
+            upkeep = {rt: getattr(unit, f'upkeep_{rt}') for rt in RESOURCE_TYPES}
+
             # Check if unit is encircled - skip normal upkeep and apply encirclement penalty
             if unit.id in encircled_unit_ids:
                 # Calculate org penalty = count of resource TYPES in upkeep (not amounts)
-                resource_types_needed = []
-                for rt in resource_types:
-                    if getattr(unit, f'upkeep_{rt}') > 0:
-                        resource_types_needed.append(rt)
+                resource_types_needed = [rt for rt in RESOURCE_TYPES if upkeep[rt] > 0]
 
                 penalty = len(resource_types_needed)
                 if penalty > 0:
                     unit.organization -= penalty
-                    await unit.upsert(conn)
-
-                    # For faction units, affected includes COMMAND holders and commander
-                    affected_ids = list(command_holders)
-                    if unit.commander_character_id and unit.commander_character_id not in affected_ids:
-                        affected_ids.append(unit.commander_character_id)
+                    penalized_units.append(unit)
 
                     events.append(TurnLog(
                         turn_number=turn_number,
                         phase=TurnPhase.UPKEEP.value,
-                        event_type='FACTION_UPKEEP_ENCIRCLED',
+                        event_type=f'{event_prefix}UPKEEP_ENCIRCLED',
                         entity_type='unit',
                         entity_id=unit.id,
                         event_data={
@@ -1818,30 +1557,23 @@ async def execute_upkeep_phase(
                             'organization_penalty': penalty,
                             'new_organization': unit.organization,
                             'resource_types_needed': resource_types_needed,
-                            'owner_faction_id': faction.faction_id,
-                            'owner_faction_name': faction.name,
-                            'affected_character_ids': affected_ids
+                            **owner_fields,
+                            'affected_character_ids': unit_affected_ids(unit)
                         },
                         guild_id=guild_id
                     ))
-                    logger.info(f"Upkeep phase: encircled faction unit {unit.unit_id} lost {penalty} org (no resources spent)")
+                    logger.info(f"Upkeep phase: encircled {owner_type} unit {unit.unit_id} lost {penalty} org (no resources spent)")
 
                 # Skip normal upkeep processing for encircled units
                 continue
 
+            deducted = ledger.deduct(owner_type, owner_id, upkeep, REASON_UNIT_UPKEEP)
             unit_deficit = {}
-
-            for rt in resource_types:
-                needed = getattr(unit, f'upkeep_{rt}')
-                available = getattr(resources, rt)
-                deducted = min(needed, available)
-
-                setattr(resources, rt, available - deducted)
-                total_spent[rt] += deducted
-
-                if deducted < needed:
-                    unit_deficit[rt] = needed - deducted
-                    total_deficit[rt] += needed - deducted
+            for rt in RESOURCE_TYPES:
+                total_spent[rt] += deducted[rt]
+                if deducted[rt] < upkeep[rt]:
+                    unit_deficit[rt] = upkeep[rt] - deducted[rt]
+                    total_deficit[rt] += upkeep[rt] - deducted[rt]
 
             units_maintained += 1
 
@@ -1849,17 +1581,12 @@ async def execute_upkeep_phase(
                 units_with_deficit += 1
                 penalty = len(unit_deficit)  # Count of different resource TYPES missing (1 per type)
                 unit.organization -= penalty
-                await unit.upsert(conn)
-
-                # For faction units, affected includes COMMAND holders and commander
-                affected_ids = list(command_holders)
-                if unit.commander_character_id and unit.commander_character_id not in affected_ids:
-                    affected_ids.append(unit.commander_character_id)
+                penalized_units.append(unit)
 
                 events.append(TurnLog(
                     turn_number=turn_number,
                     phase=TurnPhase.UPKEEP.value,
-                    event_type='FACTION_UPKEEP_DEFICIT',
+                    event_type=f'{event_prefix}UPKEEP_DEFICIT',
                     entity_type='unit',
                     entity_id=unit.id,
                     event_data={
@@ -1868,52 +1595,51 @@ async def execute_upkeep_phase(
                         'resources_deficit': unit_deficit,
                         'organization_penalty': penalty,
                         'new_organization': unit.organization,
-                        'owner_faction_id': faction.faction_id,
-                        'owner_faction_name': faction.name,
-                        'affected_character_ids': affected_ids
+                        **owner_fields,
+                        'affected_character_ids': unit_affected_ids(unit)
                     },
                     guild_id=guild_id
                 ))
-                logger.info(f"Upkeep phase: faction unit {unit.unit_id} deficit {unit_deficit}, org -{penalty} -> {unit.organization}")
+                logger.info(f"Upkeep phase: {owner_type} unit {unit.unit_id} deficit {unit_deficit}, org -{penalty} -> {unit.organization}")
 
-        await resources.upsert(conn)
-
-        if any(total_spent[rt] > 0 for rt in resource_types):
+        if any(total_spent[rt] > 0 for rt in RESOURCE_TYPES):
             events.append(TurnLog(
                 turn_number=turn_number,
                 phase=TurnPhase.UPKEEP.value,
-                event_type='FACTION_UPKEEP_SUMMARY',
-                entity_type='faction',
-                entity_id=faction_id,
+                event_type=f'{event_prefix}UPKEEP_SUMMARY',
+                entity_type=summary_entity_type,
+                entity_id=owner_id,
                 event_data={
-                    'faction_id': faction.faction_id,
-                    'faction_name': faction.name,
+                    **summary_fields,
                     'resources_spent': total_spent,
                     'units_maintained': units_maintained,
-                    'affected_character_ids': command_holders
+                    'affected_character_ids': summary_affected
                 },
                 guild_id=guild_id
             ))
-            logger.info(f"Upkeep phase: faction {faction.name} spent {total_spent} on {units_maintained} units")
+            logger.info(f"Upkeep phase: {owner_type} {owner.name} spent {total_spent} on {units_maintained} units")
 
         if units_with_deficit > 0:
             non_zero_deficit = {rt: v for rt, v in total_deficit.items() if v > 0}
             events.append(TurnLog(
                 turn_number=turn_number,
                 phase=TurnPhase.UPKEEP.value,
-                event_type='FACTION_UPKEEP_TOTAL_DEFICIT',
-                entity_type='faction',
-                entity_id=faction_id,
+                event_type=f'{event_prefix}UPKEEP_TOTAL_DEFICIT',
+                entity_type=summary_entity_type,
+                entity_id=owner_id,
                 event_data={
-                    'faction_id': faction.faction_id,
-                    'faction_name': faction.name,
+                    **summary_fields,
                     'total_deficit': non_zero_deficit,
                     'units_affected': units_with_deficit,
-                    'affected_character_ids': command_holders
+                    'affected_character_ids': summary_affected
                 },
                 guild_id=guild_id
             ))
-            logger.info(f"Upkeep phase: faction {faction.name} total deficit {non_zero_deficit} affecting {units_with_deficit} units")
+            logger.info(f"Upkeep phase: {owner_type} {owner.name} total deficit {non_zero_deficit} affecting {units_with_deficit} units")
+
+    # Write balances and organization penalties back in bulk
+    await ledger.flush(conn)
+    await Unit.update_organization_many(conn, penalized_units)
 
     logger.info(f"Upkeep phase: finished upkeep phase for guild {guild_id}, turn {turn_number}")
     return events
@@ -1923,7 +1649,9 @@ async def disband_low_organization_units(
     conn: asyncpg.Connection,
     guild_id: int,
     turn_number: int,
-    phase: str
+    phase: str,
+    units: Optional[List[Unit]] = None,
+    characters_by_id: Optional[Dict[int, Character]] = None
 ) -> List[TurnLog]:
     """
     Disband all units with organization <= 0 by setting their status to DISBANDED.
@@ -1936,28 +1664,34 @@ async def disband_low_organization_units(
         guild_id: Guild ID
         turn_number: Current turn number
         phase: The phase calling this function (for event logging)
+        units: All units in the guild, if already loaded; disbanded units are updated in place
+        characters_by_id: Characters by internal ID, if already loaded
 
     Returns:
         List of TurnLog events for disbanded units
     """
     events = []
 
-    # Fetch all units and filter for active ones with org <= 0
-    all_units = await Unit.fetch_all(conn, guild_id)
-    units_to_disband = [u for u in all_units if u.organization <= 0 and u.status == 'ACTIVE']
+    if units is None:
+        units = await Unit.fetch_all(conn, guild_id)
+    units_to_disband = [u for u in units if u.organization <= 0 and u.status == 'ACTIVE']
+    if not units_to_disband:
+        return events
+
+    if characters_by_id is None:
+        characters_by_id = {c.id: c for c in await Character.fetch_all(conn, guild_id)}
 
     for unit in units_to_disband:
-        # Set status to DISBANDED
         unit.status = 'DISBANDED'
-        await unit.upsert(conn)
+    await Unit.update_status_many(conn, units_to_disband)
 
+    for unit in units_to_disband:
         # Build affected_character_ids list
         affected_ids = [unit.owner_character_id]
         if unit.commander_character_id and unit.commander_character_id != unit.owner_character_id:
             affected_ids.append(unit.commander_character_id)
 
-        # Fetch owner name for event
-        owner = await Character.fetch_by_id(conn, unit.owner_character_id)
+        owner = characters_by_id.get(unit.owner_character_id)
         owner_name = owner.name if owner else 'Unknown'
 
         # Create UNIT_DISBANDED event
@@ -1987,13 +1721,23 @@ async def disband_low_organization_units(
             )
             events.extend(transport_events)
 
+    # Cargo lost with a transport was disbanded in the database; mirror that in memory
+    cargo_ids = {
+        e.entity_id for e in events
+        if e.event_type == 'UNIT_DISBANDED' and e.event_data.get('reason') == 'transport_destroyed'
+    }
+    for unit in units:
+        if unit.id in cargo_ids:
+            unit.status = 'DISBANDED'
+
     return events
 
 
 async def destroy_low_durability_buildings(
     conn: asyncpg.Connection,
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    modifier_index: Optional[TerritoryModifierIndex] = None
 ) -> List[TurnLog]:
     """
     Destroy all buildings with durability <= 0 by setting status to DESTROYED.
@@ -2002,6 +1746,7 @@ async def destroy_low_durability_buildings(
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
+        modifier_index: Turn-wide building modifier index to keep in sync, if any
 
     Returns:
         List of TurnLog events for destroyed buildings
@@ -2016,6 +1761,8 @@ async def destroy_low_durability_buildings(
         # Set status to DESTROYED
         building.status = 'DESTROYED'
         await building.upsert(conn)
+        if modifier_index is not None:
+            modifier_index.building_removed(building)
 
         # Find the territory to get affected character IDs
         affected_ids = []
@@ -2069,7 +1816,11 @@ async def destroy_low_durability_buildings(
 async def recover_organization_in_friendly_territory(
     conn: asyncpg.Connection,
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    modifier_index: Optional[TerritoryModifierIndex] = None,
+    units: Optional[List[Unit]] = None,
+    territories_by_id: Optional[Dict[str, Territory]] = None,
+    faction_by_character: Optional[Dict[int, int]] = None
 ) -> List[TurnLog]:
     """
     Increase organization for units in territory controlled by their faction.
@@ -2079,43 +1830,55 @@ async def recover_organization_in_friendly_territory(
     "Territory controlled by faction" means:
     - territory.controller_character_id is a member of unit.faction_id
 
+    New organization values are written back in one statement.
+
     Args:
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
+        modifier_index: Turn-wide building modifier index; built here if omitted
+        units: All units in the guild, if already loaded
+        territories_by_id: Territories by territory_id, if already loaded
+        faction_by_character: Character ID -> faction ID (see FactionMember.fetch_represented_factions)
 
     Returns:
         List of TurnLog events for recovered units
     """
     events = []
 
-    # Fetch all units and filter for active ones with faction and territory
-    all_units = await Unit.fetch_all(conn, guild_id)
-    active_units = [u for u in all_units if u.status == 'ACTIVE' and u.faction_id and u.current_territory_id is not None]
+    if units is None:
+        units = await Unit.fetch_all(conn, guild_id)
+    active_units = [u for u in units if u.status == 'ACTIVE' and u.faction_id and u.current_territory_id is not None]
+
+    if modifier_index is None:
+        modifier_index = await TerritoryModifierIndex.build(conn, guild_id)
+    if territories_by_id is None:
+        territories_by_id = {t.territory_id: t for t in await Territory.fetch_all(conn, guild_id)}
+    if faction_by_character is None:
+        faction_by_character = await FactionMember.fetch_represented_factions(conn, guild_id)
 
+    recovered_units = []
     for unit in active_units:
         # Skip if already at max organization
         if unit.organization >= unit.max_organization:
             continue
 
-        # Fetch territory
-        territory = await Territory.fetch_by_territory_id(conn, unit.current_territory_id, guild_id)
+        territory = territories_by_id.get(unit.current_territory_id)
         if not territory or not territory.controller_character_id:
             continue
 
         # Check if territory controller is in unit's faction
-        controller_faction = await FactionMember.fetch_by_character(conn, territory.controller_character_id, guild_id)
-        if not controller_faction or controller_faction.faction_id != unit.faction_id:
+        if faction_by_character.get(territory.controller_character_id) != unit.faction_id:
             continue
 
         # Calculate hospital bonus from ACTIVE hospital buildings
-        hospital_bonus = await calculate_hospital_bonus(conn, unit.current_territory_id, guild_id)
+        hospital_bonus = modifier_index.hospital_bonus(unit.current_territory_id)
 
         # Increase organization by 1 + hospital bonus (capped at max)
         old_org = unit.organization
         recovery_amount = 1 + hospital_bonus
         unit.organization = min(unit.organization + recovery_amount, unit.max_organization)
-        await unit.upsert(conn)
+        recovered_units.append(unit)
 
         # Build affected_character_ids
         affected_ids = [unit.owner_character_id]
@@ -2142,13 +1905,15 @@ async def recover_organization_in_friendly_territory(
 
         logger.info(f"Organization phase: Unit {unit.unit_id} recovered org {old_org} -> {unit.organization}")
 
+    await Unit.update_organization_many(conn, recovered_units)
     return events
 
 
 async def execute_organization_phase(
     conn: asyncpg.Connection,
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    modifier_index: Optional[TerritoryModifierIndex] = None
 ) -> List[TurnLog]:
     """
     Execute the Organization phase.
@@ -2161,6 +1926,7 @@ async def execute_organization_phase(
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
+        modifier_index: Turn-wide building modifier index; built here if omitted
 
     Returns:
         List of TurnLog objects
@@ -2168,21 +1934,32 @@ async def execute_organization_phase(
     events = []
     logger.info(f"Organization phase: starting organization phase for guild {guild_id}, turn {turn_number}")
 
+    # Load everything both unit steps need once; they update the units in place
+    units = await Unit.fetch_all(conn, guild_id)
+    characters_by_id = {c.id: c for c in await Character.fetch_all(conn, guild_id)}
+    territories_by_id = {t.territory_id: t for t in await Territory.fetch_all(conn, guild_id)}
+    faction_by_character = await FactionMember.fetch_represented_factions(conn, guild_id)
+
     # Step 1: Disband units with organization <= 0
     disband_events = await disband_low_organization_units(
-        conn, guild_id, turn_number, TurnPhase.ORGANIZATION.value
+        conn, guild_id, turn_number, TurnPhase.ORGANIZATION.value,
+        units=units, characters_by_id=characters_by_id
     )
     events.extend(disband_events)
 
+    if modifier_index is None:
+        modifier_index = await TerritoryModifierIndex.build(conn, guild_id)
+
     # Step 2: Destroy buildings with durability <= 0
     building_destroy_events = await destroy_low_durability_buildings(
-        conn, guild_id, turn_number
+        conn, guild_id, turn_number, modifier_index
     )
     events.extend(building_destroy_events)
 
     # Step 3: Recover organization for units in friendly territory
     recovery_events = await recover_organization_in_friendly_territory(
-        conn, guild_id, turn_number
+        conn, guild_id, turn_number, modifier_index,
+        units=units, territories_by_id=territories_by_id, faction_by_character=faction_by_character
     )
     events.extend(recovery_events)
 
@@ -2196,7 +1973,8 @@ async def execute_organization_phase(
 async def execute_construction_phase(
     conn: asyncpg.Connection,
     guild_id: int,
-    turn_number: int
+    turn_number: int,
+    modifier_index: Optional[TerritoryModifierIndex] = None
 ) -> List[TurnLog]:
     """
     Execute the Construction phase - processes MOBILIZATION and CONSTRUCTION orders.
@@ -2207,6 +1985,7 @@ async def execute_construction_phase(
         conn: Database connection
         guild_id: Guild ID
         turn_number: Current turn number
+        modifier_index: Turn-wide building modifier index to keep in sync, if any
 
     Returns:
         List of TurnLog objects
@@ -2231,6 +2010,12 @@ async def execute_construction_phase(
         elif order.order_type == OrderType.CONSTRUCTION.value:
             order_events = await handle_construction_order(conn, order, guild_id, turn_number)
             events.extend(order_events)
+            if modifier_index is not None and order.status == OrderStatus.SUCCESS.value:
+                building = await Building.fetch_by_building_id(
+                    conn, order.result_data['building_id'], guild_id
+                )
+                if building:
+                    modifier_index.building_added(building)
 
     logger.info(f"Construction phase: finished construction phase for guild {guild_id}, turn {turn_number}")
     return events
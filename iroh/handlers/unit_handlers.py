@@ -4,6 +4,7 @@ Unit management command handlers.
 import asyncpg
 from typing import Optional, Tuple
 from db import Unit, UnitType, Character, FactionMember, Faction, Territory
+from handlers.finance_cache import finance_projections
 
 
 async def create_unit(
@@ -108,6 +109,7 @@ async def create_unit(
     )
 
     await unit.upsert(conn)
+    finance_projections.invalidate_unit(guild_id, unit)
 
     if owner_character:
         return True, f"Unit '{unit_id}' created successfully in territory {territory_id}."
@@ -124,6 +126,7 @@ async def delete_unit(conn: asyncpg.Connection, unit_id: str, guild_id: int) ->
 
     # Delete unit
     await Unit.delete(conn, unit_id, guild_id)
+    finance_projections.invalidate_unit(guild_id, unit)
 
     return True, f"Unit '{unit_id}' has been deleted."
 
@@ -196,6 +199,7 @@ async def set_unit_status(conn: asyncpg.Connection, unit_id: str, status: str, g
     old_status = unit.status
     unit.status = status_upper
     await unit.upsert(conn)
+    finance_projections.invalidate_unit(guild_id, unit)
 
     return True, f"Unit '{unit_id}' status changed from {old_status} to {status_upper}."
 
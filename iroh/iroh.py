@@ -5,6 +5,7 @@ from helpers import *
 from embeds import *
 from views import *
 import handlers
+from handlers.finance_cache import finance_projections
 import turn_embeds
 import os
 import logging
@@ -35,6 +36,9 @@ tree = app_commands.CommandTree(client)
 # Global connection pool
 db_pool = None
 
+# Entries per page of the list commands
+LIST_PAGE_SIZE = 25
+
 
 # Public Commands
 @client.event
@@ -753,7 +757,11 @@ async def clear_wargame_config(interaction: discord.Interaction):
 
     async with db_pool.acquire() as conn:
         # Delete in reverse order of dependencies
+        await conn.execute("DELETE FROM GuildSnapshot WHERE guild_id = $1;", interaction.guild_id)
+        await conn.execute("DELETE FROM TurnReport WHERE guild_id = $1;", interaction.guild_id)
         await conn.execute("DELETE FROM TurnLog WHERE guild_id = $1;", interaction.guild_id)
+        await conn.execute("DELETE FROM ResourceLedger WHERE guild_id = $1;", interaction.guild_id)
+        await conn.execute("DELETE FROM ResourceBalance WHERE guild_id = $1;", interaction.guild_id)
         await conn.execute("DELETE FROM WargameOrder WHERE guild_id = $1;", interaction.guild_id)
         await conn.execute("DELETE FROM Unit WHERE guild_id = $1;", interaction.guild_id)
         await conn.execute("DELETE FROM UnitType WHERE guild_id = $1;", interaction.guild_id)
@@ -761,6 +769,8 @@ async def clear_wargame_config(interaction: discord.Interaction):
         await conn.execute("DELETE FROM BuildingType WHERE guild_id = $1;", interaction.guild_id)
         await conn.execute("DELETE FROM TerritoryAdjacency WHERE guild_id = $1;", interaction.guild_id)
         await conn.execute("DELETE FROM Territory WHERE guild_id = $1;", interaction.guild_id)
+        territory_graphs.invalidate_guild(interaction.guild_id)
+        finance_projections.invalidate_guild(interaction.guild_id)
         await conn.execute("DELETE FROM PlayerResources WHERE guild_id = $1;", interaction.guild_id)
         await conn.execute("DELETE FROM Alliance WHERE guild_id = $1;", interaction.guild_id)
         await conn.execute("DELETE FROM WarParticipant WHERE guild_id = $1;", interaction.guild_id)
@@ -793,12 +803,16 @@ async def clear_wargame_config(interaction: discord.Interaction):
     name="list-factions",
     description="[Admin] List all faction IDs in this server"
 )
+@app_commands.describe(page="Optional: Page to show (defaults to 1)")
 @app_commands.checks.has_permissions(manage_guild=True)
-async def list_factions_cmd(interaction: discord.Interaction):
+async def list_factions_cmd(interaction: discord.Interaction, page: int = 1):
     await interaction.response.defer()
 
+    page = max(page, 1)
     async with db_pool.acquire() as conn:
-        success, message, data = await handlers.list_factions(conn, interaction.guild_id)
+        success, message, data = await handlers.list_factions(
+            conn, interaction.guild_id, (page - 1) * LIST_PAGE_SIZE, LIST_PAGE_SIZE
+        )
 
         if not success:
             await interaction.followup.send(emotive_message(message))
@@ -813,7 +827,7 @@ async def list_factions_cmd(interaction: discord.Interaction):
             description="\n".join(faction_list),
             color=discord.Color.red()
         )
-        embed.set_footer(text=f"Total: {len(data)} factions")
+        embed.set_footer(text=f"Page {page} • {message}")
 
         await interaction.followup.send(embed=embed)
 
@@ -847,12 +861,16 @@ async def view_finances_cmd(interaction: discord.Interaction, identifier: str):
     name="list-territories",
     description="[Admin] List all territory IDs in this server"
 )
+@app_commands.describe(page="Optional: Page to show (defaults to 1)")
 @app_commands.checks.has_permissions(manage_guild=True)
-async def list_territories_cmd(interaction: discord.Interaction):
+async def list_territories_cmd(interaction: discord.Interaction, page: int = 1):
     await interaction.response.defer()
 
+    page = max(page, 1)
     async with db_pool.acquire() as conn:
-        success, message, data = await handlers.list_territories(conn, interaction.guild_id)
+        success, message, data = await handlers.list_territories(
+            conn, interaction.guild_id, (page - 1) * LIST_PAGE_SIZE, LIST_PAGE_SIZE
+        )
 
         if not success:
             await interaction.followup.send(emotive_message(message))
@@ -870,7 +888,7 @@ async def list_territories_cmd(interaction: discord.Interaction):
             description="\n".join(territory_list),
             color=discord.Color.green()
         )
-        embed.set_footer(text=f"Total: {len(data)} territories")
+        embed.set_footer(text=f"Page {page} • {message}")
 
         await interaction.followup.send(embed=embed)
 
@@ -939,12 +957,16 @@ async def list_building_types_cmd(interaction: discord.Interaction):
     name="list-units",
     description="[Admin] List all unit IDs in this server"
 )
+@app_commands.describe(page="Optional: Page to show (defaults to 1)")
 @app_commands.checks.has_permissions(manage_guild=True)
-async def list_units_cmd(interaction: discord.Interaction):
+async def list_units_cmd(interaction: discord.Interaction, page: int = 1):
     await interaction.response.defer()
 
+    page = max(page, 1)
     async with db_pool.acquire() as conn:
-        success, message, data = await handlers.list_units(conn, interaction.guild_id)
+        success, message, data = await handlers.list_units(
+            conn, interaction.guild_id, (page - 1) * LIST_PAGE_SIZE, LIST_PAGE_SIZE
+        )
 
         if not success:
             await interaction.followup.send(emotive_message(message))
@@ -958,21 +980,12 @@ async def list_units_cmd(interaction: discord.Interaction):
                 f"`{unit.unit_id}`: {unit.name or unit.unit_type} - {item['faction_name']} - {location} (Owner: {item['owner_name']})"
             )
 
-        # Split into chunks if too many
-        if len(unit_list) <= 20:
-            embed = discord.Embed(
-                title="🎖️ All Units",
-                description="\n".join(unit_list),
-                color=discord.Color.blue()
-            )
-        else:
-            embed = discord.Embed(
-                title="🎖️ All Units (first 20)",
-                description="\n".join(unit_list[:20]) + f"\n\n... and {len(unit_list) - 20} more",
-                color=discord.Color.blue()
-            )
-
-        embed.set_footer(text=f"Total: {len(data)} units")
+        embed = discord.Embed(
+            title="🎖️ All Units",
+            description="\n".join(unit_list),
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text=f"Page {page} • {message}")
 
         await interaction.followup.send(embed=embed)
 
@@ -1106,6 +1119,86 @@ async def create_production_config(interaction: discord.Interaction):
             )
 
 
+@tree.command(
+    name="export-config",
+    description="[Admin] Export this server's wargame state as a YAML attachment"
+)
+@app_commands.checks.has_permissions(manage_guild=True)
+async def export_config_cmd(interaction: discord.Interaction):
+    await interaction.response.defer(ephemeral=True)
+
+    from config_manager import ConfigManager
+    import io
+    import tempfile
+
+    # Stream the export into a spooled temporary file rather than building the whole document in memory
+    with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as buffer:
+        text = io.TextIOWrapper(buffer, encoding='utf-8')
+        try:
+            async with db_pool.acquire() as conn:
+                wargame_config = await WargameConfig.fetch(conn, interaction.guild_id)
+                await ConfigManager.export_config_to(conn, interaction.guild_id, text)
+        except Exception as e:
+            logger.error(f"Config export failed for guild {interaction.guild_id}: {e}")
+            await interaction.followup.send(
+                emotive_message(f"Failed to export configuration: {e}"),
+                ephemeral=True
+            )
+            return
+        text.flush()
+        text.detach()
+        buffer.seek(0)
+
+        turn = wargame_config.current_turn if wargame_config else 0
+        logger.info(f"Admin {interaction.user.name} (ID: {interaction.user.id}) exported config for guild {interaction.guild_id} at turn {turn}")
+        await interaction.followup.send(
+            emotive_message(f"Wargame configuration exported at turn {turn}."),
+            file=discord.File(buffer, filename=f"wargame-config-turn-{turn}.yaml"),
+            ephemeral=True
+        )
+
+
+@tree.command(
+    name="snapshot-save",
+    description="[Admin] Save a snapshot of this server's wargame state"
+)
+@app_commands.checks.has_permissions(manage_guild=True)
+async def snapshot_save_cmd(interaction: discord.Interaction):
+    await interaction.response.defer(ephemeral=True)
+
+    async with db_pool.acquire() as conn:
+        success, message, snapshot = await handlers.save_snapshot(conn, interaction.guild_id)
+
+        if success:
+            logger.info(f"Admin {interaction.user.name} (ID: {interaction.user.id}) saved snapshot #{snapshot.id} in guild {interaction.guild_id}")
+        else:
+            logger.warning(f"Admin {interaction.user.name} (ID: {interaction.user.id}) failed to save snapshot in guild {interaction.guild_id}: {message}")
+
+        await interaction.followup.send(emotive_message(message), ephemeral=True)
+
+
+@tree.command(
+    name="snapshot-restore",
+    description="[Admin] Restore this server's wargame state from a snapshot"
+)
+@app_commands.describe(
+    snapshot_id="Optional: Snapshot number to restore (defaults to the most recent, e.g. the one taken before the last turn)"
+)
+@app_commands.checks.has_permissions(manage_guild=True)
+async def snapshot_restore_cmd(interaction: discord.Interaction, snapshot_id: int = None):
+    await interaction.response.defer(ephemeral=True)
+
+    async with db_pool.acquire() as conn:
+        success, message = await handlers.restore_snapshot(conn, interaction.guild_id, snapshot_id)
+
+        if success:
+            logger.info(f"Admin {interaction.user.name} (ID: {interaction.user.id}) restored snapshot {snapshot_id or 'latest'} in guild {interaction.guild_id}")
+        else:
+            logger.warning(f"Admin {interaction.user.name} (ID: {interaction.user.id}) failed to restore snapshot {snapshot_id or 'latest'} in guild {interaction.guild_id}: {message}")
+
+        await interaction.followup.send(emotive_message(message), ephemeral=True)
+
+
 # Faction Management Commands
 @tree.command(
     name="create-faction",
@@ -2573,6 +2666,156 @@ async def order_unit_cmd(
         )
 
 
+@order_unit_cmd.autocomplete('path')
+async def order_unit_path_autocomplete(interaction: discord.Interaction, current: str):
+    async with db_pool.acquire() as conn:
+        graph = await territory_graphs.get(conn, interaction.guild_id)
+    # Discord rejects choice values over 100 characters; a truncated path would be a different path
+    return [
+        app_commands.Choice(name=label[:100], value=value)
+        for label, value in handlers.suggest_path_completions(graph, current)
+        if len(value) <= 100
+    ]
+
+
+@tree.command(
+    name="plan-route",
+    description="Find the fastest path for a unit order to a destination"
+)
+@app_commands.describe(
+    unit_ids="Comma-separated unit IDs (e.g., 'FN-001' or 'FN-001,FN-002')",
+    action="The action type the route is for",
+    destination="Destination territory ID"
+)
+@app_commands.choices(action=UNIT_ACTION_CHOICES)
+async def plan_route_cmd(
+    interaction: discord.Interaction,
+    unit_ids: str,
+    action: app_commands.Choice[str],
+    destination: str
+):
+    await interaction.response.defer(ephemeral=True)
+
+    async with db_pool.acquire() as conn:
+        # Get character for this user
+        character = await Character.fetch_by_user(conn, interaction.user.id, interaction.guild_id)
+        if not character:
+            await interaction.followup.send(
+                emotive_message("You don't have a character in this wargame."),
+                ephemeral=True
+            )
+            return
+
+        unit_id_list = [uid.strip() for uid in unit_ids.split(',')]
+        success, message, data = await handlers.suggest_route(
+            conn, unit_id_list, action.value, destination.strip(), interaction.guild_id, character.id
+        )
+
+    if success:
+        message += f"\nSubmit it with `/order-unit` and path `{','.join(data['path'])}`."
+    await interaction.followup.send(emotive_message(message), ephemeral=True)
+
+
+@plan_route_cmd.autocomplete('destination')
+async def plan_route_destination_autocomplete(interaction: discord.Interaction, current: str):
+    unit_ids = interaction.namespace.unit_ids
+    if not unit_ids:
+        return []
+    # Before an action is picked, plan a transit for land or naval units
+    actions = [interaction.namespace.action] if interaction.namespace.action else ['transit', 'naval_transit']
+
+    async with db_pool.acquire() as conn:
+        character = await Character.fetch_by_user(conn, interaction.user.id, interaction.guild_id)
+        if not character:
+            return []
+        for action in actions:
+            success, _, search = await handlers.load_route_search(
+                conn, [uid.strip() for uid in unit_ids.split(',')], action, interaction.guild_id, character.id
+            )
+            if success:
+                break
+    if not success:
+        return []
+    return [
+        app_commands.Choice(name=label, value=value)
+        for label, value in handlers.suggest_route_destinations(search, current)
+    ]
+
+
+# Largest order file accepted by /order-units-batch
+MAX_ORDER_BATCH_BYTES = 256 * 1024
+
+
+@tree.command(
+    name="order-units-batch",
+    description="Submit many unit orders at once from a YAML or CSV file"
+)
+@app_commands.describe(
+    orders_file="YAML list of {units, action, path, speed} entries, or CSV with units,action,path,speed columns",
+    override="Cancel the units' existing orders instead of refusing the batch"
+)
+async def order_units_batch_cmd(
+    interaction: discord.Interaction,
+    orders_file: discord.Attachment,
+    override: bool = False
+):
+    await interaction.response.defer(ephemeral=True)
+
+    if orders_file.size > MAX_ORDER_BATCH_BYTES:
+        await interaction.followup.send(
+            emotive_message(f"Order file is too large ({orders_file.size} bytes). The limit is {MAX_ORDER_BATCH_BYTES} bytes."),
+            ephemeral=True
+        )
+        return
+
+    try:
+        content = (await orders_file.read()).decode('utf-8')
+    except UnicodeDecodeError:
+        await interaction.followup.send(
+            emotive_message("Order file must be UTF-8 text."),
+            ephemeral=True
+        )
+        return
+
+    success, message, orders = handlers.parse_order_batch(content, orders_file.filename)
+    if not success:
+        await interaction.followup.send(emotive_message(message), ephemeral=True)
+        return
+
+    async with db_pool.acquire() as conn:
+        # Get character for this user
+        character = await Character.fetch_by_user(conn, interaction.user.id, interaction.guild_id)
+        if not character:
+            await interaction.followup.send(
+                emotive_message("You don't have a character in this wargame."),
+                ephemeral=True
+            )
+            return
+
+        success, message, summary = await handlers.submit_unit_orders(
+            conn, orders, interaction.guild_id, character.id, override=override
+        )
+
+    if success:
+        logger.info(f"User {interaction.user.name} (ID: {interaction.user.id}) submitted {len(orders)} unit orders from {orders_file.filename} in guild {interaction.guild_id}")
+    else:
+        logger.warning(f"User {interaction.user.name} (ID: {interaction.user.id}) failed to submit unit orders from {orders_file.filename} in guild {interaction.guild_id}: {message}")
+
+    # Build messages, respecting Discord's 2000 char limit
+    messages = []
+    current_msg = emotive_message(message.split("\n")[0])
+    for line in message.split("\n")[1:] + (summary or []):
+        if len(current_msg) + len(line) + 1 > 1900:
+            messages.append(current_msg)
+            current_msg = line
+        else:
+            current_msg += "\n" + line
+    messages.append(current_msg)
+
+    for msg in messages:
+        await interaction.followup.send(msg, ephemeral=True)
+
+
 @tree.command(
     name="order-assign-commander",
     description="[Unit Owner] Submit an order to assign a new commander to your unit"
@@ -2904,9 +3147,11 @@ async def resolve_turn_cmd(interaction: discord.Interaction):
                 try:
                     reports_channel = client.get_channel(config.gm_reports_channel_id)
                     if reports_channel:
-                        gm_embeds = turn_embeds.create_gm_turn_report_embeds(
-                            gm_data['turn_number'],
-                            gm_data['events'],
+                        # Post every page; a pager in a channel would stop working after a restart
+                        gm_embeds = turn_embeds.create_turn_report_embeds(
+                            f"👑 GM Turn {gm_data['turn_number']} Report",
+                            discord.Color.purple(),
+                            gm_data['sections'],
                             gm_data['summary']
                         )
                         for embed in gm_embeds:
@@ -2922,20 +3167,19 @@ async def resolve_turn_cmd(interaction: discord.Interaction):
                     logger.warn(f"Character {character.identifier} has no channel defined")
                     continue
 
-                # Use generate_character_report to get filtered events for this character
+                # Use generate_character_report to get the stored report for this character
                 char_success, _, char_data = await handlers.generate_character_report(
                     conn, character, interaction.guild_id, config.current_turn
                 )
 
-                if char_success and char_data['events']:
+                if char_success and char_data['sections']:
                     try:
                         char_channel = client.get_channel(character.channel_id)
                         if char_channel:
-                            char_embeds = turn_embeds.create_character_turn_report_embeds(
-                                char_data['character'].name,
-                                char_data['turn_number'],
-                                char_data['events'],
-                                char_data['character'].id
+                            char_embeds = turn_embeds.create_turn_report_embeds(
+                                f"📊 Turn {char_data['turn_number']} Report: {char_data['character'].name}",
+                                discord.Color.blue(),
+                                char_data['sections']
                             )
                             for embed in char_embeds:
                                 await char_channel.send(embed=embed)
@@ -2947,6 +3191,9 @@ async def resolve_turn_cmd(interaction: discord.Interaction):
                 ephemeral=False
             )
 
+        # Precompute finance projections for the new turn before players check them
+        await handlers.warm_finance_projections(conn, interaction.guild_id)
+
 
 @tree.command(
     name="turn-status",
@@ -3042,15 +3289,13 @@ async def turn_report_cmd(interaction: discord.Interaction, turn_number: int = N
             await interaction.followup.send(emotive_message(message), ephemeral=True)
             return
 
-        # Create and send embeds
-        embeds = turn_embeds.create_character_turn_report_embeds(
-            data['character'].name,
-            data['turn_number'],
-            data['events'],
-            data['character'].id
+        # Send the first page; the view renders further pages on demand
+        view = TurnReportView(
+            f"📊 Turn {data['turn_number']} Report: {data['character'].name}",
+            discord.Color.blue(),
+            data['sections']
         )
-        for embed in embeds:
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        view.message = await interaction.followup.send(embed=view.current_embed(), view=view, ephemeral=True)
 
 
 @tree.command(
@@ -3073,14 +3318,14 @@ async def gm_turn_report_cmd(interaction: discord.Interaction, turn_number: int
             await interaction.followup.send(emotive_message(message), ephemeral=True)
             return
 
-        # Create and send embeds
-        embeds = turn_embeds.create_gm_turn_report_embeds(
-            data['turn_number'],
-            data['events'],
+        # Send the first page; the view renders further pages on demand
+        view = TurnReportView(
+            f"👑 GM Turn {data['turn_number']} Report",
+            discord.Color.purple(),
+            data['sections'],
             data['summary']
         )
-        for embed in embeds:
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        view.message = await interaction.followup.send(embed=view.current_embed(), view=view, ephemeral=True)
 
 
 @tree.command(
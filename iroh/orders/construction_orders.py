@@ -5,7 +5,7 @@ from order_types import OrderType, OrderStatus, TurnPhase
 from datetime import datetime
 from db import (
     Order, Character, Faction, FactionMember, Territory, TurnLog,
-    Unit, UnitType, Building, BuildingType, PlayerResources, FactionResources,
+    Unit, UnitType, Building, BuildingType,
     Alliance, FactionPermission
 )
 from handlers.spirit_nexus_handlers import (
@@ -14,6 +14,13 @@ from handlers.spirit_nexus_handlers import (
     apply_spiritual_repair,
     building_type_is_spiritual,
 )
+from handlers.balance_ledger import (
+    BalanceLedger,
+    CHARACTER,
+    FACTION,
+    REASON_MOBILIZATION,
+    REASON_CONSTRUCTION,
+)
 import asyncpg
 from typing import List, Optional
 import logging
@@ -195,26 +202,18 @@ async def handle_mobilization_order(
 
         # Check and deduct resources
         if use_faction_resources and target_faction:
-            resources = await FactionResources.fetch_by_faction(conn, target_faction.id, guild_id)
-            if not resources:
-                resources = FactionResources(
-                    faction_id=target_faction.id,
-                    ore=0, lumber=0, coal=0, rations=0, cloth=0, platinum=0,
-                    guild_id=guild_id
-                )
+            owner_type, owner_id = FACTION, target_faction.id
         else:
-            resources = await PlayerResources.fetch_by_character(conn, order.character_id, guild_id)
-            if not resources:
-                resources = PlayerResources(
-                    character_id=order.character_id,
-                    ore=0, lumber=0, coal=0, rations=0, cloth=0, platinum=0,
-                    guild_id=guild_id
-                )
+            owner_type, owner_id = CHARACTER, order.character_id
+        ledger = await BalanceLedger.load_owner(
+            conn, guild_id, owner_type, owner_id, turn_number, TurnPhase.CONSTRUCTION.value
+        )
+        balance = ledger.balance(owner_type, owner_id)
 
         # Check if sufficient resources
         insufficient = []
         for resource_type, needed in cost.items():
-            available = getattr(resources, resource_type, 0)
+            available = balance[resource_type]
             if available < needed:
                 insufficient.append(f"{resource_type}: need {needed}, have {available}")
 
@@ -225,10 +224,8 @@ async def handle_mobilization_order(
             )
 
         # Deduct resources
-        for resource_type, needed in cost.items():
-            current = getattr(resources, resource_type)
-            setattr(resources, resource_type, current - needed)
-        await resources.upsert(conn)
+        ledger.deduct(owner_type, owner_id, cost, REASON_MOBILIZATION)
+        await ledger.flush(conn)
 
         # Generate unit ID
         owner_nation = target_faction.nation if target_faction else submitter_faction_nation
@@ -426,26 +423,18 @@ async def handle_construction_order(
 
         # Check and deduct resources
         if use_faction_resources and target_faction:
-            resources = await FactionResources.fetch_by_faction(conn, target_faction.id, guild_id)
-            if not resources:
-                resources = FactionResources(
-                    faction_id=target_faction.id,
-                    ore=0, lumber=0, coal=0, rations=0, cloth=0, platinum=0,
-                    guild_id=guild_id
-                )
+            owner_type, owner_id = FACTION, target_faction.id
         else:
-            resources = await PlayerResources.fetch_by_character(conn, order.character_id, guild_id)
-            if not resources:
-                resources = PlayerResources(
-                    character_id=order.character_id,
-                    ore=0, lumber=0, coal=0, rations=0, cloth=0, platinum=0,
-                    guild_id=guild_id
-                )
+            owner_type, owner_id = CHARACTER, order.character_id
+        ledger = await BalanceLedger.load_owner(
+            conn, guild_id, owner_type, owner_id, turn_number, TurnPhase.CONSTRUCTION.value
+        )
+        balance = ledger.balance(owner_type, owner_id)
 
         # Check if sufficient resources
         insufficient = []
         for resource_type, needed in cost.items():
-            available = getattr(resources, resource_type, 0)
+            available = balance[resource_type]
             if available < needed:
                 insufficient.append(f"{resource_type}: need {needed}, have {available}")
 
@@ -456,10 +445,8 @@ async def handle_construction_order(
             )
 
         # Deduct resources
-        for resource_type, needed in cost.items():
-            current = getattr(resources, resource_type)
-            setattr(resources, resource_type, current - needed)
-        await resources.upsert(conn)
+        ledger.deduct(owner_type, owner_id, cost, REASON_CONSTRUCTION)
+        await ledger.flush(conn)
 
         # Generate building ID
         building_count = await conn.fetchval(
@@ -3,9 +3,13 @@ Resource transfer order handlers.
 """
 from order_types import OrderType, OrderStatus, TurnPhase
 from datetime import datetime
-from db import Character, PlayerResources, TurnLog, Order, Faction, FactionResources, FactionPermission
+from db import (
+    Character, PlayerResources, TurnLog, Order, Faction, FactionResources, FactionPermission,
+    ResourceLedgerEntry
+)
+from handlers.balance_ledger import REASON_TRANSFER_OUT, REASON_TRANSFER_IN
 import asyncpg
-from typing import List
+from typing import List, Tuple
 
 
 async def handle_cancel_transfer_order(
@@ -207,6 +211,13 @@ async def handle_cancel_transfer_order(
         )]
 
 
+def _ledger_owner(resources) -> Tuple[str, int]:
+    """ResourceLedger (owner_type, owner_id) for a PlayerResources or FactionResources row."""
+    if isinstance(resources, FactionResources):
+        return 'faction', resources.faction_id
+    return 'character', resources.character_id
+
+
 async def handle_resource_transfer_order(
     conn: asyncpg.Connection,
     order: Order,
@@ -413,6 +424,25 @@ async def handle_resource_transfer_order(
         await sender_resources.upsert(conn)
         await recipient_resources.upsert(conn)
 
+        # Journal both sides of the transfer
+        if total_transferred > 0:
+            sender_owner_type, sender_owner_id = _ledger_owner(sender_resources)
+            recipient_owner_type, recipient_owner_id = _ledger_owner(recipient_resources)
+            await ResourceLedgerEntry.insert_many(conn, [
+                ResourceLedgerEntry(
+                    turn_number=turn_number, phase=TurnPhase.RESOURCE_TRANSFER.value,
+                    reason=REASON_TRANSFER_OUT, owner_type=sender_owner_type, owner_id=sender_owner_id,
+                    order_id=order.id, guild_id=guild_id,
+                    **{rt: -amount for rt, amount in transferred_resources.items()}
+                ),
+                ResourceLedgerEntry(
+                    turn_number=turn_number, phase=TurnPhase.RESOURCE_TRANSFER.value,
+                    reason=REASON_TRANSFER_IN, owner_type=recipient_owner_type, owner_id=recipient_owner_id,
+                    order_id=order.id, guild_id=guild_id,
+                    **transferred_resources
+                ),
+            ])
+
         # Build affected_character_ids list
         affected_character_ids = [submitting_character.id]
 
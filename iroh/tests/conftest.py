@@ -11,7 +11,7 @@ parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
 # Import DB models after path is set
-from db import ServerConfig
+from db import ServerConfig, territory_graphs
 
 # Test guild IDs
 TEST_GUILD_ID = 999999999999999999
@@ -46,7 +46,11 @@ async def test_server(db_conn):
     yield
 
     # Cleanup in reverse dependency order
+    await db_conn.execute("DELETE FROM GuildSnapshot WHERE guild_id = $1;", TEST_GUILD_ID)
+    await db_conn.execute("DELETE FROM TurnReport WHERE guild_id = $1;", TEST_GUILD_ID)
     await db_conn.execute("DELETE FROM TurnLog WHERE guild_id = $1;", TEST_GUILD_ID)
+    await db_conn.execute("DELETE FROM ResourceLedger WHERE guild_id = $1;", TEST_GUILD_ID)
+    await db_conn.execute("DELETE FROM ResourceBalance WHERE guild_id = $1;", TEST_GUILD_ID)
     await db_conn.execute("DELETE FROM WargameOrder WHERE guild_id = $1;", TEST_GUILD_ID)
     await db_conn.execute("DELETE FROM WargameConfig WHERE guild_id = $1;", TEST_GUILD_ID)
     await db_conn.execute("DELETE FROM WarParticipant WHERE guild_id = $1;", TEST_GUILD_ID)
@@ -67,6 +71,7 @@ async def test_server(db_conn):
     await db_conn.execute("DELETE FROM Faction WHERE guild_id = $1;", TEST_GUILD_ID)
     await db_conn.execute("DELETE FROM Character WHERE guild_id = $1;", TEST_GUILD_ID)
     await db_conn.execute("DELETE FROM ServerConfig WHERE guild_id = $1;", TEST_GUILD_ID)
+    territory_graphs.invalidate_guild(TEST_GUILD_ID)
 
 
 @pytest.fixture(scope="function")
@@ -81,7 +86,11 @@ async def test_server_multi_guild(db_conn):
     yield
 
     # Cleanup in reverse dependency order
+    await db_conn.execute("DELETE FROM GuildSnapshot WHERE guild_id IN ($1, $2);", TEST_GUILD_ID, TEST_GUILD_ID_2)
+    await db_conn.execute("DELETE FROM TurnReport WHERE guild_id IN ($1, $2);", TEST_GUILD_ID, TEST_GUILD_ID_2)
     await db_conn.execute("DELETE FROM TurnLog WHERE guild_id IN ($1, $2);", TEST_GUILD_ID, TEST_GUILD_ID_2)
+    await db_conn.execute("DELETE FROM ResourceLedger WHERE guild_id IN ($1, $2);", TEST_GUILD_ID, TEST_GUILD_ID_2)
+    await db_conn.execute("DELETE FROM ResourceBalance WHERE guild_id IN ($1, $2);", TEST_GUILD_ID, TEST_GUILD_ID_2)
     await db_conn.execute("DELETE FROM WargameOrder WHERE guild_id IN ($1, $2);", TEST_GUILD_ID, TEST_GUILD_ID_2)
     await db_conn.execute("DELETE FROM WargameConfig WHERE guild_id IN ($1, $2);", TEST_GUILD_ID, TEST_GUILD_ID_2)
     await db_conn.execute("DELETE FROM WarParticipant WHERE guild_id IN ($1, $2);", TEST_GUILD_ID, TEST_GUILD_ID_2)
@@ -942,3 +942,119 @@ async def test_nation_roundtrip(db_conn, clean_wargame_data):
     # Compare nation values
     assert config_dict_1['factions'][0]['nation'] == config_dict_2['factions'][0]['nation']
     assert config_dict_2['factions'][0]['nation'] == 'water-tribe'
+
+
+@pytest.mark.asyncio
+async def test_export_streams_to_file(db_conn, clean_wargame_data, tmp_path):
+    """Test that streaming the export to a file writes the same document as export_config."""
+    config = """
+wargame:
+  turn: 3
+
+factions:
+  - faction_id: "stream-faction"
+    name: "Stream Faction"
+    leader: "test-char-1"
+    members:
+      - "test-char-1"
+      - "test-char-2"
+
+territories:
+  - territory_id: "71"
+    terrain_type: "plains"
+    controller_faction_id: "stream-faction"
+    adjacent_to: ["72"]
+  - territory_id: "72"
+    terrain_type: "forest"
+    controller_character_identifier: "test-char-2"
+
+faction_permissions:
+  - faction_id: "stream-faction"
+    character: "test-char-2"
+    permission_type: "COMMAND"
+"""
+    success, message = await ConfigManager.import_config(db_conn, TEST_GUILD_ID, config)
+    assert success, f"Import failed: {message}"
+
+    export_path = tmp_path / "export.yaml"
+    with open(export_path, 'w') as f:
+        sections = await ConfigManager.export_config_to(db_conn, TEST_GUILD_ID, f)
+
+    streamed = export_path.read_text()
+    assert streamed == await ConfigManager.export_config(db_conn, TEST_GUILD_ID)
+    config_dict = yaml.safe_load(streamed)
+    assert sections == len(config_dict)
+
+    faction = config_dict['factions'][0]
+    assert faction['leader'] == "test-char-1"
+    assert faction['members'] == ["test-char-1", "test-char-2"]
+    territories = {t['territory_id']: t for t in config_dict['territories']}
+    assert territories["71"]['controller_faction_id'] == "stream-faction"
+    assert territories["71"]['adjacent_to'] == ["72"]
+    assert territories["72"]['controller_character_identifier'] == "test-char-2"
+    assert territories["72"]['adjacent_to'] == ["71"]
+    assert {'faction_id': "stream-faction", 'character': "test-char-2", 'permission_type': "COMMAND"} \
+        in config_dict['faction_permissions']
+
+
+DIFF_CONFIG = """
+wargame:
+  turn: 4
+
+factions:
+  - faction_id: "diff-faction"
+    name: "Diff Faction"
+    leader: "test-char-1"
+    members:
+      - "test-char-1"
+
+territories:
+  - territory_id: "81"
+    terrain_type: "plains"
+    controller_faction_id: "diff-faction"
+    production:
+      ore: 2
+    adjacent_to: ["82"]
+  - territory_id: "82"
+    terrain_type: "forest"
+
+player_resources:
+  - character: "test-char-1"
+    resources:
+      ore: 10
+"""
+
+
+@pytest.mark.asyncio
+async def test_diff_import_writes_only_changes(db_conn, clean_wargame_data):
+    """Test that a diff import of an unchanged document writes nothing and then only the edited rows."""
+    success, message = await ConfigManager.import_config(db_conn, TEST_GUILD_ID, DIFF_CONFIG)
+    assert success, f"Import failed: {message}"
+
+    success, message = await ConfigManager.import_config(db_conn, TEST_GUILD_ID, DIFF_CONFIG, diff=True)
+    assert success, f"Diff import failed: {message}"
+    assert "(0 rows changed)" in message
+
+    edited = DIFF_CONFIG.replace("ore: 2", "ore: 7")
+    success, message = await ConfigManager.import_config(db_conn, TEST_GUILD_ID, edited, diff=True)
+    assert success, f"Diff import failed: {message}"
+    assert "(1 row changed)" in message
+
+    territory = await Territory.fetch_by_territory_id(db_conn, "81", TEST_GUILD_ID)
+    assert territory.ore_production == 7
+    faction = await Faction.fetch_by_faction_id(db_conn, "diff-faction", TEST_GUILD_ID)
+    assert territory.controller_faction_id == faction.id
+    assert await TerritoryAdjacency.fetch_adjacent(db_conn, "82", TEST_GUILD_ID) == ["81"]
+
+
+@pytest.mark.asyncio
+async def test_failed_import_rolls_back(db_conn, clean_wargame_data):
+    """Test that an error while loading leaves none of the document's rows behind."""
+    # A territory adjacent to itself violates the adjacency CHECK constraint
+    broken = DIFF_CONFIG.replace('adjacent_to: ["82"]', 'adjacent_to: ["81"]')
+    with pytest.raises(asyncpg.PostgresError):
+        await ConfigManager.import_config(db_conn, TEST_GUILD_ID, broken)
+
+    assert await Faction.fetch_by_faction_id(db_conn, "diff-faction", TEST_GUILD_ID) is None
+    assert await Territory.fetch_all(db_conn, TEST_GUILD_ID) == []
+    assert await WargameConfig.fetch(db_conn, TEST_GUILD_ID) is None
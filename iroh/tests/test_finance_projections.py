@@ -0,0 +1,155 @@
+"""
+Pytest tests for cached finance projections.
+
+Tests verify:
+- Projections are cached until a relevant command invalidates them
+- Warming a guild gives the same projection as computing one owner directly
+- Ongoing transfer submission invalidates both parties
+
+Run with: docker compose -f ~/avatar-bots/docker-compose-development.yaml exec iroh-api pytest tests/test_finance_projections.py -v
+"""
+import pytest
+from handlers.finance_handlers import (
+    get_character_finances,
+    get_faction_finances,
+    warm_finance_projections,
+)
+from handlers.finance_cache import finance_projections
+from handlers.territory_handlers import set_territory_controller
+from handlers.order_handlers import submit_resource_transfer_order
+from db import Character, Faction, Territory, Unit, Building, WargameConfig
+from tests.conftest import TEST_GUILD_ID
+
+
+async def _setup(db_conn):
+    finance_projections.invalidate_guild(TEST_GUILD_ID)
+
+    config = WargameConfig(current_turn=2, guild_id=TEST_GUILD_ID)
+    await config.upsert(db_conn)
+
+    character = Character(
+        identifier="finance-char", name="Finance Tester",
+        channel_id=999000000000000601, guild_id=TEST_GUILD_ID
+    )
+    await character.upsert(db_conn)
+    character = await Character.fetch_by_identifier(db_conn, "finance-char", TEST_GUILD_ID)
+
+    faction = Faction(faction_id="finance-faction", name="Finance Faction", guild_id=TEST_GUILD_ID)
+    await faction.upsert(db_conn)
+    faction = await Faction.fetch_by_faction_id(db_conn, "finance-faction", TEST_GUILD_ID)
+
+    territory = Territory(
+        territory_id="F100", name="Finance Fields", terrain_type="plains",
+        ore_production=4, rations_production=2,
+        controller_character_id=character.id,
+        guild_id=TEST_GUILD_ID
+    )
+    await territory.upsert(db_conn)
+
+    building = Building(
+        building_id="finance-mine", building_type="mine", territory_id="F100",
+        upkeep_coal=1, keywords=["ore"], guild_id=TEST_GUILD_ID
+    )
+    await building.upsert(db_conn)
+
+    unit = Unit(
+        unit_id="finance-unit", name="Finance Unit", unit_type="infantry",
+        owner_character_id=character.id, current_territory_id="F100",
+        upkeep_rations=3, guild_id=TEST_GUILD_ID
+    )
+    await unit.upsert(db_conn)
+
+    return character, faction
+
+
+@pytest.mark.asyncio
+async def test_projection_cached_until_invalidated(db_conn, test_server):
+    """Test that projections are served from cache and refreshed after a capture."""
+    character, faction = await _setup(db_conn)
+
+    success, _, data = await get_character_finances(db_conn, character.id, TEST_GUILD_ID)
+    assert success
+    assert data['territory_production'].ore == 4
+    assert data['building_production'].ore == 2
+    assert data['building_upkeep'].coal == 1
+    assert data['unit_upkeep'].rations == 3
+    assert data['net_resources'].rations == -1
+
+    # A direct database edit that bypasses the handlers is not seen
+    await db_conn.execute(
+        "UPDATE Territory SET ore_production = 10 WHERE territory_id = 'F100' AND guild_id = $1;",
+        TEST_GUILD_ID
+    )
+    _, _, data = await get_character_finances(db_conn, character.id, TEST_GUILD_ID)
+    assert data['territory_production'].ore == 4
+
+    # Transferring the territory invalidates both controllers
+    success, _ = await set_territory_controller(
+        db_conn, "F100", "finance-faction", TEST_GUILD_ID, controller_type='faction'
+    )
+    assert success
+
+    _, _, data = await get_character_finances(db_conn, character.id, TEST_GUILD_ID)
+    assert data['territory_count'] == 0
+    assert data['territory_production'].ore == 0
+
+    _, _, faction_data = await get_faction_finances(db_conn, faction.id, TEST_GUILD_ID)
+    assert faction_data['territory_production'].ore == 10
+    assert faction_data['building_upkeep'].coal == 1
+
+    finance_projections.invalidate_guild(TEST_GUILD_ID)
+
+
+@pytest.mark.asyncio
+async def test_warm_matches_direct_projection(db_conn, test_server):
+    """Test that guild-wide warming matches computing an owner on its own."""
+    character, faction = await _setup(db_conn)
+
+    _, _, direct = await get_character_finances(db_conn, character.id, TEST_GUILD_ID)
+
+    finance_projections.invalidate_guild(TEST_GUILD_ID)
+    count = await warm_finance_projections(db_conn, TEST_GUILD_ID)
+    assert count >= 2
+    assert finance_projections.get(TEST_GUILD_ID, 2, 'character', character.id) is not None
+
+    _, _, warmed = await get_character_finances(db_conn, character.id, TEST_GUILD_ID)
+    for key in ('territory_production', 'building_production', 'unit_upkeep',
+                'building_upkeep', 'net_resources'):
+        assert warmed[key] == direct[key]
+    assert warmed['territory_count'] == direct['territory_count']
+    assert warmed['unit_count'] == direct['unit_count']
+    assert warmed['building_count'] == direct['building_count']
+
+    # Advancing the turn expires the cached projections
+    config = await WargameConfig.fetch(db_conn, TEST_GUILD_ID)
+    config.current_turn = 3
+    await config.upsert(db_conn)
+    assert finance_projections.get(TEST_GUILD_ID, 3, 'character', character.id) is None
+
+    finance_projections.invalidate_guild(TEST_GUILD_ID)
+
+
+@pytest.mark.asyncio
+async def test_ongoing_transfer_invalidates_both_parties(db_conn, test_server):
+    """Test that submitting an ongoing transfer refreshes sender and recipient projections."""
+    character, faction = await _setup(db_conn)
+
+    _, _, data = await get_character_finances(db_conn, character.id, TEST_GUILD_ID)
+    assert data['transfer_count'] == 0
+    _, _, faction_data = await get_faction_finances(db_conn, faction.id, TEST_GUILD_ID)
+    assert faction_data['incoming_transfer_count'] == 0
+
+    success, _ = await submit_resource_transfer_order(
+        db_conn, character, "finance-faction",
+        {'ore': 2}, True, None, TEST_GUILD_ID
+    )
+    assert success
+
+    _, _, data = await get_character_finances(db_conn, character.id, TEST_GUILD_ID)
+    assert data['transfer_count'] == 1
+    assert data['outgoing_transfers'].ore == 2
+    _, _, faction_data = await get_faction_finances(db_conn, faction.id, TEST_GUILD_ID)
+    assert faction_data['incoming_transfer_count'] == 1
+    assert faction_data['incoming_transfers'].ore == 2
+
+    finance_projections.invalidate_guild(TEST_GUILD_ID)
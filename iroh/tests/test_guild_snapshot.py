@@ -0,0 +1,116 @@
+"""
+Pytest tests for binary guild snapshots.
+
+Tests verify:
+- A restore brings back rows, internal IDs and character wargame columns
+- resolve_turn checkpoints the pre-turn state automatically
+- Payloads from another schema version are refused
+
+Run with: docker compose -f ~/avatar-bots/docker-compose-development.yaml exec iroh-api pytest tests/test_guild_snapshot.py -v
+"""
+import struct
+import pytest
+from handlers.snapshot_handlers import save_snapshot, restore_snapshot
+from handlers.turn_handlers import resolve_turn
+from db import (
+    Character, Faction, Territory, Unit, WargameConfig, GuildSnapshot,
+    SNAPSHOT_MAGIC, SNAPSHOT_SCHEMA_VERSION
+)
+from tests.conftest import TEST_GUILD_ID
+
+
+async def _setup(db_conn):
+    await WargameConfig(guild_id=TEST_GUILD_ID, current_turn=3).upsert(db_conn)
+
+    faction = Faction(faction_id="snap-faction", name="Snapshot Faction", guild_id=TEST_GUILD_ID)
+    await faction.upsert(db_conn)
+    faction = await Faction.fetch_by_faction_id(db_conn, "snap-faction", TEST_GUILD_ID)
+
+    character = Character(
+        identifier="snap-char", name="Snapshot Tester",
+        channel_id=999000000000000801, victory_points=4,
+        represented_faction_id=faction.id, guild_id=TEST_GUILD_ID
+    )
+    await character.upsert(db_conn)
+    character = await Character.fetch_by_identifier(db_conn, "snap-char", TEST_GUILD_ID)
+
+    territory = Territory(
+        territory_id="901", terrain_type="plains", ore_production=3,
+        controller_faction_id=faction.id, guild_id=TEST_GUILD_ID
+    )
+    await territory.upsert(db_conn)
+
+    unit = Unit(
+        unit_id="snap-unit", name="Snapshot Unit", unit_type="infantry",
+        owner_character_id=character.id, faction_id=faction.id,
+        current_territory_id="901", guild_id=TEST_GUILD_ID
+    )
+    await unit.upsert(db_conn)
+    unit = await Unit.fetch_by_unit_id(db_conn, "snap-unit", TEST_GUILD_ID)
+
+    return character, faction, unit
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trip(db_conn, test_server):
+    """Test that restoring a snapshot undoes later changes and keeps internal IDs."""
+    character, faction, unit = await _setup(db_conn)
+
+    success, message, snapshot = await save_snapshot(db_conn, TEST_GUILD_ID)
+    assert success, message
+    assert snapshot.turn_number == 3
+    assert not snapshot.automatic
+
+    # Change the world after the snapshot
+    await db_conn.execute("DELETE FROM Unit WHERE guild_id = $1;", TEST_GUILD_ID)
+    await db_conn.execute("DELETE FROM Faction WHERE guild_id = $1;", TEST_GUILD_ID)
+    await db_conn.execute("UPDATE Character SET victory_points = 9 WHERE id = $1;", character.id)
+    await Territory(territory_id="902", terrain_type="forest", guild_id=TEST_GUILD_ID).upsert(db_conn)
+
+    success, message = await restore_snapshot(db_conn, TEST_GUILD_ID, snapshot.id)
+    assert success, message
+
+    restored_faction = await Faction.fetch_by_faction_id(db_conn, "snap-faction", TEST_GUILD_ID)
+    assert restored_faction.id == faction.id
+    restored_unit = await Unit.fetch_by_unit_id(db_conn, "snap-unit", TEST_GUILD_ID)
+    assert restored_unit.id == unit.id
+    assert restored_unit.faction_id == faction.id
+
+    territories = await Territory.fetch_all(db_conn, TEST_GUILD_ID)
+    assert [t.territory_id for t in territories] == ["901"]
+    assert territories[0].controller_faction_id == faction.id
+
+    # Deleting the faction nulled the representation; the restore puts it back
+    restored_character = await Character.fetch_by_id(db_conn, character.id)
+    assert restored_character.victory_points == 4
+    assert restored_character.represented_faction_id == faction.id
+
+
+@pytest.mark.asyncio
+async def test_resolve_turn_takes_automatic_snapshot(db_conn, test_server):
+    """Test that resolve_turn snapshots the pre-turn state, which restore rolls back to."""
+    await _setup(db_conn)
+
+    success, message, _ = await resolve_turn(db_conn, TEST_GUILD_ID)
+    assert success, message
+    assert (await WargameConfig.fetch(db_conn, TEST_GUILD_ID)).current_turn == 4
+
+    snapshots = await GuildSnapshot.fetch_all(db_conn, TEST_GUILD_ID)
+    assert len(snapshots) == 1
+    assert snapshots[0].automatic
+    assert snapshots[0].turn_number == 3
+    assert snapshots[0].data is None
+
+    success, message = await restore_snapshot(db_conn, TEST_GUILD_ID)
+    assert success, message
+    assert (await WargameConfig.fetch(db_conn, TEST_GUILD_ID)).current_turn == 3
+
+
+def test_decode_refuses_other_schema_versions():
+    """Test that payloads which are not snapshots or come from another schema version are refused."""
+    with pytest.raises(ValueError):
+        GuildSnapshot.decode(b"not a snapshot")
+
+    newer = SNAPSHOT_MAGIC + struct.pack('>H', SNAPSHOT_SCHEMA_VERSION + 1) + b"\x00"
+    with pytest.raises(ValueError, match="schema version"):
+        GuildSnapshot.decode(newer)
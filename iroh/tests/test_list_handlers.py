@@ -148,6 +148,32 @@ async def test_list_territories_empty(db_conn, test_server):
     assert data is None
 
 
+@pytest.mark.asyncio
+async def test_list_territories_paginated(db_conn, test_server):
+    """Test that territories are listed page by page with the total in the message."""
+    for i in range(1, 6):
+        await Territory(
+            territory_id=str(i), terrain_type="plains", name=f"Territory {i}",
+            guild_id=TEST_GUILD_ID
+        ).upsert(db_conn)
+
+    success, message, data = await list_territories(db_conn, TEST_GUILD_ID, offset=2, limit=2)
+    assert success is True
+    assert [item['territory'].territory_id for item in data] == ["3", "4"]
+    assert message == "Showing territories 3-4 of 5"
+
+    success, message, data = await list_territories(db_conn, TEST_GUILD_ID, offset=4, limit=2)
+    assert [item['territory'].territory_id for item in data] == ["5"]
+    assert message == "Showing territories 5-5 of 5"
+
+    success, message, data = await list_territories(db_conn, TEST_GUILD_ID, offset=10, limit=2)
+    assert success is False
+    assert data is None
+    assert "no territories on that page" in message.lower()
+
+    await db_conn.execute("DELETE FROM Territory WHERE guild_id = $1;", TEST_GUILD_ID)
+
+
 @pytest.mark.asyncio
 async def test_list_unit_types_success(db_conn, test_server):
     """Test listing unit types."""
@@ -20,6 +20,7 @@ from handlers.turn_handlers import execute_movement_phase
 from handlers.movement_handlers import (
     calculate_movement_points,
     get_terrain_cost,
+    terrain_cost_table,
     build_movement_states,
     validate_units_colocation,
     get_unit_group_faction_id,
@@ -1207,6 +1208,25 @@ async def test_get_terrain_cost_desert(db_conn, test_server):
     assert cost == 2
 
 
+@pytest.mark.asyncio
+async def test_terrain_cost_table_follows_territory_edits(db_conn, test_server):
+    """Test that the terrain cost table is reused until a territory's terrain changes."""
+    await Territory(territory_id="TC_A", terrain_type="plains", guild_id=TEST_GUILD_ID).upsert(db_conn)
+    await Territory(territory_id="TC_B", terrain_type="desert", guild_id=TEST_GUILD_ID).upsert(db_conn)
+
+    costs = await terrain_cost_table(db_conn, TEST_GUILD_ID)
+    assert costs == {"TC_A": 1, "TC_B": 2}
+
+    # Edits that keep the terrain keep the table
+    await Territory(territory_id="TC_A", terrain_type="plains", name="Renamed", guild_id=TEST_GUILD_ID).upsert(db_conn)
+    assert await terrain_cost_table(db_conn, TEST_GUILD_ID) is costs
+
+    await Territory(territory_id="TC_A", terrain_type="mountains", guild_id=TEST_GUILD_ID).upsert(db_conn)
+    assert (await terrain_cost_table(db_conn, TEST_GUILD_ID))["TC_A"] == 3
+    assert await get_terrain_cost(db_conn, "TC_A", TEST_GUILD_ID) == 3
+    assert await get_terrain_cost(db_conn, "TC_MISSING", TEST_GUILD_ID) == 1
+
+
 @pytest.mark.asyncio
 async def test_no_unit_orders_returns_empty(db_conn, test_server):
     """Test that execute_movement_phase returns empty when no orders exist."""
@@ -11,6 +11,7 @@ Tests verify:
 - Transport destruction leads to carried land units being destroyed
 - Naval combat occurs before land combat in COMBAT phase
 - Simultaneous damage application (units at 0 org still deal damage)
+- The naval occupancy index agrees with per-unit position queries
 
 Run with: docker compose -f ~/avatar-bots/docker-compose-development.yaml exec iroh-api pytest tests/test_naval_combat.py -v
 """
@@ -27,6 +28,7 @@ from handlers.naval_combat_handlers import (
     NavalCombatSide,
 )
 from handlers.turn_handlers import execute_combat_phase, disband_low_organization_units
+from handlers.naval_occupancy import NavalOccupancyIndex
 from db import (
     Character, Unit, Territory, Order, WargameConfig, Faction, War, WarParticipant,
     Alliance, NavalUnitPosition
@@ -949,3 +951,48 @@ async def test_combat_phase_runs_naval_before_land(db_conn, test_server):
     assert 'NAVAL_COMBAT_STARTED' in event_types
     assert 'NAVAL_COMBAT_DAMAGE' in event_types
     assert 'NAVAL_COMBAT_ENDED' in event_types
+
+
+@pytest.mark.asyncio
+async def test_occupancy_index_matches_position_queries(db_conn, test_server):
+    """Test that combat detection reads the same windows and occupants from the index as from the table."""
+    char_a = Character(
+        identifier="occ-char-a", name="Occupancy Admiral A",
+        channel_id=999100000000000001, guild_id=TEST_GUILD_ID
+    )
+    await char_a.upsert(db_conn)
+    char_a = await Character.fetch_by_identifier(db_conn, "occ-char-a", TEST_GUILD_ID)
+
+    char_b = Character(
+        identifier="occ-char-b", name="Occupancy Admiral B",
+        channel_id=999100000000000002, guild_id=TEST_GUILD_ID
+    )
+    await char_b.upsert(db_conn)
+    char_b = await Character.fetch_by_identifier(db_conn, "occ-char-b", TEST_GUILD_ID)
+
+    faction_a, faction_b = await create_factions_at_war(db_conn, "occ-navy-a", "occ-navy-b", "occ-war")
+
+    for i in range(1, 4):
+        ocean = Territory(territory_id=f"occ-ocean-{i}", name=f"Occupancy Ocean {i}", terrain_type="ocean", guild_id=TEST_GUILD_ID)
+        await ocean.upsert(db_conn)
+
+    unit_a = await create_naval_unit_with_patrol(db_conn, "occ-fleet-a", faction_a, char_a,
+                                                  ["occ-ocean-1", "occ-ocean-2", "occ-ocean-3"])
+    unit_b = await create_naval_unit_with_convoy(db_conn, "occ-fleet-b", faction_b, char_b, ["occ-ocean-2"])
+
+    occupancy = await NavalOccupancyIndex.build(db_conn, TEST_GUILD_ID)
+
+    assert occupancy.window(unit_a.id) == await NavalUnitPosition.fetch_territories_by_unit(db_conn, unit_a.id, TEST_GUILD_ID)
+    for i in range(1, 4):
+        territory_id = f"occ-ocean-{i}"
+        assert sorted(occupancy.unit_ids_in(territory_id)) == sorted(
+            await NavalUnitPosition.fetch_units_in_territory(db_conn, territory_id, TEST_GUILD_ID)
+        )
+        indexed = await get_all_naval_units_in_territory(db_conn, territory_id, TEST_GUILD_ID, occupancy)
+        direct = await get_all_naval_units_in_territory(db_conn, territory_id, TEST_GUILD_ID)
+        assert sorted(u.unit_id for u in indexed) == sorted(u.unit_id for u in direct)
+
+    patrols = await find_naval_patrol_units(db_conn, TEST_GUILD_ID, occupancy)
+    assert [u.unit_id for u in patrols] == ["occ-fleet-a"]
+    assert await find_combat_territories_for_patrol(db_conn, patrols[0], TEST_GUILD_ID, occupancy) == \
+        await find_combat_territories_for_patrol(db_conn, patrols[0], TEST_GUILD_ID) == ["occ-ocean-2"]
@@ -262,6 +262,43 @@ async def test_naval_unit_position_set_positions_atomic(db_conn, test_server):
     assert positions == ['ocean-3', 'ocean-4', 'ocean-5']
 
 
+@pytest.mark.asyncio
+async def test_naval_unit_position_set_windows_bulk(db_conn, test_server):
+    """Test that set_windows rewrites only the units whose window changed."""
+    char = Character(
+        identifier='test-char', name='Test Character',
+        user_id=12345, channel_id=999000000000000001, guild_id=TEST_GUILD_ID
+    )
+    await char.upsert(db_conn)
+    char = await Character.fetch_by_identifier(db_conn, 'test-char', TEST_GUILD_ID)
+
+    units = []
+    for unit_id in ('fleet-1', 'fleet-2', 'fleet-3'):
+        unit = Unit(
+            unit_id=unit_id, name=unit_id, unit_type='test-fleet',
+            owner_character_id=char.id, current_territory_id='ocean-1',
+            is_naval=True, movement=3, guild_id=TEST_GUILD_ID
+        )
+        await unit.upsert(db_conn)
+        units.append(await Unit.fetch_by_unit_id(db_conn, unit_id, TEST_GUILD_ID))
+
+    await NavalUnitPosition.set_positions(db_conn, units[0].id, ['ocean-1', 'ocean-2'], TEST_GUILD_ID)
+    await NavalUnitPosition.set_positions(db_conn, units[1].id, ['ocean-1'], TEST_GUILD_ID)
+
+    changed = await NavalUnitPosition.set_windows(db_conn, {
+        units[0].id: ['ocean-1', 'ocean-2'],            # unchanged
+        units[1].id: ['ocean-2', 'ocean-3'],            # moved
+        units[2].id: ['ocean-4'],                       # first window
+    }, TEST_GUILD_ID)
+    assert changed == 2
+
+    for unit, expected in zip(units, (['ocean-1', 'ocean-2'], ['ocean-2', 'ocean-3'], ['ocean-4'])):
+        positions = await NavalUnitPosition.fetch_territories_by_unit(db_conn, unit.id, TEST_GUILD_ID)
+        assert positions == expected
+
+    assert await NavalUnitPosition.set_windows(db_conn, {units[2].id: ['ocean-4']}, TEST_GUILD_ID) == 0
+
+
 # ============================================================================
 # Helper Function Tests
 # ============================================================================
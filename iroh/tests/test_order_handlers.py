@@ -7,11 +7,11 @@ Run with: docker compose -f ~/avatar-bots/docker-compose-development.yaml exec i
 import pytest
 from handlers.order_handlers import (
     submit_join_faction_order, submit_leave_faction_order, submit_transit_order,
-    cancel_order, view_pending_orders, validate_path
+    cancel_order, view_pending_orders, validate_path, suggest_path_completions
 )
 from db import (
     Character, Faction, FactionMember, Unit, UnitType, Territory,
-    TerritoryAdjacency, WargameConfig, Order
+    TerritoryAdjacency, WargameConfig, Order, territory_graphs
 )
 from order_types import OrderType, OrderStatus
 from tests.conftest import TEST_GUILD_ID
@@ -1155,6 +1155,40 @@ async def test_validate_path_long(db_conn, test_server):
     await db_conn.execute("DELETE FROM Territory WHERE guild_id = $1;", TEST_GUILD_ID)
 
 
+@pytest.mark.asyncio
+async def test_validate_path_uses_cached_graph(db_conn, test_server):
+    """Test that paths are validated from the cached graph, which follows territory edits."""
+    for i in range(101, 104):
+        await Territory(
+            territory_id=str(i), name=f"Territory {i}", terrain_type="plains",
+            guild_id=TEST_GUILD_ID
+        ).upsert(db_conn)
+    await TerritoryAdjacency(territory_a_id="101", territory_b_id="102", guild_id=TEST_GUILD_ID).upsert(db_conn)
+
+    valid, error = await validate_path(db_conn, ["101", "102", "103"], TEST_GUILD_ID)
+    assert valid is False
+    assert error == "Territories 102 and 103 are not adjacent."
+
+    # Rewriting an unchanged territory keeps the cached graph
+    graph = await territory_graphs.get(db_conn, TEST_GUILD_ID)
+    await Territory(territory_id="101", name="Renamed", terrain_type="plains", guild_id=TEST_GUILD_ID).upsert(db_conn)
+    assert await territory_graphs.get(db_conn, TEST_GUILD_ID) is graph
+
+    # New adjacencies and deletions are picked up
+    await TerritoryAdjacency(territory_a_id="103", territory_b_id="102", guild_id=TEST_GUILD_ID).upsert(db_conn)
+    valid, error = await validate_path(db_conn, ["101", "102", "103"], TEST_GUILD_ID)
+    assert valid is True
+
+    await TerritoryAdjacency.delete(db_conn, "101", "102", TEST_GUILD_ID)
+    valid, error = await validate_path(db_conn, ["101", "102", "103"], TEST_GUILD_ID)
+    assert error == "Territories 101 and 102 are not adjacent."
+
+    graph = await territory_graphs.get(db_conn, TEST_GUILD_ID)
+    assert suggest_path_completions(graph, "102,") == [("102,103 (plains)", "102,103")]
+    assert suggest_path_completions(graph, "102,999,") == [("Territory '999' not found.", "102,999,")]
+    assert suggest_path_completions(graph, "101,102") == [("Territories '101' and '102' are not adjacent.", "101,102")]
+
+
 @pytest.mark.asyncio
 async def test_cancel_order_nonexistent(db_conn, test_server):
     """Test cancelling a non-existent order."""
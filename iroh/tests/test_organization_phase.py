@@ -431,3 +431,73 @@ async def test_already_disbanded_units_not_processed(db_conn, test_server):
         assert len(disband_events) == 0
     finally:
         await cleanup_org_test_data(db_conn)
+
+
+@pytest.mark.asyncio
+async def test_recovery_uses_represented_faction(db_conn, test_server):
+    """Test that a controller in several factions counts for the faction they represent."""
+    try:
+        old_faction = Faction(faction_id="old-rep-faction", name="Old Faction", guild_id=TEST_GUILD_ID)
+        await old_faction.upsert(db_conn)
+        old_faction = await Faction.fetch_by_faction_id(db_conn, "old-rep-faction", TEST_GUILD_ID)
+        new_faction = Faction(faction_id="new-rep-faction", name="New Faction", guild_id=TEST_GUILD_ID)
+        await new_faction.upsert(db_conn)
+        new_faction = await Faction.fetch_by_faction_id(db_conn, "new-rep-faction", TEST_GUILD_ID)
+
+        owner = Character(
+            identifier="rep-owner", name="Rep Owner",
+            channel_id=999000000000000061, guild_id=TEST_GUILD_ID
+        )
+        await owner.upsert(db_conn)
+        owner = await Character.fetch_by_identifier(db_conn, "rep-owner", TEST_GUILD_ID)
+
+        # Joined new_faction most recently, but represents old_faction
+        await FactionMember(faction_id=old_faction.id, character_id=owner.id,
+                            joined_turn=0, guild_id=TEST_GUILD_ID).insert(db_conn)
+        await FactionMember(faction_id=new_faction.id, character_id=owner.id,
+                            joined_turn=3, guild_id=TEST_GUILD_ID).insert(db_conn)
+        owner.represented_faction_id = old_faction.id
+        await owner.upsert(db_conn)
+
+        territory = Territory(
+            territory_id="160", name="Represented Land", terrain_type="plains",
+            controller_character_id=owner.id,
+            guild_id=TEST_GUILD_ID
+        )
+        await territory.upsert(db_conn)
+
+        for unit_id, faction_id in (("rep-old-unit", old_faction.id), ("rep-new-unit", new_faction.id)):
+            unit = Unit(
+                unit_id=unit_id, name=unit_id, unit_type="infantry",
+                owner_character_id=owner.id, faction_id=faction_id,
+                current_territory_id="160",
+                organization=5, max_organization=10,
+                status='ACTIVE',
+                guild_id=TEST_GUILD_ID
+            )
+            await unit.upsert(db_conn)
+
+        # A unit disbanded in the same pass does not recover
+        doomed = Unit(
+            unit_id="rep-doomed-unit", name="Doomed", unit_type="infantry",
+            owner_character_id=owner.id, faction_id=old_faction.id,
+            current_territory_id="160",
+            organization=0, max_organization=10,
+            status='ACTIVE',
+            guild_id=TEST_GUILD_ID
+        )
+        await doomed.upsert(db_conn)
+
+        events = await execute_organization_phase(db_conn, TEST_GUILD_ID, 1)
+
+        recovered = {e.event_data['unit_id'] for e in events if e.event_type == 'ORG_RECOVERY'}
+        assert recovered == {"rep-old-unit"}
+        disbanded = [e for e in events if e.event_type == 'UNIT_DISBANDED']
+        assert [e.event_data['unit_id'] for e in disbanded] == ["rep-doomed-unit"]
+        assert disbanded[0].event_data['owner_name'] == "Rep Owner"
+
+        assert (await Unit.fetch_by_unit_id(db_conn, "rep-old-unit", TEST_GUILD_ID)).organization == 6
+        assert (await Unit.fetch_by_unit_id(db_conn, "rep-new-unit", TEST_GUILD_ID)).organization == 5
+        assert (await Unit.fetch_by_unit_id(db_conn, "rep-doomed-unit", TEST_GUILD_ID)).status == 'DISBANDED'
+    finally:
+        await cleanup_org_test_data(db_conn)
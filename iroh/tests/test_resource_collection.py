@@ -6,7 +6,10 @@ Run with: docker compose -f ~/avatar-bots/docker-compose-development.yaml exec i
 """
 import pytest
 from handlers.turn_handlers import execute_resource_collection_phase
-from db import Character, Territory, PlayerResources
+from db import (
+    Character, Territory, PlayerResources, Faction, FactionPermission, FactionResources,
+    ResourceLedgerEntry
+)
 from tests.conftest import TEST_GUILD_ID
 
 
@@ -374,3 +377,55 @@ async def test_resource_collection_multiple_characters(db_conn, test_server):
     await db_conn.execute("DELETE FROM PlayerResources WHERE guild_id = $1;", TEST_GUILD_ID)
     await db_conn.execute("DELETE FROM Territory WHERE guild_id = $1;", TEST_GUILD_ID)
     await db_conn.execute("DELETE FROM Character WHERE guild_id = $1;", TEST_GUILD_ID)
+
+
+@pytest.mark.asyncio
+async def test_resource_collection_sums_faction_territories(db_conn, test_server):
+    """Test that a faction's territories are summed into one event and one balance update."""
+    leader = Character(
+        identifier="faction-leader", name="Faction Leader",
+        channel_id=999000000000000011, guild_id=TEST_GUILD_ID
+    )
+    await leader.upsert(db_conn)
+    leader = await Character.fetch_by_identifier(db_conn, "faction-leader", TEST_GUILD_ID)
+    treasurer = Character(
+        identifier="faction-treasurer", name="Faction Treasurer",
+        channel_id=999000000000000012, guild_id=TEST_GUILD_ID
+    )
+    await treasurer.upsert(db_conn)
+    treasurer = await Character.fetch_by_identifier(db_conn, "faction-treasurer", TEST_GUILD_ID)
+
+    await Faction(
+        faction_id="producer-faction", name="Producer Faction",
+        leader_character_id=leader.id, guild_id=TEST_GUILD_ID
+    ).upsert(db_conn)
+    faction = await Faction.fetch_by_faction_id(db_conn, "producer-faction", TEST_GUILD_ID)
+    await FactionPermission(
+        faction_id=faction.id, character_id=treasurer.id,
+        permission_type="FINANCIAL", guild_id=TEST_GUILD_ID
+    ).upsert(db_conn)
+
+    for territory_id, ore, keywords in [("110", 4, None), ("111", 6, None), ("112", 100, ["sacred-land"])]:
+        await Territory(
+            territory_id=territory_id, terrain_type="plains",
+            ore_production=ore, rations_production=1, keywords=keywords,
+            controller_faction_id=faction.id, guild_id=TEST_GUILD_ID
+        ).upsert(db_conn)
+
+    events = await execute_resource_collection_phase(db_conn, TEST_GUILD_ID, 1)
+
+    # One event for the faction; the sacred-land territory produces nothing
+    assert len(events) == 1
+    event = events[0]
+    assert event.event_type == 'FACTION_TERRITORY_PRODUCTION'
+    assert event.entity_id == faction.id
+    assert event.event_data['resources']['ore'] == 10
+    assert event.event_data['resources']['rations'] == 2
+    assert sorted(event.event_data['affected_character_ids']) == sorted([leader.id, treasurer.id])
+
+    resources = await FactionResources.fetch_by_faction(db_conn, faction.id, TEST_GUILD_ID)
+    assert resources.ore == 10
+    assert resources.rations == 2
+
+    summary = await ResourceLedgerEntry.fetch_turn_summary(db_conn, 'faction', faction.id, 1, TEST_GUILD_ID)
+    assert summary['TERRITORY_PRODUCTION']['ore'] == 10
@@ -0,0 +1,111 @@
+"""
+Pytest tests for the ResourceLedger journal and end-of-turn ResourceBalance snapshots.
+
+Tests verify:
+- Upkeep writes one signed entry per owner and reason
+- Snapshots materialize the current balances for a turn
+- GM resource edits are journalled as adjustments
+
+Run with: docker compose -f ~/avatar-bots/docker-compose-development.yaml exec iroh-api pytest tests/test_resource_ledger.py -v
+"""
+import pytest
+from handlers.turn_handlers import execute_upkeep_phase
+from handlers.resource_handlers import set_character_resource
+from db import Character, Unit, PlayerResources, ResourceLedgerEntry, ResourceBalance, WargameConfig
+from tests.conftest import TEST_GUILD_ID
+
+
+@pytest.mark.asyncio
+async def test_upkeep_is_journalled(db_conn, test_server):
+    """Test that unit upkeep for two units is journalled as one negative entry."""
+    character = Character(
+        identifier="ledger-char", name="Ledger Tester",
+        channel_id=999000000000000501, guild_id=TEST_GUILD_ID
+    )
+    await character.upsert(db_conn)
+    character = await Character.fetch_by_identifier(db_conn, "ledger-char", TEST_GUILD_ID)
+
+    for unit_id in ("ledger-unit-1", "ledger-unit-2"):
+        unit = Unit(
+            unit_id=unit_id, name="Ledger Unit", unit_type="infantry",
+            owner_character_id=character.id,
+            organization=10, max_organization=10,
+            upkeep_ore=2, upkeep_rations=3,
+            guild_id=TEST_GUILD_ID
+        )
+        await unit.upsert(db_conn)
+
+    resources = PlayerResources(
+        character_id=character.id, ore=10, rations=10, guild_id=TEST_GUILD_ID
+    )
+    await resources.upsert(db_conn)
+
+    await execute_upkeep_phase(db_conn, TEST_GUILD_ID, 1)
+
+    entries = await ResourceLedgerEntry.fetch_by_turn(db_conn, 1, TEST_GUILD_ID)
+    assert len(entries) == 1
+    assert entries[0].phase == 'UPKEEP'
+    assert entries[0].owner_type == 'character'
+    assert entries[0].owner_id == character.id
+
+    summary = await ResourceLedgerEntry.fetch_turn_summary(db_conn, 'character', character.id, 1, TEST_GUILD_ID)
+    assert summary['UNIT_UPKEEP']['ore'] == -4
+    assert summary['UNIT_UPKEEP']['rations'] == -6
+    assert summary['UNIT_UPKEEP']['lumber'] == 0
+
+
+@pytest.mark.asyncio
+async def test_snapshot_turn_materializes_balances(db_conn, test_server):
+    """Test that a snapshot records current balances and can be retaken."""
+    character = Character(
+        identifier="snapshot-char", name="Snapshot Tester",
+        channel_id=999000000000000502, guild_id=TEST_GUILD_ID
+    )
+    await character.upsert(db_conn)
+    character = await Character.fetch_by_identifier(db_conn, "snapshot-char", TEST_GUILD_ID)
+
+    resources = PlayerResources(
+        character_id=character.id, ore=7, platinum=2, guild_id=TEST_GUILD_ID
+    )
+    await resources.upsert(db_conn)
+
+    await ResourceBalance.snapshot_turn(db_conn, 3, TEST_GUILD_ID)
+    balance = await ResourceBalance.fetch(db_conn, 'character', character.id, 3, TEST_GUILD_ID)
+    assert balance.ore == 7
+    assert balance.platinum == 2
+
+    # Re-snapshotting the same turn overwrites rather than duplicating
+    resources.ore = 1
+    await resources.upsert(db_conn)
+    await ResourceBalance.snapshot_turn(db_conn, 3, TEST_GUILD_ID)
+    balance = await ResourceBalance.fetch(db_conn, 'character', character.id, 3, TEST_GUILD_ID)
+    assert balance.ore == 1
+
+
+@pytest.mark.asyncio
+async def test_gm_resource_edit_is_journalled(db_conn, test_server):
+    """Test that a GM edit journals the difference against the next turn to resolve."""
+    character = Character(
+        identifier="gm-edit-char", name="GM Edit Tester",
+        channel_id=999000000000000503, guild_id=TEST_GUILD_ID
+    )
+    await character.upsert(db_conn)
+    character = await Character.fetch_by_identifier(db_conn, "gm-edit-char", TEST_GUILD_ID)
+
+    resources = PlayerResources(
+        character_id=character.id, ore=7, guild_id=TEST_GUILD_ID
+    )
+    await resources.upsert(db_conn)
+
+    await set_character_resource(db_conn, character.id, TEST_GUILD_ID, 'ore', 3)
+
+    resources = await PlayerResources.fetch_by_character(db_conn, character.id, TEST_GUILD_ID)
+    assert resources.ore == 3
+
+    config = await WargameConfig.fetch(db_conn, TEST_GUILD_ID)
+    next_turn = (config.current_turn if config else 0) + 1
+    entries = await ResourceLedgerEntry.fetch_by_turn(db_conn, next_turn, TEST_GUILD_ID)
+    assert len(entries) == 1
+    assert entries[0].phase == 'GM'
+    assert entries[0].reason == 'GM_ADJUSTMENT'
+    assert entries[0].ore == -4
@@ -0,0 +1,128 @@
+"""
+Pytest tests for route planning.
+
+Tests verify:
+- Routes arrive in the fewest turns under the movement phase's MP rules
+- Land, naval and transport routes keep to their terrain
+- Transport routes board, cross water and disembark like the transport tick
+- suggest_route reports the path and turns for a unit group
+
+Run with: docker compose -f ~/avatar-bots/docker-compose-development.yaml exec iroh-api pytest tests/test_route_handlers.py -v
+"""
+import pytest
+from handlers.route_handlers import (
+    search_routes, suggest_route, suggest_route_destinations,
+    MODE_LAND, MODE_NAVAL, MODE_TRANSPORT
+)
+from db import Character, Territory, TerritoryAdjacency, Unit, TerritoryGraph
+from tests.conftest import TEST_GUILD_ID
+
+
+def _graph(terrain_types, adjacencies):
+    graph = TerritoryGraph(guild_id=TEST_GUILD_ID, terrain_types=terrain_types)
+    for a, b in adjacencies:
+        graph.neighbors.setdefault(a, set()).add(b)
+        graph.neighbors.setdefault(b, set()).add(a)
+    return graph
+
+
+# A - M(ountains) - C is shorter than A - P1 - P2 - C, but the mountain costs 3 MP
+MAP = _graph(
+    {'A': 'plains', 'M': 'mountains', 'P1': 'plains', 'P2': 'plains', 'C': 'plains',
+     'S1': 'ocean', 'S2': 'sea', 'E': 'plains'},
+    [('A', 'M'), ('M', 'C'), ('A', 'P1'), ('P1', 'P2'), ('P2', 'C'),
+     ('C', 'S1'), ('S1', 'S2'), ('S2', 'E')]
+)
+
+
+def test_search_routes_fewest_turns():
+    """Test that routes minimise turns, not steps, and skip terrain the group can never afford."""
+    search = search_routes(MAP, ['A'], MODE_LAND, movement_points=3)
+    assert search.path_to('C') == ['A', 'P1', 'P2', 'C']
+    assert search.turns_to('C') == 1
+    assert search.turns_to('M') == 1
+
+    # With 2 MP the mountain can never be entered
+    search = search_routes(MAP, ['A'], MODE_LAND, movement_points=2)
+    assert search.path_to('M') is None
+    assert search.turns_to('C') == 2
+
+    # Infiltrators pay 1 MP everywhere and may cross water on land orders
+    search = search_routes(MAP, ['A'], MODE_LAND, movement_points=2, ignores_terrain=True)
+    assert search.path_to('C') == ['A', 'M', 'C']
+    assert search.turns_to('C') == 1
+    assert search.path_to('E') == ['A', 'M', 'C', 'S1', 'S2', 'E']
+    assert search.turns_to('E') == 3
+
+    assert [value for _, value in suggest_route_destinations(search, 'S')] == ['S1', 'S2']
+
+
+def test_search_routes_terrain_modes():
+    """Test that land, naval and transport routes keep to their terrain."""
+    assert search_routes(MAP, ['A'], MODE_LAND, movement_points=4).path_to('E') is None
+
+    search = search_routes(MAP, ['S1'], MODE_NAVAL, movement_points=2)
+    assert search.path_to('S2') == ['S1', 'S2']
+    assert search.path_to('E') is None
+
+    search = search_routes(MAP, ['A'], MODE_TRANSPORT, movement_points=3)
+    assert search.path_to('E') == ['A', 'P1', 'P2', 'C', 'S1', 'S2', 'E']
+    assert search.turns_to('E') == 3
+
+
+def test_search_routes_transport_turns():
+    """Test that transport routes are costed like boarding, the transport tick and disembarking."""
+    graph = _graph(
+        {'C': 'plains', 'W1': 'ocean', 'W2': 'ocean', 'W3': 'ocean', 'D': 'plains', 'F': 'plains'},
+        [('C', 'W1'), ('W1', 'W2'), ('W2', 'W3'), ('W3', 'D'), ('D', 'F')]
+    )
+
+    # Turn 1: board to W1, then two naval MP reach W3. Turn 2: disembark to D, then one land MP to F
+    search = search_routes(graph, ['C'], MODE_TRANSPORT, movement_points=1, water_movement_points=2)
+    assert search.path_to('F') == ['C', 'W1', 'W2', 'W3', 'D', 'F']
+    assert search.turns_to('D') == 2
+    assert search.turns_to('F') == 2
+
+    # Turn 1: board to W1, then W2. Turn 2: W3. Turn 3: disembark to D, then F
+    search = search_routes(graph, ['C'], MODE_TRANSPORT, movement_points=1, water_movement_points=1)
+    assert search.turns_to('F') == 3
+
+    # Naval MP defaults to the land group's MP
+    search = search_routes(graph, ['C'], MODE_TRANSPORT, movement_points=2)
+    assert search.turns_to('F') == 2
+
+
+@pytest.mark.asyncio
+async def test_suggest_route(db_conn, test_server):
+    """Test suggesting a route for a unit group from the database."""
+    await Character(
+        identifier="route-char", name="Route Tester",
+        user_id=100000000000000001, channel_id=900000000000000001,
+        guild_id=TEST_GUILD_ID
+    ).upsert(db_conn)
+    char = await Character.fetch_by_identifier(db_conn, "route-char", TEST_GUILD_ID)
+
+    for territory_id, terrain_type in [("101", "plains"), ("102", "mountains"), ("103", "plains"), ("104", "plains")]:
+        await Territory(territory_id=territory_id, terrain_type=terrain_type, guild_id=TEST_GUILD_ID).upsert(db_conn)
+    for a, b in [("101", "102"), ("102", "103"), ("101", "104"), ("104", "103")]:
+        await TerritoryAdjacency(territory_a_id=a, territory_b_id=b, guild_id=TEST_GUILD_ID).upsert(db_conn)
+
+    await Unit(
+        unit_id="ROUTE-1", unit_type="infantry", owner_character_id=char.id, movement=1,
+        current_territory_id="101", guild_id=TEST_GUILD_ID
+    ).upsert(db_conn)
+
+    # Transit gives 1 + 1 MP: two plains steps in one turn
+    success, message, data = await suggest_route(db_conn, ["ROUTE-1"], "transit", "103", TEST_GUILD_ID, char.id)
+    assert success, message
+    assert data['path'] == ["101", "104", "103"]
+    assert data['turns'] == 1
+    assert data['movement_points'] == 2
+
+    # Patrol gets no bonus: one step per turn
+    success, message, data = await suggest_route(db_conn, ["ROUTE-1"], "patrol", "103", TEST_GUILD_ID, char.id)
+    assert data['turns'] == 2
+
+    success, message, _ = await suggest_route(db_conn, ["ROUTE-1"], "transit", "999", TEST_GUILD_ID, char.id)
+    assert not success
+    assert message == "Territory '999' not found."
@@ -0,0 +1,106 @@
+"""
+Pytest tests for the per-turn territory building modifier index.
+
+Tests verify:
+- Index matches the per-territory calculate_* helpers
+- Destroying a building mid-turn removes its modifiers
+- Constructing a building mid-turn adds its modifiers
+
+Run with: docker compose -f ~/avatar-bots/docker-compose-development.yaml exec iroh-api pytest tests/test_territory_modifiers.py -v
+"""
+import pytest
+from handlers.turn_handlers import (
+    calculate_building_production_bonus,
+    calculate_territory_siege_defense,
+    calculate_hospital_bonus,
+    destroy_low_durability_buildings,
+    FORTIFICATION_BONUS,
+    HOSPITAL_BONUS,
+)
+from handlers.territory_modifiers import TerritoryModifierIndex
+from db import Territory, Building
+from tests.conftest import TEST_GUILD_ID
+
+
+async def _cleanup(db_conn):
+    await db_conn.execute("DELETE FROM Building WHERE guild_id = $1;", TEST_GUILD_ID)
+    await db_conn.execute("DELETE FROM Territory WHERE guild_id = $1;", TEST_GUILD_ID)
+
+
+@pytest.mark.asyncio
+async def test_index_matches_direct_calculation(db_conn, test_server):
+    """Test that the index gives the same bonuses as querying each territory."""
+    territory = Territory(
+        territory_id="M100", name="Modifier Territory", terrain_type="city",
+        ore_production=3, lumber_production=0, coal_production=0,
+        rations_production=0, cloth_production=0, platinum_production=0,
+        siege_defense=1,
+        guild_id=TEST_GUILD_ID
+    )
+    await territory.upsert(db_conn)
+
+    buildings = [
+        Building(building_id="mod-mine", building_type="mine", territory_id="M100",
+                 keywords=["ore"], guild_id=TEST_GUILD_ID),
+        Building(building_id="mod-factory", building_type="factory", territory_id="M100",
+                 keywords=["industrial", "coal"], guild_id=TEST_GUILD_ID),
+        Building(building_id="mod-wall", building_type="wall", territory_id="M100",
+                 keywords=["Fortification"], guild_id=TEST_GUILD_ID),
+        Building(building_id="mod-hospital", building_type="hospital", territory_id="M100",
+                 keywords=["hospital"], guild_id=TEST_GUILD_ID),
+        Building(building_id="mod-ruin", building_type="hospital", territory_id="M100",
+                 status="DESTROYED", keywords=["hospital"], guild_id=TEST_GUILD_ID),
+    ]
+    for building in buildings:
+        await building.upsert(db_conn)
+
+    index = await TerritoryModifierIndex.build(db_conn, TEST_GUILD_ID)
+
+    assert index.production_bonus("M100") == await calculate_building_production_bonus(
+        db_conn, territory, TEST_GUILD_ID
+    )
+    assert index.production_bonus("M100")['ore'] == 2
+    assert index.production_bonus("M100")['coal'] == 2
+    assert index.siege_defense(territory) == 1 + FORTIFICATION_BONUS
+    assert index.siege_defense(territory) == await calculate_territory_siege_defense(
+        db_conn, territory, TEST_GUILD_ID
+    )
+    assert index.hospital_bonus("M100") == HOSPITAL_BONUS
+    assert index.hospital_bonus("M100") == await calculate_hospital_bonus(db_conn, "M100", TEST_GUILD_ID)
+
+    # Territory without buildings has no modifiers
+    assert index.hospital_bonus("nowhere") == 0
+
+    await _cleanup(db_conn)
+
+
+@pytest.mark.asyncio
+async def test_index_tracks_destroyed_and_constructed_buildings(db_conn, test_server):
+    """Test that building destruction and construction keep the index current."""
+    territory = Territory(
+        territory_id="M200", name="Hospital Town", terrain_type="plains",
+        guild_id=TEST_GUILD_ID
+    )
+    await territory.upsert(db_conn)
+
+    hospital = Building(
+        building_id="mod-hospital-2", building_type="hospital", territory_id="M200",
+        durability=0, keywords=["hospital"], guild_id=TEST_GUILD_ID
+    )
+    await hospital.upsert(db_conn)
+
+    index = await TerritoryModifierIndex.build(db_conn, TEST_GUILD_ID)
+    assert index.hospital_bonus("M200") == HOSPITAL_BONUS
+
+    await destroy_low_durability_buildings(db_conn, TEST_GUILD_ID, 1, index)
+    assert index.hospital_bonus("M200") == 0
+
+    new_hospital = Building(
+        building_id="mod-hospital-3", building_type="hospital", territory_id="M200",
+        keywords=["hospital"], guild_id=TEST_GUILD_ID
+    )
+    index.building_added(new_hospital)
+    index.building_added(new_hospital)  # Re-adding the same building does not double count
+    assert index.hospital_bonus("M200") == HOSPITAL_BONUS
+
+    await _cleanup(db_conn)
@@ -0,0 +1,115 @@
+"""
+Pytest tests for the per-turn resolution context.
+
+Tests verify:
+- Lookups inside an installed context match direct queries
+- Memoized lookups are only refreshed after invalidate()
+- Outside a context the helpers query the database directly
+- Engaging submarines are tracked per guild and carried into the next turn
+
+Run with: docker compose -f ~/avatar-bots/docker-compose-development.yaml exec iroh-api pytest tests/test_turn_context.py -v
+"""
+import pytest
+from handlers.turn_context import (
+    TurnContext,
+    current_turn_context,
+    fetch_character,
+    fetch_permission_holders,
+)
+from handlers.combat_handlers import get_unit_faction_id
+from handlers.naval_combat_handlers import NavalCombatSide, filter_submarines_from_combat
+from db import Character, Faction, FactionPermission, Unit
+from tests.conftest import TEST_GUILD_ID, TEST_GUILD_ID_2
+
+
+async def _setup(db_conn):
+    faction = Faction(faction_id="context-faction", name="Context Faction", guild_id=TEST_GUILD_ID)
+    await faction.upsert(db_conn)
+    faction = await Faction.fetch_by_faction_id(db_conn, "context-faction", TEST_GUILD_ID)
+
+    character = Character(
+        identifier="context-char", name="Context Tester",
+        channel_id=999000000000000701, represented_faction_id=faction.id,
+        guild_id=TEST_GUILD_ID
+    )
+    await character.upsert(db_conn)
+    character = await Character.fetch_by_identifier(db_conn, "context-char", TEST_GUILD_ID)
+
+    permission = FactionPermission(
+        faction_id=faction.id, character_id=character.id,
+        permission_type="COMMAND", guild_id=TEST_GUILD_ID
+    )
+    await permission.upsert(db_conn)
+
+    unit = Unit(
+        unit_id="context-unit", name="Context Unit", unit_type="infantry",
+        owner_character_id=character.id, guild_id=TEST_GUILD_ID
+    )
+    await unit.upsert(db_conn)
+    unit = await Unit.fetch_by_unit_id(db_conn, "context-unit", TEST_GUILD_ID)
+
+    return character, faction, unit
+
+
+@pytest.mark.asyncio
+async def test_context_lookups_match_direct_queries(db_conn, test_server):
+    """Test that memoized lookups agree with the database and survive edits until invalidated."""
+    character, faction, unit = await _setup(db_conn)
+
+    turn_context = TurnContext(TEST_GUILD_ID, 1)
+    with turn_context.installed():
+        assert current_turn_context() is turn_context
+
+        assert await get_unit_faction_id(db_conn, unit, TEST_GUILD_ID) == faction.id
+        holders = await fetch_permission_holders(db_conn, faction.id, "COMMAND", TEST_GUILD_ID)
+        assert holders == await FactionPermission.fetch_characters_with_permission(
+            db_conn, faction.id, "COMMAND", TEST_GUILD_ID
+        )
+
+        # A representation change made mid-turn is not seen until invalidated
+        await db_conn.execute(
+            "UPDATE Character SET represented_faction_id = NULL WHERE id = $1;", character.id
+        )
+        cached = await fetch_character(db_conn, character.id)
+        assert cached.represented_faction_id == faction.id
+
+        turn_context.invalidate()
+        assert await get_unit_faction_id(db_conn, unit, TEST_GUILD_ID) is None
+
+    assert current_turn_context() is None
+
+
+@pytest.mark.asyncio
+async def test_helpers_query_directly_without_context(db_conn, test_server):
+    """Test that the helpers fall back to the database outside turn resolution."""
+    character, faction, _ = await _setup(db_conn)
+
+    assert current_turn_context() is None
+    fetched = await fetch_character(db_conn, character.id)
+    assert fetched.identifier == "context-char"
+    assert await fetch_permission_holders(db_conn, faction.id, "COMMAND", TEST_GUILD_ID) == [character.id]
+    assert await fetch_character(db_conn, -1) is None
+
+
+def test_submarine_tracking_is_per_guild_and_carried_over():
+    """Test that engaging submarines are recorded on the guild's context and seed its next turn only."""
+    submarine = Unit(id=1, unit_id="sub", keywords=["submarine"], attack=5, status='ACTIVE')
+    escort = Unit(id=2, unit_id="escort", attack=5, status='ACTIVE')
+    enemy = Unit(id=3, unit_id="enemy", defense=1, status='ACTIVE')
+    sides = [
+        NavalCombatSide(faction_ids={1}, units=[submarine, escort], total_attack=10, total_defense=0),
+        NavalCombatSide(faction_ids={2}, units=[enemy], total_attack=0, total_defense=1),
+    ]
+
+    guild_a = TurnContext(TEST_GUILD_ID, 5)
+    guild_b = TurnContext(TEST_GUILD_ID_2, 5)
+    filtered = filter_submarines_from_combat(sides, [(0, 1)], guild_a)
+    assert [u.unit_id for u in filtered[0].units] == ["sub", "escort"]
+    assert guild_a.submarines_in_combat == {1}
+    assert guild_b.submarines_in_combat == set()
+
+    guild_a.finish()
+    assert TurnContext(TEST_GUILD_ID, 6).submarines_in_combat == {1}
+    # A context for a non-consecutive turn (e.g. after a rewind) starts empty
+    assert TurnContext(TEST_GUILD_ID, 8).submarines_in_combat == set()
+    assert TurnContext(TEST_GUILD_ID_2, 6).submarines_in_combat == set()
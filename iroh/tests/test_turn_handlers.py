@@ -11,7 +11,7 @@ from handlers.turn_handlers import (
 )
 from db import (
     Character, Faction, FactionMember, WargameConfig, Order, TurnLog,
-    Territory, PlayerResources
+    Territory, PlayerResources, Unit, War, WarParticipant, TerritoryAdjacency
 )
 from order_types import OrderType, OrderStatus, TurnPhase
 from tests.conftest import TEST_GUILD_ID
@@ -753,3 +753,42 @@ async def test_resolve_turn_logs_all_events(db_conn, test_server):
     await db_conn.execute("DELETE FROM FactionMember WHERE guild_id = $1;", TEST_GUILD_ID)
     await db_conn.execute("DELETE FROM Faction WHERE guild_id = $1;", TEST_GUILD_ID)
     await db_conn.execute("DELETE FROM WargameConfig WHERE guild_id = $1;", TEST_GUILD_ID)
+
+
+@pytest.mark.asyncio
+async def test_resolve_turn_runs_combat_phase(db_conn, test_server):
+    """Test that resolve_turn runs naval and land combat for hostile units."""
+    factions = []
+    for key in ("a", "b"):
+        faction = Faction(faction_id=f"resolve-combat-{key}", name=f"Faction {key}", guild_id=TEST_GUILD_ID)
+        await faction.upsert(db_conn)
+        factions.append(await Faction.fetch_by_faction_id(db_conn, f"resolve-combat-{key}", TEST_GUILD_ID))
+
+    war = War(war_id="resolve-combat-war", objective="Test War", guild_id=TEST_GUILD_ID)
+    await war.upsert(db_conn)
+    war = await War.fetch_by_id(db_conn, "resolve-combat-war", TEST_GUILD_ID)
+    for faction, side in zip(factions, ("SIDE_A", "SIDE_B")):
+        await WarParticipant(war_id=war.id, faction_id=faction.id, side=side, guild_id=TEST_GUILD_ID).upsert(db_conn)
+
+    for territory_id in ("RC-T1", "RC-T2"):
+        await Territory(territory_id=territory_id, terrain_type="plains", guild_id=TEST_GUILD_ID).upsert(db_conn)
+    await TerritoryAdjacency(territory_a_id="RC-T1", territory_b_id="RC-T2", guild_id=TEST_GUILD_ID).upsert(db_conn)
+
+    await WargameConfig(guild_id=TEST_GUILD_ID, current_turn=5).upsert(db_conn)
+
+    for faction, attack in zip(factions, (10, 3)):
+        await Unit(
+            unit_id=f"rc-unit-{faction.faction_id}", unit_type="infantry",
+            owner_faction_id=faction.id, faction_id=faction.id,
+            movement=2, organization=10, max_organization=10, attack=attack, defense=3,
+            current_territory_id="RC-T1", is_naval=False, guild_id=TEST_GUILD_ID
+        ).upsert(db_conn)
+
+    success, message, events = await resolve_turn(db_conn, TEST_GUILD_ID)
+
+    assert success is True, message
+    event_types = [e.event_type for e in events]
+    assert 'COMBAT_STARTED' in event_types
+
+    weaker = await Unit.fetch_by_unit_id(db_conn, "rc-unit-resolve-combat-b", TEST_GUILD_ID)
+    assert weaker is None or weaker.organization < 10
@@ -0,0 +1,165 @@
+"""
+Pytest tests for stored turn reports.
+
+Tests verify:
+- Events are rendered into per-phase sections in phase order
+- Reports are stored at resolution time and read back without the TurnLog
+- The GM summary counts every logged event
+- Turns without stored reports are rendered from the TurnLog
+- Report pages respect the size limit and filters
+- Broadcast reports include every page
+
+Run with: docker compose -f ~/avatar-bots/docker-compose-development.yaml exec iroh-api pytest tests/test_turn_reports.py -v
+"""
+import pytest
+from handlers.report_handlers import (
+    render_report_sections, materialize_turn_reports,
+    generate_character_report, generate_gm_report
+)
+from db import Character, WargameConfig, TurnLog, TurnReport
+import discord
+from turn_embeds import flatten_report_sections, paginate_report_entries, create_turn_report_embeds
+from tests.conftest import TEST_GUILD_ID
+
+
+def _failed_order(phase: str, order_type: str, character_ids):
+    return TurnLog(
+        turn_number=2,
+        phase=phase,
+        event_type='ORDER_FAILED',
+        entity_type='character',
+        event_data={
+            'order_type': order_type,
+            'error': 'Not allowed',
+            'affected_character_ids': character_ids
+        },
+        guild_id=TEST_GUILD_ID
+    )
+
+
+async def _setup(db_conn):
+    await WargameConfig(guild_id=TEST_GUILD_ID, current_turn=2).upsert(db_conn)
+    for identifier, channel_id in [("report-a", 999000000000000901), ("report-b", 999000000000000902)]:
+        await Character(
+            identifier=identifier, name=identifier.title(),
+            channel_id=channel_id, guild_id=TEST_GUILD_ID
+        ).upsert(db_conn)
+    a = await Character.fetch_by_identifier(db_conn, "report-a", TEST_GUILD_ID)
+    b = await Character.fetch_by_identifier(db_conn, "report-b", TEST_GUILD_ID)
+    return a, b
+
+
+def test_render_report_sections_phase_order():
+    """Test that sections follow phase order and character reports keep only their lines."""
+    events = [
+        _failed_order('MOVEMENT', 'UNIT', [1]),
+        _failed_order('BEGINNING', 'JOIN_FACTION', [1, 2]),
+        _failed_order('BEGINNING', 'LEAVE_FACTION', [2]),
+    ]
+
+    gm_sections = render_report_sections(events, 2, TEST_GUILD_ID)
+    assert [s.phase for s in gm_sections] == ['BEGINNING', 'MOVEMENT']
+    assert [s.event_count for s in gm_sections] == [2, 1]
+    assert gm_sections[0].lines == ["❌ JOIN_FACTION: Not allowed", "❌ LEAVE_FACTION: Not allowed"]
+    assert all(s.character_id is None for s in gm_sections)
+
+    character_sections = render_report_sections(events[:2], 2, TEST_GUILD_ID, character_id=1)
+    assert [s.phase for s in character_sections] == ['BEGINNING', 'MOVEMENT']
+    assert character_sections[0].lines == ["❌ Order failed: **JOIN_FACTION** - Not allowed"]
+
+
+@pytest.mark.asyncio
+async def test_reports_read_from_stored_sections(db_conn, test_server):
+    """Test that stored reports are served without re-reading the TurnLog."""
+    a, b = await _setup(db_conn)
+    events = [
+        _failed_order('BEGINNING', 'JOIN_FACTION', [a.id]),
+        _failed_order('BEGINNING', 'LEAVE_FACTION', [a.id, b.id]),
+    ]
+
+    stored = await materialize_turn_reports(db_conn, TEST_GUILD_ID, 2, events)
+    # One GM section plus one section per character
+    assert stored == 3
+
+    # No TurnLog rows exist; everything comes from TurnReport
+    success, _, data = await generate_character_report(db_conn, a, TEST_GUILD_ID, 2)
+    assert success
+    assert len(data['sections']) == 1
+    assert len(data['sections'][0].lines) == 2
+
+    success, _, data = await generate_character_report(db_conn, b, TEST_GUILD_ID, 2)
+    assert data['sections'][0].lines == ["❌ Order failed: **LEAVE_FACTION** - Not allowed"]
+
+    # The GM total counts every logged event, including phases without a section
+    await TurnLog.insert_many(db_conn, events + [_failed_order('UNKNOWN', 'UNIT', [a.id])])
+    success, _, data = await generate_gm_report(db_conn, TEST_GUILD_ID)
+    assert success
+    assert data['turn_number'] == 2
+    assert data['summary']['total_events'] == 3
+    assert data['summary']['beginning_events'] == 2
+
+    # Materializing again replaces the turn instead of duplicating it
+    await materialize_turn_reports(db_conn, TEST_GUILD_ID, 2, events[:1])
+    gm_sections = await TurnReport.fetch_for_turn(db_conn, 2, TEST_GUILD_ID)
+    assert [s.event_count for s in gm_sections] == [1]
+
+    # A character without events in a stored turn gets an empty report
+    success, _, data = await generate_character_report(db_conn, b, TEST_GUILD_ID, 2)
+    assert data['sections'] == []
+
+
+@pytest.mark.asyncio
+async def test_reports_fall_back_to_turn_log(db_conn, test_server):
+    """Test that turns without stored reports are rendered from the TurnLog."""
+    a, _ = await _setup(db_conn)
+    await TurnLog.insert_many(db_conn, [_failed_order('BEGINNING', 'JOIN_FACTION', [a.id])])
+
+    success, _, data = await generate_character_report(db_conn, a, TEST_GUILD_ID, 2)
+    assert success
+    assert data['sections'][0].lines == ["❌ Order failed: **JOIN_FACTION** - Not allowed"]
+
+    success, _, data = await generate_gm_report(db_conn, TEST_GUILD_ID, 2)
+    assert data['summary']['total_events'] == 1
+
+
+def test_report_pagination_and_filters():
+    """Test that pages stay within the size limit and filters narrow the entries."""
+    sections = [
+        TurnReport(phase='BEGINNING', event_count=30,
+                   lines=[f"Beginning line {i:02d}" for i in range(30)],
+                   event_types=['ORDER_FAILED', 'JOIN_FACTION'] * 15),
+        TurnReport(phase='MOVEMENT', event_count=5,
+                   lines=[f"Movement line {i}" for i in range(5)],
+                   event_types=['UNIT_MOVED'] * 5),
+    ]
+
+    entries = flatten_report_sections(sections)
+    assert len(entries) == 35
+
+    pages = paginate_report_entries(entries, max_chars=200)
+    assert len(pages) > 1
+    # Pages are contiguous and cover every entry exactly once
+    assert pages[0][0] == 0 and pages[-1][1] == 35
+    assert all(a[1] == b[0] for a, b in zip(pages, pages[1:]))
+    for start, end in pages:
+        assert sum(len(line) + 1 for _, _, line in entries[start:end]) <= 200
+
+    assert len(flatten_report_sections(sections, phase='MOVEMENT')) == 5
+    assert len(flatten_report_sections(sections, event_type='JOIN_FACTION')) == 15
+    assert flatten_report_sections(sections, phase='MOVEMENT', event_type='JOIN_FACTION') == []
+    assert paginate_report_entries([]) == []
+
+
+def test_broadcast_report_includes_every_page():
+    """Test that a report posted to a channel has one embed per page covering every line."""
+    lines = [f"Movement line {i:03d} " + "x" * 90 for i in range(100)]
+    sections = [TurnReport(phase='MOVEMENT', event_count=100, lines=lines, event_types=['UNIT_MOVED'] * 100)]
+
+    embeds = create_turn_report_embeds("Report", discord.Color.blue(), sections, {'total_events': 100})
+    assert len(embeds) == len(paginate_report_entries(flatten_report_sections(sections))) > 1
+    text = "\n".join(embed.description for embed in embeds)
+    assert all(line in text for line in lines)
+    # The GM summary is only on the first page
+    assert embeds[0].fields and not embeds[1].fields
+
+    assert len(create_turn_report_embeds("Report", discord.Color.blue(), [])) == 1
@@ -5,7 +5,7 @@ import pytest
 import json
 from datetime import datetime
 from db import Character, Territory, TerritoryAdjacency, Unit, UnitType, Order, Faction, FactionMember, FactionPermission, WargameConfig, NavalUnitPosition
-from handlers.order_handlers import submit_unit_order, VALID_LAND_ACTIONS, VALID_NAVAL_ACTIONS, VALID_UNIT_ACTIONS
+from handlers.order_handlers import submit_unit_order, submit_unit_orders, parse_order_batch, VALID_LAND_ACTIONS, VALID_NAVAL_ACTIONS, VALID_UNIT_ACTIONS
 from order_types import OrderType, OrderStatus, TurnPhase
 
 # Test guild ID from conftest
@@ -890,3 +890,123 @@ async def test_single_naval_unit_passes_grouping(db_conn, test_server):
     assert success is True, f"Expected success but got: {message}"
 
     await full_cleanup(db_conn)
+
+
+# ============================================================
+# Batch submission tests
+# ============================================================
+
+@pytest.mark.asyncio
+async def test_submit_unit_orders_batch(db_conn, test_server):
+    """A valid batch creates one order per entry with sequential IDs."""
+    char = await create_test_character(db_conn)
+    await create_test_territories(db_conn, ["101", "102", "103"])
+    await create_adjacencies(db_conn, [("101", "102"), ("102", "103")])
+    await create_test_unit(db_conn, "TEST-001", char.id, "101")
+    await create_test_unit(db_conn, "TEST-002", char.id, "102")
+    await create_wargame_config(db_conn)
+
+    success, message, summary = await submit_unit_orders(db_conn, [
+        {'units': ["TEST-001"], 'action': "transit", 'path': ["101", "102", "103"]},
+        {'units': ["TEST-002"], 'action': "Patrol", 'path': ["102", "103"], 'speed': 1},
+    ], TEST_GUILD_ID, char.id)
+
+    assert success is True, message
+    assert len(summary) == 2
+
+    orders = await db_conn.fetch(
+        'SELECT * FROM WargameOrder WHERE guild_id = $1 ORDER BY order_id;', TEST_GUILD_ID
+    )
+    assert [o['order_id'] for o in orders] == ["ORD-0001", "ORD-0002"]
+    assert parse_order_data(orders[1]['order_data']) == {
+        'action': 'patrol', 'path': ["102", "103"], 'path_index': 0, 'speed': 1
+    }
+    assert all(o['turn_number'] == 6 for o in orders)
+
+    await full_cleanup(db_conn)
+
+
+@pytest.mark.asyncio
+async def test_submit_unit_orders_batch_is_all_or_nothing(db_conn, test_server):
+    """One invalid entry rejects the whole batch and every problem is reported."""
+    char = await create_test_character(db_conn)
+    await create_test_territories(db_conn, ["101", "102", "103"])
+    await create_adjacencies(db_conn, [("101", "102")])
+    await create_test_unit(db_conn, "TEST-001", char.id, "101")
+    await create_test_unit(db_conn, "TEST-002", char.id, "102")
+    await create_wargame_config(db_conn)
+
+    success, message, summary = await submit_unit_orders(db_conn, [
+        {'units': ["TEST-001"], 'action': "transit", 'path': ["101", "102"]},
+        {'units': ["TEST-002"], 'action': "transit", 'path': ["102", "103"]},
+        {'units': ["TEST-001"], 'action': "raid", 'path': ["101", "102"]},
+    ], TEST_GUILD_ID, char.id)
+
+    assert success is False
+    assert summary is None
+    assert "Order 2: Territories '102' and '103' are not adjacent." in message
+    assert "Order 3:" in message and "TEST-001" in message
+
+    count = await db_conn.fetchval('SELECT COUNT(*) FROM WargameOrder WHERE guild_id = $1;', TEST_GUILD_ID)
+    assert count == 0
+
+    await full_cleanup(db_conn)
+
+
+@pytest.mark.asyncio
+async def test_submit_unit_orders_batch_override(db_conn, test_server):
+    """Existing orders block a batch unless override is set, which cancels them."""
+    char = await create_test_character(db_conn)
+    await create_test_territories(db_conn, ["101", "102"])
+    await create_adjacencies(db_conn, [("101", "102")])
+    await create_test_unit(db_conn, "TEST-001", char.id, "101")
+    await create_wargame_config(db_conn)
+
+    success, message, _ = await submit_unit_order(
+        db_conn, ["TEST-001"], "transit", ["101", "102"], TEST_GUILD_ID, char.id
+    )
+    assert success is True
+
+    batch = [{'units': ["TEST-001"], 'action': "raid", 'path': ["101", "102"]}]
+    success, message, _ = await submit_unit_orders(db_conn, batch, TEST_GUILD_ID, char.id)
+    assert success is False
+    assert "already have pending orders" in message
+
+    success, message, _ = await submit_unit_orders(db_conn, batch, TEST_GUILD_ID, char.id, override=True)
+    assert success is True, message
+
+    statuses = await db_conn.fetch(
+        'SELECT order_id, status FROM WargameOrder WHERE guild_id = $1 ORDER BY order_id;', TEST_GUILD_ID
+    )
+    assert [(r['order_id'], r['status']) for r in statuses] == [
+        ("ORD-0001", OrderStatus.CANCELLED.value), ("ORD-0002", OrderStatus.PENDING.value)
+    ]
+
+    await full_cleanup(db_conn)
+
+
+def test_parse_order_batch_formats():
+    """YAML and CSV files parse into the same order entries."""
+    yaml_content = """
+orders:
+  - units: [TEST-001, TEST-002]
+    action: transit
+    path: 101, 102
+  - units: TEST-003
+    action: patrol
+    path: [102, 103]
+    speed: 2
+"""
+    csv_content = "units,action,path,speed\nTEST-001;TEST-002,transit,101 102,\nTEST-003,patrol,102;103,2\n"
+    expected = [
+        {'units': ["TEST-001", "TEST-002"], 'action': "transit", 'path': ["101", "102"], 'speed': None},
+        {'units': ["TEST-003"], 'action': "patrol", 'path': ["102", "103"], 'speed': 2},
+    ]
+
+    assert parse_order_batch(yaml_content, "orders.yaml") == (True, "", expected)
+    assert parse_order_batch(csv_content, "orders.csv") == (True, "", expected)
+
+    success, message, _ = parse_order_batch("units,path\nTEST-001,101\n", "orders.csv")
+    assert success is False and "action" in message
+    success, message, _ = parse_order_batch("- units: TEST-001\n  speed: fast\n", "orders.yml")
+    assert success is False and "speed" in message
@@ -6,7 +6,7 @@ Run with: docker compose -f ~/avatar-bots/docker-compose-development.yaml exec i
 """
 import pytest
 from handlers.turn_handlers import execute_upkeep_phase
-from db import Character, Unit, PlayerResources
+from db import Character, Unit, PlayerResources, Territory, Building
 from tests.conftest import TEST_GUILD_ID
 from event_logging.upkeep_events import (
     upkeep_summary_character_line,
@@ -951,3 +951,52 @@ async def test_upkeep_skips_disbanded_units(db_conn, test_server):
     updated_disbanded = await Unit.fetch_by_unit_id(db_conn, "disbanded-unit", TEST_GUILD_ID)
     assert updated_disbanded.status == 'DISBANDED'
     assert updated_disbanded.organization == 0  # Unchanged
+
+
+@pytest.mark.asyncio
+async def test_upkeep_building_and_units_share_balance(db_conn, test_server):
+    """Test building upkeep is paid before unit upkeep from the same balance."""
+    character = Character(
+        identifier="shared-upkeep-char", name="Shared Upkeep",
+        channel_id=999000000000000091, guild_id=TEST_GUILD_ID
+    )
+    await character.upsert(db_conn)
+    character = await Character.fetch_by_identifier(db_conn, "shared-upkeep-char", TEST_GUILD_ID)
+
+    territory = Territory(
+        territory_id="U900", name="Upkeep Land", terrain_type="plains",
+        controller_character_id=character.id,
+        guild_id=TEST_GUILD_ID
+    )
+    await territory.upsert(db_conn)
+
+    building = Building(
+        building_id="shared-upkeep-bld", building_type="mine", territory_id="U900",
+        upkeep_ore=5, guild_id=TEST_GUILD_ID
+    )
+    await building.upsert(db_conn)
+
+    unit = Unit(
+        unit_id="shared-upkeep-unit", name="Shared Unit", unit_type="infantry",
+        owner_character_id=character.id,
+        organization=10, max_organization=10,
+        upkeep_ore=3,
+        guild_id=TEST_GUILD_ID
+    )
+    await unit.upsert(db_conn)
+
+    resources = PlayerResources(
+        character_id=character.id, ore=6, guild_id=TEST_GUILD_ID
+    )
+    await resources.upsert(db_conn)
+
+    events = await execute_upkeep_phase(db_conn, TEST_GUILD_ID, 1)
+
+    event_types = [e.event_type for e in events]
+    assert event_types.index('BUILDING_UPKEEP_PAID') < event_types.index('UPKEEP_DEFICIT')
+
+    # Building took 5, unit got the remaining 1 and is short 2
+    updated_resources = await PlayerResources.fetch_by_character(db_conn, character.id, TEST_GUILD_ID)
+    assert updated_resources.ore == 0
+    updated_unit = await Unit.fetch_by_unit_id(db_conn, "shared-upkeep-unit", TEST_GUILD_ID)
+    assert updated_unit.organization == 9
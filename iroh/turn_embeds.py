@@ -2,39 +2,10 @@
 Helper functions for creating Discord embeds for turn resolution reports.
 """
 import discord
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from order_types import PHASE_ORDER
-from event_logging import EVENT_HANDLERS
-
-
-def split_lines_into_chunks(lines: List[str], max_chars: int = 1000) -> List[str]:
-    """Split a list of lines into chunks that fit within max_chars.
-
-    Returns list of joined strings, each under max_chars.
-    """
-    if not lines:
-        return []
-
-    chunks = []
-    current_chunk = []
-    current_length = 0
-
-    for line in lines:
-        line_length = len(line) + 1  # +1 for newline
-
-        if current_length + line_length > max_chars and current_chunk:
-            chunks.append("\n".join(current_chunk))
-            current_chunk = [line]
-            current_length = len(line)
-        else:
-            current_chunk.append(line)
-            current_length += line_length
-
-    if current_chunk:
-        chunks.append("\n".join(current_chunk))
-
-    return chunks
+from db import TurnReport
 
 
 def create_orders_embed(character_name: str, orders: List[Dict]) -> discord.Embed:
@@ -171,217 +142,146 @@ def create_turn_status_embed(status_data: Dict) -> discord.Embed:
     return embed
 
 
-def create_character_turn_report_embeds(
-    character_name: str,
-    turn_number: int,
-    events: List[Dict],
-    character_id: Optional[int] = None
-) -> List[discord.Embed]:
-    """
-    Create embeds with a character's turn report.
+# Characters of report lines per page, leaving room for phase headings within the 4096 description limit
+REPORT_PAGE_CHARS = 3500
 
-    Args:
-        character_name: Name of the character
-        turn_number: Turn number
-        events: List of event dicts relevant to this character
-        character_id: ID of the viewing character (for context-aware formatting)
 
-    Returns:
-        List of Discord embeds (multiple if content exceeds limits)
+def flatten_report_sections(
+    sections: List[TurnReport],
+    phase: Optional[str] = None,
+    event_type: Optional[str] = None
+) -> List[Tuple[str, str, str]]:
     """
-    embed_color = discord.Color.blue()
-    base_title = f"Turn {turn_number} Report: {character_name}"
-
-    if not events:
-        embed = discord.Embed(
-            title=f"📊 {base_title}",
-            color=embed_color,
-            timestamp=datetime.now()
-        )
-        embed.description = "No events this turn."
-        return [embed]
-
-    # Group events by phase
-    phases = {}
-    for event in events:
-        phase = event.phase or 'UNKNOWN'
-        if phase not in phases:
-            phases[phase] = []
-        phases[phase].append(event)
-
-    embeds = []
-    current_embed = discord.Embed(
-        title=f"📊 {base_title}",
-        color=embed_color,
-        timestamp=datetime.now()
-    )
-    current_embed_size = 100  # Base size for title/timestamp
-    field_count = 0
-
-    for phase in PHASE_ORDER:
-        if phase not in phases:
+    Flatten report sections into (phase, event_type, line) entries, optionally filtered.
+    """
+    entries = []
+    for section in sections:
+        if phase and section.phase != phase:
             continue
+        for line_event_type, line in zip(section.event_types or [''] * len(section.lines), section.lines):
+            if event_type and line_event_type != event_type:
+                continue
+            entries.append((section.phase, line_event_type, line))
+    return entries
 
-        phase_events = phases[phase]
-        lines = []
-
-        # Format ALL events (no limit)
-        for event in phase_events:
-            event_type = event.event_type or 'UNKNOWN'
-            event_data = event.event_data or {}
-
-            if event_type in EVENT_HANDLERS:
-                handler = EVENT_HANDLERS[event_type]
-                line = handler.get_character_line(event_data, character_id)
-                if line:
-                    lines.append(line)
 
-        if not lines:
-            continue
+def _phase_heading(phase: str) -> str:
+    return f"**📌 {phase.replace('_', ' ').title()}**"
 
-        # Split into chunks if needed
-        chunks = split_lines_into_chunks(lines, 1000)
-        phase_name = phase.replace('_', ' ').title()
 
-        for i, chunk in enumerate(chunks):
-            field_name = f"📌 {phase_name} Phase"
-            if i > 0:
-                field_name += f" (cont. {i+1})"
+def paginate_report_entries(
+    entries: List[Tuple[str, str, str]],
+    max_chars: int = REPORT_PAGE_CHARS
+) -> List[Tuple[int, int]]:
+    """
+    Split report entries into pages that fit within max_chars, counting phase headings.
 
-            field_size = len(field_name) + len(chunk) + 10
+    Only lengths are measured; no page is rendered here.
 
-            # Check if we need a new embed
-            if current_embed_size + field_size > 5500 or field_count >= 24:
-                embeds.append(current_embed)
-                current_embed = discord.Embed(
-                    title=f"📊 {base_title} (continued)",
-                    color=embed_color
-                )
-                current_embed_size = 100
-                field_count = 0
+    Returns:
+        List of (start, end) slices into entries; empty if there are no entries
+    """
+    pages = []
+    start = 0
+    length = 0
+    previous_phase = None
 
-            current_embed.add_field(name=field_name, value=chunk, inline=False)
-            current_embed_size += field_size
-            field_count += 1
+    for i, (phase, _, line) in enumerate(entries):
+        line_length = len(line) + 1  # +1 for newline
+        if phase != previous_phase:
+            line_length += len(_phase_heading(phase)) + 1
+
+        if length + line_length > max_chars and i > start:
+            pages.append((start, i))
+            start = i
+            # The new page repeats the heading of the phase it continues
+            length = len(_phase_heading(phase)) + len(line) + 2
+        else:
+            length += line_length
+        previous_phase = phase
 
-    # Add the last embed if it has content or is the only one
-    if field_count > 0 or not embeds:
-        embeds.append(current_embed)
+    if start < len(entries):
+        pages.append((start, len(entries)))
 
-    return embeds
+    return pages
 
 
-def create_gm_turn_report_embeds(
-    turn_number: int,
-    events: List[Dict],
-    summary: Dict
-) -> List[discord.Embed]:
+def create_turn_report_page_embed(
+    title: str,
+    color: discord.Color,
+    entries: List[Tuple[str, str, str]],
+    page_range: Optional[Tuple[int, int]],
+    page: int,
+    page_count: int,
+    summary: Optional[Dict] = None
+) -> discord.Embed:
     """
-    Create embeds with the GM's comprehensive turn report.
+    Create the embed for one page of a turn report.
 
     Args:
-        turn_number: Turn number
-        events: All events from the turn
-        summary: Summary statistics dict
+        title: Embed title
+        color: Embed color
+        entries: Filtered (phase, event_type, line) entries of the report
+        page_range: (start, end) slice of entries shown on this page, or None if there are none
+        page: Zero-based page index
+        page_count: Total number of pages
+        summary: GM summary statistics dict, shown on the first page
 
     Returns:
-        List of Discord embeds (multiple if content exceeds limits)
+        Discord embed
     """
-    embed_color = discord.Color.purple()
-    base_title = f"GM Turn {turn_number} Report"
-
-    embeds = []
-    current_embed = discord.Embed(
-        title=f"👑 {base_title}",
-        description="Complete turn resolution summary",
-        color=embed_color,
-        timestamp=datetime.now()
-    )
-    current_embed_size = 150  # Base size for title/description/timestamp
-    field_count = 0
-
-    # Executive summary
-    summary_lines = []
-    if summary.get('total_events', 0) > 0:
-        summary_lines.append(f"📊 Total Events: {summary['total_events']}")
-
-    for phase in PHASE_ORDER:
-        count = summary.get(f'{phase.lower()}_events', 0)
-        if count > 0:
-            phase_name = phase.replace('_', ' ').title()
-            summary_lines.append(f"• {phase_name}: {count}")
-
-    if summary_lines:
-        summary_value = "\n".join(summary_lines)
-        current_embed.add_field(
-            name="📈 Executive Summary",
-            value=summary_value,
-            inline=False
-        )
-        current_embed_size += len("📈 Executive Summary") + len(summary_value) + 10
-        field_count += 1
-
-    # Group events by phase
-    phases = {}
-    for event in events:
-        phase = event.phase or 'UNKNOWN'
-        if phase not in phases:
-            phases[phase] = []
-        phases[phase].append(event)
-
-    # Display each phase
-    for phase in PHASE_ORDER:
-        if phase not in phases:
-            continue
-
-        phase_events = phases[phase]
-        lines = []
-
-        # Format ALL events (no limit)
-        for event in phase_events:
-            event_type = event.event_type or 'UNKNOWN'
-            event_data = event.event_data or {}
-
-            if event_type in EVENT_HANDLERS:
-                handler = EVENT_HANDLERS[event_type]
-                line = handler.get_gm_line(event_data)
-                if line:
-                    lines.append(line)
-
-        if not lines:
-            continue
-
-        # Split into chunks if needed
-        chunks = split_lines_into_chunks(lines, 1000)
-        phase_name = phase.replace('_', ' ').title()
-        event_count = len(phase_events)
-
-        for i, chunk in enumerate(chunks):
-            field_name = f"📌 {phase_name} ({event_count} events)"
-            if i > 0:
-                field_name = f"📌 {phase_name} (cont. {i+1})"
+    embed = discord.Embed(title=title, color=color, timestamp=datetime.now())
+
+    if summary and page == 0:
+        summary_lines = []
+        if summary.get('total_events', 0) > 0:
+            summary_lines.append(f"📊 Total Events: {summary['total_events']}")
+        for phase in PHASE_ORDER:
+            count = summary.get(f'{phase.lower()}_events', 0)
+            if count > 0:
+                summary_lines.append(f"• {phase.replace('_', ' ').title()}: {count}")
+        if summary_lines:
+            embed.add_field(name="📈 Executive Summary", value="\n".join(summary_lines), inline=False)
 
-            field_size = len(field_name) + len(chunk) + 10
+    if not page_range:
+        embed.description = "No events this turn."
+        return embed
 
-            # Check if we need a new embed
-            if current_embed_size + field_size > 5500 or field_count >= 24:
-                embeds.append(current_embed)
-                current_embed = discord.Embed(
-                    title=f"👑 {base_title} (continued)",
-                    color=embed_color
-                )
-                current_embed_size = 100
-                field_count = 0
+    start, end = page_range
+    lines = []
+    previous_phase = None
+    for phase, _, line in entries[start:end]:
+        if phase != previous_phase:
+            lines.append(_phase_heading(phase))
+            previous_phase = phase
+        lines.append(line)
+
+    embed.description = "\n".join(lines)
+    embed.set_footer(text=f"Page {page + 1}/{page_count} • {len(entries)} entries")
+    return embed
 
-            current_embed.add_field(name=field_name, value=chunk, inline=False)
-            current_embed_size += field_size
-            field_count += 1
 
-    # Add footer to the last embed
-    current_embed.set_footer(text=f"Turn {turn_number} completed at")
+def create_turn_report_embeds(
+    title: str,
+    color: discord.Color,
+    sections: List[TurnReport],
+    summary: Optional[Dict] = None
+) -> List[discord.Embed]:
+    """
+    Create one embed per page of an unfiltered turn report, for posting the whole report to a channel.
 
-    # Add the last embed if it has content or is the only one
-    if field_count > 0 or not embeds:
-        embeds.append(current_embed)
+    Args:
+        title: Embed title
+        color: Embed color
+        sections: Stored report sections
+        summary: GM summary statistics dict, shown on the first page
 
-    return embeds
+    Returns:
+        List of Discord embeds, at least one
+    """
+    entries = flatten_report_sections(sections)
+    pages = paginate_report_entries(entries) or [None]
+    return [
+        create_turn_report_page_embed(title, color, entries, page_range, page, len(pages), summary)
+        for page, page_range in enumerate(pages)
+    ]
@@ -2,8 +2,11 @@
 Discord UI components (modals, views, buttons) for Iroh wargame bot.
 """
 import discord
-from typing import Optional
-from db import Territory, UnitType, BuildingType, PlayerResources, Character, WargameConfig, Unit, Faction, FactionMember, NavalUnitPosition
+from collections import Counter
+from typing import Optional, List, Dict
+from db import Territory, UnitType, BuildingType, PlayerResources, Character, WargameConfig, Unit, Faction, FactionMember, NavalUnitPosition, TurnReport
+from handlers.finance_cache import finance_projections
+from turn_embeds import flatten_report_sections, paginate_report_entries, create_turn_report_page_embed
 import logging
 
 logger = logging.getLogger(__name__)
@@ -110,6 +113,7 @@ class EditTerritoryModal(discord.ui.Modal, title="Edit Territory"):
         # Save to database
         async with self.db_pool.acquire() as conn:
             await self.territory.upsert(conn)
+        finance_projections.invalidate_territory(interaction.guild_id, self.territory)
 
         logger.info(f"Admin {interaction.user.name} (ID: {interaction.user.id}) edited territory {self.territory.territory_id} via modal in guild {interaction.guild_id}")
 
@@ -761,12 +765,16 @@ class SingleResourceModal(discord.ui.Modal):
             )
             return
 
-        # Update the resource
-        setattr(self.resources, self.resource_name, new_value)
+        from handlers.resource_handlers import set_character_resource
 
-        # Save to database
+        # Save to database, journalling the change
         async with self.db_pool.acquire() as conn:
-            await self.resources.upsert(conn)
+            await set_character_resource(
+                conn, self.character.id, interaction.guild_id, self.resource_name, new_value
+            )
+
+        # Update the resource
+        setattr(self.resources, self.resource_name, new_value)
 
         logger.info(f"Admin {interaction.user.name} (ID: {interaction.user.id}) modified {self.resource_name} to {new_value} for character '{self.character.name}' in guild {interaction.guild_id}")
 
@@ -1167,6 +1175,7 @@ class EditUnitBasicModal(discord.ui.Modal, title="Edit Basic Info"):
             self.unit.unit_type = new_type
             self.unit.status = new_status
             await self.unit.upsert(conn)
+        finance_projections.invalidate_unit(interaction.guild_id, self.unit)
 
         # Update parent view's unit reference
         self.parent_view.unit = self.unit
@@ -1348,10 +1357,13 @@ class EditUnitOwnershipModal(discord.ui.Modal, title="Edit Ownership"):
                     return
                 faction_id = fact.id
 
+            # Both the previous and the new owner's upkeep change
+            finance_projections.invalidate_unit(interaction.guild_id, self.unit)
             self.unit.owner_character_id = owner_char_id
             self.unit.owner_faction_id = owner_faction_id
             self.unit.faction_id = faction_id
             await self.unit.upsert(conn)
+        finance_projections.invalidate_unit(interaction.guild_id, self.unit)
 
         logger.info(f"Admin {interaction.user.name} (ID: {interaction.user.id}) edited unit ownership for '{self.unit.unit_id}' in guild {interaction.guild_id}")
 
@@ -1651,6 +1663,7 @@ class EditUnitUpkeep1Modal(discord.ui.Modal, title="Edit Upkeep (1/2)"):
             self.unit.upkeep_lumber = lumber
             self.unit.upkeep_coal = coal
             await self.unit.upsert(conn)
+        finance_projections.invalidate_unit(interaction.guild_id, self.unit)
 
         logger.info(f"Admin {interaction.user.name} (ID: {interaction.user.id}) edited unit upkeep (ore/lumber/coal) for '{self.unit.unit_id}' in guild {interaction.guild_id}")
 
@@ -1717,6 +1730,7 @@ class EditUnitUpkeep2Modal(discord.ui.Modal, title="Edit Upkeep (2/2)"):
             self.unit.upkeep_cloth = cloth
             self.unit.upkeep_platinum = platinum
             await self.unit.upsert(conn)
+        finance_projections.invalidate_unit(interaction.guild_id, self.unit)
 
         logger.info(f"Admin {interaction.user.name} (ID: {interaction.user.id}) edited unit upkeep (rations/cloth/platinum) for '{self.unit.unit_id}' in guild {interaction.guild_id}")
 
@@ -2328,3 +2342,169 @@ class EditUnitTypeView(discord.ui.View):
     async def keywords(self, interaction: discord.Interaction, button: discord.ui.Button):
         modal = EditUnitTypeKeywordsModal(self.unit_type, self.db_pool, self)
         await interaction.response.send_modal(modal)
+
+
+class TurnReportView(discord.ui.View):
+    """
+    Paginated turn report browser with phase and event type filters.
+
+    Holds the report's stored lines and renders only the page being viewed.
+    Meant for ephemeral replies; set `message` to the sent message so the
+    controls are disabled when the view times out.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        color: discord.Color,
+        sections: List[TurnReport],
+        summary: Optional[Dict] = None
+    ):
+        super().__init__(timeout=840)  # 14 minutes, while the interaction can still edit the message
+        self.message: Optional[discord.Message] = None
+        self.title = title
+        self.color = color
+        self.sections = sections
+        self.summary = summary
+        self.phase_filter: Optional[str] = None
+        self.event_type_filter: Optional[str] = None
+        self.page = 0
+        self._apply_filters()
+
+        phases = [s.phase for s in sections if s.lines]
+        event_type_counts = Counter(t for s in sections for t in s.event_types)
+
+        if len(phases) > 1:
+            self.phase_select = discord.ui.Select(placeholder="Filter by phase", row=1)
+            self.phase_select.callback = self._on_phase_select
+            self.add_item(self.phase_select)
+
+            # Jump buttons, five per row on the last two rows
+            self.jump_buttons = {}
+            for i, phase in enumerate(phases[:10]):
+                button = discord.ui.Button(
+                    label=phase.replace('_', ' ').title(),
+                    style=discord.ButtonStyle.secondary,
+                    row=3 + i // 5
+                )
+                button.callback = self._make_jump_callback(phase)
+                self.jump_buttons[phase] = button
+                self.add_item(button)
+        else:
+            self.phase_select = None
+            self.jump_buttons = {}
+
+        if len(event_type_counts) > 1:
+            self.event_type_select = discord.ui.Select(placeholder="Filter by event type", row=2)
+            self.event_type_select.callback = self._on_event_type_select
+            # Select menus hold 25 options; keep the most frequent event types
+            self.event_types = [t for t, _ in event_type_counts.most_common(24)]
+            self.add_item(self.event_type_select)
+        else:
+            self.event_type_select = None
+            self.event_types = []
+
+        self._refresh_items()
+
+    def _apply_filters(self):
+        self.entries = flatten_report_sections(self.sections, self.phase_filter, self.event_type_filter)
+        self.pages = paginate_report_entries(self.entries)
+        self.page = max(0, min(self.page, len(self.pages) - 1))
+
+    def _refresh_items(self):
+        page_count = max(len(self.pages), 1)
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= page_count - 1
+        self.page_indicator.label = f"{self.page + 1}/{page_count}"
+
+        if self.phase_select:
+            self.phase_select.options = [
+                discord.SelectOption(label="All phases", value="ALL", default=self.phase_filter is None)
+            ] + [
+                discord.SelectOption(
+                    label=phase.replace('_', ' ').title(),
+                    value=phase,
+                    default=phase == self.phase_filter
+                )
+                for phase in self.jump_buttons
+            ]
+
+        if self.event_type_select:
+            self.event_type_select.options = [
+                discord.SelectOption(label="All event types", value="ALL", default=self.event_type_filter is None)
+            ] + [
+                discord.SelectOption(
+                    label=event_type.replace('_', ' ').title()[:100],
+                    value=event_type,
+                    default=event_type == self.event_type_filter
+                )
+                for event_type in self.event_types
+            ]
+
+        # A jump button is only useful if its phase is on some page under the current filters
+        visible_phases = {phase for phase, _, _ in self.entries}
+        for phase, button in self.jump_buttons.items():
+            button.disabled = phase not in visible_phases
+
+    def current_embed(self) -> discord.Embed:
+        """Render the embed for the current page."""
+        return create_turn_report_page_embed(
+            self.title,
+            self.color,
+            self.entries,
+            self.pages[self.page] if self.pages else None,
+            self.page,
+            max(len(self.pages), 1),
+            self.summary
+        )
+
+    async def on_timeout(self):
+        """Disable the controls so the expired pager does not look usable."""
+        for item in self.children:
+            item.disabled = True
+        if self.message is not None:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException as e:
+                logger.warning(f"Could not disable expired turn report view: {e}")
+
+    async def _show(self, interaction: discord.Interaction):
+        self._refresh_items()
+        await interaction.response.edit_message(embed=self.current_embed(), view=self)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.primary, row=0)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = max(self.page - 1, 0)
+        await self._show(interaction)
+
+    @discord.ui.button(label="1/1", style=discord.ButtonStyle.secondary, disabled=True, row=0)
+    async def page_indicator(self, interaction: discord.Interaction, button: discord.ui.Button):
+        pass
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.primary, row=0)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = min(self.page + 1, max(len(self.pages) - 1, 0))
+        await self._show(interaction)
+
+    async def _on_phase_select(self, interaction: discord.Interaction):
+        value = self.phase_select.values[0]
+        self.phase_filter = None if value == "ALL" else value
+        self.page = 0
+        self._apply_filters()
+        await self._show(interaction)
+
+    async def _on_event_type_select(self, interaction: discord.Interaction):
+        value = self.event_type_select.values[0]
+        self.event_type_filter = None if value == "ALL" else value
+        self.page = 0
+        self._apply_filters()
+        await self._show(interaction)
+
+    def _make_jump_callback(self, phase: str):
+        async def callback(interaction: discord.Interaction):
+            for i, (start, end) in enumerate(self.pages):
+                if any(entry[0] == phase for entry in self.entries[start:end]):
+                    self.page = i
+                    break
+            await self._show(interaction)
+        return callback